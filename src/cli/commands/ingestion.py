@@ -27,6 +27,8 @@ from utils.custom_logger import setup_logging, get_logger, log_status, log_progr
 from querying.exceptions import QueryingError, SymbolResolutionError, QueryExecutionError
 from querying import QueryBuilder
 from core.pipeline_orchestrator import PipelineOrchestrator, PipelineError
+from core.parallel_backfill import BackfillTask, ParallelBackfill
+from core.job_scheduler import JobScheduler, plan_jobs
 from cli.help_utils import (
     CLIExamples, CLITroubleshooter, CLITips,
     show_examples, show_tips, validate_date_range, validate_symbols,
@@ -157,6 +159,10 @@ def ingest(
     force: bool = typer.Option(False, "--force", help="Skip confirmation prompt"),
     dry_run: bool = typer.Option(False, "--dry-run", help="Preview ingestion without execution"),
     guided: bool = typer.Option(False, "--guided", help="Use interactive guided mode to select parameters"),
+    streaming: bool = typer.Option(False, "--streaming", help="Stream batches through the pipeline with bounded memory (recommended for tick/second data)"),
+    resume: bool = typer.Option(False, "--resume", help="Resume an interrupted job, skipping date chunks already checkpointed as stored"),
+    reprocess: bool = typer.Option(False, "--reprocess", help="Rebuild tables from the raw response cache only, without calling the API"),
+    incremental: bool = typer.Option(False, "--incremental", help="Only fetch date ranges not already stored (single-symbol jobs)"),
 ):
     """
     Execute data ingestion pipeline to fetch and store financial market data.
@@ -179,6 +185,18 @@ def ingest(
         
         # Preview operation without execution
         python main.py ingest --api databento --job test_job --dry-run
+        
+        # Stream a large tick job with bounded memory
+        python main.py ingest --api databento --job trades --streaming
+        
+        # Resume an interrupted job where it left off
+        python main.py ingest --api databento --job trades --resume
+        
+        # Re-run a job after a mapping fix using only cached API responses
+        python main.py ingest --api databento --job trades --reprocess
+        
+        # Nightly top-up: only fetch the days missing from the database
+        python main.py ingest --api databento --job ohlcv_daily_sample --incremental
     """
     log_user_message("Starting data ingestion process")
     
@@ -223,6 +241,8 @@ def ingest(
             start_date = start_date or job_config.get("start_date")
             end_date = end_date or job_config.get("end_date")
             stype_in = stype_in or job_config.get("stype_in")
+            streaming = streaming or bool(job_config.get("streaming", False))
+            incremental = incremental or bool(job_config.get("incremental", False))
             
         # Validate required parameters
         required_params = {
@@ -340,6 +360,14 @@ def ingest(
             "created_at": datetime.now().isoformat(),
             "created_by": "cli_ingest"
         }
+        if streaming:
+            job_config["streaming"] = True
+        if resume:
+            job_config["resume"] = True
+        if reprocess:
+            job_config["reprocess"] = True
+        if incremental:
+            job_config["incremental"] = True
         
         # Display operation summary
         console.print(f"\n📊 [bold cyan]Ingestion Summary[/bold cyan]")
@@ -350,6 +378,14 @@ def ingest(
         console.print(f"Date range: {start_date} to {end_date}")
         console.print(f"Symbol type: {stype_in or 'auto'}")
         console.print(f"Job name: {job_config['name']}")
+        if job_config.get("streaming"):
+            console.print("Mode: streaming (bounded memory)")
+        if job_config.get("resume"):
+            console.print("Mode: resume (skip checkpointed chunks)")
+        if job_config.get("reprocess"):
+            console.print("Mode: reprocess (cached API responses only, no network)")
+        if job_config.get("incremental"):
+            console.print("Mode: incremental (fetch only ranges missing from storage)")
         
         # Dry run mode
         if dry_run:
@@ -425,17 +461,21 @@ def backfill(
     schemas: List[str] = typer.Option(["ohlcv-1d"], help="Data schemas to backfill"),
     api: str = typer.Option("databento", help="API provider"),
     dataset: str = typer.Option("GLBX.MDP3", help="Dataset to use"),
-    batch_size: int = typer.Option(5, help="Number of symbols to process in parallel"),
+    batch_size: int = typer.Option(5, help="Number of symbol/schema jobs to process in parallel"),
+    max_api_calls: int = typer.Option(4, help="Maximum concurrent API requests across all parallel jobs"),
+    max_db_writers: int = typer.Option(4, help="Maximum concurrent database writes across all parallel jobs"),
     retry_failed: bool = typer.Option(True, help="Automatically retry failed symbols"),
     dry_run: bool = typer.Option(False, help="Preview operation without execution"),
-    force: bool = typer.Option(False, help="Skip confirmation prompts")
+    force: bool = typer.Option(False, help="Skip confirmation prompts"),
+    resume: bool = typer.Option(False, "--resume", help="Resume an interrupted backfill, skipping date chunks already checkpointed as stored")
 ):
     """
     High-level backfill command for common use cases.
     
     This command simplifies bulk data ingestion by using predefined symbol groups
-    and lookback periods. It automatically calculates date ranges and handles
-    batch processing for optimal performance.
+    and lookback periods. It automatically calculates date ranges and runs one
+    ingestion job per symbol and schema on a pool of parallel workers, with
+    global caps on concurrent API requests and database writes.
     
     Examples:
         # Backfill 1 year of daily OHLCV data for S&P 500 sample
@@ -447,8 +487,14 @@ def backfill(
         # Custom symbol group with specific batch size
         python main.py backfill "ES.FUT,CL.FUT,NG.FUT" --batch-size 3 --lookback 3m
         
+        # Eight parallel jobs sharing at most 4 API requests and 2 database writers
+        python main.py backfill DOW30 --batch-size 8 --max-api-calls 4 --max-db-writers 2
+        
         # Preview operation without execution
         python main.py backfill SP500_SAMPLE --dry-run
+        
+        # Resume an interrupted backfill where it left off
+        python main.py backfill SP500_SAMPLE --lookback 5y --resume
     """
     log_user_message(f"Starting backfill operation for {symbol_group}")
     
@@ -503,16 +549,19 @@ def backfill(
         console.print(f"Schemas: {', '.join(schemas)}")
         console.print(f"API: {api}")
         console.print(f"Dataset: {dataset}")
-        console.print(f"Batch size: {batch_size}")
+        console.print(f"Parallel jobs: {batch_size} (max {max_api_calls} API requests, {max_db_writers} DB writers)")
+        if resume:
+            console.print("Mode: resume (skip checkpointed chunks)")
         
         # Estimate operation
         total_operations = len(symbols) * len(schemas)
-        estimated_time = total_operations * 30  # Rough estimate: 30 seconds per operation
+        # Rough estimate: 30 seconds per operation, batch_size operations at a time
+        estimated_time = math.ceil(total_operations / batch_size) * 30
         
         console.print(f"\n📈 [cyan]Operation Estimate[/cyan]")
         console.print(f"Total operations: {total_operations}")
         console.print(f"Estimated time: {format_duration(estimated_time)}")
-        console.print(f"Batch processing: {math.ceil(len(symbols) / batch_size)} batches")
+        console.print(f"Parallel workers: {min(batch_size, total_operations)}")
         
         # Dry run mode
         if dry_run:
@@ -534,15 +583,33 @@ def backfill(
         # Execute backfill
         console.print(f"\n🚀 [bold green]Starting backfill operation...[/bold green]")
         
-        # Create pipeline orchestrator
-        orchestrator = PipelineOrchestrator()
-        
-        # Track results
-        results = {
-            "successful": [],
-            "failed": [],
-            "warnings": []
-        }
+        tasks = []
+        for schema in schemas:
+            for symbol in symbols:
+                job_config = {
+                    "name": f"backfill_{schema}_{symbol}_{lookback}",
+                    "api": api,
+                    "dataset": dataset,
+                    "schema": schema,
+                    "symbols": [symbol],
+                    "start_date": start_date.strftime("%Y-%m-%d"),
+                    "end_date": end_date.strftime("%Y-%m-%d"),
+                    "stype_in": "parent" if symbol.endswith(".FUT") else "continuous",
+                    "created_at": datetime.now().isoformat(),
+                    "created_by": "cli_backfill"
+                }
+                if resume:
+                    job_config["resume"] = True
+                tasks.append(BackfillTask(symbol, schema, job_config))
+        
+        # Every attempt runs on its own orchestrator (adapter, loaders) bound to the shared caps
+        backfill_runner = ParallelBackfill(
+            lambda limits: PipelineOrchestrator(concurrency_limits=limits),
+            max_workers=batch_size,
+            max_api_calls=max_api_calls,
+            max_db_writers=max_db_writers,
+            retry_failed=retry_failed
+        )
         
         with EnhancedProgress() as progress:
             # Create overall progress task
@@ -553,64 +620,26 @@ def backfill(
             
             completed_operations = 0
             
-            # Process symbols in batches
-            for batch_start in range(0, len(symbols), batch_size):
-                batch_symbols = symbols[batch_start:batch_start + batch_size]
-                
-                console.print(f"\n📦 [cyan]Processing batch {batch_start//batch_size + 1}/{math.ceil(len(symbols)/batch_size)}[/cyan]")
-                console.print(f"Symbols: {', '.join(batch_symbols)}")
-                
-                # Process each schema for this batch
-                for schema in schemas:
-                    for symbol in batch_symbols:
-                        try:
-                            # Create job config for this symbol/schema combination
-                            job_config = {
-                                "name": f"backfill_{schema}_{symbol}_{lookback}",
-                                "api": api,
-                                "dataset": dataset,
-                                "schema": schema,
-                                "symbols": [symbol],
-                                "start_date": start_date.strftime("%Y-%m-%d"),
-                                "end_date": end_date.strftime("%Y-%m-%d"),
-                                "stype_in": "parent" if symbol.endswith(".FUT") else "continuous",
-                                "created_at": datetime.now().isoformat(),
-                                "created_by": "cli_backfill"
-                            }
-                            
-                            # Execute pipeline for this symbol/schema
-                            result = orchestrator.execute_pipeline(job_config)
-                            
-                            if result["status"] == "success":
-                                results["successful"].append(f"{symbol} ({schema})")
-                            else:
-                                results["failed"].append(f"{symbol} ({schema}): {result.get('error', 'Unknown error')}")
-                                
-                                # Retry logic
-                                if retry_failed:
-                                    console.print(f"🔄 [yellow]Retrying {symbol} ({schema})...[/yellow]")
-                                    retry_result = orchestrator.execute_pipeline(job_config)
-                                    if retry_result["status"] == "success":
-                                        results["successful"].append(f"{symbol} ({schema}) - retry")
-                                        results["failed"].remove(f"{symbol} ({schema}): {result.get('error', 'Unknown error')}")
-                            
-                            if result.get("warnings"):
-                                results["warnings"].extend(result["warnings"])
-                            
-                        except Exception as e:
-                            error_msg = f"{symbol} ({schema}): {str(e)}"
-                            results["failed"].append(error_msg)
-                            console.print(f"❌ [red]Failed: {error_msg}[/red]")
-                        
-                        finally:
-                            completed_operations += 1
-                            progress.update(overall_task, completed=completed_operations)
+            def on_task_done(task_result):
+                nonlocal completed_operations
+                completed_operations += 1
+                if task_result.status != "success":
+                    console.print(f"❌ [red]Failed: {task_result.task.label}: {task_result.error}[/red]")
+                elif task_result.attempts > 1:
+                    console.print(f"🔄 [yellow]Succeeded on retry: {task_result.task.label}[/yellow]")
+                progress.update(overall_task, completed=completed_operations)
+            
+            results = backfill_runner.run(tasks, on_task_done=on_task_done)
         
         # Display final results
         console.print(f"\n📊 [bold cyan]Backfill Results[/bold cyan]")
         console.print(f"✅ Successful: {len(results['successful'])}")
         console.print(f"❌ Failed: {len(results['failed'])}")
         console.print(f"⚠️  Warnings: {len(results['warnings'])}")
+        console.print(f"🔄 Retried: {len(results['retried'])}")
+        console.print(f"📈 Records processed: {results['records_processed']:,}")
+        console.print(f"⏱️  Duration: {format_duration(results['duration_seconds'])} "
+                      f"({format_duration(results['task_seconds'])} of job time)")
         
         if results["successful"]:
             console.print(f"\n✅ [green]Successful operations:[/green]")
@@ -642,4 +671,159 @@ def backfill(
         console.print(f"❌ [red]Backfill operation failed: {e}[/red]")
         console.print(f"💡 [blue]Use 'python main.py troubleshoot backfill' for help[/blue]")
         logger.exception("Backfill command failed with unexpected error")
-        raise typer.Exit(code=1)
\ No newline at end of file
+        raise typer.Exit(code=1)
+
+
+@app.command("run-jobs")
+def run_jobs(
+    api: str = typer.Option("databento", help="API provider whose predefined jobs are run"),
+    jobs: Optional[str] = typer.Option(None, help="Comma-separated job names (default: every job in the config)"),
+    max_workers: Optional[int] = typer.Option(None, help="Number of jobs run in parallel (default: pipeline.scheduler.max_workers)"),
+    max_api_calls: Optional[int] = typer.Option(None, help="Maximum concurrent API requests across all jobs"),
+    max_db_writers: Optional[int] = typer.Option(None, help="Maximum concurrent database writes across all jobs"),
+    keep_going: bool = typer.Option(False, "--keep-going", help="Keep starting jobs after a job fails instead of stopping the run"),
+    retry_failed: bool = typer.Option(True, help="Retry a failed job once, resuming from its checkpoints"),
+    resume: bool = typer.Option(False, "--resume", help="Skip date chunks already checkpointed as stored"),
+    incremental: bool = typer.Option(False, "--incremental", help="Only fetch date ranges not already stored for each job"),
+    dry_run: bool = typer.Option(False, "--dry-run", help="Show the execution plan without running it"),
+    force: bool = typer.Option(False, "--force", help="Skip confirmation prompt")
+):
+    """
+    Run a list of predefined jobs concurrently under shared API and database budgets.
+    
+    Jobs start by priority, then by estimated size (largest first). Jobs that
+    derive OHLCV bars wait for the job loading their source granularity. The
+    first job that fails (after its retry) stops the run: running jobs finish
+    and the remaining jobs are skipped. One consolidated report is written to
+    pipeline.metrics.report_dir.
+    
+    Examples:
+        # Nightly refresh of every configured job
+        python main.py run-jobs --force
+        
+        # A subset with at most 2 concurrent database writers
+        python main.py run-jobs --jobs ohlcv_1m,ohlcv_5m,ohlcv_1d --max-db-writers 2
+        
+        # Show the execution order and size estimates
+        python main.py run-jobs --dry-run
+    """
+    log_user_message("Starting scheduled job run")
+    
+    try:
+        api_config = PipelineOrchestrator().load_api_config(api)
+        pipeline_config = api_config.get("pipeline", {}) or {}
+        scheduler_config = pipeline_config.get("scheduler", {}) or {}
+        job_configs = api_config.get("jobs", []) or []
+        
+        if jobs:
+            wanted = parse_symbols(jobs)
+            known = {job_config.get("name") for job_config in job_configs}
+            unknown = [name for name in wanted if name not in known]
+            if unknown:
+                console.print(f"❌ [red]Unknown jobs for API '{api}': {', '.join(unknown)}[/red]")
+                console.print(f"💡 [yellow]Use 'python main.py list-jobs --api {api}' to see available jobs[/yellow]")
+                raise typer.Exit(code=1)
+            job_configs = [job_config for job_config in job_configs if job_config.get("name") in wanted]
+        
+        if not job_configs:
+            console.print("ℹ️  [yellow]No jobs to run[/yellow]")
+            return
+        
+        job_configs = [
+            {**job_config, "api": api,
+             **({"resume": True} if resume else {}),
+             **({"incremental": True} if incremental else {})}
+            for job_config in job_configs
+        ]
+        
+        try:
+            plan = plan_jobs(job_configs)
+        except ValueError as e:
+            console.print(f"❌ [red]Invalid job list: {e}[/red]")
+            raise typer.Exit(code=1)
+        
+        max_workers = max_workers or int(scheduler_config.get("max_workers", 4))
+        max_api_calls = max_api_calls or scheduler_config.get("max_api_calls")
+        max_db_writers = max_db_writers or scheduler_config.get("max_db_writers")
+        stop_on_failure = not keep_going and bool(scheduler_config.get("stop_on_failure", True))
+        
+        table = Table(title="Execution Plan", show_header=True, header_style="bold magenta")
+        table.add_column("#", justify="right")
+        table.add_column("Job")
+        table.add_column("Schema")
+        table.add_column("Priority", justify="right")
+        table.add_column("Est. Records", justify="right")
+        table.add_column("Waits For")
+        for position, job in enumerate(plan, start=1):
+            table.add_row(
+                str(position), job.name, job.schema, str(job.priority),
+                f"{job.estimated_records:,}", ", ".join(job.depends_on) or "-"
+            )
+        console.print(table)
+        console.print(f"Parallel jobs: {max_workers} (max {max_api_calls or max_workers} API requests, "
+                      f"{max_db_writers or max_workers} DB writers)")
+        console.print(f"On failure: {'stop the run' if stop_on_failure else 'keep going'}")
+        
+        if dry_run:
+            console.print("\n🔍 [yellow]DRY RUN MODE - No data will be ingested[/yellow]")
+            return
+        
+        if not force:
+            console.print(f"\n⚠️  [yellow]Run {len(plan)} jobs? [y/N][/yellow] ", end="")
+            if input().strip().lower() not in ['y', 'yes']:
+                console.print("❌ [red]Run cancelled by user[/red]")
+                raise typer.Exit(code=1)
+        
+        scheduler = JobScheduler(
+            lambda limits: PipelineOrchestrator(concurrency_limits=limits),
+            max_workers=max_workers,
+            max_api_calls=max_api_calls,
+            max_db_writers=max_db_writers,
+            retry_failed=retry_failed,
+            stop_on_failure=stop_on_failure,
+            report_dir=(pipeline_config.get("metrics", {}) or {}).get("report_dir")
+        )
+        
+        with EnhancedProgress() as progress:
+            overall_task = progress.add_task("Scheduled jobs", total=len(plan))
+            completed_jobs = 0
+            
+            def on_task_done(task_result):
+                nonlocal completed_jobs
+                completed_jobs += 1
+                if task_result.status == "skipped":
+                    console.print(f"⏭️  [yellow]Skipped: {task_result.task.label}: {task_result.error}[/yellow]")
+                elif task_result.status != "success":
+                    console.print(f"❌ [red]Failed: {task_result.task.label}: {task_result.error}[/red]")
+                progress.update(overall_task, completed=completed_jobs)
+            
+            results = scheduler.run(job_configs, on_task_done=on_task_done)
+        
+        console.print("\n📊 [bold cyan]Scheduled Run Results[/bold cyan]")
+        console.print(f"✅ Successful: {len(results['successful'])}")
+        console.print(f"❌ Failed: {len(results['failed'])}")
+        console.print(f"⏭️  Skipped: {len(results['skipped'])}")
+        console.print(f"🔄 Retried: {len(results['retried'])}")
+        console.print(f"📈 Records processed: {results['records_processed']:,}")
+        console.print(f"⏱️  Duration: {format_duration(results['duration_seconds'])} "
+                      f"({format_duration(results['task_seconds'])} of job time)")
+        if results.get("report_path"):
+            console.print(f"📝 Report: {results['report_path']}")
+        
+        for failure in results["failed"]:
+            console.print(f"  ❌ {failure}")
+        if results["stopped_by"]:
+            console.print(f"\n🛑 [red]Run stopped after '{results['stopped_by']}' failed; "
+                          f"rerun with --resume to continue[/red]")
+        
+        if results["failed"] or results["skipped"]:
+            raise typer.Exit(code=1)
+        
+        console.print("\n🎉 [bold green]All jobs completed successfully![/bold green]")
+    
+    except typer.Exit:
+        raise
+    except Exception as e:
+        console.print(f"❌ [red]Scheduled job run failed: {e}[/red]")
+        logger.exception("run-jobs command failed with unexpected error")
+        raise typer.Exit(code=1)
@@ -13,7 +13,7 @@ from datetime import datetime, date
 from decimal import Decimal
 from io import StringIO
 from pathlib import Path
-from typing import Optional, List, Dict, Tuple
+from typing import Callable, Dict, Iterable, List, Optional, TextIO, Tuple
 
 import typer
 from rich.console import Console
@@ -23,6 +23,7 @@ from dotenv import load_dotenv
 
 from utils.custom_logger import setup_logging, get_logger, log_status, log_progress, log_user_message
 from querying.exceptions import QueryingError, SymbolResolutionError, QueryExecutionError
+from querying.aggregation import parse_bucket
 from querying import QueryBuilder
 from core.pipeline_orchestrator import PipelineOrchestrator, PipelineError
 from cli.help_utils import (
@@ -155,6 +156,34 @@ def format_table_output(results: List[Dict], schema: str) -> Table:
     return table
 
 
+def _format_csv_row(row: Dict) -> Dict:
+    """Convert Decimal, datetime and None values of a result row for CSV output."""
+    formatted_row = {}
+    for key, value in row.items():
+        if isinstance(value, Decimal):
+            formatted_row[key] = str(value)
+        elif isinstance(value, (datetime, date)):
+            formatted_row[key] = str(value)
+        elif value is None:
+            formatted_row[key] = ""
+        else:
+            formatted_row[key] = value
+    return formatted_row
+
+
+def _format_json_row(row: Dict) -> Dict:
+    """Convert Decimal and datetime values of a result row for JSON serialization."""
+    formatted_row = {}
+    for key, value in row.items():
+        if isinstance(value, Decimal):
+            formatted_row[key] = float(value)
+        elif isinstance(value, (datetime, date)):
+            formatted_row[key] = value.isoformat()
+        else:
+            formatted_row[key] = value
+    return formatted_row
+
+
 def format_csv_output(results: List[Dict]) -> str:
     """Format query results as CSV string."""
     if not results:
@@ -166,18 +195,7 @@ def format_csv_output(results: List[Dict]) -> str:
     
     writer.writeheader()
     for row in results:
-        # Convert Decimal and datetime objects to strings
-        formatted_row = {}
-        for key, value in row.items():
-            if isinstance(value, Decimal):
-                formatted_row[key] = str(value)
-            elif isinstance(value, (datetime, date)):
-                formatted_row[key] = str(value)
-            elif value is None:
-                formatted_row[key] = ""
-            else:
-                formatted_row[key] = value
-        writer.writerow(formatted_row)
+        writer.writerow(_format_csv_row(row))
     
     return output.getvalue()
 
@@ -188,19 +206,7 @@ def format_json_output(results: List[Dict]) -> str:
         return json.dumps({"message": "No data found for the specified criteria", "results": []}, indent=2)
     
     # Convert Decimal and datetime objects for JSON serialization
-    formatted_results = []
-    for row in results:
-        formatted_row = {}
-        for key, value in row.items():
-            if isinstance(value, Decimal):
-                formatted_row[key] = float(value)
-            elif isinstance(value, (datetime, date)):
-                formatted_row[key] = value.isoformat()
-            elif value is None:
-                formatted_row[key] = None
-            else:
-                formatted_row[key] = value
-        formatted_results.append(formatted_row)
+    formatted_results = [_format_json_row(row) for row in results]
     
     return json.dumps({
         "count": len(formatted_results),
@@ -208,6 +214,155 @@ def format_json_output(results: List[Dict]) -> str:
     }, indent=2)
 
 
+def write_csv_stream(rows: Iterable[Dict], stream: TextIO) -> int:
+    """
+    Write result rows to a text stream as CSV, one row at a time.
+
+    Args:
+        rows: Result rows, e.g. from a QueryBuilder iter_* method
+        stream: Open text stream to write to
+
+    Returns:
+        Number of rows written
+    """
+    writer = None
+    count = 0
+    for row in rows:
+        if writer is None:
+            writer = csv.DictWriter(stream, fieldnames=list(row.keys()))
+            writer.writeheader()
+        writer.writerow(_format_csv_row(row))
+        count += 1
+
+    if writer is None:
+        stream.write("# No data found for the specified criteria\n")
+    return count
+
+
+def write_ndjson_stream(rows: Iterable[Dict], stream: TextIO) -> int:
+    """
+    Write result rows to a text stream as newline-delimited JSON.
+
+    Args:
+        rows: Result rows, e.g. from a QueryBuilder iter_* method
+        stream: Open text stream to write to
+
+    Returns:
+        Number of rows written
+    """
+    count = 0
+    for row in rows:
+        stream.write(json.dumps(_format_json_row(row)))
+        stream.write("\n")
+        count += 1
+    return count
+
+
+def write_json_stream(rows: Iterable[Dict], stream: TextIO) -> int:
+    """
+    Write result rows to a text stream as a JSON document, one row at a time.
+
+    The document has the same keys as ``format_json_output``; ``count`` follows
+    ``results`` because it is only known once every row has been written.
+
+    Args:
+        rows: Result rows, e.g. from a QueryBuilder iter_* method
+        stream: Open text stream to write to
+
+    Returns:
+        Number of rows written
+    """
+    count = 0
+    stream.write('{\n  "results": [')
+    for row in rows:
+        stream.write(",\n    " if count else "\n    ")
+        stream.write(json.dumps(_format_json_row(row)))
+        count += 1
+    stream.write("\n  ]," if count else "],")
+    stream.write(f'\n  "count": {count}\n}}\n')
+    return count
+
+
+STREAM_WRITERS: Dict[str, Callable[[Iterable[Dict], TextIO], int]] = {
+    "csv": write_csv_stream,
+    "json": write_json_stream,
+    "ndjson": write_ndjson_stream,
+}
+
+
+def stream_output_file(rows: Iterable[Dict], file_path: str, format_type: str) -> int:
+    """
+    Stream result rows into an output file without holding them in memory.
+
+    Args:
+        rows: Result rows, e.g. from a QueryBuilder iter_* method
+        file_path: Output file path
+        format_type: 'csv', 'json' or 'ndjson'
+
+    Returns:
+        Number of rows written
+    """
+    try:
+        output_path = Path(file_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        with open(output_path, 'w', encoding='utf-8', newline='') as f:
+            count = STREAM_WRITERS[format_type](rows, f)
+
+        console.print(f"✅ [green]Output written to: {file_path}[/green]")
+        _print_file_size(output_path)
+        return count
+
+    except OSError as e:
+        console.print(f"❌ [red]Failed to write output file: {e}[/red]")
+        raise typer.Exit(code=1)
+
+
+# Binary formats written from Arrow record batches (see querying.columnar)
+COLUMNAR_FORMATS = ("parquet", "arrow")
+
+
+def write_columnar_output_file(reader, file_path: str, format_type: str) -> int:
+    """
+    Write Arrow record batches into a Parquet or Arrow IPC file as they arrive.
+
+    Args:
+        reader: pyarrow.RecordBatchReader from a QueryBuilder iter_* method with columnar=True
+        file_path: Output file path
+        format_type: 'parquet' or 'arrow'
+
+    Returns:
+        Number of rows written
+    """
+    from querying.columnar import COLUMNAR_WRITERS
+
+    try:
+        output_path = Path(file_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        count = COLUMNAR_WRITERS[format_type](reader, output_path)
+
+        console.print(f"✅ [green]Output written to: {file_path}[/green]")
+        _print_file_size(output_path)
+        return count
+
+    except OSError as e:
+        console.print(f"❌ [red]Failed to write output file: {e}[/red]")
+        raise typer.Exit(code=1)
+
+
+def _print_file_size(output_path: Path) -> None:
+    """Print the human-readable size of a written output file."""
+    file_size = output_path.stat().st_size
+    if file_size > 1024 * 1024:  # > 1MB
+        size_str = f"{file_size / (1024 * 1024):.2f} MB"
+    elif file_size > 1024:  # > 1KB
+        size_str = f"{file_size / 1024:.2f} KB"
+    else:
+        size_str = f"{file_size} bytes"
+
+    console.print(f"📁 [dim]File size: {size_str}[/dim]")
+
+
 def write_output_file(content: str, file_path: str, format_type: str):
     """Write formatted content to file with proper error handling."""
     try:
@@ -222,15 +377,7 @@ def write_output_file(content: str, file_path: str, format_type: str):
         console.print(f"✅ [green]Output written to: {file_path}[/green]")
         
         # Show file size
-        file_size = output_path.stat().st_size
-        if file_size > 1024 * 1024:  # > 1MB
-            size_str = f"{file_size / (1024 * 1024):.2f} MB"
-        elif file_size > 1024:  # > 1KB
-            size_str = f"{file_size / 1024:.2f} KB"
-        else:
-            size_str = f"{file_size} bytes"
-        
-        console.print(f"📁 [dim]File size: {size_str}[/dim]")
+        _print_file_size(output_path)
         
     except Exception as e:
         console.print(f"❌ [red]Failed to write output file: {e}[/red]")
@@ -262,7 +409,7 @@ def query(
     output_format: str = typer.Option(
         "table",
         "--output-format", "-f",
-        help="Output format (table, csv, json)"
+        help="Output format (table, csv, json, ndjson, parquet, arrow)"
     ),
     output_file: Optional[str] = typer.Option(
         None,
@@ -274,6 +421,16 @@ def query(
         "--limit",
         help="Limit number of results. Useful for large datasets like trades/tbbo."
     ),
+    fetch_size: Optional[int] = typer.Option(
+        None,
+        "--fetch-size",
+        help="Rows fetched per round trip (or per Parquet row group) when streaming results to a file (default: 10000)"
+    ),
+    bucket: Optional[str] = typer.Option(
+        None,
+        "--bucket",
+        help="Aggregate into bars of this width on the server (e.g. 30m, 4h, 1w). OHLCV schemas and trades only"
+    ),
     dry_run: bool = typer.Option(
         False,
         "--dry-run",
@@ -300,10 +457,22 @@ def query(
         # Basic daily OHLCV query
         python main.py query -s ES.c.0 --start-date 2024-01-01 --end-date 2024-01-31
         
-        # Multiple symbols with CSV output
+        # Multiple symbols with CSV output (streamed to the file)
         python main.py query -s ES.c.0,NQ.c.0 --start-date 2024-01-01 --end-date 2024-01-31 \\
             --output-format csv --output-file results.csv
+
+        # A month of trades as newline-delimited JSON, with flat memory use
+        python main.py query -s ES.c.0 --schema trades --start-date 2024-01-01 --end-date 2024-02-01 \\
+            --output-format ndjson --output-file es_trades.ndjson
+
+        # Columnar export for pandas/polars: one Parquet row group per fetched batch
+        python main.py query -s ES.c.0 --schema trades --start-date 2024-01-01 --end-date 2024-02-01 \\
+            --output-format parquet --output-file es_trades.parquet
         
+        # 30-minute bars aggregated by the database from stored 1-minute bars
+        python main.py query -s ES.c.0 --schema ohlcv-1m --start-date 2024-01-02 --end-date 2024-01-03 \\
+            --bucket 30m
+
         # Trade data with limit
         python main.py query -s ES.c.0 --schema trades --start-date 2024-01-01 --end-date 2024-01-02 \\
             --limit 1000
@@ -364,13 +533,27 @@ def query(
             validation_errors.append(f"Invalid schema: {schema}. Valid options: {', '.join(sorted(valid_schemas))}")
         
         # Output format validation
-        valid_formats = ["table", "csv", "json"]
+        valid_formats = ["table", "csv", "json", "ndjson", *COLUMNAR_FORMATS]
         if output_format not in valid_formats:
             validation_errors.append(f"Invalid output format: {output_format}. Valid options: {', '.join(valid_formats)}")
         
         # Limit validation
         if limit is not None and limit <= 0:
             validation_errors.append("Limit must be a positive integer")
+
+        if fetch_size is not None and fetch_size <= 0:
+            validation_errors.append("Fetch size must be a positive integer")
+
+        if output_format in ("ndjson", *COLUMNAR_FORMATS) and not output_file:
+            validation_errors.append(f"{output_format} output requires --output-file")
+
+        if bucket:
+            if not (schema.startswith("ohlcv") or schema == "trades"):
+                validation_errors.append(f"--bucket is only supported for OHLCV schemas and trades, not {schema}")
+            try:
+                parse_bucket(bucket)
+            except QueryingError as e:
+                validation_errors.append(str(e))
         
         if validation_errors:
             console.print("❌ [red]Validation errors:[/red]")
@@ -420,6 +603,8 @@ def query(
             console.print(f"Output file: {output_file}")
         if limit:
             console.print(f"Limit: {limit:,} records")
+        if bucket:
+            console.print(f"Bucket: {bucket} (aggregated on the server)")
         
         # Validate-only mode
         if validate_only:
@@ -451,18 +636,6 @@ def query(
         # Initialize QueryBuilder
         qb = QueryBuilder()
         
-        # Get the appropriate query method
-        if schema not in SCHEMA_MAPPING:
-            console.print(f"❌ [red]Schema mapping not found for: {schema}[/red]")
-            raise typer.Exit(code=1)
-        
-        query_method_name = SCHEMA_MAPPING[schema]
-        if not hasattr(qb, query_method_name):
-            console.print(f"❌ [red]Query method not implemented: {query_method_name}[/red]")
-            raise typer.Exit(code=1)
-        
-        query_method = getattr(qb, query_method_name)
-        
         # Build query parameters
         query_params = {
             "symbols": parsed_symbols,
@@ -472,6 +645,49 @@ def query(
         
         if limit:
             query_params["limit"] = limit
+
+        # Get the appropriate query method
+        if bucket:
+            # Bars are aggregated by the database; only one row per bucket comes back
+            query_params["bucket"] = bucket
+            if schema == "trades":
+                query_method_name = "query_trade_buckets"
+            else:
+                query_method_name = "query_ohlcv_buckets"
+                query_params["granularity"] = schema.split('-')[-1] if '-' in schema else '1d'
+        elif schema not in SCHEMA_MAPPING:
+            console.print(f"❌ [red]Schema mapping not found for: {schema}[/red]")
+            raise typer.Exit(code=1)
+        else:
+            query_method_name = SCHEMA_MAPPING[schema]
+
+        if not hasattr(qb, query_method_name):
+            console.print(f"❌ [red]Query method not implemented: {query_method_name}[/red]")
+            raise typer.Exit(code=1)
+        
+        query_method = getattr(qb, query_method_name)
+
+        # File exports stream rows from a server-side cursor straight to disk
+        if output_file and (output_format in STREAM_WRITERS or output_format in COLUMNAR_FORMATS):
+            if bucket:
+                # Already aggregated, so fetched in one go
+                stream_method, stream_params = query_method, query_params
+            else:
+                stream_method = getattr(qb, query_method_name.replace("query_", "iter_", 1))
+                stream_params = dict(query_params, fetch_size=fetch_size)
+            start_time = datetime.now()
+            if output_format in COLUMNAR_FORMATS:
+                batches = stream_method(**stream_params, columnar=True)
+                record_count = write_columnar_output_file(batches, output_file, output_format)
+            else:
+                rows = iter(stream_method(**stream_params))
+                record_count = stream_output_file(rows, output_file, output_format)
+            execution_time = (datetime.now() - start_time).total_seconds()
+
+            console.print("\n📊 [bold green]Query completed successfully![/bold green]")
+            console.print(f"📈 Records written: {record_count:,}")
+            console.print(f"⏱️  Execution time: {execution_time:.2f} seconds")
+            return
         
         # Execute query with progress tracking
         with EnhancedProgress() as progress:
@@ -490,7 +706,7 @@ def query(
         execution_time = (end_time - start_time).total_seconds()
         
         # Display results summary
-        console.print(f"\n📊 [bold green]Query completed successfully![/bold green]")
+        console.print("\n📊 [bold green]Query completed successfully![/bold green]")
         console.print(f"📈 Records retrieved: {len(results):,}")
         console.print(f"⏱️  Execution time: {execution_time:.2f} seconds")
         
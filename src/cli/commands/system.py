@@ -16,6 +16,7 @@ from rich.console import Console
 from rich.table import Table
 
 from core.pipeline_orchestrator import PipelineOrchestrator
+from querying import QueryBuilder
 from cli.progress_utils import OperationMonitor, LiveStatusDashboard, format_duration
 from cli.config_manager import get_config_manager
 from utils.custom_logger import get_logger
@@ -79,7 +80,23 @@ def list_jobs(
 
 
 @app.command()
-def status():
+def status(
+    coverage: bool = typer.Option(
+        False,
+        "--coverage", "-c",
+        help="Show stored data coverage per symbol and schema"
+    ),
+    symbols: Optional[str] = typer.Option(
+        None,
+        "--symbols", "-s",
+        help="Comma-separated symbols to limit the coverage report to"
+    ),
+    schema: Optional[str] = typer.Option(
+        None,
+        "--schema",
+        help="Schema to limit the coverage report to (e.g. ohlcv-1d, trades)"
+    )
+):
     """Check system status and connectivity."""
     console.print("🔍 [bold blue]Checking system status...[/bold blue]")
 
@@ -136,6 +153,48 @@ def status():
 
     console.print(info_table)
 
+    if coverage:
+        _print_coverage(symbols, schema)
+
+
+def _print_coverage(symbols: Optional[str], schema: Optional[str]) -> None:
+    """Print the ingestion coverage summary from the coverage catalog."""
+    symbol_list = [symbol.strip() for symbol in symbols.split(",") if symbol.strip()] if symbols else None
+
+    console.print("\n🗂️  [bold cyan]Data Coverage:[/bold cyan]")
+    try:
+        summary = QueryBuilder().get_coverage_summary(symbols=symbol_list, schema=schema)
+    except Exception as e:
+        console.print(f"❌ [red]Coverage catalog: unavailable ({e})[/red]")
+        return
+
+    if not summary:
+        console.print("ℹ️  [yellow]No coverage recorded yet (ingest data to populate the catalog)[/yellow]")
+        return
+
+    coverage_table = Table(show_header=True, header_style="bold magenta")
+    coverage_table.add_column("Symbol")
+    coverage_table.add_column("Schema")
+    coverage_table.add_column("First Day")
+    coverage_table.add_column("Last Day")
+    coverage_table.add_column("Days", justify="right")
+    coverage_table.add_column("Rows", justify="right")
+    coverage_table.add_column("Last Updated")
+
+    for entry in summary:
+        last_updated = entry.get("last_updated")
+        coverage_table.add_row(
+            entry["symbol"] or "-",
+            entry["schema"],
+            str(entry["first_day"]),
+            str(entry["last_day"]),
+            f"{entry['days']:,}",
+            f"{int(entry['total_rows'] or 0):,}",
+            last_updated.strftime("%Y-%m-%d %H:%M") if last_updated else "-"
+        )
+
+    console.print(coverage_table)
+
 
 @app.command()
 def version():
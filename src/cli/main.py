@@ -115,10 +115,26 @@ total_modules += 1
 # Add system commands directly to main app for now
 if 'system_app' in locals():
     @app.command()
-    def status():
+    def status(
+        coverage: bool = typer.Option(
+            False,
+            "--coverage", "-c",
+            help="Show stored data coverage per symbol and schema"
+        ),
+        symbols: Optional[str] = typer.Option(
+            None,
+            "--symbols", "-s",
+            help="Comma-separated symbols to limit the coverage report to"
+        ),
+        schema: Optional[str] = typer.Option(
+            None,
+            "--schema",
+            help="Schema to limit the coverage report to (e.g. ohlcv-1d, trades)"
+        )
+    ):
         """Check system status and connectivity."""
         from cli.commands.system import status as system_status
-        return system_status()
+        return system_status(coverage, symbols, schema)
     
     @app.command()
     def version():
@@ -306,10 +322,18 @@ if 'system_app' in locals():
             force: bool = typer.Option(False, "--force", help="Skip confirmation prompt"),
             dry_run: bool = typer.Option(False, "--dry-run", help="Preview ingestion without execution"),
             guided: bool = typer.Option(False, "--guided", help="Use interactive guided mode to select parameters"),
+            streaming: bool = typer.Option(False, "--streaming", help="Stream batches through the pipeline with bounded memory (recommended for tick/second data)"),
+            resume: bool = typer.Option(False, "--resume", help="Resume an interrupted job, skipping date chunks already checkpointed as stored"),
+            reprocess: bool = typer.Option(False, "--reprocess", help="Rebuild tables from the raw response cache only, without calling the API"),
+            incremental: bool = typer.Option(False, "--incremental", help="Only fetch date ranges not already stored (single-symbol jobs)"),
         ):
             """Execute data ingestion pipeline to fetch and store financial market data."""
             from cli.commands.ingestion import ingest as ingestion_ingest
-            return ingestion_ingest(api, job, dataset, schema, symbols, start_date, end_date, stype_in, force, dry_run, guided)
+            return ingestion_ingest(
+                api=api, job=job, dataset=dataset, schema=schema, symbols=symbols, start_date=start_date,
+                end_date=end_date, stype_in=stype_in, force=force, dry_run=dry_run, guided=guided,
+                streaming=streaming, resume=resume, reprocess=reprocess, incremental=incremental
+            )
         
         @app.command()
         def backfill(
@@ -318,14 +342,43 @@ if 'system_app' in locals():
             schemas: List[str] = typer.Option(["ohlcv-1d"], help="Data schemas to backfill"),
             api: str = typer.Option("databento", help="API provider"),
             dataset: str = typer.Option("GLBX.MDP3", help="Dataset to use"),
-            batch_size: int = typer.Option(5, help="Number of symbols to process in parallel"),
+            batch_size: int = typer.Option(5, help="Number of symbol/schema jobs to process in parallel"),
+            max_api_calls: int = typer.Option(4, help="Maximum concurrent API requests across all parallel jobs"),
+            max_db_writers: int = typer.Option(4, help="Maximum concurrent database writes across all parallel jobs"),
             retry_failed: bool = typer.Option(True, help="Automatically retry failed symbols"),
             dry_run: bool = typer.Option(False, help="Preview operation without execution"),
-            force: bool = typer.Option(False, help="Skip confirmation prompts")
+            force: bool = typer.Option(False, help="Skip confirmation prompts"),
+            resume: bool = typer.Option(False, "--resume", help="Resume an interrupted backfill, skipping date chunks already checkpointed as stored")
         ):
             """High-level backfill command for common use cases."""
             from cli.commands.ingestion import backfill as ingestion_backfill
-            return ingestion_backfill(symbol_group, lookback, schemas, api, dataset, batch_size, retry_failed, dry_run, force)
+            return ingestion_backfill(
+                symbol_group=symbol_group, lookback=lookback, schemas=schemas, api=api, dataset=dataset,
+                batch_size=batch_size, max_api_calls=max_api_calls, max_db_writers=max_db_writers,
+                retry_failed=retry_failed, dry_run=dry_run, force=force, resume=resume
+            )
+
+        @app.command("run-jobs")
+        def run_jobs(
+            api: str = typer.Option("databento", help="API provider whose predefined jobs are run"),
+            jobs: Optional[str] = typer.Option(None, help="Comma-separated job names (default: every job in the config)"),
+            max_workers: Optional[int] = typer.Option(None, help="Number of jobs run in parallel"),
+            max_api_calls: Optional[int] = typer.Option(None, help="Maximum concurrent API requests across all jobs"),
+            max_db_writers: Optional[int] = typer.Option(None, help="Maximum concurrent database writes across all jobs"),
+            keep_going: bool = typer.Option(False, "--keep-going", help="Keep starting jobs after a job fails"),
+            retry_failed: bool = typer.Option(True, help="Retry a failed job once, resuming from its checkpoints"),
+            resume: bool = typer.Option(False, "--resume", help="Skip date chunks already checkpointed as stored"),
+            incremental: bool = typer.Option(False, "--incremental", help="Only fetch date ranges not already stored"),
+            dry_run: bool = typer.Option(False, "--dry-run", help="Show the execution plan without running it"),
+            force: bool = typer.Option(False, "--force", help="Skip confirmation prompt")
+        ):
+            """Run predefined jobs concurrently under shared API and database budgets."""
+            from cli.commands.ingestion import run_jobs as ingestion_run_jobs
+            return ingestion_run_jobs(
+                api=api, jobs=jobs, max_workers=max_workers, max_api_calls=max_api_calls,
+                max_db_writers=max_db_writers, keep_going=keep_going, retry_failed=retry_failed,
+                resume=resume, incremental=incremental, dry_run=dry_run, force=force
+            )
 
     # Add querying commands to main app if available
     if 'querying_app' in locals():
@@ -354,7 +407,7 @@ if 'system_app' in locals():
             output_format: str = typer.Option(
                 "table",
                 "--output-format", "-f",
-                help="Output format (table, csv, json)"
+                help="Output format (table, csv, json, ndjson, parquet, arrow)"
             ),
             output_file: Optional[str] = typer.Option(
                 None,
@@ -366,6 +419,16 @@ if 'system_app' in locals():
                 "--limit",
                 help="Limit number of results. Useful for large datasets like trades/tbbo."
             ),
+            fetch_size: Optional[int] = typer.Option(
+                None,
+                "--fetch-size",
+                help="Rows fetched per round trip (or per Parquet row group) when streaming results to a file (default: 10000)"
+            ),
+            bucket: Optional[str] = typer.Option(
+                None,
+                "--bucket",
+                help="Aggregate into bars of this width on the server (e.g. 30m, 4h, 1w). OHLCV schemas and trades only"
+            ),
             dry_run: bool = typer.Option(
                 False,
                 "--dry-run",
@@ -384,7 +447,10 @@ if 'system_app' in locals():
         ):
             """Query historical financial data from TimescaleDB with intelligent symbol resolution."""
             from cli.commands.querying import query as querying_query
-            return querying_query(symbols, start_date, end_date, schema, output_format, output_file, limit, dry_run, validate_only, guided)
+            return querying_query(
+                symbols, start_date, end_date, schema, output_format, output_file, limit,
+                fetch_size=fetch_size, bucket=bucket, dry_run=dry_run, validate_only=validate_only, guided=guided
+            )
 
     # Add workflow commands to main app if available
     if 'workflow_app' in locals():
@@ -604,7 +670,7 @@ def info():
     console.print("✅ [green]All Modules Completed:[/green]")
     console.print("  • System commands (status, version, config, monitor, list-jobs, status-dashboard)")
     console.print("  • Help commands (examples, troubleshoot, tips, schemas, quickstart, help-menu, cheatsheet)")
-    console.print("  • Ingestion commands (ingest, backfill)")
+    console.print("  • Ingestion commands (ingest, backfill, run-jobs)")
     console.print("  • Query commands (query)")
     console.print("  • Workflow commands (workflows, workflow)")
     console.print("  • Validation commands (validate, market-calendar)")
@@ -13,8 +13,12 @@ from pathlib import Path
 from dataclasses import dataclass
 from enum import Enum
 import difflib
+import importlib.util
+import os
+import threading
 from functools import lru_cache
 
+import numpy as np
 import pandas as pd
 
 from rich.console import Console
@@ -23,6 +27,8 @@ from rich.table import Table
 from rich.panel import Panel
 from rich.text import Text
 
+from src.cli.trading_day_bitmap import TradingDayBitmap
+
 console = Console()
 
 
@@ -251,12 +257,19 @@ class SymbolCache:
         return self.symbol_metadata.get(symbol.upper())
 
 
-try:
-    import pandas_market_calendars as mcal
-    PANDAS_MARKET_CALENDARS_AVAILABLE = True
-except ImportError:
-    PANDAS_MARKET_CALENDARS_AVAILABLE = False
-    mcal = None
+# pandas-market-calendars is slow to import; it is only imported once a calendar
+# is actually needed (trading-day bitmaps answer most questions without it)
+PANDAS_MARKET_CALENDARS_AVAILABLE = importlib.util.find_spec("pandas_market_calendars") is not None
+mcal = None
+
+
+def _market_calendars():
+    """Import pandas-market-calendars on first use."""
+    global mcal
+    if mcal is None:
+        import pandas_market_calendars
+        mcal = pandas_market_calendars
+    return mcal
 
 # Cache for calendar instances to avoid redundant creation
 @lru_cache(maxsize=10)
@@ -277,14 +290,107 @@ def get_calendar_instance(exchange_name: str):
     if not PANDAS_MARKET_CALENDARS_AVAILABLE:
         raise ImportError("pandas-market-calendars is not installed. Please install it with: pip install pandas-market-calendars")
     
+    calendars = _market_calendars()
     try:
-        return mcal.get_calendar(exchange_name.upper())
+        return calendars.get_calendar(exchange_name.upper())
     except Exception as e:
         # Try to get available calendars for better error message
-        available = mcal.get_calendar_names() if hasattr(mcal, 'get_calendar_names') else []
+        available = calendars.get_calendar_names() if hasattr(calendars, 'get_calendar_names') else []
         raise ValueError(f"Unknown exchange calendar '{exchange_name}'. Available calendars: {', '.join(available)}") from e
 
 
+# Range and location of the persisted per-exchange trading-day bitmaps
+TRADING_DAY_BITMAP_START = date(1990, 1, 1)
+TRADING_DAY_BITMAP_END = date(2050, 12, 31)
+TRADING_DAY_BITMAP_ENV = "TRADING_DAY_BITMAP_DIR"
+DEFAULT_TRADING_DAY_BITMAP_DIR = Path(__file__).resolve().parents[2] / "cache" / "calendars"
+
+_trading_day_bitmaps: Dict[Tuple[str, str], TradingDayBitmap] = {}
+_trading_day_bitmaps_lock = threading.Lock()
+
+
+def trading_day_bitmap_dir() -> Path:
+    """Directory of the trading-day bitmaps ($TRADING_DAY_BITMAP_DIR or cache/calendars in the repository)."""
+    return Path(os.getenv(TRADING_DAY_BITMAP_ENV) or DEFAULT_TRADING_DAY_BITMAP_DIR)
+
+
+def _calendar_source() -> str:
+    """Description of the installed pandas-market-calendars, stored in built bitmaps."""
+    return f"pandas_market_calendars {getattr(_market_calendars(), '__version__', '')}".strip()
+
+
+def _build_trading_day_bitmap(exchange_name: str, source: str) -> TradingDayBitmap:
+    """Build an exchange's bitmap from pandas-market-calendars."""
+    valid_days = get_calendar_instance(exchange_name).valid_days(
+        start_date=TRADING_DAY_BITMAP_START, end_date=TRADING_DAY_BITMAP_END
+    )
+    trading_days = [pd.Timestamp(day).date() for day in valid_days]
+    # Guard against calendars without data for most of the range
+    weekdays = int(np.busday_count(TRADING_DAY_BITMAP_START, TRADING_DAY_BITMAP_END))
+    if len(trading_days) < weekdays // 2:
+        raise ValueError(f"calendar returned only {len(trading_days)} trading days")
+    return TradingDayBitmap.from_trading_days(TRADING_DAY_BITMAP_START, TRADING_DAY_BITMAP_END, trading_days, source)
+
+
+def get_trading_day_bitmap(
+    exchange_name: str,
+    bitmap_dir: Optional[Union[str, Path]] = None,
+    rebuild: bool = False
+) -> Optional[TradingDayBitmap]:
+    """
+    Load, or build and persist, the trading-day bitmap of an exchange.
+
+    An existing bitmap file is memory-mapped as is, without importing
+    pandas-market-calendars; the calendar is only used to build a missing or
+    unreadable file, or when ``rebuild`` is requested. Loaded bitmaps are
+    shared per process.
+
+    Args:
+        exchange_name: The name of the exchange (e.g., 'CME', 'NYSE')
+        bitmap_dir: Directory holding one bitmap file per exchange
+            (default: ``trading_day_bitmap_dir()``)
+        rebuild: Rebuild the file unless it was made by the installed
+            pandas-market-calendars release
+
+    Returns:
+        The bitmap, or None if there is none on disk and it cannot be built
+    """
+    exchange_name = exchange_name.upper()
+    bitmap_dir = Path(bitmap_dir) if bitmap_dir else trading_day_bitmap_dir()
+    key = (exchange_name, str(bitmap_dir))
+    with _trading_day_bitmaps_lock:
+        bitmap = _trading_day_bitmaps.get(key)
+        if bitmap is not None and not rebuild:
+            return bitmap
+
+        path = bitmap_dir / f"{exchange_name}.tdbm"
+        if bitmap is None and path.exists():
+            try:
+                bitmap = TradingDayBitmap.load(path)
+            except (OSError, ValueError) as e:
+                console.print(f"[yellow]Warning: Ignoring unreadable trading-day bitmap {path}: {e}[/yellow]")
+
+        if (bitmap is None or rebuild) and PANDAS_MARKET_CALENDARS_AVAILABLE:
+            try:
+                source = _calendar_source()
+                if bitmap is None or bitmap.source != source[:32]:
+                    bitmap = _build_trading_day_bitmap(exchange_name, source)
+                    try:
+                        bitmap.save(path)
+                        bitmap = TradingDayBitmap.load(path)
+                    except (OSError, ValueError) as e:
+                        # Still usable from memory for this process
+                        console.print(f"[yellow]Warning: Could not persist trading-day bitmap {path}: {e}[/yellow]")
+            except Exception as e:
+                console.print(f"[yellow]Warning: Could not build trading-day bitmap for {exchange_name}: {e}[/yellow]")
+                if bitmap is None:
+                    return None
+
+        if bitmap is not None:
+            _trading_day_bitmaps[key] = bitmap
+        return bitmap
+
+
 class MarketCalendar:
     """
     Market calendar service that wraps pandas-market-calendars to provide
@@ -292,15 +398,21 @@ class MarketCalendar:
     
     This class replaces the previous hardcoded holiday implementation with
     a robust, maintained solution that supports 50+ global exchanges.
+
+    Trading-day questions (is_trading_day, counts, next/previous trading day)
+    are answered from a memory-mapped trading-day bitmap when one covers the
+    dates, so they never build a pandas-market-calendars schedule.
     """
     
-    def __init__(self, exchange_name: str = "NYSE"):
+    def __init__(self, exchange_name: str = "NYSE", bitmap_dir: Optional[Union[str, Path]] = None):
         """
         Initialize the MarketCalendar for a specific exchange.
         
         Args:
             exchange_name: The name of the exchange calendar (e.g., 'CME', 'NYSE', 
                           'CME_Energy', 'CME_Equity'). Defaults to 'NYSE'.
+            bitmap_dir: Directory of persisted trading-day bitmaps
+                        (default: ``trading_day_bitmap_dir()``)
                           
         Raises:
             ValueError: If exchange name is invalid or calendar not found
@@ -310,14 +422,34 @@ class MarketCalendar:
             raise ValueError("Exchange name cannot be empty.")
         
         self.exchange_name = exchange_name.upper()
+        self._bitmap = get_trading_day_bitmap(self.exchange_name, bitmap_dir)
+        self._market_calendar = None
         
         # For backward compatibility, check if pandas-market-calendars is available
         if PANDAS_MARKET_CALENDARS_AVAILABLE:
-            self._calendar = get_calendar_instance(self.exchange_name)
+            # With a bitmap the calendar is only needed for schedules and
+            # dates outside it, so it is created on first use
+            if self._bitmap is None:
+                self._market_calendar = get_calendar_instance(self.exchange_name)
         else:
             # Fallback to basic implementation
-            self._calendar = None
             self.known_holidays = self._get_fallback_holidays()
+
+    @property
+    def _calendar(self):
+        """The pandas-market-calendars calendar, or None in fallback mode."""
+        if self._market_calendar is None and PANDAS_MARKET_CALENDARS_AVAILABLE:
+            self._market_calendar = get_calendar_instance(self.exchange_name)
+        return self._market_calendar
+
+    @property
+    def trading_day_bitmap(self) -> Optional[TradingDayBitmap]:
+        """The trading-day bitmap in use, or None."""
+        return self._bitmap
+
+    def _bitmap_covers(self, *dates: date) -> bool:
+        """Whether the bitmap can answer for all given dates."""
+        return self._bitmap is not None and all(self._bitmap.covers(d) for d in dates)
             
     def _get_fallback_holidays(self) -> Set[date]:
         """
@@ -373,6 +505,8 @@ class MarketCalendar:
         Returns:
             True if the date is a trading day, False otherwise.
         """
+        if self._bitmap_covers(check_date):
+            return self._bitmap.is_trading_day(check_date)
         if self._calendar:
             # Use pandas-market-calendars
             schedule = self._calendar.schedule(start_date=check_date, end_date=check_date)
@@ -397,6 +531,8 @@ class MarketCalendar:
         Returns:
             A list of trading days as date objects.
         """
+        if self._bitmap_covers(start_date, end_date):
+            return self._bitmap.trading_days(start_date, end_date).tolist()
         if self._calendar:
             # Use pandas-market-calendars
             valid_days = self._calendar.valid_days(start_date=start_date, end_date=end_date)
@@ -411,6 +547,23 @@ class MarketCalendar:
                     trading_days.append(current_date)
                 current_date += timedelta(days=1)
             return trading_days
+
+    def get_trading_days_count(self, start_date: date, end_date: date) -> int:
+        """
+        Count the trading days within a date range (both ends inclusive).
+        
+        Args:
+            start_date: The start of the date range.
+            end_date: The end of the date range.
+            
+        Returns:
+            Number of trading days, 0 if end_date is before start_date.
+        """
+        if end_date < start_date:
+            return 0
+        if self._bitmap_covers(start_date, end_date):
+            return self._bitmap.count(start_date, end_date)
+        return len(self.get_trading_days(start_date, end_date))
             
     def get_schedule(self, start_date: date, end_date: date) -> pd.DataFrame:
         """
@@ -476,6 +629,10 @@ class MarketCalendar:
         Returns:
             Next trading day
         """
+        if self._bitmap_covers(from_date):
+            found = self._bitmap.next_trading_days([from_date])[0]
+            if not np.isnat(found):
+                return found.item()
         next_day = from_date + timedelta(days=1)
         while not self.is_trading_day(next_day):
             next_day += timedelta(days=1)
@@ -491,10 +648,46 @@ class MarketCalendar:
         Returns:
             Previous trading day
         """
+        if self._bitmap_covers(from_date):
+            found = self._bitmap.previous_trading_days([from_date])[0]
+            if not np.isnat(found):
+                return found.item()
         prev_day = from_date - timedelta(days=1)
         while not self.is_trading_day(prev_day):
             prev_day -= timedelta(days=1)
         return prev_day
+
+    def get_next_trading_days(self, dates: List[date]) -> List[date]:
+        """
+        Vectorized get_next_trading_day.
+        
+        Args:
+            dates: Starting dates
+            
+        Returns:
+            Next trading day after each date
+        """
+        if dates and self._bitmap_covers(min(dates), max(dates)):
+            found = self._bitmap.next_trading_days(dates)
+            if not np.isnat(found).any():
+                return found.tolist()
+        return [self.get_next_trading_day(d) for d in dates]
+
+    def get_previous_trading_days(self, dates: List[date]) -> List[date]:
+        """
+        Vectorized get_previous_trading_day.
+        
+        Args:
+            dates: Starting dates
+            
+        Returns:
+            Previous trading day before each date
+        """
+        if dates and self._bitmap_covers(min(dates), max(dates)):
+            found = self._bitmap.previous_trading_days(dates)
+            if not np.isnat(found).any():
+                return found.tolist()
+        return [self.get_previous_trading_day(d) for d in dates]
         
     def get_early_closes(self, start_date: date, end_date: date) -> Dict[date, str]:
         """
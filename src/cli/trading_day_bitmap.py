@@ -0,0 +1,276 @@
+"""
+Precomputed per-exchange trading-day bitmap.
+
+Asking pandas-market-calendars whether a single day trades builds a schedule
+DataFrame on every call, which dominates multi-year chunk planning. The bitmap
+answers the same questions from three flat arrays covering several decades:
+
+- one bit per calendar day (1 = trading day), for O(1) ``is_trading_day``
+- prefix counts of trading days, so ``count(start, end)`` is one subtraction
+- the day index of every trading day, so next/previous trading-day lookups are
+  two array reads and work on whole arrays of dates at once
+
+The arrays are stored in a single file and memory-mapped when loaded, so a
+calendar costs a page-in rather than a rebuild, and only numpy is needed to
+use it; pandas-market-calendars is only needed to build it.
+"""
+
+import os
+import struct
+import threading
+from datetime import date
+from pathlib import Path
+from typing import Any, Iterable, Union
+
+import numpy as np
+
+DateLike = Union[date, np.datetime64, str]
+
+_MAGIC = b"TDBM"
+_FORMAT_VERSION = 1
+# magic, format version, reserved, first day (days since 1970-01-01), days, trading days, source
+_HEADER = struct.Struct("<4sHHqII32s")
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+_NOT_A_DAY = np.datetime64("NaT", "D")
+
+
+def _aligned(offset: int) -> int:
+    """Round a file offset up to a multiple of 8."""
+    return (offset + 7) & ~7
+
+
+def _layout(n_days: int, n_trading: int):
+    """Byte offsets of the bit array, prefix counts and trading-day indexes, and the file size."""
+    bits_offset = _aligned(_HEADER.size)
+    prefix_offset = _aligned(bits_offset + (n_days + 7) // 8)
+    trading_offset = _aligned(prefix_offset + 4 * (n_days + 1))
+    return bits_offset, prefix_offset, trading_offset, trading_offset + 4 * n_trading
+
+
+class TradingDayBitmap:
+    """Trading days of one exchange over a fixed range of calendar days."""
+
+    def __init__(self, first_day: int, bits: np.ndarray, prefix: np.ndarray, trading: np.ndarray, source: str = ""):
+        """
+        Wrap prebuilt arrays; use ``from_trading_days`` or ``load`` instead.
+
+        Args:
+            first_day: First covered day as days since 1970-01-01
+            bits: Little-endian packed trading flags, one bit per covered day
+            prefix: Trading days before each day index (length: days + 1)
+            trading: Day index of every trading day, ascending
+            source: Description of the calendar the bitmap was built from
+        """
+        self._first = int(first_day)
+        self._bits = bits
+        self._prefix = prefix
+        self._trading = trading
+        self.n_days = len(prefix) - 1
+        self.source = source
+
+    @classmethod
+    def from_trading_days(
+        cls,
+        first_day: date,
+        last_day: date,
+        trading_days: Iterable[Any],
+        source: str = ""
+    ) -> "TradingDayBitmap":
+        """
+        Build a bitmap from a list of trading days.
+
+        Args:
+            first_day: First calendar day covered
+            last_day: Last calendar day covered
+            trading_days: Trading days (dates or datetime64); days outside the range are ignored
+            source: Description of the calendar, stored with the bitmap
+
+        Returns:
+            The bitmap
+
+        Raises:
+            ValueError: If the range is empty
+        """
+        first = first_day.toordinal() - _EPOCH_ORDINAL
+        n_days = last_day.toordinal() - first_day.toordinal() + 1
+        if n_days <= 0:
+            raise ValueError(f"Empty bitmap range {first_day} to {last_day}")
+
+        days = np.asarray(list(trading_days), dtype="datetime64[D]").astype(np.int64) - first
+        days = np.unique(days[(days >= 0) & (days < n_days)])
+        flags = np.zeros(n_days, dtype=np.uint8)
+        flags[days] = 1
+
+        prefix = np.zeros(n_days + 1, dtype=np.int32)
+        np.cumsum(flags, out=prefix[1:])
+        return cls(first, np.packbits(flags, bitorder="little"), prefix, days.astype(np.int32), source)
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "TradingDayBitmap":
+        """
+        Memory-map a bitmap written by ``save``.
+
+        Args:
+            path: Bitmap file
+
+        Returns:
+            The bitmap, backed by the file
+
+        Raises:
+            ValueError: If the file is not a bitmap of this format or is truncated
+        """
+        mapped = np.memmap(path, dtype=np.uint8, mode="r")
+        if len(mapped) < _HEADER.size:
+            raise ValueError(f"Truncated trading-day bitmap: {path}")
+        magic, version, _, first, n_days, n_trading, source = _HEADER.unpack(bytes(mapped[:_HEADER.size]))
+        if magic != _MAGIC or version != _FORMAT_VERSION:
+            raise ValueError(f"Not a trading-day bitmap (format {_FORMAT_VERSION}): {path}")
+
+        bits_offset, prefix_offset, trading_offset, size = _layout(n_days, n_trading)
+        if len(mapped) != size:
+            raise ValueError(f"Trading-day bitmap has {len(mapped)} bytes, expected {size}: {path}")
+        return cls(
+            first,
+            np.frombuffer(mapped, dtype=np.uint8, count=(n_days + 7) // 8, offset=bits_offset),
+            np.frombuffer(mapped, dtype="<i4", count=n_days + 1, offset=prefix_offset),
+            np.frombuffer(mapped, dtype="<i4", count=n_trading, offset=trading_offset),
+            source.rstrip(b"\0").decode("utf-8"),
+        )
+
+    def save(self, path: Union[str, Path]) -> None:
+        """
+        Write the bitmap to a file, replacing it atomically.
+
+        Args:
+            path: Destination file
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        bits_offset, prefix_offset, trading_offset, size = _layout(self.n_days, len(self._trading))
+        buffer = bytearray(size)
+        _HEADER.pack_into(
+            buffer, 0, _MAGIC, _FORMAT_VERSION, 0, self._first, self.n_days, len(self._trading),
+            self.source.encode("utf-8")[:32]
+        )
+        buffer[bits_offset:bits_offset + len(self._bits)] = self._bits.tobytes()
+        buffer[prefix_offset:prefix_offset + 4 * len(self._prefix)] = self._prefix.astype("<i4").tobytes()
+        buffer[trading_offset:size] = self._trading.astype("<i4").tobytes()
+
+        tmp_path = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(buffer)
+            os.replace(tmp_path, path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+    @property
+    def first_day(self) -> date:
+        """First calendar day covered."""
+        return date.fromordinal(self._first + _EPOCH_ORDINAL)
+
+    @property
+    def last_day(self) -> date:
+        """Last calendar day covered."""
+        return date.fromordinal(self._first + self.n_days - 1 + _EPOCH_ORDINAL)
+
+    def _index(self, day: date) -> int:
+        """Day index of a covered date."""
+        index = day.toordinal() - _EPOCH_ORDINAL - self._first
+        if not 0 <= index < self.n_days:
+            raise ValueError(f"{day} is outside the bitmap range {self.first_day} to {self.last_day}")
+        return index
+
+    def _indexes(self, days: Any) -> np.ndarray:
+        """Day indexes of an array of dates (may fall outside the range)."""
+        return np.asarray(days, dtype="datetime64[D]").astype(np.int64) - self._first
+
+    def covers(self, day: date) -> bool:
+        """Whether a date lies within the bitmap range."""
+        return 0 <= day.toordinal() - _EPOCH_ORDINAL - self._first < self.n_days
+
+    def is_trading_day(self, day: date) -> bool:
+        """
+        Whether a covered date is a trading day.
+
+        Raises:
+            ValueError: If the date is outside the bitmap range
+        """
+        index = self._index(day)
+        return bool((self._bits[index >> 3] >> (index & 7)) & 1)
+
+    def is_trading_days(self, days: Iterable[DateLike]) -> np.ndarray:
+        """
+        Vectorized ``is_trading_day``.
+
+        Returns:
+            Boolean array; dates outside the range are False
+        """
+        indexes = self._indexes(days)
+        inside = (indexes >= 0) & (indexes < self.n_days)
+        safe = np.where(inside, indexes, 0)
+        return inside & (self._prefix[safe + 1] > self._prefix[safe])
+
+    def count(self, start: date, end: date) -> int:
+        """
+        Number of trading days from ``start`` to ``end``, both inclusive.
+
+        Returns:
+            The count; 0 if ``end`` is before ``start``
+
+        Raises:
+            ValueError: If either date is outside the bitmap range
+        """
+        if end < start:
+            return 0
+        return int(self._prefix[self._index(end) + 1] - self._prefix[self._index(start)])
+
+    def trading_days(self, start: date, end: date) -> np.ndarray:
+        """
+        Trading days from ``start`` to ``end``, both inclusive.
+
+        Returns:
+            datetime64[D] array
+
+        Raises:
+            ValueError: If either date is outside the bitmap range
+        """
+        if end < start:
+            return np.array([], dtype="datetime64[D]")
+        window = self._trading[self._prefix[self._index(start)]:self._prefix[self._index(end) + 1]]
+        return (window.astype(np.int64) + self._first).astype("datetime64[D]")
+
+    def next_trading_days(self, days: Iterable[DateLike]) -> np.ndarray:
+        """
+        First trading day strictly after each date.
+
+        Returns:
+            datetime64[D] array; NaT for dates outside the range or without a
+            later trading day in it
+        """
+        indexes = self._indexes(days)
+        inside = (indexes >= 0) & (indexes < self.n_days)
+        rank = self._prefix[np.where(inside, indexes, 0) + 1]
+        found = inside & (rank < len(self._trading))
+        return self._to_dates(rank, found)
+
+    def previous_trading_days(self, days: Iterable[DateLike]) -> np.ndarray:
+        """
+        Last trading day strictly before each date.
+
+        Returns:
+            datetime64[D] array; NaT for dates outside the range or without an
+            earlier trading day in it
+        """
+        indexes = self._indexes(days)
+        inside = (indexes >= 0) & (indexes < self.n_days)
+        rank = self._prefix[np.where(inside, indexes, 0)].astype(np.int64) - 1
+        found = inside & (rank >= 0)
+        return self._to_dates(rank, found)
+
+    def _to_dates(self, rank: np.ndarray, found: np.ndarray) -> np.ndarray:
+        """Dates of the trading days at the given ranks, NaT where not ``found``."""
+        if len(self._trading) == 0:
+            return np.full(rank.shape, _NOT_A_DAY)
+        trading = self._trading[np.clip(rank, 0, len(self._trading) - 1)].astype(np.int64) + self._first
+        return np.where(found, trading.astype("datetime64[D]"), _NOT_A_DAY)
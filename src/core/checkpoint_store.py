@@ -0,0 +1,206 @@
+"""
+Chunk-level checkpoints for resumable ingestion jobs.
+
+Every job gets a JSON Lines manifest under ``base_dir`` whose file name is
+derived from the job's identity (name, dataset, schema, stype_in and
+symbols). One line is appended, and fsync'ed, for each date chunk (as planned by
+the adapter from ``_generate_date_chunks``) once it has been durably stored.
+A resumed run reads the manifest in one pass, O(chunks), without touching
+the database, and skips every chunk window already listed. With adaptive chunk
+sizing a resumed run may plan different windows than the interrupted one, so a
+window also counts as done when the listed windows cover it together.
+
+The manifest is append-only, so a crash can at worst lose the line of the chunk
+being written; that chunk is then simply re-ingested (loads are upserts).
+"""
+
+import bisect
+import hashlib
+import json
+import os
+import re
+import threading
+from datetime import datetime, UTC
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+ChunkWindow = Tuple[str, str]
+Span = Tuple[datetime, datetime]
+
+_MAX_UTC = datetime.max.replace(tzinfo=UTC)
+
+
+class CheckpointStore:
+    """Append-only, per-job manifest of completed date chunks."""
+
+    def __init__(self, base_dir: str = "checkpoints"):
+        """
+        Initialize the checkpoint store.
+
+        Args:
+            base_dir: Directory holding one manifest file per job
+        """
+        self.base_dir = Path(base_dir)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def job_key(job_config: Dict[str, Any]) -> str:
+        """
+        Stable identity of a job for checkpointing.
+
+        Args:
+            job_config: Job configuration dictionary
+
+        Returns:
+            File-name-safe key combining the job name and a hash of its data identity
+        """
+        symbols = job_config.get("symbols", [])
+        symbols = sorted(symbols) if isinstance(symbols, (list, tuple)) else [symbols]
+        identity = json.dumps({
+            "name": job_config.get("name", "unnamed_job"),
+            "dataset": job_config.get("dataset"),
+            "schema": job_config.get("schema"),
+            "stype_in": job_config.get("stype_in"),
+            "symbols": symbols,
+        }, sort_keys=True, default=str)
+        digest = hashlib.sha256(identity.encode("utf-8")).hexdigest()[:16]
+        name = re.sub(r"[^A-Za-z0-9_.-]+", "_", str(job_config.get("name", "unnamed_job")))
+        return f"{name}-{digest}"
+
+    def manifest_path(self, job_config: Dict[str, Any]) -> Path:
+        """Path of the job's manifest file."""
+        return self.base_dir / f"{self.job_key(job_config)}.jsonl"
+
+    def completed_chunks(self, job_config: Dict[str, Any]) -> Set[ChunkWindow]:
+        """
+        Read the chunk windows already stored for a job.
+
+        Args:
+            job_config: Job configuration dictionary
+
+        Returns:
+            Set of (start, end) windows; empty if the job has no manifest
+        """
+        path = self.manifest_path(job_config)
+        completed: Set[ChunkWindow] = set()
+        if not path.exists():
+            return completed
+
+        with open(path, "r", encoding="utf-8") as manifest:
+            for line_number, line in enumerate(manifest, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    entry = json.loads(line)
+                    completed.add((entry["start"], entry["end"]))
+                except (json.JSONDecodeError, KeyError) as e:
+                    # A torn final line from a crash mid-write; that chunk is re-ingested
+                    logger.warning("Ignoring unreadable checkpoint entry", path=str(path), line=line_number, error=str(e))
+
+        return completed
+
+    @staticmethod
+    def covered_spans(completed: Iterable[ChunkWindow]) -> List[Span]:
+        """
+        Merge completed windows into sorted, non-overlapping spans.
+
+        Compute this once per planning pass and hand it to ``is_covered`` so
+        that checking every planned chunk stays O(chunks log chunks).
+
+        Args:
+            completed: Windows from ``completed_chunks``
+
+        Returns:
+            Sorted (start, end) spans in UTC; unparseable windows are ignored
+        """
+        return _merged_spans(completed)
+
+    @staticmethod
+    def is_covered(completed: Set[ChunkWindow], start: str, end: str,
+                   spans: Optional[List[Span]] = None) -> bool:
+        """
+        Whether a chunk window lies entirely within completed windows.
+
+        Args:
+            completed: Windows from ``completed_chunks``
+            start: Chunk start as planned by the adapter
+            end: Chunk end as planned by the adapter
+            spans: ``covered_spans(completed)``, if already computed
+
+        Returns:
+            True if the window is listed or the union of listed windows spans it
+        """
+        if (start, end) in completed:
+            return True
+        if spans is None:
+            spans = _merged_spans(completed)
+        try:
+            window_start, window_end = _to_utc(start), _to_utc(end)
+        except (ValueError, TypeError):
+            return False
+        # The only span that can contain the window is the last one starting at or before it
+        index = bisect.bisect_right(spans, (window_start, _MAX_UTC)) - 1
+        return index >= 0 and window_start < spans[index][1] and window_end <= spans[index][1]
+
+    def mark_completed(self, job_config: Dict[str, Any], start: str, end: str, records: int = 0) -> None:
+        """
+        Durably record that a chunk window has been stored.
+
+        Args:
+            job_config: Job configuration dictionary
+            start: Chunk start as planned by the adapter
+            end: Chunk end as planned by the adapter
+            records: Number of records stored for the chunk
+        """
+        entry = json.dumps({
+            "start": start,
+            "end": end,
+            "records": records,
+            "completed_at": datetime.now(UTC).isoformat(),
+        })
+        path = self.manifest_path(job_config)
+
+        with self._lock:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, "a", encoding="utf-8") as manifest:
+                manifest.write(entry + "\n")
+                manifest.flush()
+                os.fsync(manifest.fileno())
+
+    def clear(self, job_config: Dict[str, Any]) -> None:
+        """
+        Forget every checkpoint of a job (a non-resumed run starts over).
+
+        Args:
+            job_config: Job configuration dictionary
+        """
+        with self._lock:
+            self.manifest_path(job_config).unlink(missing_ok=True)
+
+
+def _to_utc(value: str) -> datetime:
+    """Parse a chunk bound; naive bounds are taken as UTC."""
+    parsed = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    return parsed.replace(tzinfo=UTC) if parsed.tzinfo is None else parsed
+
+
+def _merged_spans(windows: Iterable[ChunkWindow]) -> List[Span]:
+    """Union of chunk windows as sorted, non-overlapping (start, end) spans."""
+    bounds: List[Span] = []
+    for start, end in windows:
+        try:
+            bounds.append((_to_utc(start), _to_utc(end)))
+        except (ValueError, TypeError):
+            continue
+
+    spans: List[Span] = []
+    for start, end in sorted(bounds):
+        if spans and start <= spans[-1][1]:
+            spans[-1] = (spans[-1][0], max(spans[-1][1], end))
+        else:
+            spans.append((start, end))
+    return spans
@@ -0,0 +1,77 @@
+"""
+Missing-range computation for incremental ingestion.
+
+Given the days already stored per symbol, work out which parts of a job's date
+window still need fetching:
+
+- everything before a symbol's first stored day,
+- gaps between stored days longer than ``gap_tolerance_days`` (shorter gaps are
+  weekends and holidays, which have no data),
+- the last stored day onwards, since that day may only be partially stored
+  (or, with ``refetch_last_day=False``, every day after it).
+
+The tolerance only bridges gaps between stored days: nothing stored before the
+first day or after the last one tells a closure apart from data never fetched,
+so the window edges are always fetched.
+
+A symbol with nothing stored needs the whole window. Ranges of all symbols are
+merged, because a chunk request covers every symbol of the job.
+"""
+
+from datetime import date, timedelta
+from typing import Dict, Iterable, List, Set, Tuple
+
+DateRange = Tuple[date, date]
+
+
+def find_missing_ranges(
+    stored_days: Dict[str, Set[date]],
+    symbols: Iterable[str],
+    start: date,
+    end: date,
+    gap_tolerance_days: int = 4,
+    refetch_last_day: bool = True
+) -> List[DateRange]:
+    """
+    Compute the date ranges of a window that still need to be ingested.
+
+    Args:
+        stored_days: Days holding rows per symbol (see StoredRangeMixin.get_stored_days)
+        symbols: Symbols of the job
+        start: Inclusive window start
+        end: Exclusive window end
+        gap_tolerance_days: Longest run of empty days between stored days treated
+            as a market closure
+        refetch_last_day: Whether the last stored day counts as missing (it may be
+            partial); when False the stored days are trusted as complete
+
+    Returns:
+        Sorted, non-overlapping half-open [start, end) ranges; empty if nothing is missing
+    """
+    ranges: List[DateRange] = []
+    for symbol in symbols:
+        days = sorted(day for day in stored_days.get(symbol, ()) if start <= day < end)
+        if not days:
+            ranges.append((start, end))
+            continue
+
+        ranges.append((start, days[0]))
+        for previous, current in zip(days, days[1:]):
+            if (current - previous).days - 1 > gap_tolerance_days:
+                ranges.append((previous + timedelta(days=1), current))
+        ranges.append((days[-1] if refetch_last_day else days[-1] + timedelta(days=1), end))
+
+    return _merge(ranges)
+
+
+def _merge(ranges: List[DateRange]) -> List[DateRange]:
+    """Merge overlapping or touching ranges."""
+    merged: List[DateRange] = []
+    for range_start, range_end in sorted(ranges):
+        if range_start >= range_end:
+            continue
+        if merged and range_start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], range_end))
+        else:
+            merged.append((range_start, range_end))
+    return merged
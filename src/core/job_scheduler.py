@@ -0,0 +1,385 @@
+"""
+Concurrent execution of the predefined jobs of an API config.
+
+``JobScheduler`` runs a whole job list, such as every job in
+``databento_config.yaml``, on a worker pool. Like ``ParallelBackfill``, it gives
+every attempt its own orchestrator, and all attempts share one
+``ConcurrencyLimits``. API requests and database writes therefore keep
+separate budgets however many jobs run at once.
+
+Jobs start in order of ``priority`` (higher first), then estimated size
+(largest first, so long jobs do not start last and stretch the run). A job
+waits for the jobs it depends on:
+
+- the jobs named in its ``depends_on`` list;
+- for an OHLCV job with ``derive_from``, the job in the list that loads the
+  source granularity.
+
+A job whose dependency did not succeed is skipped.
+
+By default, the first job that still fails after its retry stops the run. No
+further job is started. Jobs already running finish normally, and their
+checkpoints let a ``resume`` run continue from where they stopped. The
+remaining jobs are reported as skipped.
+"""
+
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from datetime import date
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+import structlog
+
+from src.core.parallel_backfill import BackfillTaskResult, ConcurrencyLimits, ParallelBackfill
+from src.core.pipeline_metrics import write_job_report
+from src.storage.connection_pool import close_shared_connection_providers
+
+logger = structlog.get_logger(__name__)
+
+# Rough records per symbol and calendar day; only used to order jobs by size
+RECORDS_PER_SYMBOL_DAY: Dict[str, int] = {
+    "ohlcv-1d": 1,
+    "ohlcv-1h": 23,
+    "ohlcv-15m": 92,
+    "ohlcv-5m": 276,
+    "ohlcv-1m": 1_380,
+    "ohlcv-1s": 40_000,
+    "trades": 250_000,
+    "tbbo": 250_000,
+    "statistics": 200,
+    "definition": 2_000,
+}
+DEFAULT_RECORDS_PER_SYMBOL_DAY = 1_000
+
+STATUS_SKIPPED = "skipped"
+
+
+class ScheduledJob(NamedTuple):
+    """One predefined job with its resolved scheduling attributes."""
+
+    name: str
+    schema: str
+    job_config: Dict[str, Any]
+    priority: int
+    estimated_records: int
+    depends_on: Tuple[str, ...]
+
+    @property
+    def symbol(self) -> str:
+        """Requested symbols as one string (for task logging)."""
+        symbols = self.job_config.get("symbols") or []
+        return ",".join(symbols) if isinstance(symbols, list) else str(symbols)
+
+    @property
+    def label(self) -> str:
+        """Human-readable task name used in summaries."""
+        return self.name
+
+
+def estimate_job_records(job_config: Dict[str, Any]) -> int:
+    """
+    Estimate the number of records a job loads, from its schema, symbols and date range.
+
+    Args:
+        job_config: Job configuration dictionary
+
+    Returns:
+        Rough record count (at least the per-day density of one symbol)
+    """
+    schema = str(job_config.get("schema", "")).lower()
+    symbols = job_config.get("symbols") or []
+    symbol_count = max(1, len(symbols)) if isinstance(symbols, list) else 1
+    try:
+        start = date.fromisoformat(str(job_config["start_date"])[:10])
+        end = date.fromisoformat(str(job_config["end_date"])[:10])
+        days = max(1, (end - start).days + 1)
+    except (KeyError, ValueError):
+        days = 1
+    return symbol_count * days * RECORDS_PER_SYMBOL_DAY.get(schema, DEFAULT_RECORDS_PER_SYMBOL_DAY)
+
+
+def plan_jobs(job_configs: List[Dict[str, Any]]) -> List[ScheduledJob]:
+    """
+    Resolve dependencies and order jobs for execution.
+
+    Args:
+        job_configs: Job configurations, e.g. the ``jobs`` list of an API config
+
+    Returns:
+        Jobs ordered by priority (descending), then estimated records (descending),
+        then their position in ``job_configs``
+
+    Raises:
+        ValueError: If a job has no name, names are duplicated, a ``depends_on``
+            entry names an unknown job, or dependencies form a cycle
+    """
+    names = [job_config.get("name") for job_config in job_configs]
+    if not all(names):
+        raise ValueError("Every scheduled job needs a name")
+    duplicates = sorted({name for name in names if names.count(name) > 1})
+    if duplicates:
+        raise ValueError(f"Duplicate job names: {duplicates}")
+
+    jobs = []
+    for job_config in job_configs:
+        depends_on = list(job_config.get("depends_on") or [])
+        unknown = [name for name in depends_on if name not in names]
+        if unknown:
+            raise ValueError(f"Job '{job_config['name']}' depends on unknown jobs: {unknown}")
+
+        # Derived bars need the source granularity loaded first, when this run loads it
+        if job_config.get("derive_from"):
+            source_schema = f"ohlcv-{job_config['derive_from']}"
+            depends_on.extend(
+                other["name"] for other in job_configs
+                if other.get("schema") == source_schema
+                and other.get("dataset") == job_config.get("dataset")
+                and other["name"] not in depends_on
+            )
+
+        jobs.append(ScheduledJob(
+            name=job_config["name"],
+            schema=str(job_config.get("schema", "")),
+            job_config=job_config,
+            priority=int(job_config.get("priority", 0)),
+            estimated_records=estimate_job_records(job_config),
+            depends_on=tuple(depends_on)
+        ))
+
+    _check_acyclic(jobs)
+    order = {job.name: index for index, job in enumerate(jobs)}
+    return sorted(jobs, key=lambda job: (-job.priority, -job.estimated_records, order[job.name]))
+
+
+def _check_acyclic(jobs: List[ScheduledJob]) -> None:
+    """Raise ValueError if the dependencies of ``jobs`` contain a cycle."""
+    by_name = {job.name: job for job in jobs}
+    done, visiting = set(), []
+
+    def visit(name: str) -> None:
+        if name in done:
+            return
+        if name in visiting:
+            cycle = visiting[visiting.index(name):] + [name]
+            raise ValueError(f"Job dependency cycle: {' -> '.join(cycle)}")
+        visiting.append(name)
+        for dependency in by_name[name].depends_on:
+            visit(dependency)
+        visiting.pop()
+        done.add(name)
+
+    for job in jobs:
+        visit(job.name)
+
+
+class JobScheduler(ParallelBackfill):
+    """
+    Run a list of predefined jobs concurrently under shared API and DB budgets.
+
+    Attempts run (and are retried) exactly like ``ParallelBackfill`` tasks;
+    ``orchestrator_factory`` is called with the shared ``ConcurrencyLimits``.
+    """
+
+    def __init__(
+        self,
+        orchestrator_factory: Callable[[ConcurrencyLimits], Any],
+        max_workers: int = 4,
+        max_api_calls: Optional[int] = None,
+        max_db_writers: Optional[int] = None,
+        retry_failed: bool = True,
+        stop_on_failure: bool = True,
+        report_dir: Optional[str] = None
+    ):
+        """
+        Initialize the scheduler.
+
+        Args:
+            orchestrator_factory: Creates an orchestrator bound to the shared limits
+            max_workers: Number of jobs executed concurrently
+            max_api_calls: Global cap on concurrent API calls (default: max_workers)
+            max_db_writers: Global cap on concurrent database writes (default: max_workers)
+            retry_failed: Retry a failed job once, resuming from its checkpoints
+            stop_on_failure: Start no further jobs once a job has failed
+            report_dir: Directory receiving the consolidated JSON report (None: not written)
+
+        Raises:
+            ValueError: If max_workers is below 1
+        """
+        super().__init__(orchestrator_factory, max_workers, max_api_calls, max_db_writers, retry_failed)
+        self.stop_on_failure = stop_on_failure
+        self.report_dir = report_dir
+
+    def run(
+        self,
+        job_configs: List[Dict[str, Any]],
+        on_task_done: Optional[Callable[[BackfillTaskResult], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        Execute the jobs and consolidate the results.
+
+        Args:
+            job_configs: Job configurations to run
+            on_task_done: Called on the calling thread as each job finishes or is skipped
+
+        Returns:
+            Summary dictionary as ``ParallelBackfill.run`` (failed jobs only in
+            'failed'), plus 'skipped' labels, 'stopped_by' (the job that stopped
+            the run, or None), 'order' (job names in planned order) and, if
+            written, 'report_path'
+
+        Raises:
+            ValueError: If the job list cannot be planned (see ``plan_jobs``)
+        """
+        jobs = plan_jobs(job_configs)
+        started_at = time.perf_counter()
+        logger.info(
+            "Starting scheduled job run",
+            jobs=[job.name for job in jobs],
+            max_workers=self.max_workers,
+            max_api_calls=self.limits.max_api_calls,
+            max_db_writers=self.limits.max_db_writers,
+            stop_on_failure=self.stop_on_failure
+        )
+
+        results: Dict[str, BackfillTaskResult] = {}
+        pending = list(jobs)
+        running: Dict[Future, ScheduledJob] = {}
+        stopped_by: Optional[str] = None
+
+        def finish(result: BackfillTaskResult) -> None:
+            results[result.task.name] = result
+            if on_task_done is not None:
+                on_task_done(result)
+
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="scheduler") as executor:
+                while pending or running:
+                    # Repeat while skips happen: a skipped job can doom jobs planned before it
+                    skipped_any = stopped_by is None
+                    while skipped_any:
+                        skipped_any = False
+                        for job in list(pending):
+                            unmet = [name for name in job.depends_on if name in results
+                                     and results[name].status != "success"]
+                            if unmet:
+                                pending.remove(job)
+                                finish(self._skipped(job, f"Dependency did not succeed: {', '.join(unmet)}"))
+                                skipped_any = True
+                            elif all(name in results for name in job.depends_on) and len(running) < self.max_workers:
+                                pending.remove(job)
+                                running[executor.submit(self._run_task, job)] = job
+
+                    if not running:
+                        break
+
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        running.pop(future)
+                        result = future.result()
+                        finish(result)
+                        if result.status != "success" and self.stop_on_failure and stopped_by is None:
+                            stopped_by = result.task.name
+                            logger.error(
+                                "Scheduled job failed; starting no further jobs",
+                                job_name=result.task.name,
+                                error=result.error,
+                                still_running=[job.name for job in running.values()]
+                            )
+        finally:
+            close_shared_connection_providers()
+
+        reason = f"Run stopped after job '{stopped_by}' failed" if stopped_by else "Dependencies could not run"
+        for job in pending:
+            finish(self._skipped(job, reason))
+
+        summary = self.summarize([results[job.name] for job in jobs], time.perf_counter() - started_at)
+        summary["stopped_by"] = stopped_by
+        summary["order"] = [job.name for job in jobs]
+        if self.report_dir:
+            summary["report_path"] = str(write_job_report(self.report_dir, "scheduled_run", self.report(summary)))
+
+        logger.info(
+            "Scheduled job run finished",
+            successful=len(summary["successful"]),
+            failed=len(summary["failed"]),
+            skipped=len(summary["skipped"]),
+            stopped_by=stopped_by,
+            records_processed=summary["records_processed"],
+            duration_seconds=summary["duration_seconds"],
+            task_seconds=summary["task_seconds"]
+        )
+        return summary
+
+    @staticmethod
+    def _skipped(job: ScheduledJob, reason: str) -> BackfillTaskResult:
+        return BackfillTaskResult(job, STATUS_SKIPPED, 0, 0, 0.0, reason, [])
+
+    @staticmethod
+    def summarize(results: List[BackfillTaskResult], duration: float) -> Dict[str, Any]:
+        """
+        Consolidate per-job results; skipped jobs are listed apart from failures.
+
+        Args:
+            results: Job results in planned order
+            duration: Wall-clock duration of the run in seconds
+
+        Returns:
+            Summary dictionary (see ``run``)
+        """
+        ran = [result for result in results if result.status != STATUS_SKIPPED]
+        summary = ParallelBackfill.summarize(ran, duration)
+        summary["skipped"] = [
+            f"{result.task.label}: {result.error}" for result in results if result.status == STATUS_SKIPPED
+        ]
+        summary["results"] = results
+        return summary
+
+    @staticmethod
+    def report(summary: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Build the consolidated, JSON-serializable report of a run.
+
+        Per-stage wall time and rows are summed over the jobs that reported
+        stage timings, next to each job's own outcome and statistics.
+
+        Args:
+            summary: Summary returned by ``run``
+
+        Returns:
+            Report dictionary
+        """
+        stages: Dict[str, Dict[str, float]] = {}
+        jobs = []
+        for result in summary["results"]:
+            stats = result.stats or {}
+            for name, timings in (stats.get("stages") or {}).items():
+                totals = stages.setdefault(name, {"wall_seconds": 0.0, "cpu_seconds": 0.0, "rows": 0})
+                totals["wall_seconds"] = round(totals["wall_seconds"] + timings.get("wall_seconds", 0.0), 6)
+                totals["cpu_seconds"] = round(totals["cpu_seconds"] + timings.get("cpu_seconds", 0.0), 6)
+                totals["rows"] += timings.get("rows", 0)
+            jobs.append({
+                "name": result.task.name,
+                "schema": result.task.schema,
+                "status": result.status,
+                "attempts": result.attempts,
+                "priority": result.task.priority,
+                "estimated_records": result.task.estimated_records,
+                "records_processed": result.records_processed,
+                "duration_seconds": round(result.duration_seconds, 3),
+                "error": result.error,
+                "stats": result.stats,
+            })
+
+        return {
+            "status": "success" if not summary["failed"] and not summary["skipped"] else "failed",
+            "stopped_by": summary.get("stopped_by"),
+            "records_processed": summary["records_processed"],
+            "duration_seconds": summary["duration_seconds"],
+            "task_seconds": summary["task_seconds"],
+            "successful": summary["successful"],
+            "failed": summary["failed"],
+            "skipped": summary["skipped"],
+            "retried": summary["retried"],
+            "stages": stages,
+            "jobs": jobs,
+        }
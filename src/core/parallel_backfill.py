@@ -0,0 +1,239 @@
+"""
+Worker-pool execution of backfill jobs.
+
+A backfill is a list of independent (symbol, schema) ingestion jobs. Instead of
+running them one after another on a single orchestrator, ``ParallelBackfill``
+runs them on a thread pool where every attempt gets its own orchestrator, and
+therefore its own adapter, rule engine and loaders. Workers only share a
+``ConcurrencyLimits`` instance, which caps API calls and database writes across
+the whole backfill regardless of the number of workers.
+
+A failed task is retried once (``retry_failed``) on a fresh orchestrator with
+``resume`` set, so chunks checkpointed by the failed attempt are not fetched
+again. Workers share the process-wide database connection pool, which is
+closed once the backfill finishes.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+import structlog
+
+from src.storage.connection_pool import close_shared_connection_providers
+
+logger = structlog.get_logger(__name__)
+
+
+class ConcurrencyLimits:
+    """Process-wide caps shared by every orchestrator of a backfill."""
+
+    def __init__(self, api_calls: int = 4, db_writers: int = 4):
+        """
+        Initialize the limits.
+
+        Args:
+            api_calls: Maximum number of API requests in flight at once
+            db_writers: Maximum number of chunks being written to the database at once
+
+        Raises:
+            ValueError: If a limit is below 1
+        """
+        if api_calls < 1 or db_writers < 1:
+            raise ValueError(f"Invalid concurrency limits: api_calls={api_calls}, db_writers={db_writers}")
+
+        self.max_api_calls = api_calls
+        self.max_db_writers = db_writers
+        # Used as context managers around each API request / database write
+        self.api_calls = threading.BoundedSemaphore(api_calls)
+        self.db_writers = threading.BoundedSemaphore(db_writers)
+
+
+class BackfillTask(NamedTuple):
+    """One (symbol, schema) ingestion job of a backfill."""
+
+    symbol: str
+    schema: str
+    job_config: Dict[str, Any]
+
+    @property
+    def label(self) -> str:
+        """Human-readable task name used in summaries."""
+        return f"{self.symbol} ({self.schema})"
+
+
+class BackfillTaskResult(NamedTuple):
+    """Outcome of a backfill task after all of its attempts."""
+
+    task: BackfillTask
+    status: str
+    attempts: int
+    records_processed: int
+    duration_seconds: float
+    error: Optional[str]
+    warnings: List[str]
+    # PipelineStats.to_dict() of the last attempt, when the orchestrator reported it
+    stats: Optional[Dict[str, Any]] = None
+
+
+class ParallelBackfill:
+    """
+    Run backfill tasks on a worker pool with isolated orchestrators.
+
+    ``orchestrator_factory`` is called with the shared ``ConcurrencyLimits``
+    for every attempt and must return an object with ``execute_pipeline``
+    (normally a new ``PipelineOrchestrator``).
+    """
+
+    def __init__(
+        self,
+        orchestrator_factory: Callable[[ConcurrencyLimits], Any],
+        max_workers: int = 4,
+        max_api_calls: Optional[int] = None,
+        max_db_writers: Optional[int] = None,
+        retry_failed: bool = True
+    ):
+        """
+        Initialize the backfill runner.
+
+        Args:
+            orchestrator_factory: Creates an orchestrator bound to the shared limits
+            max_workers: Number of tasks executed concurrently
+            max_api_calls: Global cap on concurrent API calls (default: max_workers)
+            max_db_writers: Global cap on concurrent database writes (default: max_workers)
+            retry_failed: Retry a failed task once, resuming from its checkpoints
+
+        Raises:
+            ValueError: If max_workers is below 1
+        """
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+
+        self.orchestrator_factory = orchestrator_factory
+        self.max_workers = max_workers
+        self.retry_failed = retry_failed
+        self.limits = ConcurrencyLimits(
+            api_calls=max_api_calls or max_workers,
+            db_writers=max_db_writers or max_workers
+        )
+
+    def run(
+        self,
+        tasks: List[BackfillTask],
+        on_task_done: Optional[Callable[[BackfillTaskResult], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        Execute every task and consolidate the results.
+
+        Args:
+            tasks: Tasks to execute
+            on_task_done: Called on the calling thread as each task finishes
+
+        Returns:
+            Summary dictionary with 'successful', 'failed', 'retried' and
+            'warnings' label lists, 'records_processed', 'duration_seconds',
+            'task_seconds' and the per-task 'results' in task order
+        """
+        started_at = time.perf_counter()
+        logger.info(
+            "Starting parallel backfill",
+            tasks=len(tasks),
+            max_workers=self.max_workers,
+            max_api_calls=self.limits.max_api_calls,
+            max_db_writers=self.limits.max_db_writers
+        )
+
+        results: List[Optional[BackfillTaskResult]] = [None] * len(tasks)
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="backfill") as executor:
+                futures = {executor.submit(self._run_task, task): index for index, task in enumerate(tasks)}
+                for future in as_completed(futures):
+                    result = future.result()
+                    results[futures[future]] = result
+                    if on_task_done is not None:
+                        on_task_done(result)
+        finally:
+            close_shared_connection_providers()
+
+        summary = self.summarize(results, time.perf_counter() - started_at)
+        logger.info(
+            "Parallel backfill finished",
+            successful=len(summary["successful"]),
+            failed=len(summary["failed"]),
+            retried=len(summary["retried"]),
+            records_processed=summary["records_processed"],
+            duration_seconds=summary["duration_seconds"]
+        )
+        return summary
+
+    @staticmethod
+    def summarize(results: List[BackfillTaskResult], duration: float) -> Dict[str, Any]:
+        """
+        Consolidate per-task results.
+
+        Args:
+            results: Task results in task order
+            duration: Wall-clock duration of the backfill in seconds
+
+        Returns:
+            Summary dictionary (see ``run``)
+        """
+        summary: Dict[str, Any] = {
+            "successful": [],
+            "failed": [],
+            "retried": [],
+            "warnings": [],
+            "records_processed": 0,
+            "duration_seconds": round(duration, 3),
+            "task_seconds": 0.0,
+            "results": results,
+        }
+        for result in results:
+            label = result.task.label
+            if result.status == "success":
+                summary["successful"].append(f"{label} - retry" if result.attempts > 1 else label)
+            else:
+                summary["failed"].append(f"{label}: {result.error or 'Unknown error'}")
+            if result.attempts > 1:
+                summary["retried"].append(label)
+            summary["warnings"].extend(result.warnings)
+            summary["records_processed"] += result.records_processed
+            summary["task_seconds"] += result.duration_seconds
+        summary["task_seconds"] = round(summary["task_seconds"], 3)
+        return summary
+
+    def _run_task(self, task: BackfillTask) -> BackfillTaskResult:
+        """Execute one task, retrying once on failure if configured."""
+        task_logger = logger.bind(symbol=task.symbol, schema=task.schema)
+        max_attempts = 2 if self.retry_failed else 1
+        job_config = task.job_config
+        started_at = time.perf_counter()
+        records_processed = 0
+        warnings: List[str] = []
+        error: Optional[str] = None
+
+        for attempt in range(1, max_attempts + 1):
+            try:
+                result = self.orchestrator_factory(self.limits).execute_pipeline(job_config)
+            except Exception as e:
+                result = {"status": "failed", "error": str(e)}
+
+            records_processed += result.get("records_processed", 0)
+            warnings.extend(result.get("warnings") or [])
+            stats = result.get("stats")
+            if result.get("status") == "success":
+                return BackfillTaskResult(
+                    task, "success", attempt, records_processed,
+                    time.perf_counter() - started_at, None, warnings, stats
+                )
+
+            error = result.get("error", "Unknown error")
+            task_logger.warning("Backfill task failed", attempt=attempt, max_attempts=max_attempts, error=error)
+            # Retries skip the chunks the failed attempt already stored
+            job_config = dict(job_config, resume=True)
+
+        return BackfillTaskResult(
+            task, "failed", max_attempts, records_processed,
+            time.perf_counter() - started_at, error, warnings, stats
+        )
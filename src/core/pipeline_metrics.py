@@ -0,0 +1,308 @@
+"""
+Per-stage timing and throughput metrics for pipeline runs.
+
+``PipelineStats`` keeps one ``StageTimings`` per pipeline stage (fetch, decode,
+transform, validate, store). Each timed batch adds its wall-clock time, the CPU
+time of the thread that ran it and its row count, and lands in a fixed-bucket
+latency histogram from which p50/p95/p99 are estimated the same way
+Prometheus' ``histogram_quantile`` does. Memory use is constant per stage no
+matter how many batches a job runs.
+
+The module also renders a stats dictionary in the Prometheus text exposition
+format, for the node exporter's textfile collector, and writes the
+machine-readable end-of-job report.
+"""
+
+import json
+import math
+import os
+import re
+import tempfile
+import time
+from bisect import bisect_left
+from contextlib import nullcontext
+from pathlib import Path
+from typing import Any, Callable, ContextManager, Dict, Iterable, Iterator, List, Optional
+
+# Upper bounds (seconds) of the batch latency histogram buckets; +Inf is implicit
+LATENCY_BUCKETS = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+    1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0,
+)
+
+QUANTILES = (0.5, 0.95, 0.99)
+
+METRIC_PREFIX = "hist_ingestor"
+
+
+class LatencyHistogram:
+    """Fixed-bucket histogram of batch latencies (not thread-safe; guarded by the owner)."""
+
+    def __init__(self, buckets: Iterable[float] = LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        # One count per bucket plus the +Inf bucket
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds: float) -> None:
+        """Add one latency sample."""
+        self.counts[bisect_left(self.buckets, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+        self.max = max(self.max, seconds)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Estimate a quantile by linear interpolation inside its bucket.
+
+        Samples in the +Inf bucket are reported as the largest sample seen.
+
+        Returns:
+            Estimated latency in seconds, or None without samples
+        """
+        if self.count == 0:
+            return None
+
+        rank = q * self.count
+        cumulative = 0
+        for index, bucket_count in enumerate(self.counts):
+            if cumulative + bucket_count >= rank and bucket_count:
+                if index == len(self.buckets):
+                    return self.max
+                lower = self.buckets[index - 1] if index else 0.0
+                # Every sample of the bucket is <= max, which tightens the top bucket
+                upper = min(self.buckets[index], self.max)
+                fraction = (rank - cumulative) / bucket_count
+                return lower + (upper - lower) * fraction
+            cumulative += bucket_count
+        return self.max
+
+    def cumulative_counts(self) -> List[int]:
+        """Counts of samples <= each bucket bound, ending with the +Inf bucket."""
+        totals, running = [], 0
+        for bucket_count in self.counts:
+            running += bucket_count
+            totals.append(running)
+        return totals
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the histogram summary to a dictionary for logging/reporting."""
+        summary = {
+            "count": self.count,
+            "mean_seconds": round(self.sum / self.count, 6) if self.count else None,
+            "max_seconds": round(self.max, 6) if self.count else None,
+        }
+        for q in QUANTILES:
+            value = self.quantile(q)
+            summary[f"p{int(q * 100)}_seconds"] = round(value, 6) if value is not None else None
+        return summary
+
+
+class StageTimings:
+    """Accumulated wall time, CPU time, rows and batch latencies of one stage."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.wall_seconds = 0.0
+        self.cpu_seconds = 0.0
+        self.rows = 0
+        self.batches = 0
+        self.latency = LatencyHistogram()
+
+    def observe(self, wall_seconds: float, cpu_seconds: float, rows: int) -> None:
+        """Add one timed batch."""
+        self.wall_seconds += wall_seconds
+        self.cpu_seconds += cpu_seconds
+        self.rows += rows
+        self.batches += 1
+        self.latency.observe(wall_seconds)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert timings to a dictionary for logging/reporting."""
+        return {
+            "wall_seconds": round(self.wall_seconds, 6),
+            "cpu_seconds": round(self.cpu_seconds, 6),
+            "rows": self.rows,
+            "batches": self.batches,
+            # Rows per second of time spent inside the stage (not per second of the job)
+            "rows_per_second": round(self.rows / self.wall_seconds, 2) if self.wall_seconds > 0 else 0.0,
+            "batch_latency": self.latency.to_dict(),
+        }
+
+
+class StageTiming:
+    """Handle yielded by ``PipelineStats.stage``; set ``rows`` once the batch size is known."""
+
+    __slots__ = ("rows",)
+
+    def __init__(self, rows: int = 0):
+        self.rows = rows
+
+
+def timed_batches(
+    iterable: Iterable[Any],
+    record: Callable[[float, float, int], None]
+) -> Iterator[Any]:
+    """
+    Yield from ``iterable``, charging only the time spent producing items.
+
+    Time the consumer spends between items is excluded, so wrapping a lazy
+    decoder measures the decoder alone. ``record(wall, cpu, rows)`` is called
+    once when the iterable is exhausted or the generator is closed.
+
+    Args:
+        iterable: Iterable whose production time is measured
+        record: Callback receiving (wall seconds, CPU seconds, items produced)
+    """
+    iterator = iter(iterable)
+    wall = cpu = 0.0
+    rows = 0
+    try:
+        while True:
+            wall_started, cpu_started = time.perf_counter(), time.thread_time()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            finally:
+                wall += time.perf_counter() - wall_started
+                cpu += time.thread_time() - cpu_started
+            rows += 1
+            yield item
+    finally:
+        record(wall, cpu, rows)
+
+
+def stage_timer(stats: Any, name: str, rows: int = 0) -> ContextManager[StageTiming]:
+    """
+    ``stats.stage(name, rows)``, or a no-op timer when no stats are attached.
+
+    Components (adapter, rule engine) call this with their optional
+    ``pipeline_stats`` attribute, so they also run standalone.
+    """
+    if stats is None:
+        return nullcontext(StageTiming(rows))
+    return stats.stage(name, rows)
+
+
+def timed_stage_iter(stats: Any, name: str, iterable: Iterable[Any]) -> Iterable[Any]:
+    """``stats.timed_iter(name, iterable)``, or ``iterable`` unchanged when no stats are attached."""
+    if stats is None:
+        return iterable
+    return stats.timed_iter(name, iterable)
+
+
+def _metric_name(name: str) -> str:
+    return f"{METRIC_PREFIX}_{re.sub(r'[^a-zA-Z0-9_]', '_', name)}"
+
+
+def _label_text(labels: Dict[str, Any]) -> str:
+    if not labels:
+        return ""
+    pairs = []
+    for key, value in sorted(labels.items()):
+        escaped = str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        pairs.append(f'{key}="{escaped}"')
+    return "{" + ",".join(pairs) + "}"
+
+
+def _format_value(value: float) -> str:
+    if isinstance(value, float) and math.isinf(value):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def render_prometheus(
+    counters: Dict[str, float],
+    stages: Dict[str, StageTimings],
+    labels: Optional[Dict[str, Any]] = None
+) -> str:
+    """
+    Render pipeline metrics in the Prometheus text exposition format.
+
+    Args:
+        counters: Job-level values (e.g. records_stored, bytes_fetched, duration_seconds)
+        stages: Stage name -> StageTimings
+        labels: Labels attached to every sample (e.g. {'job': 'ohlcv_1d'})
+
+    Returns:
+        Exposition text ending with a newline
+    """
+    labels = dict(labels or {})
+    lines: List[str] = []
+
+    for name, value in counters.items():
+        if value is None:
+            continue
+        metric = _metric_name(f"job_{name}")
+        lines.append(f"# TYPE {metric} gauge")
+        lines.append(f"{metric}{_label_text(labels)} {_format_value(value)}")
+
+    stage_gauges = (
+        ("stage_wall_seconds", "wall_seconds"),
+        ("stage_cpu_seconds", "cpu_seconds"),
+        ("stage_rows", "rows"),
+        ("stage_batches", "batches"),
+    )
+    for metric_suffix, attribute in stage_gauges:
+        metric = _metric_name(metric_suffix)
+        lines.append(f"# TYPE {metric} gauge")
+        for stage_name, timings in stages.items():
+            stage_labels = {**labels, "stage": stage_name}
+            lines.append(f"{metric}{_label_text(stage_labels)} {_format_value(getattr(timings, attribute))}")
+
+    metric = _metric_name("stage_batch_latency_seconds")
+    lines.append(f"# TYPE {metric} histogram")
+    for stage_name, timings in stages.items():
+        histogram = timings.latency
+        bounds = [*histogram.buckets, math.inf]
+        for bound, cumulative in zip(bounds, histogram.cumulative_counts()):
+            bucket_labels = {**labels, "stage": stage_name, "le": _format_value(float(bound))}
+            lines.append(f"{metric}_bucket{_label_text(bucket_labels)} {cumulative}")
+        stage_labels = {**labels, "stage": stage_name}
+        lines.append(f"{metric}_sum{_label_text(stage_labels)} {_format_value(histogram.sum)}")
+        lines.append(f"{metric}_count{_label_text(stage_labels)} {histogram.count}")
+
+    return "\n".join(lines) + "\n"
+
+
+def _atomic_write(path: Path, text: str) -> None:
+    """Write ``text`` to ``path`` via a rename so readers never see a partial file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as handle:
+            handle.write(text)
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
+        raise
+
+
+def write_prometheus_textfile(path: str, text: str) -> Path:
+    """Atomically write exposition text for the node exporter textfile collector."""
+    output = Path(path)
+    _atomic_write(output, text)
+    return output
+
+
+def write_job_report(report_dir: str, job_name: str, report: Dict[str, Any]) -> Path:
+    """
+    Write the end-of-job report as JSON.
+
+    Args:
+        report_dir: Directory receiving one file per job run
+        job_name: Job name, used in the file name
+        report: Report document (see ``PipelineStats.report``)
+
+    Returns:
+        Path of the written report
+    """
+    safe_name = re.sub(r"[^a-zA-Z0-9_.-]", "_", job_name) or "job"
+    stamp = time.strftime("%Y%m%dT%H%M%SZ", time.gmtime())
+    output = Path(report_dir) / f"{safe_name}_{stamp}.json"
+    _atomic_write(output, json.dumps(report, indent=2, default=str))
+    return output
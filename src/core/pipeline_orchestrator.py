@@ -7,22 +7,44 @@ execution sequencing, error handling, and progress tracking.
 """
 
 import os
+import threading
+import time
 import yaml
-from datetime import datetime, UTC
+from contextlib import contextmanager, nullcontext
+from datetime import date, datetime, timedelta, UTC
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Type, Union
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Type, Union
 
+import pandas as pd
 import structlog
 from pydantic import BaseModel, ValidationError
 from tenacity import RetryError
 
+from src.core.checkpoint_store import CheckpointStore
+from src.core.incremental import find_missing_ranges
+from src.core.parallel_backfill import ConcurrencyLimits
+from src.core.pipeline_metrics import (
+    StageTiming,
+    StageTimings,
+    render_prometheus,
+    timed_batches,
+    write_job_report,
+    write_prometheus_textfile,
+)
 from src.core.config_manager import ConfigManager
+from src.core.staged_pipeline import PipelineStage, StagedPipeline
 from src.ingestion.api_adapters.base_adapter import BaseAdapter
+from src.ingestion.api_adapters.dbn_cache import DBNResponseCache
 from src.ingestion.api_adapters.databento_adapter import DatabentoAdapter
 from src.transformation.rule_engine import RuleEngine, TransformationError
+from src.transformation.rule_engine.frame_transform import failure_messages_by_row
+from src.storage.ohlcv_rollup import validate_rollup
+from src.storage.connection_pool import PooledConnectionProvider, get_shared_connection_provider
 from src.storage.timescale_loader import TimescaleDefinitionLoader
 from src.storage.timescale_ohlcv_loader import TimescaleOHLCVLoader
 from src.utils.custom_logger import get_logger
+from src.utils.file_io import QuarantineManager
 
 logger = get_logger(__name__)
 
@@ -101,6 +123,8 @@ class PipelineStats:
     """Statistics tracking for pipeline execution."""
 
     def __init__(self):
+        # Counters are updated from several worker threads in the staged pipeline
+        self._lock = threading.Lock()
         self.start_time: Optional[datetime] = None
         self.end_time: Optional[datetime] = None
         self.records_fetched: int = 0
@@ -109,7 +133,67 @@ class PipelineStats:
         self.records_stored: int = 0
         self.records_quarantined: int = 0
         self.chunks_processed: int = 0
+        self.chunks_skipped: int = 0
         self.errors_encountered: int = 0
+        self.bytes_fetched: int = 0
+        self.db_round_trips: int = 0
+        # Stage name (fetch, decode, transform, validate, store) -> timings
+        self.stages: Dict[str, StageTimings] = {}
+
+    def add(self, **counts: int) -> None:
+        """
+        Atomically increment counters.
+
+        Args:
+            **counts: Counter names (e.g. records_stored) and the amount to add
+        """
+        with self._lock:
+            for name, amount in counts.items():
+                setattr(self, name, getattr(self, name) + amount)
+
+    def record_stage(self, name: str, wall_seconds: float, cpu_seconds: float, rows: int = 0) -> None:
+        """
+        Atomically add one timed batch to a stage.
+
+        Args:
+            name: Stage name
+            wall_seconds: Wall-clock time of the batch
+            cpu_seconds: CPU time of the thread that processed the batch
+            rows: Rows the batch processed
+        """
+        with self._lock:
+            timings = self.stages.get(name)
+            if timings is None:
+                timings = self.stages[name] = StageTimings(name)
+            timings.observe(wall_seconds, cpu_seconds, rows)
+
+    @contextmanager
+    def stage(self, name: str, rows: int = 0) -> Iterator[StageTiming]:
+        """
+        Time the enclosed block as one batch of a stage.
+
+        The batch is recorded even if the block raises. Set ``rows`` on the
+        yielded handle when the row count is only known afterwards.
+
+        Args:
+            name: Stage name
+            rows: Rows the batch processes, if known up front
+        """
+        timing = StageTiming(rows)
+        wall_started, cpu_started = time.perf_counter(), time.thread_time()
+        try:
+            yield timing
+        finally:
+            self.record_stage(
+                name,
+                time.perf_counter() - wall_started,
+                time.thread_time() - cpu_started,
+                timing.rows
+            )
+
+    def timed_iter(self, name: str, iterable: Iterable[Any]) -> Iterator[Any]:
+        """Yield from ``iterable``, recording the time spent producing items as one batch of a stage."""
+        return timed_batches(iterable, lambda wall, cpu, rows: self.record_stage(name, wall, cpu, rows))
 
     def start(self) -> None:
         """Mark the start of pipeline execution."""
@@ -131,7 +215,11 @@ class PipelineStats:
             records_stored=self.records_stored,
             records_quarantined=self.records_quarantined,
             chunks_processed=self.chunks_processed,
-            errors_encountered=self.errors_encountered
+            chunks_skipped=self.chunks_skipped,
+            errors_encountered=self.errors_encountered,
+            bytes_fetched=self.bytes_fetched,
+            db_round_trips=self.db_round_trips,
+            stage_wall_seconds={name: round(timings.wall_seconds, 3) for name, timings in self.stages.items()}
         )
 
     def to_dict(self) -> Dict[str, Any]:
@@ -140,6 +228,9 @@ class PipelineStats:
         if self.start_time and self.end_time:
             duration = (self.end_time - self.start_time).total_seconds()
 
+        with self._lock:
+            stages = {name: timings.to_dict() for name, timings in self.stages.items()}
+
         return {
             "start_time": self.start_time.isoformat() if self.start_time else None,
             "end_time": self.end_time.isoformat() if self.end_time else None,
@@ -150,8 +241,29 @@ class PipelineStats:
             "records_stored": self.records_stored,
             "records_quarantined": self.records_quarantined,
             "chunks_processed": self.chunks_processed,
-            "errors_encountered": self.errors_encountered
+            "chunks_skipped": self.chunks_skipped,
+            "errors_encountered": self.errors_encountered,
+            "bytes_fetched": self.bytes_fetched,
+            "db_round_trips": self.db_round_trips,
+            "records_per_second": round(self.records_stored / duration, 2) if duration else 0.0,
+            "stages": stages
+        }
+
+    def report(self, job_name: str, success: bool) -> Dict[str, Any]:
+        """Machine-readable end-of-job report: job outcome plus ``to_dict()``."""
+        return {"job_name": job_name, "status": "success" if success else "failed", **self.to_dict()}
+
+    def to_prometheus(self, labels: Optional[Dict[str, Any]] = None) -> str:
+        """Render job counters and stage timings in the Prometheus text format."""
+        stats = self.to_dict()
+        counters = {
+            name: value for name, value in stats.items()
+            if name not in ("start_time", "end_time", "stages")
         }
+        if self.end_time:
+            counters["end_timestamp_seconds"] = self.end_time.timestamp()
+        with self._lock:
+            return render_prometheus(counters, dict(self.stages), labels)
 
 
 class PipelineOrchestrator:
@@ -166,7 +278,12 @@ class PipelineOrchestrator:
     5. Tracking progress and performance metrics
     """
 
-    def __init__(self, config_manager: Optional[ConfigManager] = None, progress_callback: Optional[callable] = None):
+    def __init__(
+        self,
+        config_manager: Optional[ConfigManager] = None,
+        progress_callback: Optional[callable] = None,
+        concurrency_limits: Optional[ConcurrencyLimits] = None
+    ):
         """
         Initialize the pipeline orchestrator.
 
@@ -175,6 +292,8 @@ class PipelineOrchestrator:
             progress_callback: Optional callback function for progress updates. 
                               Signature: progress_callback(description: str, completed: int = 0, 
                                                         total: int = 0, **kwargs)
+            concurrency_limits: Optional API call / database writer caps shared with other
+                                orchestrators running in parallel (see ParallelBackfill)
         """
         self.config_manager = config_manager or ConfigManager()
         self.system_config = self.config_manager.get()
@@ -189,6 +308,20 @@ class PipelineOrchestrator:
         self.trades_loader = None  # Optional[TimescaleTradesLoader]
         self.tbbo_loader = None    # Optional[TimescaleTBBOLoader]
         self.statistics_loader = None  # Optional[TimescaleStatisticsLoader]
+        self.quarantine_manager: Optional[QuarantineManager] = None
+        self.connection_provider: Optional[PooledConnectionProvider] = None
+
+        # When True, rows failing batch validation are quarantined and the rest stored
+        self.isolate_validation_failures: bool = False
+
+        # Staged (bounded queue) pipeline settings from the API config's "pipeline" section
+        self.pipeline_config: Dict[str, Any] = {}
+        # Per-stage and per-queue metrics of the last staged run
+        self.stage_metrics: Optional[Dict[str, Any]] = None
+        # Manifest of stored date chunks, used to resume interrupted jobs
+        self.checkpoint_store: Optional[CheckpointStore] = None
+        # Caps shared with sibling orchestrators of a parallel backfill
+        self.concurrency_limits = concurrency_limits
 
         logger.info("PipelineOrchestrator initialized", has_progress_callback=bool(progress_callback))
 
@@ -279,6 +412,10 @@ class PipelineOrchestrator:
             # Initialize API adapter
             logger.info("Initializing API adapter", api_type=api_type)
             self.adapter = ComponentFactory.create_adapter(api_type, api_config)
+            if self.concurrency_limits is not None:
+                self.adapter.api_call_limiter = self.concurrency_limits.api_calls
+            # Fetch and decode stage timings land in the job's PipelineStats
+            self.adapter.pipeline_stats = self.stats
 
             # Validate adapter configuration
             if not self.adapter.validate_config():
@@ -294,10 +431,23 @@ class PipelineOrchestrator:
             if mapping_config_path:
                 logger.info("Initializing RuleEngine", mapping_config_path=mapping_config_path)
                 self.rule_engine = RuleEngine(mapping_config_path)
+                self.rule_engine.pipeline_stats = self.stats
             else:
                 logger.warning("No mapping configuration specified, transformation will be skipped")
                 self.rule_engine = None
 
+            # Row-level validation failure isolation and bulk quarantine
+            validation_config = api_config.get("validation", {}) or {}
+            self.isolate_validation_failures = bool(validation_config.get("isolate_row_failures", False))
+            self.pipeline_config = api_config.get("pipeline", {}) or {}
+            checkpoint_config = self.pipeline_config.get("checkpoints", {}) or {}
+            if checkpoint_config.get("enabled", False):
+                self.checkpoint_store = CheckpointStore(checkpoint_config.get("base_dir", "checkpoints"))
+            self.quarantine_manager = QuarantineManager(
+                enabled=validation_config.get("quarantine_enabled", True),
+                base_dir=validation_config.get("quarantine_base_dir", "dlq/validation_failures")
+            )
+
             # Initialize storage loaders
             logger.info("Initializing storage loaders")
 
@@ -324,18 +474,62 @@ class PipelineOrchestrator:
                 }
                 logger.info("Using regular database configuration")
 
+            # Resolve bulk load method ('insert' or 'copy'), optionally per schema
+            storage_config = api_config.get("storage", {}) or {}
+            default_load_method = storage_config.get("load_method", "insert")
+            load_methods = storage_config.get("load_methods", {}) or {}
+
+            def load_method_for(schema_key: str) -> str:
+                return load_methods.get(schema_key, default_load_method)
+
+            # One persistent connection pool shared by every loader
+            pool_config = storage_config.get("connection_pool", {}) or {}
+            if pool_config.get("enabled", False):
+                self.connection_provider = get_shared_connection_provider(
+                    connection_params,
+                    min_size=int(pool_config.get("min_size", 1)),
+                    max_size=int(pool_config.get("max_size", 10)),
+                    checkout_timeout=float(pool_config.get("checkout_timeout", 30.0)),
+                    health_check_interval=pool_config.get("health_check_interval", 30.0),
+                    max_connection_age=pool_config.get("max_connection_age")
+                )
+                if pool_config.get("warm_up", True):
+                    self.connection_provider.warm_up()
+
+            logger.info(
+                "Storage load methods resolved",
+                default_load_method=default_load_method,
+                overrides=load_methods
+            )
+
             # Initialize all storage loaders
-            self.storage_loader = TimescaleDefinitionLoader(connection_params)
-            self.ohlcv_loader = TimescaleOHLCVLoader(connection_params)
+            self.storage_loader = TimescaleDefinitionLoader(
+                connection_params, load_method=load_method_for("definition"),
+                connection_provider=self.connection_provider
+            )
+            self.ohlcv_loader = TimescaleOHLCVLoader(
+                connection_params, load_method=load_method_for("ohlcv"),
+                connection_provider=self.connection_provider,
+                rollups=storage_config.get("rollups")
+            )
             
             # Import and initialize new loaders
             from src.storage.timescale_trades_loader import TimescaleTradesLoader
             from src.storage.timescale_tbbo_loader import TimescaleTBBOLoader
             from src.storage.timescale_statistics_loader import TimescaleStatisticsLoader
             
-            self.trades_loader = TimescaleTradesLoader(connection_params)
-            self.tbbo_loader = TimescaleTBBOLoader(connection_params)
-            self.statistics_loader = TimescaleStatisticsLoader(connection_params)
+            self.trades_loader = TimescaleTradesLoader(
+                connection_params, load_method=load_method_for("trades"),
+                connection_provider=self.connection_provider
+            )
+            self.tbbo_loader = TimescaleTBBOLoader(
+                connection_params, load_method=load_method_for("tbbo"),
+                connection_provider=self.connection_provider
+            )
+            self.statistics_loader = TimescaleStatisticsLoader(
+                connection_params, load_method=load_method_for("statistics"),
+                connection_provider=self.connection_provider
+            )
 
             # Create schemas if they don't exist
             self.ohlcv_loader.create_schema_if_not_exists()
@@ -352,6 +546,10 @@ class PipelineOrchestrator:
 
     def cleanup_components(self) -> None:
         """Clean up and disconnect pipeline components."""
+        response_cache = getattr(self.adapter, "response_cache", None)
+        if isinstance(response_cache, DBNResponseCache):
+            logger.info("Raw response cache stats", **response_cache.stats())
+
         if self.adapter:
             try:
                 self.adapter.disconnect()
@@ -366,6 +564,13 @@ class PipelineOrchestrator:
             except Exception as e:
                 logger.warning("Failed to cleanup storage loader", error=str(e))
 
+        if self.connection_provider:
+            logger.info("Connection pool stats", **self.connection_provider.stats())
+            # Parallel backfill workers share the pool; the backfill closes it when done
+            if self.concurrency_limits is None:
+                self.connection_provider.close()
+            self.connection_provider = None
+
         # Reset component references
         self.adapter = None
         self.rule_engine = None
@@ -392,6 +597,7 @@ class PipelineOrchestrator:
             True if pipeline completed successfully, False otherwise
         """
         job_name = job_config.get("name", "unnamed_job")
+        succeeded = False
 
         try:
             self.stats.start()
@@ -401,22 +607,37 @@ class PipelineOrchestrator:
             if not self.validate_job_config(job_config, "databento"):
                 raise PipelineExecutionError("Invalid job configuration")
 
+            # OHLCV jobs with derive_from are built from finer stored bars when those are complete
+            if job_config.get("derive_from") and self._derive_ohlcv_job(job_config):
+                succeeded = True
+                return True
+
             # Check component initialization
             if not all([self.adapter, self.storage_loader]):
                 raise PipelineExecutionError("Pipeline components not properly initialized")
 
+            # Incremental jobs only fetch the date ranges not stored yet
+            if job_config.get("incremental", False):
+                job_config = self._restrict_to_missing_ranges(job_config)
+                if job_config.get("date_ranges") == []:
+                    logger.info("Incremental job is already up to date", job_name=job_name)
+                    self.progress_callback(description=f"{job_name} is already up to date", completed=1, total=1)
+                    succeeded = True
+                    return True
+
             # Execute pipeline stages
             success = self._execute_pipeline_stages(job_config)
 
             if success:
                 logger.info("Databento pipeline completed successfully", job_name=job_name)
+                succeeded = True
                 return True
             else:
                 logger.error("Databento pipeline failed", job_name=job_name)
                 return False
 
         except Exception as e:
-            self.stats.errors_encountered += 1
+            self.stats.add(errors_encountered=1)
             logger.error(
                 "Databento pipeline execution failed",
                 job_name=job_name,
@@ -425,18 +646,242 @@ class PipelineOrchestrator:
             )
             return False
         finally:
+            self._refresh_ingestion_coverage()
             self.stats.finish()
+            self._publish_job_metrics(job_config, succeeded)
+
+    def _publish_job_metrics(self, job_config: Dict[str, Any], succeeded: bool) -> None:
+        """
+        Log the end-of-job report and write it, and the Prometheus textfile, if configured.
+
+        ``pipeline.metrics.report_dir`` and ``pipeline.metrics.prometheus_textfile``
+        in the API config enable the outputs; a job's ``metrics`` section overrides
+        them. Write errors are logged and never fail the job.
+        """
+        job_name = job_config.get("name", "unnamed_job")
+        report = self.stats.report(job_name, succeeded)
+        logger.info("Pipeline job report", **report)
+
+        metrics_config = {
+            **(self.pipeline_config.get("metrics") or {}),
+            **(job_config.get("metrics") or {})
+        }
+        report_dir = metrics_config.get("report_dir")
+        textfile = metrics_config.get("prometheus_textfile")
+
+        try:
+            if report_dir:
+                path = write_job_report(report_dir, job_name, report)
+                logger.info("Wrote pipeline job report", job_name=job_name, path=str(path))
+            if textfile:
+                # 'job' and 'instance' are set by the scraper, so the pipeline job gets its own label
+                labels = {"pipeline_job": job_name, "schema": job_config.get("schema", "")}
+                write_prometheus_textfile(textfile, self.stats.to_prometheus(labels))
+                logger.debug("Wrote Prometheus metrics", job_name=job_name, path=textfile)
+        except OSError as e:
+            logger.error("Failed to write pipeline metrics", job_name=job_name, error=str(e))
+
+    def _refresh_ingestion_coverage(self) -> None:
+        """
+        Update the ingestion_coverage catalog for the days this run loaded.
+
+        Runs after failed runs too, so chunks stored before the failure are
+        catalogued. A catalog error is logged and never fails the job.
+        """
+        loaders = [
+            self.ohlcv_loader, self.trades_loader, self.tbbo_loader,
+            self.statistics_loader, self.storage_loader
+        ]
+        for loader in loaders:
+            if loader is None or not hasattr(loader, "refresh_coverage"):
+                continue
+            try:
+                loader.refresh_coverage()
+            except Exception as e:
+                logger.warning(
+                    "Failed to refresh ingestion coverage",
+                    table=getattr(loader, "TABLE_NAME", None),
+                    error=str(e)
+                )
+
+    def _job_window(self, job_config: Dict[str, Any]) -> Tuple[List[str], date, date]:
+        """
+        Symbols and whole-day window of a job.
+
+        Args:
+            job_config: Job configuration dictionary
+
+        Returns:
+            Tuple of (symbols, inclusive start day, exclusive end day)
+        """
+        symbols = job_config.get("symbols", [])
+        symbols = symbols if isinstance(symbols, list) else [symbols]
+        start = pd.Timestamp(job_config["start_date"]).date()
+        end_ts = pd.Timestamp(job_config["end_date"])
+        # Exclusive end day: a partial last day still counts as part of the window
+        end = end_ts.date() if end_ts == end_ts.normalize() else (end_ts + pd.Timedelta(days=1)).date()
+        return symbols, start, end
+
+    def _derive_ohlcv_job(self, job_config: Dict[str, Any]) -> bool:
+        """
+        Build an OHLCV job's bars from finer bars already stored, without calling the API.
+
+        The job's ``derive_from`` granularity (e.g. '1m' for an ohlcv-1h job) must
+        be stored for every symbol across the whole window, allowing market
+        closures of up to ``incremental_gap_days`` between stored days; otherwise
+        the job is left to the normal fetch path.
+
+        Args:
+            job_config: Job configuration dictionary with ``derive_from``
+
+        Returns:
+            True if the job was satisfied from stored bars, False to fetch it
+
+        Raises:
+            PipelineExecutionError: If the job's bars cannot be derived from ``derive_from`` bars
+        """
+        job_name = job_config.get("name", "unnamed_job")
+        source = job_config["derive_from"]
+        schema = job_config.get("schema", "")
+        if not schema.startswith("ohlcv-") or self.ohlcv_loader is None:
+            logger.warning("derive_from only applies to OHLCV jobs; fetching from the API", schema=schema)
+            return False
+        target = schema.split('-')[-1]
+        try:
+            validate_rollup(source, target)
+        except ValueError as e:
+            raise PipelineExecutionError(str(e)) from e
+
+        symbols, start, end = self._job_window(job_config)
+        stored_days = self.ohlcv_loader.get_stored_days(symbols, start, end, granularity=source)
+        missing = find_missing_ranges(
+            stored_days, symbols, start, end,
+            gap_tolerance_days=int(job_config.get("incremental_gap_days", 4)),
+            refetch_last_day=False
+        )
+        if missing:
+            logger.info(
+                "Source bars incomplete; fetching derived bars from the API",
+                job_name=job_name,
+                source=source,
+                missing_ranges=[(range_start.isoformat(), range_end.isoformat()) for range_start, range_end in missing]
+            )
+            return False
+
+        chunk_days = int(job_config.get("date_chunk_interval_days", 30))
+        chunks = [
+            (chunk_start, min(chunk_start + timedelta(days=chunk_days), end))
+            for chunk_start in (start + timedelta(days=offset) for offset in range(0, (end - start).days, chunk_days))
+        ]
+        for chunk_idx, (chunk_start, chunk_end) in enumerate(chunks, 1):
+            bars = self.ohlcv_loader.rollup(source, target, chunk_start, chunk_end, symbols=symbols)
+            self.stats.add(records_stored=bars, chunks_processed=1)
+            self.progress_callback(
+                description=f"Deriving {target} bars from {source} ({chunk_idx}/{len(chunks)})",
+                completed=chunk_idx,
+                total=len(chunks)
+            )
+
+        logger.info(
+            "OHLCV job derived from stored bars",
+            job_name=job_name,
+            source=source,
+            target=target,
+            chunks=len(chunks),
+            bars=self.stats.records_stored
+        )
+        return True
+
+    def _restrict_to_missing_ranges(self, job_config: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Add the ``date_ranges`` still missing from storage to an incremental job.
+
+        The loader for the job's schema reports which days are stored per symbol;
+        the adapter then shrinks or drops date chunks outside the missing ranges.
+        Schemas without a symbol-keyed table (definitions) are fetched in full, as
+        are multi-symbol jobs: their rows are all stored under the first symbol,
+        so stored days cannot be attributed to the job's other symbols.
+
+        Args:
+            job_config: Job configuration dictionary
+
+        Returns:
+            Copy of the job configuration with ``date_ranges`` as ISO date pairs,
+            or the job configuration unchanged if the schema is not supported
+        """
+        schema = job_config.get("schema", "")
+        filters: Dict[str, Any] = {}
+        if schema.startswith("ohlcv"):
+            loader = self.ohlcv_loader
+            filters["granularity"] = schema.split('-')[-1] if '-' in schema else '1d'
+        else:
+            loader = {
+                "trades": self.trades_loader,
+                "tbbo": self.tbbo_loader,
+                "statistics": self.statistics_loader,
+            }.get(schema)
+        if loader is None:
+            logger.warning("Incremental mode not supported for schema; fetching full range", schema=schema)
+            return job_config
+
+        symbols, start, end = self._job_window(job_config)
+        if len(symbols) != 1:
+            logger.warning(
+                "Incremental mode only supports single-symbol jobs; fetching full range",
+                job_name=job_config.get("name", "unnamed_job"),
+                symbols=len(symbols)
+            )
+            return job_config
+
+        stored_days = loader.get_stored_days(symbols, start, end, **filters)
+        missing = find_missing_ranges(
+            stored_days, symbols, start, end,
+            gap_tolerance_days=int(job_config.get("incremental_gap_days", 4))
+        )
+        logger.info(
+            "Incremental ingestion planned",
+            job_name=job_config.get("name", "unnamed_job"),
+            stored_days=sum(len(days) for days in stored_days.values()),
+            missing_ranges=[(range_start.isoformat(), range_end.isoformat()) for range_start, range_end in missing]
+        )
+        return dict(
+            job_config,
+            date_ranges=[(range_start.isoformat(), range_end.isoformat()) for range_start, range_end in missing]
+        )
 
     def _execute_pipeline_stages(self, job_config: Dict[str, Any]) -> bool:
         """
         Execute the core pipeline stages for data processing.
 
+        Jobs with ``streaming: true`` are routed to the streaming variant, which
+        never materializes the full extraction result in memory. Jobs with
+        ``columnar: true`` are routed to the DataFrame path, which decodes each
+        DBN chunk in bulk and loads it without per-record models. Jobs with
+        ``staged: true`` (or ``pipeline.staged`` in the API config) run the
+        stages concurrently on bounded queues; ``columnar`` still selects the
+        DataFrame variant of each stage there.
+
+        Precedence: ``staged``, then checkpointing (``pipeline.checkpoints`` or
+        ``resume``), then ``columnar``, then ``streaming``. Checkpointed jobs keep
+        their mode: ``columnar`` jobs run the DataFrame stages on one frame per
+        chunk, and the others stream each chunk in ``processing_batch_size``
+        record batches, so memory stays bounded as with ``streaming``.
+
         Args:
             job_config: Job configuration dictionary
 
         Returns:
             True if all stages completed successfully
         """
+        if job_config.get("staged", self.pipeline_config.get("staged", False)):
+            return self._execute_staged_pipeline_stages(job_config)
+        if self._checkpoint_store_for(job_config) is not None:
+            return self._execute_checkpointed_pipeline_stages(job_config)
+        if job_config.get("columnar", False):
+            return self._execute_columnar_pipeline_stages(job_config)
+        if job_config.get("streaming", False):
+            return self._execute_streaming_pipeline_stages(job_config)
+
         job_name = job_config.get("name", "unnamed_job")
 
         try:
@@ -461,103 +906,666 @@ class PipelineOrchestrator:
             records_processed = 0
             for chunk_idx, raw_data_chunk in enumerate(data_chunks):
                 chunk_size = len(raw_data_chunk) if hasattr(raw_data_chunk, '__len__') else 0
-                
-                logger.info(
-                    "Processing data chunk",
-                    job_name=job_name,
-                    chunk_index=chunk_idx,
-                    chunk_size=chunk_size
+
+                if not self._process_data_chunk(
+                    raw_data_chunk,
+                    job_config,
+                    chunk_idx,
+                    chunk_label=f"{chunk_idx + 1}/{total_chunks}",
+                    records_processed=records_processed,
+                    total_records=total_records
+                ):
+                    return False
+
+                records_processed += chunk_size
+
+            # Final progress update
+            self.progress_callback(
+                description=f"Pipeline completed for {job_name}",
+                completed=total_records,
+                total=total_records,
+                final_stats=self.stats.to_dict()
+            )
+
+            return True
+
+        except Exception as e:
+            logger.error(
+                "Pipeline stage execution failed",
+                job_name=job_name,
+                error=str(e),
+                error_type=type(e).__name__
+            )
+            self.stats.add(errors_encountered=1)
+            self.progress_callback(
+                description=f"Pipeline failed: {str(e)}",
+                error=True
+            )
+            return False
+
+    def _execute_streaming_pipeline_stages(self, job_config: Dict[str, Any]) -> bool:
+        """
+        Execute the pipeline stages with bounded memory.
+
+        Batches of ``processing_batch_size`` records flow from the adapter straight
+        through transformation, validation and storage before the next batch is
+        pulled. Progress is reported from running counters since the total record
+        count is unknown until extraction finishes.
+
+        Args:
+            job_config: Job configuration dictionary
+
+        Returns:
+            True if all stages completed successfully
+        """
+        job_name = job_config.get("name", "unnamed_job")
+
+        try:
+            logger.info("Pipeline Stage 1: Data Extraction (streaming)", job_name=job_name)
+            self.progress_callback(description=f"Fetching data for {job_name}...")
+
+            records_processed = 0
+            chunk_idx = -1
+            for chunk_idx, raw_data_chunk in enumerate(self._stage_data_extraction_stream(job_config)):
+                if not self._process_data_chunk(
+                    raw_data_chunk,
+                    job_config,
+                    chunk_idx,
+                    chunk_label=f"{chunk_idx + 1}",
+                    records_processed=records_processed,
+                    total_records=self.stats.records_fetched
+                ):
+                    return False
+
+                records_processed += len(raw_data_chunk)
+
+            if chunk_idx < 0:
+                self.progress_callback(description="No data to process", completed=1, total=1)
+                return True
+
+            self.progress_callback(
+                description=f"Pipeline completed for {job_name}",
+                completed=records_processed,
+                total=records_processed,
+                final_stats=self.stats.to_dict()
+            )
+
+            return True
+
+        except Exception as e:
+            logger.error(
+                "Streaming pipeline stage execution failed",
+                job_name=job_name,
+                error=str(e),
+                error_type=type(e).__name__
+            )
+            self.stats.add(errors_encountered=1)
+            self.progress_callback(
+                description=f"Pipeline failed: {str(e)}",
+                error=True
+            )
+            return False
+
+    def _execute_columnar_pipeline_stages(self, job_config: Dict[str, Any]) -> bool:
+        """
+        Execute the pipeline stages on decoded DataFrames, one per date chunk.
+
+        Each chunk is decoded column-wise by the adapter, transformed and
+        validated in one pass by ``RuleEngine.transform_frame`` and handed to
+        the matching loader's ``insert_frame``; no Pydantic model or dict is
+        built per record.
+
+        Args:
+            job_config: Job configuration dictionary
+
+        Returns:
+            True if all stages completed successfully
+        """
+        job_name = job_config.get("name", "unnamed_job")
+
+        try:
+            logger.info("Pipeline Stage 1: Data Extraction (columnar)", job_name=job_name)
+            self.progress_callback(description=f"Fetching data for {job_name}...")
+
+            if not hasattr(self.adapter, "fetch_historical_frames"):
+                raise PipelineExecutionError(
+                    f"Adapter {type(self.adapter).__name__} does not support columnar extraction"
                 )
-                
-                # Update progress for chunk start
+
+            records_processed = 0
+            chunk_idx = -1
+            for chunk_idx, frame in enumerate(self.adapter.fetch_historical_frames(job_config)):
+                self.stats.add(records_fetched=len(frame), chunks_processed=1)
                 self.progress_callback(
-                    description=f"Processing chunk {chunk_idx + 1}/{total_chunks}",
+                    description=f"Storing chunk {chunk_idx + 1} ({len(frame):,} records)",
                     completed=records_processed,
-                    total=total_records,
-                    chunk_progress=0,
-                    chunk_total=chunk_size
+                    total=self.stats.records_fetched,
+                    stage="storage"
                 )
 
-                # Stage 2: Data Transformation
-                logger.debug("Pipeline Stage 2: Data Transformation", job_name=job_name, chunk_index=chunk_idx)
+                frame = self._stage_frame_transformation(frame, job_config, chunk_idx)
+                if not self._stage_frame_storage(frame, job_config):
+                    return False
+
+                records_processed += len(frame)
                 self.progress_callback(
-                    description=f"Transforming chunk {chunk_idx + 1}/{total_chunks}",
+                    description=f"Completed chunk {chunk_idx + 1}",
                     completed=records_processed,
-                    total=total_records,
-                    stage="transformation"
+                    total=self.stats.records_fetched,
+                    records_stored=self.stats.records_stored
                 )
-                transformed_data = self._stage_data_transformation(raw_data_chunk, job_config, chunk_idx)
 
-                # Stage 3: Data Validation (Post-transformation)
-                logger.debug("Pipeline Stage 3: Data Validation", job_name=job_name, chunk_index=chunk_idx)
-                self.progress_callback(
-                    description=f"Validating chunk {chunk_idx + 1}/{total_chunks}",
-                    completed=records_processed,
-                    total=total_records,
-                    stage="validation"
-                )
-                validated_data, quarantined_data = self._stage_data_validation(transformed_data, job_name, chunk_idx)
+            if chunk_idx < 0:
+                self.progress_callback(description="No data to process", completed=1, total=1)
+                return True
+
+            self.progress_callback(
+                description=f"Pipeline completed for {job_name}",
+                completed=records_processed,
+                total=records_processed,
+                final_stats=self.stats.to_dict()
+            )
+
+            return True
+
+        except Exception as e:
+            logger.error(
+                "Columnar pipeline stage execution failed",
+                job_name=job_name,
+                error=str(e),
+                error_type=type(e).__name__
+            )
+            self.stats.add(errors_encountered=1)
+            self.progress_callback(
+                description=f"Pipeline failed: {str(e)}",
+                error=True
+            )
+            return False
+
+    def _execute_staged_pipeline_stages(self, job_config: Dict[str, Any]) -> bool:
+        """
+        Execute fetch -> decode -> transform -> store as a bounded-queue pipeline.
+
+        Each date chunk planned by the adapter flows through the four stages, which
+        run on their own worker threads (``pipeline.workers`` / job ``stage_workers``)
+        and are connected by queues holding at most ``queue_depth`` chunks, so the
+        database is written to while later chunks are still being fetched. The
+        first failing chunk aborts the run. Chunks may be stored out of order.
+
+        Args:
+            job_config: Job configuration dictionary
+
+        Returns:
+            True if all stages completed successfully
+        """
+        job_name = job_config.get("name", "unnamed_job")
+        columnar = job_config.get("columnar", False)
+
+        try:
+            logger.info("Executing staged pipeline", job_name=job_name, columnar=columnar)
+            self.progress_callback(description=f"Fetching data for {job_name}...")
+
+            if not hasattr(self.adapter, "plan_data_chunks"):
+                raise PipelineExecutionError(
+                    f"Adapter {type(self.adapter).__name__} does not support staged execution"
+                )
+
+            checkpoint_store = self._checkpoint_store_for(job_config)
+            chunk_requests = self._pending_chunk_requests(job_config, checkpoint_store)
+            if not chunk_requests:
+                self.progress_callback(description="No data to process", completed=1, total=1)
+                return True
+
+            workers = {**(self.pipeline_config.get("workers") or {}), **(job_config.get("stage_workers") or {})}
+            queue_depth = int(job_config.get("queue_depth", self.pipeline_config.get("queue_depth", 4)))
+            chunk_indexes = iter(range(len(chunk_requests)))
+            progress_lock = threading.Lock()
+            records_processed = [0]
+            failed_storage_chunks: List[int] = []
+
+            def fetch(request):
+                return request, self.adapter.fetch_data_chunk(request)
+
+            def decode(fetched):
+                request, data_chunk = fetched
+                if columnar:
+                    data = self.adapter.decode_data_chunk_frame(request, data_chunk)
+                else:
+                    data = self.adapter.decode_data_chunk_records(request, data_chunk)
+                if len(data) == 0:
+                    if checkpoint_store:
+                        checkpoint_store.mark_completed(job_config, request.start, request.end, 0)
+                    return None
+                self.stats.add(records_fetched=len(data))
+                return next(chunk_indexes), request, data
+
+            def transform(decoded):
+                chunk_idx, request, data = decoded
+                if columnar:
+                    return chunk_idx, request, self._stage_frame_transformation(data, job_config, chunk_idx), None
+                transformed = self._stage_data_transformation(data, job_config, chunk_idx)
+                validated, quarantined = self._stage_data_validation(transformed, job_name, chunk_idx)
+                return chunk_idx, request, validated, quarantined
+
+            def store(transformed):
+                chunk_idx, request, data, quarantined = transformed
+                if columnar:
+                    stored = self._stage_frame_storage(data, job_config)
+                else:
+                    stored = self._stage_data_storage(data, job_name, chunk_idx, job_config)
+                if not stored:
+                    # Errors were already counted by the storage stage; just stop the run
+                    failed_storage_chunks.append(chunk_idx)
+                    raise PipelineExecutionError(f"Storage stage failed for chunk {chunk_idx + 1}")
+
+                self.stats.add(chunks_processed=1, records_quarantined=len(quarantined) if quarantined else 0)
+                if checkpoint_store:
+                    checkpoint_store.mark_completed(job_config, request.start, request.end, len(data))
+                with progress_lock:
+                    records_processed[0] += len(data)
+                    self.progress_callback(
+                        description=f"Completed chunk {chunk_idx + 1}/{len(chunk_requests)}",
+                        completed=records_processed[0],
+                        total=max(self.stats.records_fetched, records_processed[0]),
+                        records_stored=self.stats.records_stored,
+                        records_quarantined=self.stats.records_quarantined,
+                        chunks_processed=self.stats.chunks_processed
+                    )
+                return transformed
+
+            pipeline = StagedPipeline(
+                job_name,
+                chunk_requests,
+                [
+                    PipelineStage("fetch", fetch, int(workers.get("fetch", 1))),
+                    PipelineStage("decode", decode, int(workers.get("decode", 1))),
+                    PipelineStage("transform", transform, int(workers.get("transform", 1))),
+                    PipelineStage("store", store, int(workers.get("store", 1))),
+                ],
+                queue_depth=queue_depth
+            )
+            result = pipeline.run()
+            self.stage_metrics = result.metrics
+
+            logger.info(
+                "Staged pipeline stage metrics",
+                job_name=job_name,
+                bottleneck_stage=result.metrics["bottleneck_stage"],
+                stages=result.metrics["stages"],
+                queues=result.metrics["queues"]
+            )
+            if failed_storage_chunks:
+                logger.error("Storage stage failed", job_name=job_name, chunk_index=failed_storage_chunks[0])
+                return False
+            if not result.success:
+                raise result.error
+
+            self.progress_callback(
+                description=f"Pipeline completed for {job_name}",
+                completed=records_processed[0],
+                total=records_processed[0],
+                final_stats=self.stats.to_dict(),
+                stage_metrics=result.metrics
+            )
+
+            return True
+
+        except Exception as e:
+            logger.error(
+                "Staged pipeline stage execution failed",
+                job_name=job_name,
+                error=str(e),
+                error_type=type(e).__name__
+            )
+            self.stats.add(errors_encountered=1)
+            self.progress_callback(
+                description=f"Pipeline failed: {str(e)}",
+                error=True
+            )
+            return False
+
+    def _execute_checkpointed_pipeline_stages(self, job_config: Dict[str, Any]) -> bool:
+        """
+        Execute the pipeline one date chunk at a time, checkpointing each stored chunk.
+
+        Chunks already in the job's manifest are skipped when the job is resumed.
+        Records of a chunk still flow through transformation, validation and
+        storage in ``processing_batch_size`` batches (columnar jobs: one frame per
+        chunk), and the chunk is checkpointed only after its last batch is stored.
+
+        Args:
+            job_config: Job configuration dictionary
+
+        Returns:
+            True if all stages completed successfully
+        """
+        job_name = job_config.get("name", "unnamed_job")
+        columnar = job_config.get("columnar", False)
+        checkpoint_store = self._checkpoint_store_for(job_config)
+
+        try:
+            logger.info("Executing checkpointed pipeline", job_name=job_name, resume=bool(job_config.get("resume")))
+            self.progress_callback(description=f"Fetching data for {job_name}...")
+
+            chunk_requests = self._pending_chunk_requests(job_config, checkpoint_store)
+            if not chunk_requests:
+                self.progress_callback(description="No data to process", completed=1, total=1)
+                return True
+
+            batch_size = job_config.get("processing_batch_size", 1000)
+            records_processed = 0
+            chunk_idx = 0
+            for request, data_chunk in self.adapter.fetch_data_chunks(
+                chunk_requests, job_config.get("max_concurrent_chunks")
+            ):
+                chunk_records = 0
+                if columnar:
+                    frame = self.adapter.decode_data_chunk_frame(request, data_chunk)
+                    if not frame.empty:
+                        self.stats.add(records_fetched=len(frame), chunks_processed=1)
+                        frame = self._stage_frame_transformation(frame, job_config, chunk_idx)
+                        if not self._stage_frame_storage(frame, job_config):
+                            return False
+                        chunk_idx += 1
+                        chunk_records = len(frame)
+                else:
+                    records = self.adapter.iter_data_chunk_records(request, data_chunk)
+                    while batch := list(islice(records, batch_size)):
+                        self.stats.add(records_fetched=len(batch))
+                        if not self._process_data_chunk(
+                            batch,
+                            job_config,
+                            chunk_idx,
+                            chunk_label=f"{chunk_idx + 1}",
+                            records_processed=records_processed + chunk_records,
+                            total_records=self.stats.records_fetched
+                        ):
+                            return False
+                        chunk_idx += 1
+                        chunk_records += len(batch)
+
+                records_processed += chunk_records
+                checkpoint_store.mark_completed(job_config, request.start, request.end, chunk_records)
+
+            self.progress_callback(
+                description=f"Pipeline completed for {job_name}",
+                completed=records_processed,
+                total=records_processed,
+                final_stats=self.stats.to_dict()
+            )
+
+            return True
+
+        except Exception as e:
+            logger.error(
+                "Checkpointed pipeline stage execution failed",
+                job_name=job_name,
+                error=str(e),
+                error_type=type(e).__name__
+            )
+            self.stats.add(errors_encountered=1)
+            self.progress_callback(
+                description=f"Pipeline failed: {str(e)}",
+                error=True
+            )
+            return False
+
+    def _checkpoint_store_for(self, job_config: Dict[str, Any]) -> Optional[CheckpointStore]:
+        """
+        Checkpoint store for a job, or None if the job is not checkpointed.
+
+        Jobs are checkpointed when ``pipeline.checkpoints`` is enabled or the job
+        asks to ``resume``, provided the adapter can plan chunks up front.
+
+        Args:
+            job_config: Job configuration dictionary
+
+        Returns:
+            The CheckpointStore to use, or None
+        """
+        if not hasattr(self.adapter, "plan_data_chunks"):
+            return None
+        if self.checkpoint_store is None and job_config.get("resume", False):
+            self.checkpoint_store = CheckpointStore()
+        return self.checkpoint_store
+
+    def _pending_chunk_requests(self, job_config: Dict[str, Any], checkpoint_store: Optional[CheckpointStore]) -> List[Any]:
+        """
+        Plan a job's date chunks, dropping those already checkpointed when resuming.
+
+        A run that does not resume starts a fresh manifest instead.
+
+        Args:
+            job_config: Job configuration dictionary
+            checkpoint_store: Store of the job's checkpoints, or None
+
+        Returns:
+            Chunk requests still to be ingested
+        """
+        chunk_requests = self.adapter.plan_data_chunks(job_config)
+        if checkpoint_store is None:
+            return chunk_requests
+        if not job_config.get("resume", False):
+            checkpoint_store.clear(job_config)
+            return chunk_requests
+
+        completed = checkpoint_store.completed_chunks(job_config)
+        spans = checkpoint_store.covered_spans(completed)
+        pending = [
+            request for request in chunk_requests
+            if not checkpoint_store.is_covered(completed, request.start, request.end, spans)
+        ]
+        self.stats.add(chunks_skipped=len(chunk_requests) - len(pending))
+        logger.info(
+            "Resuming job from checkpoints",
+            job_name=job_config.get("name", "unnamed_job"),
+            chunks_planned=len(chunk_requests),
+            chunks_skipped=len(chunk_requests) - len(pending),
+            manifest=str(checkpoint_store.manifest_path(job_config))
+        )
+        return pending
+
+    def _stage_frame_transformation(self, frame: Any, job_config: Dict[str, Any], chunk_idx: int) -> Any:
+        """
+        Transform and validate a decoded DataFrame with the RuleEngine.
+
+        Rows failing Pandera validation are dropped from the returned frame and
+        written to the quarantine in one batch. If no RuleEngine is configured, or the schema has
+        no mapping, the frame is returned unchanged (as the record path does).
+
+        Args:
+            frame: Decoded frame following the dbn_frame contract
+            job_config: Job configuration dictionary
+            chunk_idx: Chunk index for logging
+
+        Returns:
+            Frame of rows ready for storage
+        """
+        if not self.rule_engine or frame.empty:
+            return frame
+
+        job_name = job_config.get("name", "unnamed_job")
+        schema_name = frame.attrs.get("schema") or job_config.get("schema", "ohlcv-1d")
+
+        try:
+            result = self.rule_engine.transform_frame(frame, schema_name)
+        except (TransformationError, KeyError, ValueError) as e:
+            logger.error(
+                "Frame transformation failed",
+                job_name=job_name,
+                chunk_index=chunk_idx,
+                error=str(e)
+            )
+            self.stats.add(errors_encountered=1)
+            return frame
+
+        rows_failed = int(result.failure_mask.sum())
+        self.stats.add(
+            records_transformed=len(result.frame),
+            records_validated=len(result.frame) - rows_failed
+        )
+        if rows_failed:
+            failed_frame = result.failed_frame
+            messages = failure_messages_by_row(result.failure_cases)
+            self._quarantine_failures(
+                schema_name,
+                frame.loc[failed_frame.index].to_dict(orient="records"),
+                [messages.get(index, "Schema-level validation failure") for index in failed_frame.index],
+                failed_frame.to_dict(orient="records")
+            )
+
+        logger.debug(
+            "Frame transformation completed",
+            job_name=job_name,
+            chunk_index=chunk_idx,
+            records_transformed=len(result.frame),
+            records_quarantined=rows_failed
+        )
+        return result.valid_frame if rows_failed else result.frame
+
+    def _stage_frame_storage(self, frame: Any, job_config: Dict[str, Any]) -> bool:
+        """
+        Store a decoded DataFrame with the loader matching its schema.
+
+        Args:
+            frame: Decoded frame following the dbn_frame contract
+            job_config: Job configuration dictionary
+
+        Returns:
+            True if storage succeeded, False otherwise
+        """
+        schema = frame.attrs.get("schema") or job_config.get("schema", "")
+        data_source = job_config.get('api', 'databento')
+
+        try:
+            with self._db_write_slot(), self.stats.stage("store", rows=len(frame)):
+                if schema.startswith("ohlcv"):
+                    granularity = schema.split('-')[-1] if '-' in schema else '1d'
+                    stats = self.ohlcv_loader.insert_frame(frame, data_source=data_source, granularity=granularity)
+                elif schema == "trades":
+                    stats = self.trades_loader.insert_frame(frame, data_source=data_source)
+                elif schema == "tbbo":
+                    stats = self.tbbo_loader.insert_frame(frame, data_source=data_source)
+                elif schema == "statistics":
+                    stats = self.statistics_loader.insert_frame(frame, data_source=data_source)
+                else:
+                    logger.error("No frame loader for schema", schema=schema)
+                    return False
+        except Exception as e:
+            logger.error("Frame storage failed", schema=schema, error=str(e))
+            self.stats.add(errors_encountered=1)
+            return False
+
+        self.stats.add(records_stored=stats.get('inserted', 0), db_round_trips=stats.get('round_trips', 0))
+        logger.debug(
+            "Frame storage completed",
+            schema=schema,
+            records_stored=stats.get('inserted', 0),
+            rows_per_second=stats.get('rows_per_second')
+        )
+        return True
+
+    def _process_data_chunk(
+        self,
+        raw_data_chunk: Any,
+        job_config: Dict[str, Any],
+        chunk_idx: int,
+        chunk_label: str,
+        records_processed: int,
+        total_records: int
+    ) -> bool:
+        """
+        Run transformation, validation and storage for a single data chunk.
+
+        Args:
+            raw_data_chunk: Raw records from the extraction stage
+            job_config: Job configuration dictionary
+            chunk_idx: Chunk index for logging
+            chunk_label: Human readable chunk position (e.g. "3/10")
+            records_processed: Records completed before this chunk
+            total_records: Total (or running total) of records for progress
+
+        Returns:
+            True if the chunk was stored successfully
+        """
+        job_name = job_config.get("name", "unnamed_job")
+        chunk_size = len(raw_data_chunk) if hasattr(raw_data_chunk, '__len__') else 0
+
+        logger.info(
+            "Processing data chunk",
+            job_name=job_name,
+            chunk_index=chunk_idx,
+            chunk_size=chunk_size
+        )
 
-                # Stage 4: Data Storage
-                logger.debug("Pipeline Stage 4: Data Storage", job_name=job_name, chunk_index=chunk_idx)
-                self.progress_callback(
-                    description=f"Storing chunk {chunk_idx + 1}/{total_chunks}",
-                    completed=records_processed,
-                    total=total_records,
-                    stage="storage"
-                )
-                storage_success = self._stage_data_storage(validated_data, job_name, chunk_idx, job_config)
+        # Update progress for chunk start
+        self.progress_callback(
+            description=f"Processing chunk {chunk_label}",
+            completed=records_processed,
+            total=total_records,
+            chunk_progress=0,
+            chunk_total=chunk_size
+        )
 
-                if not storage_success:
-                    logger.error("Storage stage failed", job_name=job_name, chunk_index=chunk_idx)
-                    return False
+        # Stage 2: Data Transformation
+        logger.debug("Pipeline Stage 2: Data Transformation", job_name=job_name, chunk_index=chunk_idx)
+        self.progress_callback(
+            description=f"Transforming chunk {chunk_label}",
+            completed=records_processed,
+            total=total_records,
+            stage="transformation"
+        )
+        transformed_data = self._stage_data_transformation(raw_data_chunk, job_config, chunk_idx)
+
+        # Stage 3: Data Validation (Post-transformation)
+        logger.debug("Pipeline Stage 3: Data Validation", job_name=job_name, chunk_index=chunk_idx)
+        self.progress_callback(
+            description=f"Validating chunk {chunk_label}",
+            completed=records_processed,
+            total=total_records,
+            stage="validation"
+        )
+        validated_data, quarantined_data = self._stage_data_validation(transformed_data, job_name, chunk_idx)
+
+        # Stage 4: Data Storage
+        logger.debug("Pipeline Stage 4: Data Storage", job_name=job_name, chunk_index=chunk_idx)
+        self.progress_callback(
+            description=f"Storing chunk {chunk_label}",
+            completed=records_processed,
+            total=total_records,
+            stage="storage"
+        )
+        storage_success = self._stage_data_storage(validated_data, job_name, chunk_idx, job_config)
 
-                # Update statistics and progress
-                self.stats.chunks_processed += 1
-                self.stats.records_quarantined += len(quarantined_data) if quarantined_data else 0
-                records_processed += chunk_size
-                
-                # Update progress for chunk completion
-                self.progress_callback(
-                    description=f"Completed chunk {chunk_idx + 1}/{total_chunks}",
-                    completed=records_processed,
-                    total=total_records,
-                    records_stored=self.stats.records_stored,
-                    records_quarantined=self.stats.records_quarantined,
-                    chunks_processed=self.stats.chunks_processed
-                )
+        if not storage_success:
+            logger.error("Storage stage failed", job_name=job_name, chunk_index=chunk_idx)
+            return False
 
-                logger.info(
-                    "Chunk processing completed",
-                    job_name=job_name,
-                    chunk_index=chunk_idx,
-                    records_stored=len(validated_data) if validated_data else 0,
-                    records_quarantined=len(quarantined_data) if quarantined_data else 0
-                )
+        # Update statistics and progress
+        self.stats.add(
+            chunks_processed=1,
+            records_quarantined=len(quarantined_data) if quarantined_data else 0
+        )
 
-            # Final progress update
-            self.progress_callback(
-                description=f"Pipeline completed for {job_name}",
-                completed=total_records,
-                total=total_records,
-                final_stats=self.stats.to_dict()
-            )
+        # Update progress for chunk completion
+        self.progress_callback(
+            description=f"Completed chunk {chunk_label}",
+            completed=records_processed + chunk_size,
+            total=max(total_records, records_processed + chunk_size),
+            records_stored=self.stats.records_stored,
+            records_quarantined=self.stats.records_quarantined,
+            chunks_processed=self.stats.chunks_processed
+        )
 
-            return True
+        logger.info(
+            "Chunk processing completed",
+            job_name=job_name,
+            chunk_index=chunk_idx,
+            records_stored=len(validated_data) if validated_data else 0,
+            records_quarantined=len(quarantined_data) if quarantined_data else 0
+        )
 
-        except Exception as e:
-            logger.error(
-                "Pipeline stage execution failed",
-                job_name=job_name,
-                error=str(e),
-                error_type=type(e).__name__
-            )
-            self.stats.errors_encountered += 1
-            self.progress_callback(
-                description=f"Pipeline failed: {str(e)}",
-                error=True
-            )
-            return False
+        return True
 
     def _stage_data_extraction(self, job_config: Dict[str, Any]) -> List[List[BaseModel]]:
         """
@@ -605,6 +1613,54 @@ class PipelineOrchestrator:
             logger.error("Data extraction stage failed", job_name=job_name, error=str(e))
             raise PipelineExecutionError(f"Data extraction failed: {e}") from e
 
+    def _stage_data_extraction_stream(self, job_config: Dict[str, Any]) -> Iterator[List[BaseModel]]:
+        """
+        Stage 1 (streaming): Extract data from the API in bounded batches.
+
+        Unlike ``_stage_data_extraction`` this never holds more than one batch of
+        ``processing_batch_size`` records, so memory does not grow with the job's
+        date range. ``stats.records_fetched`` is updated as batches are emitted.
+
+        Args:
+            job_config: Job configuration dictionary
+
+        Yields:
+            Lists of at most ``processing_batch_size`` validated records
+
+        Raises:
+            PipelineExecutionError: If data extraction fails
+        """
+        job_name = job_config.get("name", "unnamed_job")
+        chunk_size = job_config.get("processing_batch_size", 1000)
+        batch: List[BaseModel] = []
+        chunks_emitted = 0
+
+        try:
+            for record in self.adapter.fetch_historical_data(job_config):
+                batch.append(record)
+                if len(batch) >= chunk_size:
+                    self.stats.add(records_fetched=len(batch))
+                    chunks_emitted += 1
+                    yield batch
+                    batch = []
+
+            if batch:
+                self.stats.add(records_fetched=len(batch))
+                chunks_emitted += 1
+                yield batch
+
+        except Exception as e:
+            logger.error("Streaming data extraction failed", job_name=job_name, error=str(e))
+            raise PipelineExecutionError(f"Data extraction failed: {e}") from e
+
+        logger.info(
+            "Streaming data extraction completed",
+            job_name=job_name,
+            chunks_count=chunks_emitted,
+            total_records=self.stats.records_fetched,
+            chunk_size=chunk_size
+        )
+
     def _stage_data_transformation(self, raw_data: Any, job_config: Dict[str, Any], chunk_idx: int) -> Any:
         """
         Stage 2: Transform data using the RuleEngine.
@@ -623,10 +1679,13 @@ class PipelineOrchestrator:
             if self.rule_engine:
                 # Get schema name from job config
                 schema_name = job_config.get("schema", "ohlcv-1d")  # Default fallback
+                if self.isolate_validation_failures:
+                    return self._transform_isolating_failures(raw_data, schema_name, job_name, chunk_idx)
+
                 transformed_data = self.rule_engine.transform_batch(raw_data, schema_name)
 
                 record_count = len(transformed_data) if hasattr(transformed_data, '__len__') else 1
-                self.stats.records_transformed += record_count
+                self.stats.add(records_transformed=record_count)
 
                 logger.debug(
                     "Data transformation completed",
@@ -651,7 +1710,7 @@ class PipelineOrchestrator:
                 chunk_index=chunk_idx,
                 error=str(e)
             )
-            self.stats.errors_encountered += 1
+            self.stats.add(errors_encountered=1)
             # Return original data to allow pipeline to continue
             return raw_data
         except Exception as e:
@@ -662,10 +1721,63 @@ class PipelineOrchestrator:
                 error=str(e),
                 error_type=type(e).__name__
             )
-            self.stats.errors_encountered += 1
+            self.stats.add(errors_encountered=1)
             # Return original data to allow pipeline to continue
             return raw_data
 
+    def _transform_isolating_failures(self, raw_data: Any, schema_name: str, job_name: str, chunk_idx: int) -> Any:
+        """
+        Transform a chunk, quarantining rows that fail validation and keeping the rest.
+
+        Args:
+            raw_data: Raw records from the extraction stage
+            schema_name: Schema used for transformation and validation
+            job_name: Job name for logging
+            chunk_idx: Chunk index for logging
+
+        Returns:
+            Transformed records that passed validation
+        """
+        result = self.rule_engine.transform_batch_isolated(raw_data, schema_name)
+
+        self.stats.add(records_transformed=len(result.records) + len(result.failed_records))
+        self._quarantine_failures(
+            schema_name,
+            result.failed_records,
+            result.failure_messages,
+            result.failed_transformed
+        )
+
+        logger.debug(
+            "Data transformation completed with row-level failure isolation",
+            job_name=job_name,
+            chunk_index=chunk_idx,
+            records_transformed=len(result.records),
+            records_quarantined=len(result.failed_records)
+        )
+        return result.records
+
+    def _quarantine_failures(
+        self,
+        schema_name: str,
+        records: List[Dict[str, Any]],
+        error_messages: List[str],
+        transformed_records: Optional[List[Optional[Dict[str, Any]]]] = None
+    ) -> None:
+        """Count failed rows as quarantined and write them to the quarantine in one batch."""
+        if not records:
+            return
+
+        self.stats.add(records_quarantined=len(records))
+        if self.quarantine_manager:
+            self.quarantine_manager.quarantine_records(
+                schema_name,
+                "pandera_validation",
+                records,
+                error_messages,
+                transformed_records
+            )
+
     def _stage_data_validation(self, data: Any, job_name: str, chunk_idx: int) -> tuple[Any, Any]:
         """
         Stage 3: Validate transformed data and handle quarantine.
@@ -683,7 +1795,7 @@ class PipelineOrchestrator:
             # Future implementation can add post-transformation validation here
 
             record_count = len(data) if hasattr(data, '__len__') else 1
-            self.stats.records_validated += record_count
+            self.stats.add(records_validated=record_count)
 
             logger.debug(
                 "Data validation completed",
@@ -703,7 +1815,7 @@ class PipelineOrchestrator:
                 error=str(e),
                 error_type=type(e).__name__
             )
-            self.stats.errors_encountered += 1
+            self.stats.add(errors_encountered=1)
             # Return original data and empty quarantine list
             return data, []
 
@@ -754,6 +1866,116 @@ class PipelineOrchestrator:
         
         return repaired_dict
     
+    def _repair_record_frame(self, frame: Any, schema: str, job_config: Dict[str, Any]) -> tuple:
+        """
+        Vectorized counterpart of ``_validate_and_repair_record_dict`` for a whole batch.
+
+        Missing symbols are filled column-wise from the job's symbols (or the
+        instrument ID for multi-symbol jobs); rows that cannot be repaired, and
+        batches missing a required column, are dropped.
+
+        Args:
+            frame: DataFrame of transformed records (object columns)
+            schema: Normalized schema name
+            job_config: Job configuration dictionary
+
+        Returns:
+            Tuple of (repaired frame, repair statistics dict)
+        """
+        repair_stats = {'repaired': 0, 'failed_repair': 0}
+
+        if 'symbol' not in frame.columns:
+            frame['symbol'] = None
+        missing_symbol = frame['symbol'].isna() | (frame['symbol'] == '')
+
+        if missing_symbol.any():
+            symbols = job_config.get('symbols')
+            if isinstance(symbols, list) and len(symbols) == 1:
+                fill = pd.Series(symbols[0], index=frame.index)
+            elif isinstance(symbols, str):
+                fill = pd.Series(symbols, index=frame.index)
+            elif symbols and 'instrument_id' in frame.columns:
+                fill = 'INSTRUMENT_' + frame['instrument_id'].astype(str)
+            elif symbols:
+                fill = pd.Series("UNKNOWN_SYMBOL", index=frame.index)
+            else:
+                fill = None
+
+            if fill is None:
+                logger.error(
+                    "Cannot repair missing symbol field - no symbols in job config",
+                    records_dropped=int(missing_symbol.sum())
+                )
+                repair_stats['failed_repair'] += int(missing_symbol.sum())
+                frame = frame[~missing_symbol]
+            else:
+                frame.loc[missing_symbol, 'symbol'] = fill[missing_symbol]
+                repair_stats['repaired'] += int(missing_symbol.sum())
+                logger.info(
+                    "Repaired missing symbol field",
+                    records_repaired=int(missing_symbol.sum()),
+                    original_symbols=symbols
+                )
+
+        missing_fields = [field for field in self._get_required_fields_for_schema(schema) if field not in frame.columns]
+        if missing_fields:
+            logger.error("Cannot repair missing required fields", missing_fields=missing_fields, schema=schema)
+            repair_stats['failed_repair'] += len(frame)
+            frame = frame.iloc[0:0]
+
+        return frame, repair_stats
+
+    def _store_transformed_records(
+        self,
+        records_list: List[Dict[str, Any]],
+        schema: str,
+        job_config: Dict[str, Any],
+        storage_logger: Any
+    ) -> None:
+        """
+        Store transformed record dicts for OHLCV, trades, TBBO or statistics.
+
+        The batch becomes one DataFrame (object columns, so values keep their
+        Python types), is repaired in a single vectorized pass and reaches the
+        loader as row tuples via ``frame_to_rows``/``insert_rows``.
+
+        Args:
+            records_list: Transformed records from the RuleEngine
+            schema: Normalized schema name
+            job_config: Job configuration dictionary
+            storage_logger: Bound logger for the storage stage
+        """
+        data_source = job_config.get('api', 'databento')
+        column_values = {}
+        if 'ohlcv' in schema:
+            loader, table = self.ohlcv_loader, "daily_ohlcv_data"
+            column_values['granularity'] = schema.split('-')[-1] if '-' in schema else '1d'
+        else:
+            loader, table = {
+                'trades': (self.trades_loader, "trades_data"),
+                'tbbo': (self.tbbo_loader, "tbbo_data"),
+                'statistics': (self.statistics_loader, "statistics_data"),
+            }[schema]
+
+        storage_logger = storage_logger.bind(storage_type=schema, table=table)
+        storage_logger.debug("Storing transformed records", record_count=len(records_list))
+
+        frame, repair_stats = self._repair_record_frame(
+            pd.DataFrame(records_list, dtype=object), schema, job_config
+        )
+        self.stats.add(errors_encountered=repair_stats['failed_repair'])
+        if any(repair_stats.values()):
+            storage_logger.info("Record repair statistics", **repair_stats)
+
+        if frame.empty:
+            return
+
+        rows = loader.frame_to_rows(frame, data_source=data_source, **column_values)
+        stats = loader.insert_rows(rows)
+        self.stats.add(records_stored=stats['inserted'], db_round_trips=stats.get('round_trips', 0))
+        if stats['errors'] > 0:
+            storage_logger.warning(f"Failed to store {stats['errors']} {schema} records")
+
     def _apply_definition_field_mapping(self, record_dict: Dict[str, Any]) -> Dict[str, Any]:
         """Apply field name mapping for definition records to match Pydantic model field names."""
         
@@ -830,6 +2052,12 @@ class PipelineOrchestrator:
         }
         return schema_aliases.get(schema_name, schema_name)
 
+    def _db_write_slot(self) -> Any:
+        """Context manager holding one of the shared database writer slots, if capped."""
+        if self.concurrency_limits is None:
+            return nullcontext()
+        return self.concurrency_limits.db_writers
+
     def _stage_data_storage(self, data: Any, job_name: str, chunk_idx: int, job_config: Dict[str, Any]) -> bool:
         """
         Stage 4: Store validated data in TimescaleDB using appropriate loader.
@@ -843,6 +2071,12 @@ class PipelineOrchestrator:
         Returns:
             True if storage succeeded, False otherwise
         """
+        rows = len(data) if isinstance(data, list) else int(bool(data))
+        with self._db_write_slot(), self.stats.stage("store", rows=rows):
+            return self._store_data(data, job_name, chunk_idx, job_config)
+
+    def _store_data(self, data: Any, job_name: str, chunk_idx: int, job_config: Dict[str, Any]) -> bool:
+        """Store validated data with the loader matching the record type (see _stage_data_storage)."""
         # Bind context for storage operations
         storage_logger = logger.bind(
             job_name=job_name,
@@ -882,11 +2116,13 @@ class PipelineOrchestrator:
                 granularity = schema.split('-')[-1] if '-' in schema else '1d'
                 data_source = job_config.get('api', 'databento')
                 
-                self.ohlcv_loader.insert_ohlcv_records(
+                stats = self.ohlcv_loader.insert_ohlcv_records(
                     records_list, 
                     granularity=granularity,
                     data_source=data_source
                 )
+                if isinstance(stats, dict):
+                    self.stats.add(db_round_trips=stats.get('round_trips', 0))
             elif isinstance(first_record, DatabentoTradeRecord):
                 # Use Trades loader for trade records
                 storage_logger = storage_logger.bind(storage_type="trades", table="trades_data")
@@ -897,7 +2133,7 @@ class PipelineOrchestrator:
                     records_list,
                     data_source=data_source
                 )
-                self.stats.records_stored += stats['inserted']
+                self.stats.add(records_stored=stats['inserted'], db_round_trips=stats.get('round_trips', 0))
                 if stats['errors'] > 0:
                     storage_logger.warning(f"Failed to store {stats['errors']} trade records")
                 return True
@@ -911,7 +2147,7 @@ class PipelineOrchestrator:
                     records_list,
                     data_source=data_source
                 )
-                self.stats.records_stored += stats['inserted']
+                self.stats.add(records_stored=stats['inserted'], db_round_trips=stats.get('round_trips', 0))
                 if stats['errors'] > 0:
                     storage_logger.warning(f"Failed to store {stats['errors']} TBBO records")
                 return True
@@ -925,7 +2161,7 @@ class PipelineOrchestrator:
                     records_list,
                     data_source=data_source
                 )
-                self.stats.records_stored += stats['inserted']
+                self.stats.add(records_stored=stats['inserted'], db_round_trips=stats.get('round_trips', 0))
                 if stats['errors'] > 0:
                     storage_logger.warning(f"Failed to store {stats['errors']} statistics records")
                 return True
@@ -935,12 +2171,12 @@ class PipelineOrchestrator:
                 storage_logger.debug("Storing Definition records")
                 stats = self.storage_loader.insert_definition_records(records_list)
                 if isinstance(stats, dict):
-                    self.stats.records_stored += stats.get('inserted', 0)
+                    self.stats.add(records_stored=stats.get('inserted', 0), db_round_trips=stats.get('round_trips', 0))
                     if stats.get('errors', 0) > 0:
                         storage_logger.warning(f"Failed to store {stats['errors']} definition records")
                 else:
                     # Fallback for loaders that don't return stats dict
-                    self.stats.records_stored += len(records_list)
+                    self.stats.add(records_stored=len(records_list))
                 
                 storage_logger.debug(
                     "Data storage completed",
@@ -955,190 +2191,13 @@ class PipelineOrchestrator:
                 schema = self._normalize_schema_name_for_storage(raw_schema)
                 data_source = job_config.get('api', 'databento')
                 
-                if 'ohlcv' in schema:
-                    # Use OHLCV loader for transformed OHLCV records
-                    storage_logger = storage_logger.bind(storage_type="ohlcv", table="daily_ohlcv_data")
-                    storage_logger.debug("Storing transformed OHLCV records")
-                    granularity = schema.split('-')[-1] if '-' in schema else '1d'
-                    
-                    # Convert dicts back to Pydantic models for the loader with validation and repair
-                    pydantic_records = []
-                    repair_stats = {'repaired': 0, 'failed_repair': 0, 'conversion_errors': 0}
-                    
-                    for record_dict in records_list:
-                        # Pre-validate and repair if needed
-                        validated_dict = self._validate_and_repair_record_dict(record_dict, schema, job_config)
-                        
-                        if validated_dict is None:
-                            repair_stats['failed_repair'] += 1
-                            self.stats.errors_encountered += 1
-                            continue
-                        
-                        if validated_dict != record_dict:
-                            repair_stats['repaired'] += 1
-                        
-                        try:
-                            pydantic_record = DatabentoOHLCVRecord(**validated_dict)
-                            pydantic_records.append(pydantic_record)
-                        except ValidationError as e:
-                            repair_stats['conversion_errors'] += 1
-                            storage_logger.error("Failed to convert validated dict to OHLCV model", 
-                                               error=str(e),
-                                               validated_dict=validated_dict,
-                                               original_dict=record_dict)
-                            self.stats.errors_encountered += 1
-                    
-                    # Log repair statistics
-                    if any(repair_stats.values()):
-                        storage_logger.info("Record repair statistics", **repair_stats)
-                    
-                    if pydantic_records:
-                        self.ohlcv_loader.insert_ohlcv_records(
-                            pydantic_records, 
-                            granularity=granularity,
-                            data_source=data_source
-                        )
-                        self.stats.records_stored += len(pydantic_records)
-                elif schema == 'trades':
-                    # Use Trades loader for transformed trade records
-                    storage_logger = storage_logger.bind(storage_type="trades", table="trades_data")
-                    storage_logger.debug("Storing transformed Trade records")
-                    
-                    # Convert dicts back to Pydantic models for the loader with validation and repair
-                    pydantic_records = []
-                    repair_stats = {'repaired': 0, 'failed_repair': 0, 'conversion_errors': 0}
-                    
-                    for record_dict in records_list:
-                        # Pre-validate and repair if needed
-                        validated_dict = self._validate_and_repair_record_dict(record_dict, schema, job_config)
-                        
-                        if validated_dict is None:
-                            repair_stats['failed_repair'] += 1
-                            self.stats.errors_encountered += 1
-                            continue
-                        
-                        if validated_dict != record_dict:
-                            repair_stats['repaired'] += 1
-                        
-                        try:
-                            pydantic_record = DatabentoTradeRecord(**validated_dict)
-                            pydantic_records.append(pydantic_record)
-                        except ValidationError as e:
-                            repair_stats['conversion_errors'] += 1
-                            storage_logger.error("Failed to convert validated dict to Trade model", 
-                                               error=str(e),
-                                               validated_dict=validated_dict,
-                                               original_dict=record_dict)
-                            self.stats.errors_encountered += 1
-                    
-                    # Log repair statistics
-                    if any(repair_stats.values()):
-                        storage_logger.info("Record repair statistics", **repair_stats)
-                    
-                    if pydantic_records:
-                        stats = self.trades_loader.insert_trades_records(
-                            pydantic_records,
-                            data_source=data_source
-                        )
-                        self.stats.records_stored += stats['inserted']
-                        if stats['errors'] > 0:
-                            storage_logger.warning(f"Failed to store {stats['errors']} trade records")
-                elif schema == 'tbbo':
-                    # Use TBBO loader for transformed TBBO records
-                    storage_logger = storage_logger.bind(storage_type="tbbo", table="tbbo_data")
-                    storage_logger.debug("Storing transformed TBBO records")
-                    
-                    # Convert dicts back to Pydantic models for the loader with validation and repair
-                    pydantic_records = []
-                    repair_stats = {'repaired': 0, 'failed_repair': 0, 'conversion_errors': 0}
-                    
-                    for record_dict in records_list:
-                        # Pre-validate and repair if needed
-                        validated_dict = self._validate_and_repair_record_dict(record_dict, schema, job_config)
-                        
-                        if validated_dict is None:
-                            repair_stats['failed_repair'] += 1
-                            self.stats.errors_encountered += 1
-                            continue
-                        
-                        if validated_dict != record_dict:
-                            repair_stats['repaired'] += 1
-                        
-                        try:
-                            pydantic_record = DatabentoTBBORecord(**validated_dict)
-                            pydantic_records.append(pydantic_record)
-                        except ValidationError as e:
-                            repair_stats['conversion_errors'] += 1
-                            storage_logger.error("Failed to convert validated dict to TBBO model", 
-                                               error=str(e),
-                                               validated_dict=validated_dict,
-                                               original_dict=record_dict)
-                            self.stats.errors_encountered += 1
-                    
-                    # Log repair statistics
-                    if any(repair_stats.values()):
-                        storage_logger.info("Record repair statistics", **repair_stats)
-                    
-                    if pydantic_records:
-                        stats = self.tbbo_loader.insert_tbbo_records(
-                            pydantic_records,
-                            data_source=data_source
-                        )
-                        self.stats.records_stored += stats['inserted']
-                        if stats['errors'] > 0:
-                            storage_logger.warning(f"Failed to store {stats['errors']} TBBO records")
-                elif schema == 'statistics':
-                    # Use Statistics loader for transformed statistics records
-                    storage_logger = storage_logger.bind(storage_type="statistics", table="statistics_data")
-                    storage_logger.debug("Storing transformed Statistics records")
-                    
-                    # Convert dicts back to Pydantic models for the loader with validation and repair
-                    pydantic_records = []
-                    repair_stats = {'repaired': 0, 'failed_repair': 0, 'conversion_errors': 0}
-                    
-                    for record_dict in records_list:
-                        # Create a new dict with proper field mappings
-                        # The transformation maps stat_value to price, but the model expects stat_value
-                        model_dict = record_dict.copy()
-                        if 'price' in model_dict and 'stat_value' not in model_dict:
-                            model_dict['stat_value'] = model_dict.pop('price')
-                        
-                        # Pre-validate and repair if needed
-                        validated_dict = self._validate_and_repair_record_dict(model_dict, schema, job_config)
-                        
-                        if validated_dict is None:
-                            repair_stats['failed_repair'] += 1
-                            self.stats.errors_encountered += 1
-                            continue
-                        
-                        if validated_dict != model_dict:
-                            repair_stats['repaired'] += 1
-                        
-                        try:
-                            pydantic_record = DatabentoStatisticsRecord(**validated_dict)
-                            pydantic_records.append(pydantic_record)
-                        except ValidationError as e:
-                            repair_stats['conversion_errors'] += 1
-                            storage_logger.error("Failed to convert validated dict to Statistics model", 
-                                               error=str(e),
-                                               validated_dict=validated_dict,
-                                               original_dict=record_dict)
-                            self.stats.errors_encountered += 1
-                    
-                    # Log repair statistics
-                    if any(repair_stats.values()):
-                        storage_logger.info("Record repair statistics", **repair_stats)
-                    
-                    if pydantic_records:
-                        stats = self.statistics_loader.insert_statistics_records(
-                            pydantic_records,
-                            data_source=data_source
-                        )
-                        self.stats.records_stored += stats['inserted']
-                        if stats['errors'] > 0:
-                            storage_logger.warning(f"Failed to store {stats['errors']} statistics records")
+                if 'ohlcv' in schema or schema in ('trades', 'tbbo', 'statistics'):
+                    # Transformed records go to the loader as row tuples: one vectorized
+                    # repair pass, no per-row Pydantic model construction
+                    self._store_transformed_records(records_list, schema, job_config, storage_logger)
                 elif schema == 'definition':
-                    # Use Definition loader for transformed definition records
+                    # Definitions keep the model path: the loader relies on model defaults
+                    # and per-record constraint fixing, and volumes are small
                     storage_logger = storage_logger.bind(storage_type="definition", table="definitions_data")
                     storage_logger.debug("Storing transformed Definition records")
                     
@@ -1152,7 +2211,7 @@ class PipelineOrchestrator:
                         
                         if validated_dict is None:
                             repair_stats['failed_repair'] += 1
-                            self.stats.errors_encountered += 1
+                            self.stats.add(errors_encountered=1)
                             continue
                         
                         if validated_dict != record_dict:
@@ -1167,7 +2226,7 @@ class PipelineOrchestrator:
                                                error=str(e),
                                                validated_dict=validated_dict,
                                                original_dict=record_dict)
-                            self.stats.errors_encountered += 1
+                            self.stats.add(errors_encountered=1)
                     
                     # Log repair statistics
                     if any(repair_stats.values()):
@@ -1176,12 +2235,12 @@ class PipelineOrchestrator:
                     if pydantic_records:
                         stats = self.storage_loader.insert_definition_records(pydantic_records)
                         if isinstance(stats, dict):
-                            self.stats.records_stored += stats.get('inserted', 0)
+                            self.stats.add(records_stored=stats.get('inserted', 0), db_round_trips=stats.get('round_trips', 0))
                             if stats.get('errors', 0) > 0:
                                 storage_logger.warning(f"Failed to store {stats['errors']} definition records")
                         else:
                             # Fallback for loaders that don't return stats dict
-                            self.stats.records_stored += len(pydantic_records)
+                            self.stats.add(records_stored=len(pydantic_records))
                 else:
                     # Unknown schema type
                     storage_logger.error(
@@ -1203,7 +2262,7 @@ class PipelineOrchestrator:
                 return False
 
             record_count = len(records_list)
-            self.stats.records_stored += record_count
+            self.stats.add(records_stored=record_count)
 
             storage_logger.debug(
                 "Data storage completed",
@@ -1219,7 +2278,7 @@ class PipelineOrchestrator:
                 error=str(e),
                 error_type=type(e).__name__
             )
-            self.stats.errors_encountered += 1
+            self.stats.add(errors_encountered=1)
             return False
 
     def execute_ingestion(
@@ -1284,6 +2343,10 @@ class PipelineOrchestrator:
             if overrides:
                 job_config.update(overrides)
 
+            # Reprocess jobs rebuild tables from cached raw responses, without the network
+            if job_config.get("reprocess", False):
+                api_config = {**api_config, "cache": {**(api_config.get("cache") or {}), "reprocess": True}}
+
             # Initialize pipeline components
             self.initialize_components(api_type, api_config)
 
@@ -1307,6 +2370,35 @@ class PipelineOrchestrator:
         finally:
             self.cleanup_components()
 
+    def execute_pipeline(self, job_config: Dict[str, Any], progress_callback: Optional[callable] = None) -> Dict[str, Any]:
+        """
+        Execute a fully specified job (as built by the CLI) and summarize the outcome.
+
+        Args:
+            job_config: Complete job configuration; ``api`` selects the API type
+            progress_callback: Optional progress callback for this run
+
+        Returns:
+            Dictionary with 'status' ('success' or 'failed'), 'records_processed',
+            'duration', 'stats' and, on failure, 'error'
+        """
+        if progress_callback is not None:
+            self.progress_callback = progress_callback
+        self.stats = PipelineStats()
+
+        success = self.execute_ingestion(job_config.get("api", "databento"), overrides=job_config)
+
+        stats = self.stats.to_dict()
+        result = {
+            "status": "success" if success else "failed",
+            "records_processed": stats["records_stored"],
+            "duration": stats["duration_seconds"] or 0,
+            "stats": stats,
+        }
+        if not success:
+            result["error"] = f"Pipeline failed after {stats['errors_encountered']} error(s); see logs for details"
+        return result
+
     def _get_predefined_job_config(self, api_config: Dict[str, Any], job_name: str) -> Dict[str, Any]:
         """Get a predefined job configuration by name."""
         jobs = api_config.get("jobs", [])
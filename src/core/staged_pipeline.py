@@ -0,0 +1,301 @@
+"""
+Bounded producer/consumer stage pipeline.
+
+A source iterator feeds a chain of stages (e.g. fetch -> decode -> transform ->
+store). Each stage runs on its own worker threads and reads from a bounded
+queue, so a slow stage applies backpressure upstream instead of letting
+buffered chunks grow without limit, while I/O-bound stages (network fetch,
+database writes) overlap with each other.
+
+Every queue records occupancy samples and how long producers waited on a full
+queue versus how long consumers waited on an empty one, which identifies the
+bottleneck stage.
+"""
+
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+# Marks the end of a stage's input
+_STOP = object()
+
+# How often blocked workers re-check for an aborted run (seconds)
+_POLL_INTERVAL = 0.1
+
+
+class PipelineStage(NamedTuple):
+    """One stage of a StagedPipeline.
+
+    ``func`` receives an item from the stage's input queue and returns the item
+    for the next stage; returning None drops the item. Exceptions abort the run.
+    """
+
+    name: str
+    func: Callable[[Any], Any]
+    workers: int = 1
+
+
+class QueueMetrics:
+    """Occupancy and wait-time metrics for one bounded stage queue."""
+
+    def __init__(self, name: str, depth: int):
+        self.name = name
+        self.depth = depth
+        self.items = 0
+        self.samples = 0
+        self.occupancy_total = 0
+        self.max_occupancy = 0
+        self.producer_wait_seconds = 0.0
+        self.consumer_wait_seconds = 0.0
+        self._lock = threading.Lock()
+
+    def record_put(self, occupancy: int, waited: float) -> None:
+        """Record a put, the queue size seen after it and how long the producer blocked."""
+        with self._lock:
+            self.items += 1
+            self.samples += 1
+            self.occupancy_total += occupancy
+            self.max_occupancy = max(self.max_occupancy, occupancy)
+            self.producer_wait_seconds += waited
+
+    def record_get(self, waited: float) -> None:
+        """Record how long a consumer waited for an item."""
+        with self._lock:
+            self.consumer_wait_seconds += waited
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert metrics to a dictionary for logging/reporting."""
+        mean_occupancy = self.occupancy_total / self.samples if self.samples else 0.0
+        return {
+            "queue": self.name,
+            "depth": self.depth,
+            "items": self.items,
+            "mean_occupancy": round(mean_occupancy, 3),
+            "max_occupancy": self.max_occupancy,
+            "mean_fill_ratio": round(mean_occupancy / self.depth, 3) if self.depth else 0.0,
+            "producer_wait_seconds": round(self.producer_wait_seconds, 6),
+            "consumer_wait_seconds": round(self.consumer_wait_seconds, 6),
+        }
+
+
+class StageMetrics:
+    """Throughput metrics for one stage's workers."""
+
+    def __init__(self, name: str, workers: int):
+        self.name = name
+        self.workers = workers
+        self.items_processed = 0
+        self.items_dropped = 0
+        self.busy_seconds = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, busy: float, dropped: bool) -> None:
+        """Record one processed item and the time spent in the stage function."""
+        with self._lock:
+            self.items_processed += 1
+            self.items_dropped += int(dropped)
+            self.busy_seconds += busy
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert metrics to a dictionary for logging/reporting."""
+        return {
+            "stage": self.name,
+            "workers": self.workers,
+            "items_processed": self.items_processed,
+            "items_dropped": self.items_dropped,
+            "busy_seconds": round(self.busy_seconds, 6),
+            # Busy time per worker: the stage with the highest value is the bottleneck
+            "busy_seconds_per_worker": round(self.busy_seconds / self.workers, 6) if self.workers else 0.0,
+        }
+
+
+class StagedPipelineResult(NamedTuple):
+    """Outcome of ``StagedPipeline.run``."""
+
+    success: bool
+    error: Optional[BaseException]
+    metrics: Dict[str, Any]
+
+
+class StagedPipeline:
+    """
+    Run a source iterator through bounded-queue stages on worker threads.
+
+    The source is consumed by a single producer thread. Stage ``i`` reads from
+    queue ``i`` (bounded by ``queue_depth``) and writes to queue ``i + 1``.
+    The first exception, from the source or any stage, aborts the run: every
+    thread stops at its next queue operation and ``run`` reports the error.
+    """
+
+    def __init__(self, name: str, source: Iterable[Any], stages: List[PipelineStage], queue_depth: int = 4):
+        """
+        Initialize the staged pipeline.
+
+        Args:
+            name: Pipeline name for logging
+            source: Iterable producing the first stage's input items
+            stages: Stages in execution order
+            queue_depth: Maximum number of items buffered in front of each stage
+
+        Raises:
+            ValueError: If no stages are given or a depth/worker count is below 1
+        """
+        if not stages:
+            raise ValueError("A staged pipeline needs at least one stage")
+        if queue_depth < 1 or any(stage.workers < 1 for stage in stages):
+            raise ValueError("Queue depth and stage worker counts must be at least 1")
+
+        self.name = name
+        self.source = source
+        self.stages = stages
+        self.queue_depth = queue_depth
+        self._queues = [queue.Queue(maxsize=queue_depth) for _ in stages]
+        self.queue_metrics = [QueueMetrics(f"{stage.name}_input", queue_depth) for stage in stages]
+        self.stage_metrics = [StageMetrics(stage.name, stage.workers) for stage in stages]
+        self._abort = threading.Event()
+        self._error: Optional[BaseException] = None
+        self._error_lock = threading.Lock()
+
+    def run(self) -> StagedPipelineResult:
+        """
+        Execute the pipeline to completion (or the first error).
+
+        Returns:
+            StagedPipelineResult with success flag, first error and metrics
+        """
+        started_at = time.perf_counter()
+        threads = [threading.Thread(target=self._produce, name=f"{self.name}-source", daemon=True)]
+        stage_done = []
+        for index, stage in enumerate(self.stages):
+            remaining = [stage.workers]
+            stage_done.append((remaining, threading.Lock()))
+            for worker in range(stage.workers):
+                threads.append(threading.Thread(
+                    target=self._work,
+                    args=(index, stage_done[index]),
+                    name=f"{self.name}-{stage.name}-{worker}",
+                    daemon=True
+                ))
+
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        metrics = self.metrics(time.perf_counter() - started_at)
+        logger.info(
+            "Staged pipeline finished",
+            pipeline=self.name,
+            success=self._error is None,
+            bottleneck_stage=metrics["bottleneck_stage"],
+            duration_seconds=metrics["duration_seconds"]
+        )
+        return StagedPipelineResult(self._error is None, self._error, metrics)
+
+    def metrics(self, duration: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Snapshot of per-stage and per-queue metrics.
+
+        Args:
+            duration: Wall-clock duration of the run, if finished
+
+        Returns:
+            Dictionary with 'stages', 'queues', 'bottleneck_stage' and 'duration_seconds'
+        """
+        stages = [metric.to_dict() for metric in self.stage_metrics]
+        bottleneck = max(stages, key=lambda stage: stage["busy_seconds_per_worker"])["stage"] if stages else None
+        return {
+            "duration_seconds": round(duration, 6) if duration is not None else None,
+            "queue_depth": self.queue_depth,
+            "stages": stages,
+            "queues": [metric.to_dict() for metric in self.queue_metrics],
+            "bottleneck_stage": bottleneck,
+        }
+
+    def _fail(self, error: BaseException) -> None:
+        """Record the first error and signal every thread to stop."""
+        with self._error_lock:
+            if self._error is None:
+                self._error = error
+        self._abort.set()
+
+    def _put(self, index: int, item: Any) -> bool:
+        """Put onto queue ``index``, blocking while full; False if the run was aborted."""
+        target = self._queues[index]
+        started_at = time.perf_counter()
+        while not self._abort.is_set():
+            try:
+                target.put(item, timeout=_POLL_INTERVAL)
+            except queue.Full:
+                continue
+            if item is not _STOP:
+                self.queue_metrics[index].record_put(target.qsize(), time.perf_counter() - started_at)
+            return True
+        return False
+
+    def _get(self, index: int) -> Any:
+        """Get from queue ``index``, blocking while empty; _STOP if the run was aborted."""
+        source = self._queues[index]
+        started_at = time.perf_counter()
+        while not self._abort.is_set():
+            try:
+                item = source.get(timeout=_POLL_INTERVAL)
+            except queue.Empty:
+                continue
+            self.queue_metrics[index].record_get(time.perf_counter() - started_at)
+            return item
+        return _STOP
+
+    def _produce(self) -> None:
+        """Feed source items into the first stage queue."""
+        try:
+            for item in self.source:
+                if not self._put(0, item):
+                    return
+        except Exception as e:
+            logger.error("Staged pipeline source failed", pipeline=self.name, error=str(e))
+            self._fail(e)
+            return
+        finally:
+            close = getattr(self.source, "close", None)
+            if self._abort.is_set() and callable(close):
+                close()
+
+        for _ in range(self.stages[0].workers):
+            self._put(0, _STOP)
+
+    def _work(self, index: int, done: tuple) -> None:
+        """Process items of stage ``index`` until its input is exhausted."""
+        stage = self.stages[index]
+        is_last = index == len(self.stages) - 1
+
+        while True:
+            item = self._get(index)
+            if item is _STOP:
+                break
+
+            started_at = time.perf_counter()
+            try:
+                result = stage.func(item)
+            except Exception as e:
+                logger.error("Staged pipeline stage failed", pipeline=self.name, stage=stage.name, error=str(e))
+                self._fail(e)
+                break
+            self.stage_metrics[index].record(time.perf_counter() - started_at, dropped=result is None)
+
+            if result is not None and not is_last and not self._put(index + 1, result):
+                break
+
+        # The last worker of a stage to finish closes the next stage's input
+        remaining, lock = done
+        with lock:
+            remaining[0] -= 1
+            last_worker = remaining[0] == 0
+        if last_worker and not is_last and not self._abort.is_set():
+            for _ in range(self.stages[index + 1].workers):
+                self._put(index + 1, _STOP)
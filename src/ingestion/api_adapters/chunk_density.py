@@ -0,0 +1,265 @@
+"""
+Adaptive sizing of date chunks from learned data densities.
+
+A static ``date_chunk_interval_days`` fits some symbols and not others: a quiet
+contract fetched 7 days at a time costs one request per small chunk, while an
+active one can return more data per chunk than comfortably fits in memory.
+
+``ChunkDensityStore`` learns, per (dataset, schema, stype_in, symbols), how many
+records and response bytes one calendar day of data holds. Every fetched chunk
+contributes a sample. Densities rise to a denser sample at once and decay
+towards sparser samples by exponential smoothing, so one busy period shrinks
+chunks immediately while a quiet one only grows them gradually. The densities
+are kept in a small JSON file, rewritten atomically, so later runs start from
+what earlier runs measured.
+
+``AdaptiveChunker`` turns a density into a chunk length that hits a target
+record count and/or byte size, and splits planned windows that turn out to be
+too long once a denser chunk has been seen.
+"""
+
+import json
+import math
+import os
+import threading
+from datetime import datetime, UTC
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+_SECONDS_PER_DAY = 86400.0
+
+
+def _parse(value: str) -> datetime:
+    """Parse a chunk bound the way ``DatabentoAdapter._generate_date_chunks`` does."""
+    return datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+
+
+def window_days(start: str, end: str) -> float:
+    """
+    Length of a chunk window in (fractional) days.
+
+    Args:
+        start: Chunk start (ISO date or timestamp)
+        end: Chunk end (ISO date or timestamp)
+
+    Returns:
+        Number of days between the bounds, 0.0 if they cannot be compared
+    """
+    try:
+        return max(0.0, (_parse(end) - _parse(start)).total_seconds() / _SECONDS_PER_DAY)
+    except (ValueError, TypeError):
+        return 0.0
+
+
+def split_window(start: str, end: str, max_days: float) -> List[Tuple[str, str]]:
+    """
+    Split a window into equal consecutive parts of at most ``max_days``.
+
+    Args:
+        start: Window start (ISO date or timestamp)
+        end: Window end (ISO date or timestamp)
+        max_days: Maximum length of a part in days
+
+    Returns:
+        Consecutive (start, end) windows; the outer bounds keep their original strings
+    """
+    days = window_days(start, end)
+    parts = math.ceil(days / max_days) if max_days > 0 else 1
+    if parts <= 1:
+        return [(start, end)]
+
+    start_dt = _parse(start)
+    step = (_parse(end) - start_dt) / parts
+    bounds = [start] + [
+        (start_dt + step * index).replace(microsecond=0).isoformat() for index in range(1, parts)
+    ] + [end]
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+class ChunkDensityStore:
+    """Persisted records-per-day and bytes-per-day densities per request identity."""
+
+    def __init__(self, path: str = "cache/databento/chunk_density.json", smoothing: float = 0.3):
+        """
+        Initialize the store, loading densities saved by earlier runs.
+
+        Args:
+            path: JSON file holding the densities
+            smoothing: Weight of a new sample when it is sparser than the current
+                density (denser samples replace it outright)
+        """
+        self.path = Path(path)
+        self.smoothing = min(1.0, max(0.0, float(smoothing)))
+        self._lock = threading.Lock()
+        self._densities: Dict[str, Dict[str, Any]] = {}
+        self._load()
+
+    @staticmethod
+    def key(dataset: str, schema: str, symbols: Any, stype_in: str) -> str:
+        """
+        Identity whose chunks share a density.
+
+        Returns:
+            Readable key combining dataset, schema, stype_in and the sorted symbols
+        """
+        symbols = sorted(symbols) if isinstance(symbols, (list, tuple)) else [symbols]
+        return "|".join([str(dataset), str(schema), str(stype_in), ",".join(str(symbol) for symbol in symbols)])
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Current densities of a key.
+
+        Returns:
+            Copy of the entry ('records_per_day', 'bytes_per_day', 'samples',
+            'updated_at'), or None if nothing was measured yet
+        """
+        with self._lock:
+            entry = self._densities.get(key)
+            return dict(entry) if entry is not None else None
+
+    def observe(self, key: str, days: float, records: Optional[int] = None, nbytes: Optional[int] = None) -> None:
+        """
+        Add the measurements of one fetched chunk and persist the densities.
+
+        Args:
+            key: Key from ``key``
+            days: Length of the chunk window in days (windows of 0 days are ignored)
+            records: Records decoded from the chunk, if known
+            nbytes: Response size of the chunk in bytes, if known
+        """
+        if days <= 0 or (records is None and nbytes is None):
+            return
+
+        with self._lock:
+            entry = self._densities.setdefault(key, {"samples": 0})
+            for field, amount in (("records_per_day", records), ("bytes_per_day", nbytes)):
+                if amount is None:
+                    continue
+                sample = amount / days
+                current = entry.get(field)
+                if current is None or sample >= current:
+                    entry[field] = sample
+                else:
+                    entry[field] = current + self.smoothing * (sample - current)
+            entry["samples"] += 1
+            entry["updated_at"] = datetime.now(UTC).isoformat()
+            self._save()
+
+    def _load(self) -> None:
+        """Read the densities file, starting empty if it is missing or unreadable."""
+        if not self.path.exists():
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                self._densities = json.load(f).get("densities", {})
+        except (OSError, ValueError, AttributeError) as e:
+            logger.warning("Ignoring unreadable chunk density file", path=str(self.path), error=str(e))
+
+    def _save(self) -> None:
+        """Rewrite the densities file atomically (lock held)."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(f"{self.path.name}.{threading.get_ident()}.tmp")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"densities": self._densities}, f, indent=2, sort_keys=True)
+            os.replace(tmp_path, self.path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+
+class AdaptiveChunker:
+    """Chooses date chunk lengths that hit a record and/or byte target."""
+
+    def __init__(
+        self,
+        store: ChunkDensityStore,
+        target_records: Optional[int] = None,
+        target_bytes: Optional[int] = None,
+        min_chunk_hours: float = 1.0,
+        max_chunk_days: float = 366.0,
+        shrink_threshold: float = 1.5
+    ):
+        """
+        Initialize the chunker.
+
+        Args:
+            store: Densities learned from earlier chunks
+            target_records: Records wanted per chunk (None: no record target)
+            target_bytes: Response bytes wanted per chunk (None: no byte target)
+            min_chunk_hours: Shortest chunk ever planned
+            max_chunk_days: Longest chunk ever planned
+            shrink_threshold: Planned windows longer than this multiple of the
+                current chunk length are split before they are fetched
+        """
+        self.store = store
+        self.target_records = target_records
+        self.target_bytes = target_bytes
+        self.min_chunk_days = max(1.0, float(min_chunk_hours)) / 24.0
+        self.max_chunk_days = max(self.min_chunk_days, float(max_chunk_days))
+        self.shrink_threshold = max(1.0, float(shrink_threshold))
+
+    def chunk_days(self, key: str, default: Optional[float] = None) -> Optional[float]:
+        """
+        Chunk length for a request identity.
+
+        Lengths of a day or more are whole days and shorter ones whole hours, so
+        chunk bounds stay on day or hour boundaries.
+
+        Args:
+            key: Key from ``ChunkDensityStore.key``
+            default: Length to use while nothing has been measured (the static interval)
+
+        Returns:
+            Chunk length in days, or ``default`` without measurements
+        """
+        density = self.store.get(key)
+        if density is None:
+            return default
+
+        lengths = []
+        for target, field in ((self.target_records, "records_per_day"), (self.target_bytes, "bytes_per_day")):
+            per_day = density.get(field)
+            if target and per_day is not None:
+                lengths.append(target / per_day if per_day > 0 else self.max_chunk_days)
+        if not lengths:
+            return default
+
+        days = min(self.max_chunk_days, max(self.min_chunk_days, min(lengths)))
+        if days >= 1:
+            return float(math.floor(days))
+        return max(self.min_chunk_days, math.floor(days * 24) / 24.0)
+
+    def shrink(self, windows: List[Tuple[str, str]], key: str) -> List[Tuple[str, str]]:
+        """
+        Split planned windows that are too long for the current density.
+
+        Args:
+            windows: Ordered (start, end) windows not fetched yet
+            key: Key from ``ChunkDensityStore.key``
+
+        Returns:
+            The same span as consecutive windows; unchanged if none is too long
+        """
+        days = self.chunk_days(key)
+        if days is None:
+            return windows
+
+        shrunk = []
+        for start, end in windows:
+            if window_days(start, end) > days * self.shrink_threshold:
+                shrunk.extend(split_window(start, end, days))
+            else:
+                shrunk.append((start, end))
+        if len(shrunk) > len(windows):
+            logger.info(
+                "Shrinking remaining date chunks",
+                key=key,
+                chunk_days=days,
+                planned_chunks=len(windows),
+                chunks=len(shrunk)
+            )
+        return shrunk
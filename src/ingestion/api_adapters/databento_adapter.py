@@ -6,10 +6,15 @@ using the official databento-python client library to fetch historical market da
 """
 
 import os
+import threading
+from collections import deque
+from contextlib import nullcontext
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Any, Dict, Iterator, List, Optional
+from typing import Any, Deque, Dict, Iterator, List, NamedTuple, Optional, Tuple, Type
 
 import databento
+import pandas as pd
 import structlog
 from pydantic import BaseModel, ValidationError
 from tenacity import (
@@ -20,8 +25,12 @@ from tenacity import (
     RetryError,
 )
 from src.utils.custom_logger import get_logger
+from src.core.pipeline_metrics import stage_timer, timed_stage_iter
 
 from src.ingestion.api_adapters.base_adapter import BaseAdapter
+from src.ingestion.api_adapters.chunk_density import AdaptiveChunker, ChunkDensityStore, window_days
+from src.ingestion.api_adapters.dbn_cache import DBNResponseCache
+from src.ingestion.api_adapters.dbn_frame import decode_dbn_store, supports_columnar
 from src.storage.models import DATABENTO_SCHEMA_MODEL_MAPPING
 from src.transformation.validators.databento_validators import validate_dataframe
 from src.utils.file_io import QuarantineManager
@@ -29,6 +38,17 @@ from src.utils.file_io import QuarantineManager
 logger = get_logger(__name__)
 
 
+class DataChunkRequest(NamedTuple):
+    """One date chunk of a job, as planned by ``DatabentoAdapter.plan_data_chunks``."""
+
+    dataset: str
+    schema: str  # canonical schema name
+    symbols: Any
+    stype_in: str
+    start: str
+    end: str
+
+
 class DatabentoAdapter(BaseAdapter):
     """
     API Adapter for Databento that fetches historical market data.
@@ -60,6 +80,43 @@ class DatabentoAdapter(BaseAdapter):
         self.max_delay = retry_config.get("max_delay", 60.0)
         self.backoff_multiplier = retry_config.get("backoff_multiplier", 2.0)
 
+        # Number of date chunks fetched concurrently ahead of decoding (1 = serial)
+        fetch_config = self.config.get("fetch", {})
+        self.max_concurrent_chunks = max(1, int(fetch_config.get("max_concurrent_chunks", 1)))
+
+        # Optional chunk sizing from learned densities (date_chunk_interval_days is then the first guess)
+        adaptive_config = fetch_config.get("adaptive_chunking", {}) or {}
+        self.adaptive_chunker: Optional[AdaptiveChunker] = None
+        if adaptive_config.get("enabled", False):
+            self.adaptive_chunker = AdaptiveChunker(
+                ChunkDensityStore(
+                    adaptive_config.get("state_file", "cache/databento/chunk_density.json"),
+                    smoothing=float(adaptive_config.get("smoothing", 0.3))
+                ),
+                target_records=adaptive_config.get("target_records"),
+                target_bytes=adaptive_config.get("target_bytes"),
+                min_chunk_hours=float(adaptive_config.get("min_chunk_hours", 1)),
+                max_chunk_days=float(adaptive_config.get("max_chunk_days", 366)),
+                shrink_threshold=float(adaptive_config.get("shrink_threshold", 1.5))
+            )
+
+        # Optional semaphore capping API calls across adapters (set for parallel backfills)
+        self.api_call_limiter: Optional[threading.Semaphore] = None
+
+        # Optional PipelineStats receiving fetch and decode stage timings (set by the orchestrator)
+        self.pipeline_stats = None
+
+        # On-disk cache of raw DBN responses; in reprocess mode it is the only data source
+        cache_config = self.config.get("cache", {}) or {}
+        self.reprocess = bool(cache_config.get("reprocess", False))
+        self.response_cache: Optional[DBNResponseCache] = None
+        if cache_config.get("enabled", False) or self.reprocess:
+            self.response_cache = DBNResponseCache(
+                base_dir=cache_config.get("base_dir", "cache/databento"),
+                max_bytes=int(float(cache_config.get("max_size_gb", 10)) * 1024 ** 3),
+                min_age_hours=float(cache_config.get("min_age_hours", 24))
+            )
+
     def validate_config(self) -> bool:
         """
         Validate the adapter configuration.
@@ -67,6 +124,10 @@ class DatabentoAdapter(BaseAdapter):
         Returns:
             bool: True if configuration is valid, False otherwise
         """
+        if self.reprocess:
+            # Cached responses only; no API key needed
+            return True
+
         api_config = self.config.get("api", {})
         key_env_var = api_config.get("key_env_var")
 
@@ -85,7 +146,12 @@ class DatabentoAdapter(BaseAdapter):
         """
         Connects to the Databento API.
         It can be configured with a direct 'key' or a 'key_env_var' to read from the environment.
+        In reprocess mode no client is created, since only cached responses are read.
         """
+        if self.reprocess:
+            logger.info("Reprocess mode: serving data from the raw response cache only")
+            return
+
         api_config = self.config.get('api', {})
         api_key = api_config.get('key')
 
@@ -200,6 +266,10 @@ class DatabentoAdapter(BaseAdapter):
         """
         Fetch a single chunk of data from the Databento API with retry logic.
 
+        With the raw response cache enabled, windows old enough to be immutable
+        are served from disk when cached, and otherwise written to the cache
+        while they are downloaded.
+
         Args:
             dataset: Dataset identifier (e.g., 'GLBX.MDP3')
             schema: Schema type (e.g., 'ohlcv-1d', 'trades', 'tbbo')
@@ -212,8 +282,54 @@ class DatabentoAdapter(BaseAdapter):
             DBNStore containing the fetched data
 
         Raises:
-            RuntimeError: If API call fails after all retries
+            RuntimeError: If API call fails after all retries, or in reprocess
+                mode if the chunk is not cached
         """
+        with stage_timer(self.pipeline_stats, "fetch"):
+            data_chunk = self._download_data_chunk(dataset, schema, symbols, stype_in, start_date, end_date)
+        nbytes = getattr(data_chunk, "nbytes", None)
+        if not isinstance(nbytes, int):
+            nbytes = None
+        if self.pipeline_stats is not None and nbytes:
+            self.pipeline_stats.add(bytes_fetched=nbytes)
+        self._observe_chunk_density(dataset, schema, symbols, stype_in, start_date, end_date, nbytes=nbytes)
+        return data_chunk
+
+    def _density_key(self, dataset: str, schema: str, symbols: Any, stype_in: str) -> str:
+        """Key under which the adaptive chunker learns the density of a request."""
+        return ChunkDensityStore.key(dataset, self._normalize_schema(schema), symbols, stype_in)
+
+    def _observe_chunk_density(
+        self,
+        dataset: str,
+        schema: str,
+        symbols: Any,
+        stype_in: str,
+        start_date: str,
+        end_date: str,
+        records: Optional[int] = None,
+        nbytes: Optional[int] = None
+    ) -> None:
+        """Feed the size of a fetched or decoded chunk to the adaptive chunker, if enabled."""
+        if self.adaptive_chunker is None:
+            return
+        self.adaptive_chunker.store.observe(
+            self._density_key(dataset, schema, symbols, stype_in),
+            window_days(start_date, end_date),
+            records=records,
+            nbytes=nbytes
+        )
+
+    def _download_data_chunk(
+        self,
+        dataset: str,
+        schema: str,
+        symbols: Any,
+        stype_in: str,
+        start_date: str,
+        end_date: str
+    ) -> databento.DBNStore:
+        """Fetch one chunk from the raw response cache or the API (see ``_fetch_data_chunk``)."""
         # Normalize the schema to canonical name
         normalized_schema = self._normalize_schema(schema)
         
@@ -228,22 +344,42 @@ class DatabentoAdapter(BaseAdapter):
             operation="api_call"
         )
 
+        cache_key = None
+        if self.response_cache is not None and (self.reprocess or self.response_cache.is_cacheable(end_date)):
+            cache_key = self.response_cache.key(dataset, normalized_schema, symbols, stype_in, start_date, end_date)
+            cached_path = self.response_cache.get(cache_key)
+            if cached_path is not None:
+                api_logger.debug("Serving data chunk from raw response cache", path=str(cached_path))
+                return databento.DBNStore.from_file(cached_path)
+        if self.reprocess:
+            api_logger.error("Reprocess mode: data chunk missing from raw response cache")
+            raise RuntimeError(
+                f"No cached response for {dataset} {normalized_schema} {start_date} to {end_date} (reprocess mode)"
+            )
+
         retry_decorator = self._create_retry_decorator()
 
         @retry_decorator
-        def _make_api_call():
+        def _make_api_call(**kwargs):
             api_logger.info("Fetching data chunk from Databento API")
-            return self.client.timeseries.get_range(
-                dataset=dataset,
-                symbols=symbols,
-                schema=normalized_schema,
-                start=start_date,
-                end=end_date,
-                stype_in=stype_in
-            )
+            # Held per attempt only, so retry back-off does not occupy a slot
+            with self.api_call_limiter or nullcontext():
+                return self.client.timeseries.get_range(
+                    dataset=dataset,
+                    symbols=symbols,
+                    schema=normalized_schema,
+                    start=start_date,
+                    end=end_date,
+                    stype_in=stype_in,
+                    **kwargs
+                )
 
         try:
-            return _make_api_call()
+            if cache_key is None:
+                return _make_api_call()
+            # Spool the response straight into the cache instead of memory
+            cached_path = self.response_cache.store(cache_key, lambda path: _make_api_call(path=path))
+            return databento.DBNStore.from_file(cached_path)
         except RetryError as e:
             api_logger.error(
                 "Failed to fetch data after all retries",
@@ -255,23 +391,41 @@ class DatabentoAdapter(BaseAdapter):
         self,
         start_date: str,
         end_date: str,
-        chunk_interval_days: Optional[int],
+        chunk_interval_days: Optional[float],
         enable_market_calendar: bool = False,
-        exchange_name: str = "NYSE"
+        exchange_name: str = "NYSE",
+        density_key: Optional[str] = None
     ) -> List[tuple[str, str]]:
         """
         Generate date chunks for processing large date ranges with optional market calendar filtering.
 
+        With adaptive chunking enabled and a ``density_key`` given, the chunk
+        length is chosen from the densities learned for that key so chunks hit
+        the configured record/byte target; ``chunk_interval_days`` is only used
+        until the key has been measured.
+
         Args:
             start_date: Start date in ISO format
             end_date: End date in ISO format
             chunk_interval_days: Number of days per chunk, None for no chunking
             enable_market_calendar: Whether to filter chunks based on trading days
             exchange_name: Exchange name for market calendar (e.g., NYSE, CME_Equity)
+            density_key: Key from ``ChunkDensityStore.key`` for adaptive sizing
 
         Returns:
             List of (start_date, end_date) tuples for each chunk, optionally filtered for trading days
         """
+        if self.adaptive_chunker is not None and density_key is not None:
+            adaptive_days = self.adaptive_chunker.chunk_days(density_key, default=chunk_interval_days)
+            if adaptive_days != chunk_interval_days:
+                logger.info(
+                    "Adaptive chunk length",
+                    density_key=density_key,
+                    configured_days=chunk_interval_days,
+                    chunk_days=adaptive_days
+                )
+            chunk_interval_days = adaptive_days
+
         if not chunk_interval_days:
             chunks = [(start_date, end_date)]
         else:
@@ -297,9 +451,11 @@ class DatabentoAdapter(BaseAdapter):
         # Apply market calendar filtering if enabled
         if enable_market_calendar:
             try:
-                from src.cli.smart_validation import MarketCalendar, PANDAS_MARKET_CALENDARS_AVAILABLE
+                from src.cli.smart_validation import (
+                    MarketCalendar, PANDAS_MARKET_CALENDARS_AVAILABLE, get_trading_day_bitmap
+                )
                 
-                if PANDAS_MARKET_CALENDARS_AVAILABLE:
+                if PANDAS_MARKET_CALENDARS_AVAILABLE or get_trading_day_bitmap(exchange_name) is not None:
                     calendar = MarketCalendar(exchange_name)
                     filtered_chunks = []
                     
@@ -330,7 +486,8 @@ class DatabentoAdapter(BaseAdapter):
                     
                     chunks = filtered_chunks
                 else:
-                    logger.warning("Market calendar filtering requested but pandas-market-calendars not available")
+                    logger.warning("Market calendar filtering requested but neither pandas-market-calendars "
+                                   "nor a trading-day bitmap is available")
                     
             except Exception as e:
                 logger.warning(f"Market calendar filtering failed: {e}", 
@@ -341,6 +498,92 @@ class DatabentoAdapter(BaseAdapter):
         logger.info(f"Generated {len(chunks)} date chunks", chunks=len(chunks))
         return chunks
 
+    def _iter_data_chunks(
+        self,
+        dataset: str,
+        schema: str,
+        symbols: Any,
+        stype_in: str,
+        date_chunks: List[Tuple[str, str]],
+        max_concurrent: int = 1
+    ) -> Iterator[Tuple[Tuple[str, str], databento.DBNStore]]:
+        """
+        Fetch date chunks, optionally prefetching several ahead on a thread pool.
+
+        Chunks are always yielded in the order of ``date_chunks``, so records stay
+        chronological. At most ``max_concurrent`` chunks are in flight or buffered
+        at any time, and each fetch goes through ``_fetch_data_chunk`` so the retry
+        policy still applies per chunk.
+
+        With adaptive chunking, windows not submitted yet are split after each
+        chunk if the densities learned so far make them too long, so the yielded
+        windows can be finer than ``date_chunks`` (they cover the same span).
+
+        Args:
+            dataset: Dataset identifier (e.g., 'GLBX.MDP3')
+            schema: Canonical schema name
+            symbols: List of symbols or single symbol string
+            stype_in: Symbol type ('continuous', 'native', 'parent')
+            date_chunks: Ordered (start, end) tuples from _generate_date_chunks
+            max_concurrent: Maximum number of chunks fetched ahead (1 = serial)
+
+        Yields:
+            Tuples of ((start, end), DBNStore) in chronological order
+        """
+        pending_chunks: Deque[Tuple[str, str]] = deque(date_chunks)
+
+        def shrink_pending() -> None:
+            if self.adaptive_chunker is not None and pending_chunks:
+                shrunk = self.adaptive_chunker.shrink(
+                    list(pending_chunks), self._density_key(dataset, schema, symbols, stype_in)
+                )
+                if len(shrunk) != len(pending_chunks):
+                    pending_chunks.clear()
+                    pending_chunks.extend(shrunk)
+
+        if max_concurrent <= 1 or len(date_chunks) <= 1:
+            while pending_chunks:
+                start, end = pending_chunks.popleft()
+                yield (start, end), self._fetch_data_chunk(dataset, schema, symbols, stype_in, start, end)
+                shrink_pending()
+            return
+
+        in_flight: Deque[Tuple[Tuple[str, str], Future]] = deque()
+        executor = ThreadPoolExecutor(
+            max_workers=min(max_concurrent, len(date_chunks)),
+            thread_name_prefix="databento-fetch"
+        )
+
+        def submit_next() -> None:
+            if pending_chunks:
+                chunk = pending_chunks.popleft()
+                in_flight.append((
+                    chunk,
+                    executor.submit(self._fetch_data_chunk, dataset, schema, symbols, stype_in, *chunk)
+                ))
+
+        logger.info(
+            "Fetching date chunks concurrently",
+            chunks=len(date_chunks),
+            max_concurrent=max_concurrent
+        )
+
+        try:
+            for _ in range(max_concurrent):
+                submit_next()
+
+            while in_flight:
+                chunk, future = in_flight.popleft()
+                data_chunk = future.result()
+                shrink_pending()
+                # Keep the pipeline full while the caller decodes this chunk
+                submit_next()
+                yield chunk, data_chunk
+        finally:
+            for _, future in in_flight:
+                future.cancel()
+            executor.shutdown(wait=True)
+
     def _ensure_symbol_field(self, record_dict: Dict[str, Any], symbols=None, record=None) -> Dict[str, Any]:
         """Ensure symbol field is always present with appropriate fallback logic."""
         
@@ -720,6 +963,98 @@ class DatabentoAdapter(BaseAdapter):
 
         return record_dict
 
+    def _plan_date_chunks(self, job_config: Dict[str, Any], fetch_logger) -> List[Tuple[str, str]]:
+        """
+        Build the date chunks for a job, applying market calendar filtering if enabled.
+
+        If the job carries ``date_ranges`` (incremental ingestion), chunks are
+        shrunk to the part overlapping those ranges and dropped if they do not
+        overlap any.
+
+        Args:
+            job_config: Job configuration (start/end dates, chunk interval, calendar settings)
+            fetch_logger: Bound logger of the calling fetch session
+
+        Returns:
+            Ordered list of (start_date, end_date) tuples
+        """
+        symbols = job_config["symbols"]
+
+        # Extract market calendar settings from job config 
+        enable_market_calendar = job_config.get("enable_market_calendar_filtering", False)
+        exchange_name = job_config.get("exchange_name")
+        
+        # Intelligent exchange detection if not explicitly provided
+        if enable_market_calendar and not exchange_name:
+            try:
+                from src.cli.exchange_mapping import map_symbols_to_exchange
+                symbol_list = symbols if isinstance(symbols, list) else [symbols]
+                exchange_name, confidence = map_symbols_to_exchange(symbol_list, "NYSE")
+                fetch_logger.info(f"Auto-detected exchange for calendar filtering",
+                                exchange=exchange_name, 
+                                confidence=confidence,
+                                symbols=symbol_list)
+            except Exception as e:
+                fetch_logger.warning(f"Failed to auto-detect exchange: {e}")
+                exchange_name = "NYSE"
+        elif not exchange_name:
+            exchange_name = "NYSE"
+        
+        density_key = None
+        if self.adaptive_chunker is not None:
+            density_key = self._density_key(job_config["dataset"], job_config["schema"], symbols, job_config.get("stype_in"))
+        chunks = self._generate_date_chunks(job_config["start_date"], job_config["end_date"],
+                                            job_config.get("date_chunk_interval_days"),
+                                            enable_market_calendar, exchange_name,
+                                            density_key=density_key)
+
+        date_ranges = job_config.get("date_ranges")
+        if date_ranges is not None:
+            restricted = self._restrict_date_chunks(chunks, date_ranges)
+            fetch_logger.info(
+                "Restricted date chunks to missing ranges",
+                planned_chunks=len(chunks),
+                remaining_chunks=len(restricted),
+                date_ranges=len(date_ranges)
+            )
+            chunks = restricted
+        return chunks
+
+    @staticmethod
+    def _restrict_date_chunks(chunks: List[Tuple[str, str]], date_ranges: List[Tuple[Any, Any]]) -> List[Tuple[str, str]]:
+        """
+        Shrink date chunks to the span overlapping the given ranges.
+
+        Args:
+            chunks: (start, end) tuples from _generate_date_chunks
+            date_ranges: Half-open [start, end) ranges still to be fetched
+
+        Returns:
+            Chunks covering only the overlapping span; unchanged bounds keep their original strings
+        """
+        def to_utc(value: Any) -> pd.Timestamp:
+            timestamp = pd.Timestamp(value)
+            return timestamp.tz_localize("UTC") if timestamp.tzinfo is None else timestamp.tz_convert("UTC")
+
+        ranges = [(to_utc(range_start), to_utc(range_end)) for range_start, range_end in date_ranges]
+        restricted = []
+        for chunk_start, chunk_end in chunks:
+            start_ts, end_ts = to_utc(chunk_start), to_utc(chunk_end)
+            overlaps = [
+                (max(start_ts, range_start), min(end_ts, range_end))
+                for range_start, range_end in ranges
+                if range_start < end_ts and range_end > start_ts
+            ]
+            if not overlaps:
+                continue
+            new_start = min(overlap[0] for overlap in overlaps)
+            new_end = max(overlap[1] for overlap in overlaps)
+            restricted.append((
+                chunk_start if new_start == start_ts else new_start.isoformat(),
+                chunk_end if new_end == end_ts else new_end.isoformat()
+            ))
+        return restricted
+
     def fetch_historical_data(self, job_config: Dict[str, Any]) -> Iterator[BaseModel]:
         """
         Fetches historical data from the Databento API based on the job configuration.
@@ -736,6 +1071,7 @@ class DatabentoAdapter(BaseAdapter):
                 - start_date: Start date in ISO format
                 - end_date: End date in ISO format
                 - date_chunk_interval_days: Optional chunking interval
+                - max_concurrent_chunks: Optional number of chunks to prefetch concurrently
 
         Yields:
             Iterator of validated Pydantic model instances (DatabentoOHLCVRecord, etc.)
@@ -763,9 +1099,6 @@ class DatabentoAdapter(BaseAdapter):
         schema = job_config["schema"]
         symbols = job_config["symbols"]
         stype_in = job_config["stype_in"]
-        start_date = job_config["start_date"]
-        end_date = job_config["end_date"]
-        chunk_interval_days = job_config.get("date_chunk_interval_days")
 
         # Bind context for all operations in this fetch session
         fetch_logger = logger.bind(
@@ -778,28 +1111,7 @@ class DatabentoAdapter(BaseAdapter):
         # Normalize schema first to handle aliases
         normalized_schema = self._normalize_schema(schema)
         
-        # Extract market calendar settings from job config 
-        enable_market_calendar = job_config.get("enable_market_calendar_filtering", False)
-        exchange_name = job_config.get("exchange_name")
-        
-        # Intelligent exchange detection if not explicitly provided
-        if enable_market_calendar and not exchange_name:
-            try:
-                from src.cli.exchange_mapping import map_symbols_to_exchange
-                symbol_list = symbols if isinstance(symbols, list) else [symbols]
-                exchange_name, confidence = map_symbols_to_exchange(symbol_list, "NYSE")
-                fetch_logger.info(f"Auto-detected exchange for calendar filtering",
-                                exchange=exchange_name, 
-                                confidence=confidence,
-                                symbols=symbol_list)
-            except Exception as e:
-                fetch_logger.warning(f"Failed to auto-detect exchange: {e}")
-                exchange_name = "NYSE"
-        elif not exchange_name:
-            exchange_name = "NYSE"
-        
-        date_chunks = self._generate_date_chunks(start_date, end_date, chunk_interval_days, 
-                                                enable_market_calendar, exchange_name)
+        date_chunks = self._plan_date_chunks(job_config, fetch_logger)
 
         model_cls = DATABENTO_SCHEMA_MODEL_MAPPING.get(normalized_schema)
         if not model_cls:
@@ -809,42 +1121,272 @@ class DatabentoAdapter(BaseAdapter):
             return
 
         validation_stats = {"total_records": 0, "failed_validation": 0}
-
-        for start, end in date_chunks:
-            data_chunk = self._fetch_data_chunk(dataset, normalized_schema, symbols, stype_in, start, end)
-
-            for record in data_chunk:
-                validation_stats["total_records"] += 1
-                try:
-                    # Convert record to dictionary using direct attribute access
-                    record_dict = self._record_to_dict(record, symbols)
-
-                    # Stage 1 Validation: Pydantic model instantiation
-                    model_instance = model_cls.model_validate(
-                        record_dict,
-                        strict=self.strict_mode
-                    )
-                    yield model_instance
-                except ValidationError as e:
-                    validation_stats["failed_validation"] += 1
-                    record_dict = self._record_to_dict(record, symbols)
-                    fetch_logger.warning(
-                        "Pydantic validation failed for record",
-                        error=str(e),
-                        record_data=record_dict
-                    )
-                    self.quarantine_manager.quarantine_record(
-                        schema,
-                        "pydantic_validation",
-                        str(e),
-                        original_record=record_dict
-                    )
+        max_concurrent = max(1, int(job_config.get("max_concurrent_chunks", self.max_concurrent_chunks)))
+
+        for (start, end), data_chunk in self._iter_data_chunks(
+            dataset, normalized_schema, symbols, stype_in, date_chunks, max_concurrent
+        ):
+            records_before = validation_stats["total_records"]
+            yield from timed_stage_iter(self.pipeline_stats, "decode", self._validate_chunk_records(
+                data_chunk, model_cls, schema, symbols, validation_stats, fetch_logger
+            ))
+            self._observe_chunk_density(
+                dataset, normalized_schema, symbols, stype_in, start, end,
+                records=validation_stats["total_records"] - records_before
+            )
 
         fetch_logger.info(
             "Data fetching and validation complete",
             stats=validation_stats
         )
 
+    def _validate_chunk_records(
+        self,
+        data_chunk: Any,
+        model_cls: Type[BaseModel],
+        schema: str,
+        symbols: Any,
+        validation_stats: Dict[str, int],
+        fetch_logger
+    ) -> Iterator[BaseModel]:
+        """
+        Convert the DBN records of one chunk into validated Pydantic models.
+
+        Records failing validation are quarantined and counted in ``validation_stats``.
+
+        Args:
+            data_chunk: DBNStore (or iterable of DBN records) for one date chunk
+            model_cls: Pydantic model class for the schema
+            schema: Schema name used for quarantine entries
+            symbols: Requested symbols, used to fill the symbol field
+            validation_stats: Counters updated in place ('total_records', 'failed_validation')
+            fetch_logger: Bound logger of the calling fetch session
+
+        Yields:
+            Validated Pydantic model instances
+        """
+        for record in data_chunk:
+            validation_stats["total_records"] += 1
+            try:
+                # Convert record to dictionary using direct attribute access
+                record_dict = self._record_to_dict(record, symbols)
+
+                # Stage 1 Validation: Pydantic model instantiation
+                model_instance = model_cls.model_validate(
+                    record_dict,
+                    strict=self.strict_mode
+                )
+                yield model_instance
+            except ValidationError as e:
+                validation_stats["failed_validation"] += 1
+                record_dict = self._record_to_dict(record, symbols)
+                fetch_logger.warning(
+                    "Pydantic validation failed for record",
+                    error=str(e),
+                    record_data=record_dict
+                )
+                self.quarantine_manager.quarantine_record(
+                    schema,
+                    "pydantic_validation",
+                    str(e),
+                    original_record=record_dict
+                )
+
+    def fetch_historical_frames(self, job_config: Dict[str, Any]) -> Iterator[pd.DataFrame]:
+        """
+        Fetch historical data as one decoded DataFrame per date chunk.
+
+        This is the columnar counterpart of ``fetch_historical_data``: each DBN chunk
+        is decoded in bulk by ``dbn_frame.decode_dbn_store`` instead of building a
+        dict and a Pydantic model per record. Prices stay fixed-point int64 and
+        timestamps stay int64 nanoseconds (see the dbn_frame module docstring).
+
+        Args:
+            job_config: Same job configuration as ``fetch_historical_data``
+
+        Yields:
+            Decoded DataFrames in chronological chunk order (empty chunks are skipped)
+
+        Raises:
+            ValueError: If the schema is not supported by the columnar decoder
+        """
+        dataset = job_config["dataset"]
+        symbols = job_config["symbols"]
+        stype_in = job_config["stype_in"]
+        normalized_schema = self._normalize_schema(job_config["schema"])
+
+        if not supports_columnar(normalized_schema):
+            raise ValueError(f"Columnar decoding is not supported for schema '{normalized_schema}'")
+
+        fetch_logger = logger.bind(
+            schema_name=normalized_schema,
+            dataset=dataset,
+            symbols=symbols,
+            operation="fetch_historical_frames"
+        )
+
+        date_chunks = self._plan_date_chunks(job_config, fetch_logger)
+        max_concurrent = max(1, int(job_config.get("max_concurrent_chunks", self.max_concurrent_chunks)))
+        symbol = symbols[0] if isinstance(symbols, list) and symbols else symbols or None
+        total_records = 0
+
+        for (start, end), data_chunk in self._iter_data_chunks(
+            dataset, normalized_schema, symbols, stype_in, date_chunks, max_concurrent
+        ):
+            with stage_timer(self.pipeline_stats, "decode") as timing:
+                frame = decode_dbn_store(data_chunk, normalized_schema, symbol)
+                timing.rows = len(frame)
+            total_records += len(frame)
+            self._observe_chunk_density(dataset, normalized_schema, symbols, stype_in, start, end, records=len(frame))
+            fetch_logger.debug("Decoded chunk", start=start, end=end, records=len(frame))
+            if not frame.empty:
+                yield frame
+
+        fetch_logger.info("Columnar data fetching complete", total_records=total_records)
+
+    def plan_data_chunks(self, job_config: Dict[str, Any]) -> List[DataChunkRequest]:
+        """
+        Plan the date chunks of a job without fetching them.
+
+        Used by the staged pipeline, which fetches and decodes chunks on separate
+        worker pools instead of through ``fetch_historical_data``.
+
+        Args:
+            job_config: Same job configuration as ``fetch_historical_data``
+
+        Returns:
+            Ordered list of DataChunkRequest, one per date chunk
+        """
+        normalized_schema = self._normalize_schema(job_config["schema"])
+        fetch_logger = logger.bind(
+            schema_name=normalized_schema,
+            dataset=job_config["dataset"],
+            symbols=job_config["symbols"],
+            operation="plan_data_chunks"
+        )
+        return [
+            DataChunkRequest(
+                job_config["dataset"], normalized_schema, job_config["symbols"],
+                job_config["stype_in"], start, end
+            )
+            for start, end in self._plan_date_chunks(job_config, fetch_logger)
+        ]
+
+    def fetch_data_chunk(self, request: DataChunkRequest) -> databento.DBNStore:
+        """
+        Fetch one planned date chunk (with the adapter's retry policy).
+
+        Args:
+            request: Chunk from ``plan_data_chunks``
+
+        Returns:
+            DBNStore containing the fetched data
+        """
+        return self._fetch_data_chunk(
+            request.dataset, request.schema, request.symbols, request.stype_in, request.start, request.end
+        )
+
+    def fetch_data_chunks(
+        self,
+        requests: List[DataChunkRequest],
+        max_concurrent: Optional[int] = None
+    ) -> Iterator[Tuple[DataChunkRequest, databento.DBNStore]]:
+        """
+        Fetch planned chunks in order, prefetching up to ``max_concurrent`` ahead.
+
+        Args:
+            requests: Chunks from ``plan_data_chunks`` (all of one job)
+            max_concurrent: Chunks fetched ahead (default: the adapter's max_concurrent_chunks)
+
+        Yields:
+            Tuples of (request, DBNStore) in the order of ``requests``; with adaptive
+            chunking a request may be replaced by several consecutive finer ones
+        """
+        if not requests:
+            return
+
+        first = requests[0]
+        by_window = {(request.start, request.end): request for request in requests}
+        for window, data_chunk in self._iter_data_chunks(
+            first.dataset, first.schema, first.symbols, first.stype_in,
+            [(request.start, request.end) for request in requests],
+            max(1, int(max_concurrent or self.max_concurrent_chunks))
+        ):
+            yield by_window.get(window) or first._replace(start=window[0], end=window[1]), data_chunk
+
+    def iter_data_chunk_records(self, request: DataChunkRequest, data_chunk: Any) -> Iterator[BaseModel]:
+        """
+        Lazily decode a fetched chunk into validated Pydantic models.
+
+        Args:
+            request: Chunk from ``plan_data_chunks``
+            data_chunk: DBNStore returned by ``fetch_data_chunk``
+
+        Yields:
+            Validated records; invalid records are quarantined
+
+        Raises:
+            ValueError: If the schema has no Pydantic model
+        """
+        model_cls = DATABENTO_SCHEMA_MODEL_MAPPING.get(request.schema)
+        if not model_cls:
+            raise ValueError(f"No Pydantic model found for schema '{request.schema}'")
+
+        fetch_logger = logger.bind(
+            schema_name=request.schema,
+            dataset=request.dataset,
+            start=request.start,
+            end=request.end,
+            operation="decode_data_chunk_records"
+        )
+        validation_stats = {"total_records": 0, "failed_validation": 0}
+        yield from timed_stage_iter(self.pipeline_stats, "decode", self._validate_chunk_records(
+            data_chunk, model_cls, request.schema, request.symbols, validation_stats, fetch_logger
+        ))
+        self._observe_chunk_density(*request, records=validation_stats["total_records"])
+        fetch_logger.debug("Decoded chunk", stats=validation_stats)
+
+    def decode_data_chunk_records(self, request: DataChunkRequest, data_chunk: Any) -> List[BaseModel]:
+        """
+        Decode a fetched chunk into validated Pydantic models.
+
+        Args:
+            request: Chunk from ``plan_data_chunks``
+            data_chunk: DBNStore returned by ``fetch_data_chunk``
+
+        Returns:
+            Validated records; invalid records are quarantined
+
+        Raises:
+            ValueError: If the schema has no Pydantic model
+        """
+        return list(self.iter_data_chunk_records(request, data_chunk))
+
+    def decode_data_chunk_frame(self, request: DataChunkRequest, data_chunk: Any) -> pd.DataFrame:
+        """
+        Decode a fetched chunk column-wise (see ``fetch_historical_frames``).
+
+        Args:
+            request: Chunk from ``plan_data_chunks``
+            data_chunk: DBNStore returned by ``fetch_data_chunk``
+
+        Returns:
+            Decoded DataFrame following the dbn_frame contract
+
+        Raises:
+            ValueError: If the schema is not supported by the columnar decoder
+        """
+        if not supports_columnar(request.schema):
+            raise ValueError(f"Columnar decoding is not supported for schema '{request.schema}'")
+
+        symbols = request.symbols
+        symbol = symbols[0] if isinstance(symbols, list) and symbols else symbols or None
+        with stage_timer(self.pipeline_stats, "decode") as timing:
+            frame = decode_dbn_store(data_chunk, request.schema, symbol)
+            timing.rows = len(frame)
+        self._observe_chunk_density(*request, records=len(frame))
+        return frame
+
     def disconnect(self) -> None:
         """Disconnects the client. For Databento, this is a no-op."""
         self.client = None
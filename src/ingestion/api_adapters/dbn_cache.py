@@ -0,0 +1,196 @@
+"""
+On-disk, content-addressed cache of raw Databento responses.
+
+Historical windows never change once they are old enough, so re-running a job
+(e.g. after a mapping or schema fix) does not need to call
+``timeseries.get_range`` again. Each chunk is keyed by a hash of dataset,
+schema, symbols, stype_in and the chunk window and stored as the DBN file the
+API returned; Databento writes the response straight to disk (``path=``), so
+cached chunks are never held in memory as a whole.
+
+The cache is bounded by total size: when a new file pushes it over
+``max_bytes``, the least recently used files are deleted. Hits, misses and
+evictions are counted for reporting.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from datetime import datetime, timedelta, UTC
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+import pandas as pd
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+_SUFFIX = ".dbn.zst"
+
+
+class DBNResponseCache:
+    """Size-bounded LRU cache of DBN response files."""
+
+    def __init__(self, base_dir: str = "cache/databento", max_bytes: int = 10 * 1024 ** 3, min_age_hours: float = 24.0):
+        """
+        Initialize the cache, indexing files left by earlier runs.
+
+        Args:
+            base_dir: Directory holding the cached DBN files
+            max_bytes: Total size above which least recently used files are evicted
+            min_age_hours: Only cache windows that ended at least this long ago,
+                since more recent data may still be revised
+        """
+        self.base_dir = Path(base_dir)
+        self.max_bytes = max_bytes
+        self.min_age = timedelta(hours=min_age_hours)
+        self._lock = threading.Lock()
+        # key -> file size, least recently used first
+        self._entries: "OrderedDict[str, int]" = OrderedDict()
+        self._total_bytes = 0
+        self._stats = {"hits": 0, "misses": 0, "writes": 0, "evictions": 0}
+        self._load_index()
+
+    @staticmethod
+    def key(dataset: str, schema: str, symbols: Any, stype_in: str, start: str, end: str) -> str:
+        """
+        Content address of a chunk request.
+
+        Returns:
+            Hex digest identifying the request
+        """
+        symbols = sorted(symbols) if isinstance(symbols, (list, tuple)) else [symbols]
+        identity = json.dumps({
+            "dataset": dataset,
+            "schema": schema,
+            "symbols": symbols,
+            "stype_in": stype_in,
+            "start": str(start),
+            "end": str(end),
+        }, sort_keys=True, default=str)
+        return hashlib.sha256(identity.encode("utf-8")).hexdigest()
+
+    def path_for(self, key: str) -> Path:
+        """File path of a cache entry."""
+        return self.base_dir / key[:2] / f"{key}{_SUFFIX}"
+
+    def is_cacheable(self, end: str) -> bool:
+        """
+        Whether a window is old enough to be treated as immutable.
+
+        Args:
+            end: Chunk end (ISO date or timestamp)
+
+        Returns:
+            True if the window ended at least ``min_age_hours`` ago
+        """
+        try:
+            window_end = pd.Timestamp(end)
+        except (ValueError, TypeError):
+            return False
+        if window_end.tzinfo is None:
+            window_end = window_end.tz_localize("UTC")
+        return window_end <= pd.Timestamp(datetime.now(UTC) - self.min_age)
+
+    def get(self, key: str) -> Optional[Path]:
+        """
+        Look up a cached response and mark it as recently used.
+
+        Args:
+            key: Key from ``key``
+
+        Returns:
+            Path of the cached DBN file, or None on a miss
+        """
+        path = self.path_for(key)
+        with self._lock:
+            if key in self._entries and path.exists():
+                self._entries.move_to_end(key)
+                self._stats["hits"] += 1
+                # mtime records recency for the index of the next run
+                os.utime(path)
+                return path
+            if key in self._entries:
+                # Deleted behind our back
+                self._total_bytes -= self._entries.pop(key)
+            self._stats["misses"] += 1
+            return None
+
+    def store(self, key: str, write: Callable[[Path], None]) -> Path:
+        """
+        Add a response to the cache.
+
+        ``write`` receives a temporary path in the cache directory and must write
+        the DBN response to it (e.g. ``get_range(..., path=path)``). The file is
+        moved into place only once ``write`` returns, so readers never see a
+        partial file.
+
+        Args:
+            key: Key from ``key``
+            write: Callable writing the response to the given path
+
+        Returns:
+            Path of the cached DBN file
+        """
+        path = self.path_for(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+        try:
+            write(tmp_path)
+            os.replace(tmp_path, path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+        size = path.stat().st_size
+        with self._lock:
+            self._total_bytes += size - self._entries.pop(key, 0)
+            self._entries[key] = size
+            self._stats["writes"] += 1
+            self._evict(keep=key)
+        return path
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Snapshot of the cache statistics.
+
+        Returns:
+            Dictionary with hits, misses, hit_rate, writes, evictions, entries and bytes
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats["entries"] = len(self._entries)
+            stats["bytes"] = self._total_bytes
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = round(stats["hits"] / lookups, 4) if lookups else 0.0
+        return stats
+
+    def _evict(self, keep: str) -> None:
+        """Delete least recently used files until the cache fits ``max_bytes`` (lock held)."""
+        while self._total_bytes > self.max_bytes and len(self._entries) > 1:
+            key, size = next(iter(self._entries.items()))
+            if key == keep:
+                self._entries.move_to_end(key)
+                continue
+            del self._entries[key]
+            self._total_bytes -= size
+            self._stats["evictions"] += 1
+            self.path_for(key).unlink(missing_ok=True)
+            logger.debug("Evicted cached response", key=key, bytes=size)
+
+    def _load_index(self) -> None:
+        """Index existing cache files, least recently used (oldest mtime) first."""
+        if not self.base_dir.exists():
+            return
+        files = []
+        for path in self.base_dir.glob(f"*/*{_SUFFIX}"):
+            stat = path.stat()
+            files.append((stat.st_mtime, path.name[:-len(_SUFFIX)], stat.st_size))
+
+        with self._lock:
+            for _, key, size in sorted(files):
+                self._entries[key] = size
+                self._total_bytes += size
+            self._evict(keep="")
+        logger.info("Raw response cache loaded", base_dir=str(self.base_dir), entries=len(self._entries), bytes=self._total_bytes)
@@ -0,0 +1,213 @@
+"""
+Columnar decoding of Databento DBN chunks into pandas DataFrames.
+
+Instead of converting records one at a time through ``_record_to_dict`` and a
+Pydantic model, a whole ``DBNStore`` chunk is read as a NumPy structured array
+and reshaped into a frame whose columns use the storage model field names.
+
+Frame contract:
+    - Price columns stay fixed-point ``Int64`` (1e-9 units, Databento's native
+      encoding); undefined prices (``UNDEF_PRICE``) become ``<NA>``.
+    - Timestamp columns stay ``int64`` nanoseconds since the UNIX epoch (UTC).
+    - ``frame.attrs`` records the canonical schema plus which columns are
+      prices and timestamps so downstream consumers can scale them in bulk.
+"""
+
+from typing import Any, Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+PRICE_SCALE = 1_000_000_000
+UNDEF_PRICE = np.iinfo(np.int64).max
+UNDEF_QUANTITY = np.iinfo(np.int64).max
+
+# Per schema family: DBN field -> frame column, plus price/timestamp/char columns.
+# Columns missing from a chunk (e.g. ts_recv on OHLCV) are filled as described below.
+FRAME_SCHEMA_SPECS: Dict[str, Dict[str, Any]] = {
+    "ohlcv": {
+        "columns": {
+            "ts_event": "ts_event",
+            "instrument_id": "instrument_id",
+            "rtype": "rtype",
+            "publisher_id": "publisher_id",
+            "open": "open_price",
+            "high": "high_price",
+            "low": "low_price",
+            "close": "close_price",
+            "volume": "volume",
+        },
+        "price_columns": ["open_price", "high_price", "low_price", "close_price"],
+        "char_columns": [],
+    },
+    "trades": {
+        "columns": {
+            "ts_event": "ts_event",
+            "ts_recv": "ts_recv",
+            "instrument_id": "instrument_id",
+            "rtype": "rtype",
+            "publisher_id": "publisher_id",
+            "price": "price",
+            "size": "size",
+            "side": "side",
+            "flags": "flags",
+            "sequence": "sequence",
+        },
+        "price_columns": ["price"],
+        "char_columns": ["side"],
+    },
+    "tbbo": {
+        "columns": {
+            "ts_event": "ts_event",
+            "ts_recv": "ts_recv",
+            "instrument_id": "instrument_id",
+            "rtype": "rtype",
+            "publisher_id": "publisher_id",
+            "bid_px_00": "bid_px",
+            "ask_px_00": "ask_px",
+            "bid_sz_00": "bid_sz",
+            "ask_sz_00": "ask_sz",
+            "bid_ct_00": "bid_ct",
+            "ask_ct_00": "ask_ct",
+            "flags": "flags",
+            "sequence": "sequence",
+        },
+        "price_columns": ["bid_px", "ask_px"],
+        "char_columns": [],
+    },
+    "statistics": {
+        "columns": {
+            "ts_event": "ts_event",
+            "ts_recv": "ts_recv",
+            "instrument_id": "instrument_id",
+            "rtype": "rtype",
+            "publisher_id": "publisher_id",
+            "stat_type": "stat_type",
+            "price": "stat_value",
+            "quantity": "quantity",
+            "update_action": "update_action",
+            "stat_flags": "flags",
+            "sequence": "sequence",
+        },
+        "price_columns": ["stat_value"],
+        "char_columns": [],
+    },
+}
+
+TIMESTAMP_COLUMNS = ["ts_event", "ts_recv"]
+
+
+def schema_family(schema: str) -> Optional[str]:
+    """
+    Map a canonical Databento schema name to its frame spec key.
+
+    Args:
+        schema: Canonical schema name (e.g., 'ohlcv-1m', 'trades', 'tbbo')
+
+    Returns:
+        Spec key ('ohlcv', 'trades', 'tbbo', 'statistics') or None if unsupported
+    """
+    if schema.startswith("ohlcv"):
+        return "ohlcv"
+    if schema in ("trades", "tbbo", "statistics"):
+        return schema
+    return None
+
+
+def supports_columnar(schema: str) -> bool:
+    """Return True if ``schema`` can be decoded through the columnar path."""
+    return schema_family(schema) is not None
+
+
+def _fixed_price_column(values: np.ndarray) -> pd.arrays.IntegerArray:
+    """Wrap raw fixed-point prices as nullable Int64 with UNDEF_PRICE masked."""
+    values = values.astype(np.int64, copy=False)
+    return pd.arrays.IntegerArray(values, values == UNDEF_PRICE)
+
+
+def _char_column(values: np.ndarray) -> np.ndarray:
+    """Decode single-byte char fields (``S1``) to Python strings in bulk."""
+    return np.char.decode(values, "ascii") if values.dtype.kind == "S" else values.astype(str)
+
+
+def decode_dbn_array(records: np.ndarray, schema: str, symbol: Optional[str] = None) -> pd.DataFrame:
+    """
+    Decode a DBN structured array into a storage-shaped DataFrame.
+
+    Args:
+        records: Structured array as returned by ``DBNStore.to_ndarray()``
+        schema: Canonical Databento schema name
+        symbol: Symbol to assign to every row (mirrors ``_ensure_symbol_field``)
+
+    Returns:
+        DataFrame following the frame contract described in the module docstring
+
+    Raises:
+        ValueError: If the schema is not supported by the columnar path
+    """
+    family = schema_family(schema)
+    if family is None:
+        raise ValueError(f"Schema '{schema}' is not supported by the columnar decoder")
+
+    spec = FRAME_SCHEMA_SPECS[family]
+    available = set(records.dtype.names or ())
+    data: Dict[str, Any] = {}
+
+    for dbn_field, column in spec["columns"].items():
+        if dbn_field not in available:
+            continue
+        values = records[dbn_field]
+        if column in spec["price_columns"]:
+            data[column] = _fixed_price_column(values)
+        elif column in spec["char_columns"]:
+            data[column] = _char_column(values)
+        elif column in TIMESTAMP_COLUMNS:
+            data[column] = values.astype(np.int64, copy=False)
+        elif column == "quantity":
+            quantity = values.astype(np.int64, copy=False)
+            data[column] = pd.arrays.IntegerArray(quantity, quantity == UNDEF_QUANTITY)
+        else:
+            data[column] = values
+
+    frame = pd.DataFrame(data)
+
+    # OHLCV bars carry no receive timestamp; fall back to ts_event like _record_to_dict
+    if "ts_recv" not in frame.columns and "ts_event" in frame.columns:
+        frame["ts_recv"] = frame["ts_event"]
+
+    frame["symbol"] = symbol if symbol is not None else (
+        "INSTRUMENT_" + frame["instrument_id"].astype(str) if "instrument_id" in frame.columns else None
+    )
+
+    frame.attrs["schema"] = schema
+    frame.attrs["price_scale"] = PRICE_SCALE
+    frame.attrs["price_columns"] = [c for c in spec["price_columns"] if c in frame.columns]
+    frame.attrs["timestamp_columns"] = [c for c in TIMESTAMP_COLUMNS if c in frame.columns]
+    return frame
+
+
+def decode_dbn_store(store: Any, schema: str, symbol: Optional[str] = None) -> pd.DataFrame:
+    """
+    Decode an entire ``DBNStore`` chunk into a storage-shaped DataFrame.
+
+    Args:
+        store: ``databento.DBNStore`` (anything exposing ``to_ndarray()``)
+        schema: Canonical Databento schema name
+        symbol: Symbol to assign to every row
+
+    Returns:
+        Decoded DataFrame (empty with the expected attrs if the chunk has no records)
+    """
+    # Empty stores come back as a (0, 1) array; flatten so every field is 1-D
+    return decode_dbn_array(np.asarray(store.to_ndarray()).reshape(-1), schema, symbol)
+
+
+def fixed_to_float(values: pd.Series) -> pd.Series:
+    """Scale fixed-point prices to float64 in one vectorized step (for checks, not storage)."""
+    return values.astype("Float64") / PRICE_SCALE
+
+
+def ns_to_datetime(values: pd.Series) -> pd.Series:
+    """Convert int64 nanosecond timestamps to tz-aware UTC datetimes in bulk."""
+    return pd.to_datetime(values, unit="ns", utc=True)
+
@@ -0,0 +1,119 @@
+"""
+Server-side time-bucketed aggregation for the QueryBuilder.
+
+Bars of any width (30m, 4h, 1w, ...) are computed by TimescaleDB with
+``time_bucket`` and aggregate functions, so only one row per bucket and
+instrument crosses the wire instead of every stored bar or trade:
+
+- OHLCV: first/max/min/last prices, summed volume and trade count, and a
+  volume-weighted vwap of the stored bars,
+- trades: first/max/min/last trade price, volume, trade count and vwap.
+"""
+
+import re
+from datetime import timedelta
+from typing import List, Union
+
+from sqlalchemy import BigInteger, DateTime, Numeric, cast, func, literal_column
+
+from .exceptions import ValidationError
+
+_BUCKET_PATTERN = re.compile(r"^\s*(\d+)\s*([smhdw])\s*$")
+_UNIT_SECONDS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400, 'w': 604800}
+
+# Type of the aggregated prices, matching the stored DECIMAL(20,8) columns
+PRICE_TYPE = Numeric(20, 8)
+
+
+def parse_bucket(bucket: Union[str, timedelta]) -> timedelta:
+    """
+    Parse a bucket width such as '30m', '4h' or '1w'.
+
+    Args:
+        bucket: Width as <count><unit> with unit s, m, h, d or w, or a timedelta
+
+    Returns:
+        Bucket width as a timedelta
+
+    Raises:
+        ValidationError: If the width is malformed or not a positive whole number of seconds
+    """
+    if isinstance(bucket, timedelta):
+        width = bucket
+    else:
+        match = _BUCKET_PATTERN.match(str(bucket).lower())
+        if not match:
+            raise ValidationError(f"Invalid bucket '{bucket}'. Use <count><unit> with unit s, m, h, d or w (e.g. 30m, 4h)")
+        width = timedelta(seconds=int(match.group(1)) * _UNIT_SECONDS[match.group(2)])
+
+    if width <= timedelta(0) or width % timedelta(seconds=1):
+        raise ValidationError(f"Bucket must be a positive whole number of seconds, got {width}")
+    return width
+
+
+def time_bucket(column, bucket: timedelta):
+    """
+    ``time_bucket`` of a timestamp column.
+
+    The width is rendered inline so the expression compiles to identical SQL in
+    the select list, GROUP BY and ORDER BY.
+
+    Args:
+        column: Timestamp column
+        bucket: Bucket width from ``parse_bucket``
+
+    Returns:
+        SQLAlchemy expression typed as a timezone-aware timestamp
+    """
+    interval = literal_column(f"INTERVAL '{int(bucket.total_seconds())} seconds'")
+    return func.time_bucket(interval, column, type_=DateTime(timezone=True))
+
+
+def _vwap(price_volume, volume):
+    """Volume-weighted average of per-row prices (NULL for zero volume)."""
+    return cast(func.sum(price_volume) / func.nullif(func.sum(volume), 0), PRICE_TYPE)
+
+
+def ohlcv_aggregates(table) -> List:
+    """
+    Aggregates folding stored OHLCV bars into one bar per bucket.
+
+    Args:
+        table: daily_ohlcv_data table
+
+    Returns:
+        Labeled aggregate expressions
+    """
+    c = table.c
+    return [
+        func.first(c.open_price, c.ts_event, type_=PRICE_TYPE).label('open_price'),
+        func.max(c.high_price).label('high_price'),
+        func.min(c.low_price).label('low_price'),
+        func.last(c.close_price, c.ts_event, type_=PRICE_TYPE).label('close_price'),
+        func.sum(c.volume, type_=BigInteger).label('volume'),
+        func.sum(c.trade_count, type_=BigInteger).label('trade_count'),
+        _vwap(c.vwap * c.volume, c.volume).label('vwap'),
+        func.count(type_=BigInteger).label('bar_count'),
+    ]
+
+
+def trades_aggregates(table) -> List:
+    """
+    Aggregates folding trades into one bar per bucket.
+
+    Args:
+        table: trades_data table
+
+    Returns:
+        Labeled aggregate expressions
+    """
+    c = table.c
+    return [
+        func.first(c.price, c.ts_event, type_=PRICE_TYPE).label('open_price'),
+        func.max(c.price).label('high_price'),
+        func.min(c.price).label('low_price'),
+        func.last(c.price, c.ts_event, type_=PRICE_TYPE).label('close_price'),
+        func.sum(c.size, type_=BigInteger).label('volume'),
+        func.count(type_=BigInteger).label('trade_count'),
+        _vwap(c.price * c.size, c.size).label('vwap'),
+    ]
@@ -0,0 +1,218 @@
+"""
+Columnar (Arrow) result path for the QueryBuilder.
+
+Row results cost a Python tuple, a dict, a ``Decimal`` and a ``datetime`` per
+value before pandas sees them. This path instead has PostgreSQL stream the
+query as CSV through ``COPY (...) TO STDOUT`` and parses it with Arrow's
+multithreaded CSV reader directly into column buffers:
+
+- timestamps are converted server-side to int64 nanoseconds since the epoch and
+  exposed as ``timestamp[ns, UTC]`` (same int64 buffer, zero-copy to pandas),
+- DECIMAL prices are cast server-side to float64,
+- integers keep their width, everything else becomes a string column.
+
+Results come back as a ``pyarrow.RecordBatchReader`` whose batches can be
+written out as Parquet row groups or Arrow IPC batches as they arrive.
+"""
+
+import os
+import threading
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Tuple, Union
+
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
+import structlog
+from sqlalchemy import BigInteger, Date, DateTime, Integer, Numeric, SmallInteger, cast, extract, func
+from sqlalchemy.dialects.postgresql import DOUBLE_PRECISION
+
+logger = structlog.get_logger(__name__)
+
+# Rough size of one COPY CSV row; turns a rows-per-batch target into a read block size
+CSV_BYTES_PER_ROW = 128
+
+TIMESTAMP_TYPE = pa.timestamp("ns", tz="UTC")
+
+
+def _arrow_column(column) -> Tuple[object, pa.DataType]:
+    """Server-side expression and Arrow type of one selected column."""
+    name = column.name
+    sql_type = column.type
+
+    if isinstance(sql_type, DateTime):
+        # Microsecond epoch computed exactly by the database, scaled to ns
+        epoch_us = func.round(extract("epoch", column) * 1_000_000)
+        return (cast(epoch_us, BigInteger) * 1000).label(name), TIMESTAMP_TYPE
+    if isinstance(sql_type, Date):
+        return column, pa.date32()
+    if isinstance(sql_type, Numeric):
+        return cast(column, DOUBLE_PRECISION).label(name), pa.float64()
+    if isinstance(sql_type, SmallInteger):
+        return column, pa.int16()
+    if isinstance(sql_type, BigInteger):
+        return column, pa.int64()
+    if isinstance(sql_type, Integer):
+        return column, pa.int32()
+    return column, pa.string()
+
+
+def columnar_select(query) -> Tuple[object, pa.Schema]:
+    """
+    Rewrite a select so every column arrives in its columnar representation.
+
+    Args:
+        query: SQLAlchemy select built by the QueryBuilder
+
+    Returns:
+        Tuple of (rewritten select, Arrow schema of its results)
+    """
+    columns = []
+    fields: List[pa.Field] = []
+    for column in query.selected_columns:
+        expression, arrow_type = _arrow_column(column)
+        columns.append(expression)
+        fields.append(pa.field(column.name, arrow_type))
+    return query.with_only_columns(*columns, maintain_column_froms=True), pa.schema(fields)
+
+
+def compile_copy_sql(query, dialect, cursor) -> str:
+    """
+    Render a select as a ``COPY ... TO STDOUT`` statement with inlined parameters.
+
+    Args:
+        query: Select returned by ``columnar_select``
+        dialect: SQLAlchemy dialect of the engine
+        cursor: psycopg2 cursor used to quote the parameters
+
+    Returns:
+        COPY statement producing CSV with a header row
+    """
+    compiled = query.compile(dialect=dialect, compile_kwargs={"render_postcompile": True})
+    select_sql = cursor.mogrify(str(compiled), compiled.params).decode()
+    return f"COPY ({select_sql}) TO STDOUT WITH (FORMAT csv, HEADER true)"
+
+
+def _read_schema(schema: pa.Schema) -> pa.Schema:
+    """Schema the CSV is parsed with: timestamps are read as their int64 ns values."""
+    return pa.schema([
+        pa.field(field.name, pa.int64() if field.type == TIMESTAMP_TYPE else field.type)
+        for field in schema
+    ])
+
+
+def copy_record_batches(
+    connection,
+    copy_sql: str,
+    schema: pa.Schema,
+    block_size: int
+) -> Iterator[pa.RecordBatch]:
+    """
+    Run a COPY statement and parse its output into record batches as it streams.
+
+    The COPY runs on a producer thread writing into a pipe that the Arrow CSV
+    reader consumes, so neither side holds more than a block in memory.
+    Closing the iterator early aborts the COPY; the connection must then be
+    discarded.
+
+    Args:
+        connection: psycopg2 (DBAPI) connection
+        copy_sql: Statement from ``compile_copy_sql``
+        schema: Arrow schema from ``columnar_select``
+        block_size: Bytes of CSV parsed per record batch
+
+    Yields:
+        Record batches conforming to ``schema``
+
+    Raises:
+        psycopg2.Error: If the COPY fails
+    """
+    read_fd, write_fd = os.pipe()
+    failures: List[BaseException] = []
+
+    def produce() -> None:
+        try:
+            with os.fdopen(write_fd, "wb") as sink:
+                with connection.cursor() as cursor:
+                    cursor.copy_expert(copy_sql, sink)
+        except BaseException as e:  # Re-raised by the consumer
+            failures.append(e)
+
+    producer = threading.Thread(target=produce, name="copy-to-arrow", daemon=True)
+    producer.start()
+
+    source = os.fdopen(read_fd, "rb")
+    convert_options = pa_csv.ConvertOptions(
+        column_types=_read_schema(schema),
+        strings_can_be_null=True,
+        quoted_strings_can_be_null=False
+    )
+    try:
+        reader = pa_csv.open_csv(
+            source,
+            read_options=pa_csv.ReadOptions(block_size=block_size),
+            convert_options=convert_options
+        )
+        for batch in reader:
+            yield pa.RecordBatch.from_arrays(
+                [batch.column(field.name).view(field.type) for field in schema],
+                schema=schema
+            )
+    except pa.ArrowInvalid as e:
+        # A failed COPY leaves truncated CSV behind; report the database error instead
+        source.close()
+        producer.join()
+        if failures:
+            raise failures[0] from e
+        raise
+    finally:
+        source.close()
+        producer.join()
+
+    if failures:
+        raise failures[0]
+
+
+def write_parquet(reader: pa.RecordBatchReader, file_path: Union[str, Path]) -> int:
+    """
+    Write record batches to a Parquet file, one row group per batch.
+
+    Args:
+        reader: Record batches, e.g. from a QueryBuilder iter_* method with columnar=True
+        file_path: Output file path
+
+    Returns:
+        Number of rows written
+    """
+    rows = 0
+    with pq.ParquetWriter(str(file_path), reader.schema, compression="zstd") as writer:
+        for batch in reader:
+            writer.write_batch(batch)
+            rows += batch.num_rows
+    return rows
+
+
+def write_arrow(reader: pa.RecordBatchReader, file_path: Union[str, Path]) -> int:
+    """
+    Write record batches to an Arrow IPC (Feather v2) file as they arrive.
+
+    Args:
+        reader: Record batches, e.g. from a QueryBuilder iter_* method with columnar=True
+        file_path: Output file path
+
+    Returns:
+        Number of rows written
+    """
+    rows = 0
+    with pa.OSFile(str(file_path), "wb") as sink:
+        with pa.ipc.new_file(sink, reader.schema) as writer:
+            for batch in reader:
+                writer.write_batch(batch)
+                rows += batch.num_rows
+    return rows
+
+
+COLUMNAR_WRITERS: Dict[str, Callable[[pa.RecordBatchReader, Union[str, Path]], int]] = {
+    "parquet": write_parquet,
+    "arrow": write_arrow,
+}
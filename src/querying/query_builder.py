@@ -9,24 +9,72 @@ and provides optimized query construction with symbol resolution.
 import structlog
 import os
 from contextlib import contextmanager
-from datetime import datetime, date
+from datetime import datetime, date, timedelta
 from decimal import Decimal
 from typing import List, Dict, Any, Optional, Union, Iterator
 from urllib.parse import quote_plus
 
 import pandas as pd
-from sqlalchemy import create_engine, select, and_, or_, text
+from sqlalchemy import create_engine, select, and_, or_, text, func, case, literal
 from sqlalchemy.engine import Engine
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.pool import NullPool
 
 from .table_definitions import (
     SCHEMA_TABLES, INDEX_COLUMNS, definitions_data,
-    daily_ohlcv_data, trades_data, tbbo_data, statistics_data
+    daily_ohlcv_data, trades_data, tbbo_data, statistics_data,
+    ingestion_coverage
 )
-from .exceptions import QueryExecutionError, SymbolResolutionError
+from .exceptions import QueryExecutionError, SymbolResolutionError, ValidationError
+from .symbol_cache import SymbolCache, shared_symbol_cache
+from .result_cache import CacheScope, QueryResultCache, query_cache_key
+from .aggregation import ohlcv_aggregates, parse_bucket, time_bucket, trades_aggregates
 
 logger = structlog.get_logger(__name__)
 
+# Rows fetched per round trip by the streaming (iter_*) query methods
+DEFAULT_FETCH_SIZE = 10_000
+
+
+class _ProviderPool(NullPool):
+    """
+    SQLAlchemy pool that borrows DBAPI connections from a PooledConnectionProvider.
+
+    SQLAlchemy keeps no connections of its own: each checkout takes one from the
+    shared provider and returning it hands it back instead of closing it, so the
+    query builder and the storage loaders draw from the same psycopg2 pool.
+    """
+
+    def __init__(self, connection_provider, **kwargs):
+        self._connection_provider = connection_provider
+        super().__init__(self._borrow, **kwargs)
+
+    def _borrow(self, connection_record):
+        connection = self._connection_provider.checkout()
+        connection_record.info['provider_connection'] = connection
+        return connection
+
+    def _do_return_conn(self, record) -> None:
+        connection = record.info.pop('provider_connection', None)
+        # Detach so SQLAlchemy does not close the borrowed connection itself
+        record.dbapi_connection = None
+        if connection is not None:
+            self._connection_provider.release(connection)
+
+    def recreate(self) -> "_ProviderPool":
+        return self.__class__(
+            self._connection_provider,
+            echo=self.echo,
+            logging_name=self._orig_logging_name,
+            reset_on_return=self._reset_on_return,
+            pre_ping=self._pre_ping,
+            _dispatch=self.dispatch,
+            dialect=self._dialect,
+        )
+
+    def status(self) -> str:
+        return f"ProviderPool {self._connection_provider.stats()}"
+
 
 class QueryBuilder:
     """
@@ -36,14 +84,32 @@ class QueryBuilder:
     date range filtering, and performance optimization for TimescaleDB.
     """
 
-    def __init__(self, connection_params: Optional[Dict[str, Any]] = None):
+    def __init__(
+        self,
+        connection_params: Optional[Dict[str, Any]] = None,
+        connection_provider=None,
+        symbol_cache: Optional[SymbolCache] = None,
+        fetch_size: int = DEFAULT_FETCH_SIZE,
+        result_cache: Optional[QueryResultCache] = None
+    ):
         """
         Initialize the QueryBuilder.
 
         Args:
             connection_params: Database connection parameters, if None uses environment
+            connection_provider: Optional shared PooledConnectionProvider; when set,
+                queries borrow connections from its pool instead of SQLAlchemy's own
+            symbol_cache: Symbol resolution cache; defaults to the process-wide
+                cache of the database
+            fetch_size: Default rows per round trip of the streaming iter_* methods
+            result_cache: Cache of query_* results, invalidated by the loaders'
+                writes; None disables result caching
         """
         self.connection_params = connection_params or self._get_connection_params()
+        self.connection_provider = connection_provider
+        self.symbol_cache = symbol_cache or shared_symbol_cache(self.connection_params)
+        self.fetch_size = fetch_size
+        self.result_cache = result_cache
         self.engine = self._create_engine()
 
     def _get_connection_params(self) -> Dict[str, Any]:
@@ -66,6 +132,13 @@ class QueryBuilder:
             f"{params['host']}:{params['port']}/{params['database']}"
         )
 
+        if self.connection_provider is not None:
+            return create_engine(
+                connection_string,
+                pool=_ProviderPool(self.connection_provider),
+                echo=False
+            )
+
         return create_engine(
             connection_string,
             pool_size=5,
@@ -91,12 +164,41 @@ class QueryBuilder:
             if connection:
                 connection.close()
 
+    def _warm_symbol_cache(self) -> None:
+        """
+        Load every (instrument_id, raw_symbol) pair of definitions_data into the symbol cache.
+
+        Raises:
+            QueryExecutionError: If the database cannot be queried
+        """
+        with self.get_connection() as conn:
+            table_exists = conn.execute(
+                text("SELECT to_regclass('definitions_data') IS NOT NULL")
+            ).fetchone()[0]
+
+            if not table_exists:
+                self.symbol_cache.warm([], definitions_available=False)
+                return
+
+            query = select(definitions_data.c.instrument_id, definitions_data.c.raw_symbol).distinct()
+            rows = conn.execute(query).fetchall()
+
+        self.symbol_cache.warm((row.instrument_id, row.raw_symbol) for row in rows)
+
+    def invalidate_symbol_cache(self) -> None:
+        """Forget cached symbol mappings, e.g. after new definitions were loaded."""
+        self.symbol_cache.invalidate()
+
     def _resolve_symbols_to_instrument_ids(
         self,
         symbols: Union[str, List[str]]
     ) -> List[int]:
         """
-        Resolve security symbols to instrument_ids via definitions_data table.
+        Resolve security symbols to instrument_ids via the symbol cache.
+
+        The cache is warmed in bulk from definitions_data when cold or expired;
+        symbols it does not know are looked up once and remembered, so a warm
+        cache resolves without any database round trip.
 
         Args:
             symbols: Single symbol string or list of symbol strings
@@ -114,47 +216,43 @@ class QueryBuilder:
             return []
 
         try:
-            with self.get_connection() as conn:
-                # First check if definitions_data table exists
-                table_exists = conn.execute(text("""
-                    SELECT EXISTS (
-                        SELECT FROM information_schema.tables
-                        WHERE table_name = 'definitions_data'
-                    );
-                """)).fetchone()[0]
-
-                if not table_exists:
-                    logger.info("definitions_data table not found, using fallback symbol resolution")
-                    raise SymbolResolutionError("definitions_data table does not exist")
-
-                # Query to resolve symbols to instrument_ids
-                query = select(definitions_data.c.instrument_id, definitions_data.c.raw_symbol).where(
-                    definitions_data.c.raw_symbol.in_(symbols)
-                ).distinct()
-
-                result = conn.execute(query)
-                rows = result.fetchall()
+            if not self.symbol_cache.is_fresh():
+                self._warm_symbol_cache()
 
-                if not rows:
-                    raise SymbolResolutionError(f"No instrument_ids found for symbols: {symbols}")
+            if not self.symbol_cache.definitions_available:
+                logger.info("definitions_data table not found, using fallback symbol resolution")
+                raise SymbolResolutionError("definitions_data table does not exist")
 
-                # Check if all symbols were resolved
-                found_symbols = {row.raw_symbol for row in rows}
-                missing_symbols = set(symbols) - found_symbols
-
-                if missing_symbols:
-                    logger.warning(f"Could not resolve symbols: {missing_symbols}")
-                    # Continue with found symbols rather than failing completely
-
-                instrument_ids = [row.instrument_id for row in rows]
-                logger.info(f"Resolved {len(symbols)} symbols to {len(instrument_ids)} instrument_ids")
-
-                return instrument_ids
+            resolved, unknown = self.symbol_cache.lookup(symbols)
+            if unknown:
+                # Symbols defined after the last warm-up
+                query = select(definitions_data.c.instrument_id, definitions_data.c.raw_symbol).where(
+                    definitions_data.c.raw_symbol.in_(unknown)
+                ).distinct()
+                with self.get_connection() as conn:
+                    rows = conn.execute(query).fetchall()
+                self.symbol_cache.add(unknown, [(row.instrument_id, row.raw_symbol) for row in rows])
+                resolved.update(self.symbol_cache.lookup(unknown)[0])
 
         except SQLAlchemyError as e:
             logger.error(f"Database error during symbol resolution: {e}")
             raise SymbolResolutionError(f"Failed to resolve symbols: {e}")
 
+        instrument_ids = list(dict.fromkeys(
+            instrument_id for symbol in symbols for instrument_id in resolved.get(symbol, [])
+        ))
+        if not instrument_ids:
+            raise SymbolResolutionError(f"No instrument_ids found for symbols: {symbols}")
+
+        # Check if all symbols were resolved
+        missing_symbols = [symbol for symbol in symbols if not resolved.get(symbol)]
+        if missing_symbols:
+            logger.warning(f"Could not resolve symbols: {set(missing_symbols)}")
+            # Continue with found symbols rather than failing completely
+
+        logger.info(f"Resolved {len(symbols)} symbols to {len(instrument_ids)} instrument_ids")
+        return instrument_ids
+
     def _query_ohlcv_by_symbols_direct(
         self,
         symbols: Union[str, List[str]],
@@ -188,43 +286,67 @@ class QueryBuilder:
             return []
 
         try:
-            with self.get_connection() as conn:
-                # Build query conditions
-                conditions = [
-                    daily_ohlcv_data.c.symbol.in_(symbols),
-                    daily_ohlcv_data.c.granularity == granularity
-                ]
-
-                # Add date range filters
-                if start_date:
-                    conditions.append(daily_ohlcv_data.c.ts_event >= start_date)
-                if end_date:
-                    conditions.append(daily_ohlcv_data.c.ts_event <= end_date)
-
-                # Build query
-                query = select(daily_ohlcv_data).where(and_(*conditions))
-                query = query.order_by(daily_ohlcv_data.c.symbol, daily_ohlcv_data.c.ts_event.desc())
-
-                # Apply limit if specified
-                if limit:
-                    query = query.limit(limit)
+            query = self._build_ohlcv_direct_query(symbols, start_date, end_date, granularity, limit)
+            # Filtered on the symbol column, so any instrument's write may affect it
+            scope = CacheScope.for_query(daily_ohlcv_data.name, None, start_date, end_date)
+            results = self._execute_cached(query, scope)
 
-                result = conn.execute(query)
-                rows = result.fetchall()
-
-                # Convert to list of dictionaries
-                results = []
-                for row in rows:
-                    row_dict = dict(row._mapping)
-                    results.append(row_dict)
-
-                logger.info(f"Retrieved {len(results)} OHLCV records for {len(symbols)} symbols")
-                return results
+            logger.info(f"Retrieved {len(results)} OHLCV records for {len(symbols)} symbols")
+            return results
 
         except SQLAlchemyError as e:
             logger.error(f"Database error during direct OHLCV query: {e}")
             raise QueryExecutionError(f"Failed to query OHLCV data: {e}")
 
+    def _build_ohlcv_direct_query(
+        self,
+        symbols: List[str],
+        start_date: Optional[Union[date, datetime]] = None,
+        end_date: Optional[Union[date, datetime]] = None,
+        granularity: str = '1d',
+        limit: Optional[int] = None
+    ):
+        """Build the OHLCV query filtering on the stored symbol column (no definitions needed)."""
+        # Build query conditions
+        conditions = [
+            daily_ohlcv_data.c.symbol.in_(symbols),
+            daily_ohlcv_data.c.granularity == granularity
+        ]
+
+        # Add date range filters
+        if start_date:
+            conditions.append(daily_ohlcv_data.c.ts_event >= start_date)
+        if end_date:
+            conditions.append(daily_ohlcv_data.c.ts_event <= end_date)
+
+        # Build query
+        query = select(daily_ohlcv_data).where(and_(*conditions))
+        query = query.order_by(daily_ohlcv_data.c.symbol, daily_ohlcv_data.c.ts_event.desc())
+
+        # Apply limit if specified
+        if limit:
+            query = query.limit(limit)
+
+        return query
+
+    @staticmethod
+    def _symbol_column(table, symbol_names: Dict[int, str]):
+        """'symbol' computed server-side from instrument_id."""
+        if symbol_names:
+            symbol = case(symbol_names, value=table.c.instrument_id, else_=literal('UNKNOWN'))
+        else:
+            symbol = literal('UNKNOWN')
+        return symbol.label('symbol')
+
+    @staticmethod
+    def _annotated_columns(table, symbol_names: Dict[int, str]) -> List:
+        """Table columns with 'symbol' computed server-side from instrument_id."""
+        symbol = QueryBuilder._symbol_column(table, symbol_names)
+        columns = [symbol if column.name == 'symbol' else column for column in table.c]
+        if 'symbol' not in table.c:
+            columns.append(symbol)
+        return columns
+
     def _build_base_query(
         self,
         table,
@@ -232,7 +354,8 @@ class QueryBuilder:
         start_date: Optional[Union[date, datetime]] = None,
         end_date: Optional[Union[date, datetime]] = None,
         additional_filters: Optional[List] = None,
-        limit: Optional[int] = None
+        limit: Optional[int] = None,
+        symbol_names: Optional[Dict[int, str]] = None
     ):
         """
         Build base query with common filters for optimal index usage.
@@ -244,19 +367,24 @@ class QueryBuilder:
             end_date: End date for time range filter
             additional_filters: Additional WHERE conditions
             limit: Maximum number of records to return
+            symbol_names: instrument_id -> symbol mapping; when given, rows carry
+                a 'symbol' column computed by the database from this mapping
 
         Returns:
             SQLAlchemy select query object
         """
         # Start with base select
-        query = select(table)
+        if symbol_names is None:
+            query = select(table)
+        else:
+            query = select(*self._annotated_columns(table, symbol_names))
 
         # Build WHERE conditions for optimal index usage
         conditions = []
 
         # Always filter by instrument_id first (primary key component)
         if instrument_ids:
-            conditions.append(table.c.instrument_id.in_(instrument_ids))
+            conditions.append(table.c.instrument_id.in_(sorted(instrument_ids)))
 
         # Add date range filters (leverages time-based partitioning)
         if start_date:
@@ -281,7 +409,7 @@ class QueryBuilder:
 
         return query
 
-    def _execute_query_with_symbol_resolution(
+    def _build_symbol_query(
         self,
         table,
         symbols: Union[str, List[str]],
@@ -290,101 +418,367 @@ class QueryBuilder:
         additional_filters: Optional[List] = None,
         limit: Optional[int] = None,
         include_symbol_names: bool = True
-    ) -> List[Dict[str, Any]]:
+    ):
         """
-        Execute query with automatic symbol resolution and return formatted results.
+        Resolve symbols and build the data query for them.
+
+        Returns:
+            Tuple of (SQLAlchemy select query, or None if no instrument_ids were
+            resolved, resolved instrument_ids)
+
+        Raises:
+            SymbolResolutionError: If symbols cannot be resolved
+        """
+        instrument_ids = self._resolve_symbols_to_instrument_ids(symbols)
+        if not instrument_ids:
+            return None, []
+
+        # One statement: symbol names are annotated by the database
+        symbol_names = self.symbol_cache.symbols_for(instrument_ids) if include_symbol_names else None
+        query = self._build_base_query(
+            table, instrument_ids, start_date, end_date, additional_filters, limit,
+            symbol_names=symbol_names
+        )
+        return query, instrument_ids
+
+    def _build_bucketed_query(
+        self,
+        table,
+        bucket: timedelta,
+        aggregates: List,
+        instrument_ids: Optional[List[int]] = None,
+        symbols: Optional[List[str]] = None,
+        start_date: Optional[Union[date, datetime]] = None,
+        end_date: Optional[Union[date, datetime]] = None,
+        additional_filters: Optional[List] = None,
+        limit: Optional[int] = None
+    ):
+        """
+        Build a query aggregating a table into one row per time bucket and instrument.
 
         Args:
             table: SQLAlchemy table object
-            symbols: Symbol(s) to query for
-            start_date: Start date for filtering
-            end_date: End date for filtering
+            bucket: Bucket width
+            aggregates: Labeled aggregate expressions (see the aggregation module)
+            instrument_ids: Instruments to aggregate; their symbols are annotated
+                from the symbol cache
+            symbols: Instead of instrument_ids, filter and label on the stored
+                symbol column (no definitions needed)
+            start_date: Start date for time range filter
+            end_date: End date for time range filter
             additional_filters: Additional WHERE conditions
-            limit: Maximum records to return
-            include_symbol_names: Whether to include resolved symbol names in results
+            limit: Maximum number of buckets to return
 
         Returns:
-            List of dictionaries containing query results
+            SQLAlchemy select query object
         """
-        try:
-            # Resolve symbols to instrument_ids
-            instrument_ids = self._resolve_symbols_to_instrument_ids(symbols)
+        bucket_column = time_bucket(table.c.ts_event, bucket)
+        if symbols is not None:
+            symbol = table.c.symbol
+            conditions = [table.c.symbol.in_(sorted(symbols))]
+            group_by = [bucket_column, table.c.instrument_id, table.c.symbol]
+        else:
+            symbol_names = self.symbol_cache.symbols_for(instrument_ids) if instrument_ids else {}
+            symbol = self._symbol_column(table, symbol_names)
+            conditions = [table.c.instrument_id.in_(sorted(instrument_ids or []))]
+            group_by = [bucket_column, table.c.instrument_id]
+
+        if start_date:
+            conditions.append(table.c.ts_event >= start_date)
+        if end_date:
+            conditions.append(table.c.ts_event <= end_date)
+        if additional_filters:
+            conditions.extend(additional_filters)
+
+        query = (
+            select(bucket_column.label('ts_event'), table.c.instrument_id, symbol, *aggregates)
+            .where(and_(*conditions))
+            .group_by(*group_by)
+            .order_by(table.c.instrument_id, bucket_column.desc())
+        )
+        if limit:
+            query = query.limit(limit)
+        return query
+
+    def _execute_bucketed_query(
+        self,
+        table,
+        symbols: Union[str, List[str]],
+        bucket: Union[str, timedelta],
+        aggregates: List,
+        start_date: Optional[Union[date, datetime]] = None,
+        end_date: Optional[Union[date, datetime]] = None,
+        additional_filters: Optional[List] = None,
+        limit: Optional[int] = None,
+        columnar: bool = False,
+        by_stored_symbol: bool = False
+    ):
+        """
+        Resolve symbols, then run a bucketed aggregation query.
+
+        Returns:
+            List of dictionaries, or a pyarrow.RecordBatchReader if columnar
 
-            if not instrument_ids:
+        Raises:
+            SymbolResolutionError: If symbols cannot be resolved (and by_stored_symbol is False)
+            QueryExecutionError: If the query fails
+        """
+        width = parse_bucket(bucket)
+        symbol_list = [symbols] if isinstance(symbols, str) else list(symbols)
+        if by_stored_symbol:
+            instrument_ids, matched = None, bool(symbol_list)
+        else:
+            instrument_ids = self._resolve_symbols_to_instrument_ids(symbol_list)
+            matched = bool(instrument_ids)
+
+        try:
+            query = self._build_bucketed_query(
+                table, width, aggregates,
+                instrument_ids=instrument_ids,
+                symbols=symbol_list if by_stored_symbol else None,
+                start_date=start_date, end_date=end_date,
+                additional_filters=additional_filters, limit=limit
+            )
+            if not matched:
                 logger.info("No instrument_ids resolved, returning empty result")
+                if columnar:
+                    from .columnar import columnar_select
+                    import pyarrow as pa
+                    return pa.RecordBatchReader.from_batches(columnar_select(query)[1], [])
                 return []
+            if columnar:
+                return self._stream_query(query, columnar=True)
 
-            # Build and execute query
-            query = self._build_base_query(
-                table, instrument_ids, start_date, end_date, additional_filters, limit
-            )
+            # Filtered on the symbol column when by_stored_symbol, so any instrument's write may affect it
+            scope = CacheScope.for_query(table.name, instrument_ids, start_date, end_date)
+            results = self._execute_cached(query, scope)
+            logger.info(f"Aggregated {len(results)} {bucket} buckets from {table.name}")
+            return results
 
-            with self.get_connection() as conn:
-                start_time = datetime.now()
-                result = conn.execute(query)
-                rows = result.fetchall()
-                execution_time = (datetime.now() - start_time).total_seconds()
+        except QueryExecutionError:
+            raise
+        except Exception as e:
+            logger.error(f"Bucketed query failed: {e}")
+            raise QueryExecutionError(f"Failed to execute bucketed query: {e}")
+
+    def _stream_query(self, query, fetch_size: Optional[int] = None, columnar: bool = False):
+        """
+        Execute a query on a server-side cursor and yield rows as dictionaries.
+
+        Rows are fetched ``fetch_size`` at a time, so memory use does not grow
+        with the result size. The connection is held until the iterator is
+        exhausted or closed.
 
-                logger.info(f"Query executed in {execution_time:.3f}s, returned {len(rows)} rows")
+        Args:
+            query: SQLAlchemy select query
+            fetch_size: Rows per round trip (default: the builder's fetch_size)
+            columnar: Return Arrow record batches instead (see ``_stream_record_batches``)
 
-                # Convert to list of dictionaries
-                results = [dict(row._mapping) for row in rows]
+        Returns:
+            Iterator of one dictionary per result row, or a pyarrow.RecordBatchReader
 
-                # Add symbol names if requested
-                if include_symbol_names and results:
-                    results = self._add_symbol_names_to_results(results)
+        Raises:
+            QueryExecutionError: If the query fails
+        """
+        fetch_size = fetch_size or self.fetch_size
+        if columnar:
+            return self._stream_record_batches(query, fetch_size)
+        return self._stream_rows(query, fetch_size)
+
+    def _stream_rows(self, query, fetch_size: int) -> Iterator[Dict[str, Any]]:
+        """Yield the rows of a query from a server-side cursor as dictionaries."""
+        start_time = datetime.now()
+        row_count = 0
+
+        with self.get_connection() as conn:
+            # yield_per implies stream_results: a named cursor on PostgreSQL
+            result = conn.execution_options(yield_per=fetch_size).execute(query)
+            for row in result:
+                row_count += 1
+                yield dict(row._mapping)
+
+        execution_time = (datetime.now() - start_time).total_seconds()
+        logger.info(f"Streamed {row_count} rows in {execution_time:.3f}s (fetch size {fetch_size})")
+
+    def _stream_record_batches(self, query, fetch_size: int):
+        """
+        Stream a query through ``COPY ... TO STDOUT`` into Arrow record batches.
+
+        Nothing is executed until the first batch is read. Each batch holds
+        roughly ``fetch_size`` rows.
+
+        Args:
+            query: SQLAlchemy select query
+            fetch_size: Approximate rows per record batch
+
+        Returns:
+            pyarrow.RecordBatchReader; timestamps are timestamp[ns, UTC] and
+            DECIMAL columns float64
+
+        Raises:
+            QueryExecutionError: If the query fails (when reading)
+        """
+        from .columnar import CSV_BYTES_PER_ROW, columnar_select, compile_copy_sql, copy_record_batches
+        import pyarrow as pa
+
+        arrow_query, schema = columnar_select(query)
+        block_size = fetch_size * CSV_BYTES_PER_ROW
+
+        def batches():
+            start_time = datetime.now()
+            row_count = 0
+            completed = False
+            try:
+                connection = self.engine.raw_connection()
+            except Exception as e:
+                logger.error(f"Database connection error: {e}")
+                raise QueryExecutionError(f"Failed to connect to database: {e}")
+
+            try:
+                with connection.cursor() as cursor:
+                    copy_sql = compile_copy_sql(arrow_query, self.engine.dialect, cursor)
+                for batch in copy_record_batches(connection, copy_sql, schema, block_size):
+                    row_count += batch.num_rows
+                    yield batch
+                completed = True
+            except QueryExecutionError:
+                raise
+            except Exception as e:
+                logger.error(f"Columnar query failed: {e}")
+                raise QueryExecutionError(f"Failed to execute query: {e}")
+            finally:
+                if not completed:
+                    # An interrupted COPY leaves the connection unusable
+                    connection.invalidate()
+                connection.close()
+
+            execution_time = (datetime.now() - start_time).total_seconds()
+            logger.info(f"Streamed {row_count} rows as record batches in {execution_time:.3f}s")
+
+        return pa.RecordBatchReader.from_batches(schema, batches())
+
+    def _stream_query_with_symbol_resolution(
+        self,
+        table,
+        symbols: Union[str, List[str]],
+        start_date: Optional[Union[date, datetime]] = None,
+        end_date: Optional[Union[date, datetime]] = None,
+        additional_filters: Optional[List] = None,
+        limit: Optional[int] = None,
+        include_symbol_names: bool = True,
+        fetch_size: Optional[int] = None,
+        columnar: bool = False
+    ):
+        """
+        Streaming counterpart of ``_execute_query_with_symbol_resolution``.
 
-                return results
+        Symbols are resolved eagerly, so resolution errors are raised by this
+        call rather than on first iteration.
 
+        Returns:
+            Iterator of result dictionaries, or a pyarrow.RecordBatchReader if columnar
+        """
+        try:
+            query, _ = self._build_symbol_query(
+                table, symbols, start_date, end_date, additional_filters, limit, include_symbol_names
+            )
         except SymbolResolutionError:
-            # Re-raise SymbolResolutionError for fallback handling
             raise
         except Exception as e:
-            logger.error(f"Query execution failed: {e}")
+            logger.error(f"Query preparation failed: {e}")
             raise QueryExecutionError(f"Failed to execute query: {e}")
 
-    def _add_symbol_names_to_results(self, results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        if query is None:
+            logger.info("No instrument_ids resolved, returning empty result")
+            if columnar:
+                return self._empty_record_batches(table, include_symbol_names)
+            return iter(())
+        return self._stream_query(query, fetch_size, columnar)
+
+    def _empty_record_batches(self, table, include_symbol_names: bool = True):
+        """Empty RecordBatchReader with the columnar schema of a table's results."""
+        from .columnar import columnar_select
+        import pyarrow as pa
+
+        query = select(*self._annotated_columns(table, {})) if include_symbol_names else select(table)
+        _, schema = columnar_select(query)
+        return pa.RecordBatchReader.from_batches(schema, [])
+
+    def _execute_cached(self, query, scope: CacheScope) -> List[Dict[str, Any]]:
         """
-        Add symbol names to query results by looking up instrument_ids.
+        Execute a query, answering from and filling the result cache if there is one.
 
         Args:
-            results: List of query result dictionaries
+            query: SQLAlchemy select query
+            scope: Table, instruments and time range the query reads
 
         Returns:
-            Results with 'symbol' field added
+            List of dictionaries containing query results
         """
-        if not results:
-            return results
+        cache = self.result_cache
+        if cache is not None:
+            key = query_cache_key(query)
+            cached = cache.get(key)
+            if cached is not None:
+                logger.debug(f"Result cache hit, {len(cached)} rows")
+                return cached
+            position = cache.begin()
+
+        with self.get_connection() as conn:
+            start_time = datetime.now()
+            result = conn.execute(query)
+            rows = [dict(row._mapping) for row in result.fetchall()]
+            execution_time = (datetime.now() - start_time).total_seconds()
+
+            logger.info(f"Query executed in {execution_time:.3f}s, returned {len(rows)} rows")
+
+        if cache is not None:
+            cache.put(key, scope, rows, position)
+        return rows
 
-        # Get unique instrument_ids from results
-        instrument_ids = list(set(row['instrument_id'] for row in results))
+    def _execute_query_with_symbol_resolution(
+        self,
+        table,
+        symbols: Union[str, List[str]],
+        start_date: Optional[Union[date, datetime]] = None,
+        end_date: Optional[Union[date, datetime]] = None,
+        additional_filters: Optional[List] = None,
+        limit: Optional[int] = None,
+        include_symbol_names: bool = True
+    ) -> List[Dict[str, Any]]:
+        """
+        Execute query with automatic symbol resolution and return formatted results.
 
-        try:
-            with self.get_connection() as conn:
-                # Query for symbol mappings
-                symbol_query = select(
-                    definitions_data.c.instrument_id,
-                    definitions_data.c.raw_symbol
-                ).where(
-                    definitions_data.c.instrument_id.in_(instrument_ids)
-                ).distinct()
+        Args:
+            table: SQLAlchemy table object
+            symbols: Symbol(s) to query for
+            start_date: Start date for filtering
+            end_date: End date for filtering
+            additional_filters: Additional WHERE conditions
+            limit: Maximum records to return
+            include_symbol_names: Whether to include resolved symbol names in results
 
-                symbol_result = conn.execute(symbol_query)
-                symbol_mapping = {
-                    row.instrument_id: row.raw_symbol
-                    for row in symbol_result.fetchall()
-                }
+        Returns:
+            List of dictionaries containing query results
+        """
+        try:
+            query, instrument_ids = self._build_symbol_query(
+                table, symbols, start_date, end_date, additional_filters, limit, include_symbol_names
+            )
 
-                # Add symbol names to results
-                for row in results:
-                    row['symbol'] = symbol_mapping.get(row['instrument_id'], 'UNKNOWN')
+            if query is None:
+                logger.info("No instrument_ids resolved, returning empty result")
+                return []
 
-                return results
+            scope = CacheScope.for_query(table.name, instrument_ids, start_date, end_date)
+            return self._execute_cached(query, scope)
 
+        except SymbolResolutionError:
+            # Re-raise SymbolResolutionError for fallback handling
+            raise
         except Exception as e:
-            logger.warning(f"Failed to add symbol names: {e}")
-            # Return results without symbol names rather than failing
-            return results
+            logger.error(f"Query execution failed: {e}")
+            raise QueryExecutionError(f"Failed to execute query: {e}")
 
     def query_daily_ohlcv(
         self,
@@ -577,6 +971,283 @@ class QueryBuilder:
                 logger.error(f"Definitions query failed: {e}")
                 raise QueryExecutionError(f"Failed to query definitions: {e}")
 
+    def query_ohlcv_buckets(
+        self,
+        symbols: Union[str, List[str]],
+        bucket: Union[str, timedelta],
+        start_date: Optional[Union[date, datetime]] = None,
+        end_date: Optional[Union[date, datetime]] = None,
+        granularity: str = '1m',
+        limit: Optional[int] = None,
+        columnar: bool = False
+    ):
+        """
+        Aggregate stored OHLCV bars into bars of any width on the server.
+
+        Args:
+            symbols: Symbol(s) to query for
+            bucket: Bar width, e.g. '30m', '4h', '1w' (a multiple of granularity)
+            start_date: Start date for filtering (inclusive)
+            end_date: End date for filtering (inclusive)
+            granularity: Stored granularity the bars are built from (default: '1m')
+            limit: Maximum number of bars to return
+            columnar: Return Arrow record batches read via COPY instead of dictionaries
+
+        Returns:
+            List of dictionaries with ts_event (bucket start), instrument_id, symbol,
+            open/high/low/close_price, volume, trade_count, vwap and bar_count,
+            or a pyarrow.RecordBatchReader if columnar
+
+        Raises:
+            ValidationError: If the bucket is malformed or not a multiple of granularity
+            QueryExecutionError: If database query fails
+
+        Example:
+            >>> qb = QueryBuilder()
+            >>> bars = qb.query_ohlcv_buckets('ES.c.0', '30m', date(2024, 1, 2), date(2024, 1, 3))
+        """
+        width = parse_bucket(bucket)
+        if width % parse_bucket(granularity):
+            raise ValidationError(f"Bucket {bucket} is not a multiple of the {granularity} granularity")
+
+        additional_filters = [daily_ohlcv_data.c.granularity == granularity]
+        aggregates = ohlcv_aggregates(daily_ohlcv_data)
+        try:
+            return self._execute_bucketed_query(
+                daily_ohlcv_data, symbols, width, aggregates, start_date, end_date,
+                additional_filters, limit, columnar
+            )
+        except SymbolResolutionError as e:
+            logger.info(f"Symbol resolution failed, using direct symbol query: {e}")
+            return self._execute_bucketed_query(
+                daily_ohlcv_data, symbols, width, aggregates, start_date, end_date,
+                additional_filters, limit, columnar, by_stored_symbol=True
+            )
+
+    def query_trade_buckets(
+        self,
+        symbols: Union[str, List[str]],
+        bucket: Union[str, timedelta],
+        start_date: Optional[Union[date, datetime]] = None,
+        end_date: Optional[Union[date, datetime]] = None,
+        side: Optional[str] = None,
+        limit: Optional[int] = None,
+        columnar: bool = False
+    ):
+        """
+        Aggregate trades into bars of any width on the server.
+
+        Args:
+            symbols: Symbol(s) to query for
+            bucket: Bar width, e.g. '1s', '5m', '1h'
+            start_date: Start date for filtering (inclusive)
+            end_date: End date for filtering (inclusive)
+            side: Trade side filter ('B' for buy, 'S' for sell)
+            limit: Maximum number of bars to return
+            columnar: Return Arrow record batches read via COPY instead of dictionaries
+
+        Returns:
+            List of dictionaries with ts_event (bucket start), instrument_id, symbol,
+            open/high/low/close_price, volume, trade_count and vwap,
+            or a pyarrow.RecordBatchReader if columnar
+
+        Raises:
+            ValidationError: If the bucket is malformed
+            QueryExecutionError: If database query fails
+        """
+        additional_filters = []
+        if side:
+            additional_filters.append(trades_data.c.side == side)
+
+        return self._execute_bucketed_query(
+            trades_data, symbols, bucket, trades_aggregates(trades_data), start_date, end_date,
+            additional_filters, limit, columnar
+        )
+
+    def iter_daily_ohlcv(
+        self,
+        symbols: Union[str, List[str]],
+        start_date: Optional[Union[date, datetime]] = None,
+        end_date: Optional[Union[date, datetime]] = None,
+        granularity: str = '1d',
+        limit: Optional[int] = None,
+        fetch_size: Optional[int] = None,
+        columnar: bool = False
+    ):
+        """
+        Stream OHLCV data like ``query_daily_ohlcv`` without loading it into memory.
+
+        Args:
+            symbols: Symbol(s) to query for
+            start_date: Start date for filtering (inclusive)
+            end_date: End date for filtering (inclusive)
+            granularity: Data granularity (default: '1d')
+            limit: Maximum number of records to return
+            fetch_size: Rows per round trip (default: the builder's fetch_size)
+            columnar: Return Arrow record batches read via COPY instead of dictionaries
+
+        Returns:
+            Iterator of dictionaries containing OHLCV data, or a
+            pyarrow.RecordBatchReader if columnar
+        """
+        try:
+            return self._stream_query_with_symbol_resolution(
+                daily_ohlcv_data, symbols, start_date, end_date,
+                [daily_ohlcv_data.c.granularity == granularity], limit,
+                fetch_size=fetch_size, columnar=columnar
+            )
+        except SymbolResolutionError as e:
+            logger.info(f"Symbol resolution failed, using direct symbol query: {e}")
+            symbol_list = [symbols] if isinstance(symbols, str) else list(symbols)
+            if not symbol_list:
+                return self._empty_record_batches(daily_ohlcv_data) if columnar else iter(())
+            query = self._build_ohlcv_direct_query(symbol_list, start_date, end_date, granularity, limit)
+            return self._stream_query(query, fetch_size, columnar)
+
+    def iter_trades(
+        self,
+        symbols: Union[str, List[str]],
+        start_date: Optional[Union[date, datetime]] = None,
+        end_date: Optional[Union[date, datetime]] = None,
+        side: Optional[str] = None,
+        limit: Optional[int] = None,
+        fetch_size: Optional[int] = None,
+        columnar: bool = False
+    ):
+        """
+        Stream trades data like ``query_trades``; unlimited by default.
+
+        Args:
+            symbols: Symbol(s) to query for
+            start_date: Start date for filtering (inclusive)
+            end_date: End date for filtering (inclusive)
+            side: Trade side filter ('B' for buy, 'S' for sell)
+            limit: Maximum number of records to return
+            fetch_size: Rows per round trip (default: the builder's fetch_size)
+            columnar: Return Arrow record batches read via COPY instead of dictionaries
+
+        Returns:
+            Iterator of dictionaries containing trades data, or a
+            pyarrow.RecordBatchReader if columnar
+        """
+        additional_filters = []
+        if side:
+            additional_filters.append(trades_data.c.side == side)
+
+        return self._stream_query_with_symbol_resolution(
+            trades_data, symbols, start_date, end_date,
+            additional_filters, limit, fetch_size=fetch_size, columnar=columnar
+        )
+
+    def iter_tbbo(
+        self,
+        symbols: Union[str, List[str]],
+        start_date: Optional[Union[date, datetime]] = None,
+        end_date: Optional[Union[date, datetime]] = None,
+        limit: Optional[int] = None,
+        fetch_size: Optional[int] = None,
+        columnar: bool = False
+    ):
+        """
+        Stream TBBO data like ``query_tbbo``; unlimited by default.
+
+        Args:
+            symbols: Symbol(s) to query for
+            start_date: Start date for filtering (inclusive)
+            end_date: End date for filtering (inclusive)
+            limit: Maximum number of records to return
+            fetch_size: Rows per round trip (default: the builder's fetch_size)
+            columnar: Return Arrow record batches read via COPY instead of dictionaries
+
+        Returns:
+            Iterator of dictionaries containing TBBO data, or a
+            pyarrow.RecordBatchReader if columnar
+        """
+        return self._stream_query_with_symbol_resolution(
+            tbbo_data, symbols, start_date, end_date,
+            None, limit, fetch_size=fetch_size, columnar=columnar
+        )
+
+    def iter_statistics(
+        self,
+        symbols: Union[str, List[str]],
+        start_date: Optional[Union[date, datetime]] = None,
+        end_date: Optional[Union[date, datetime]] = None,
+        stat_type: Optional[int] = None,
+        limit: Optional[int] = None,
+        fetch_size: Optional[int] = None,
+        columnar: bool = False
+    ):
+        """
+        Stream statistics data like ``query_statistics``.
+
+        Args:
+            symbols: Symbol(s) to query for
+            start_date: Start date for filtering (inclusive)
+            end_date: End date for filtering (inclusive)
+            stat_type: Statistics type filter
+            limit: Maximum number of records to return
+            fetch_size: Rows per round trip (default: the builder's fetch_size)
+            columnar: Return Arrow record batches read via COPY instead of dictionaries
+
+        Returns:
+            Iterator of dictionaries containing statistics data, or a
+            pyarrow.RecordBatchReader if columnar
+        """
+        additional_filters = []
+        if stat_type is not None:
+            additional_filters.append(statistics_data.c.stat_type == stat_type)
+
+        return self._stream_query_with_symbol_resolution(
+            statistics_data, symbols, start_date, end_date,
+            additional_filters, limit, fetch_size=fetch_size, columnar=columnar
+        )
+
+    def iter_definitions(
+        self,
+        symbols: Optional[Union[str, List[str]]] = None,
+        asset: Optional[str] = None,
+        exchange: Optional[str] = None,
+        instrument_class: Optional[str] = None,
+        limit: Optional[int] = None,
+        fetch_size: Optional[int] = None,
+        columnar: bool = False
+    ):
+        """
+        Stream instrument definitions like ``query_definitions``; unlimited by default.
+
+        Args:
+            symbols: Symbol(s) to query for (optional)
+            asset: Asset filter (e.g., 'ES', 'CL')
+            exchange: Exchange filter
+            instrument_class: Instrument class filter (e.g., 'FUT', 'OPT')
+            limit: Maximum number of records to return
+            fetch_size: Rows per round trip (default: the builder's fetch_size)
+            columnar: Return Arrow record batches read via COPY instead of dictionaries
+
+        Returns:
+            Iterator of dictionaries containing definitions data, or a
+            pyarrow.RecordBatchReader if columnar
+        """
+        additional_filters = []
+
+        if asset:
+            additional_filters.append(definitions_data.c.asset == asset)
+        if exchange:
+            additional_filters.append(definitions_data.c.exchange == exchange)
+        if instrument_class:
+            additional_filters.append(definitions_data.c.instrument_class == instrument_class)
+
+        if symbols:
+            return self._stream_query_with_symbol_resolution(
+                definitions_data, symbols, None, None,
+                additional_filters, limit, include_symbol_names=False,
+                fetch_size=fetch_size, columnar=columnar
+            )
+
+        query = self._build_base_query(definitions_data, [], None, None, additional_filters, limit)
+        return self._stream_query(query, fetch_size, columnar)
+
     def to_dataframe(self, results: List[Dict[str, Any]]) -> pd.DataFrame:
         """
         Convert query results to Pandas DataFrame.
@@ -644,3 +1315,115 @@ class QueryBuilder:
         except Exception as e:
             logger.error(f"Failed to get available symbols: {e}")
             return []
+
+    def _coverage_filters(
+        self,
+        symbols: Optional[Union[str, List[str]]],
+        schema: Optional[str],
+        start_date: Optional[Union[date, datetime]],
+        end_date: Optional[Union[date, datetime]]
+    ) -> List:
+        """Build WHERE conditions on the ingestion_coverage catalog."""
+        filters = []
+        if symbols:
+            symbol_list = [symbols] if isinstance(symbols, str) else list(symbols)
+            filters.append(ingestion_coverage.c.symbol.in_(symbol_list))
+        if schema:
+            filters.append(ingestion_coverage.c.schema == schema)
+        if start_date:
+            start = start_date.date() if isinstance(start_date, datetime) else start_date
+            filters.append(ingestion_coverage.c.day >= start)
+        if end_date:
+            end = end_date.date() if isinstance(end_date, datetime) else end_date
+            filters.append(ingestion_coverage.c.day <= end)
+        return filters
+
+    def get_ingestion_coverage(
+        self,
+        symbols: Optional[Union[str, List[str]]] = None,
+        schema: Optional[str] = None,
+        start_date: Optional[Union[date, datetime]] = None,
+        end_date: Optional[Union[date, datetime]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Get per-day coverage entries from the ingestion_coverage catalog.
+
+        The catalog is maintained by the storage loaders, so this never scans
+        the market data hypertables.
+
+        Args:
+            symbols: Symbol(s) to filter by (as stored, e.g. 'ES.c.0')
+            schema: Databento schema to filter by (e.g. 'ohlcv-1d', 'trades')
+            start_date: First day to include (inclusive)
+            end_date: Last day to include (inclusive)
+
+        Returns:
+            List of dictionaries with schema, symbol, instrument_id, day,
+            row_count, min_ts_event, max_ts_event, content_hash and updated_at
+
+        Raises:
+            QueryExecutionError: If database query fails
+        """
+        query = select(ingestion_coverage)
+        filters = self._coverage_filters(symbols, schema, start_date, end_date)
+        if filters:
+            query = query.where(and_(*filters))
+        query = query.order_by(
+            ingestion_coverage.c.symbol,
+            ingestion_coverage.c.schema,
+            ingestion_coverage.c.day
+        )
+
+        try:
+            with self.get_connection() as conn:
+                result = conn.execute(query)
+                return [dict(row._mapping) for row in result.fetchall()]
+        except Exception as e:
+            logger.error(f"Failed to query ingestion coverage: {e}")
+            raise QueryExecutionError(f"Failed to query ingestion coverage: {e}")
+
+    def get_coverage_summary(
+        self,
+        symbols: Optional[Union[str, List[str]]] = None,
+        schema: Optional[str] = None,
+        start_date: Optional[Union[date, datetime]] = None,
+        end_date: Optional[Union[date, datetime]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Summarize the ingestion_coverage catalog per symbol and schema.
+
+        Args:
+            symbols: Symbol(s) to filter by (as stored, e.g. 'ES.c.0')
+            schema: Databento schema to filter by (e.g. 'ohlcv-1d', 'trades')
+            start_date: First day to include (inclusive)
+            end_date: Last day to include (inclusive)
+
+        Returns:
+            List of dictionaries with symbol, schema, first_day, last_day,
+            days (distinct days stored), total_rows and last_updated
+
+        Raises:
+            QueryExecutionError: If database query fails
+        """
+        c = ingestion_coverage.c
+        query = select(
+            c.symbol,
+            c.schema,
+            func.min(c.day).label('first_day'),
+            func.max(c.day).label('last_day'),
+            func.count(func.distinct(c.day)).label('days'),
+            func.sum(c.row_count).label('total_rows'),
+            func.max(c.updated_at).label('last_updated')
+        )
+        filters = self._coverage_filters(symbols, schema, start_date, end_date)
+        if filters:
+            query = query.where(and_(*filters))
+        query = query.group_by(c.symbol, c.schema).order_by(c.symbol, c.schema)
+
+        try:
+            with self.get_connection() as conn:
+                result = conn.execute(query)
+                return [dict(row._mapping) for row in result.fetchall()]
+        except Exception as e:
+            logger.error(f"Failed to summarize ingestion coverage: {e}")
+            raise QueryExecutionError(f"Failed to summarize ingestion coverage: {e}")
@@ -0,0 +1,302 @@
+"""
+Result cache for QueryBuilder queries, invalidated by the loaders' writes.
+
+Entries are keyed by the normalized query (table, sorted instrument set, time
+range, filters and limit, as compiled SQL plus parameters) and kept in an
+in-memory LRU, optionally backed by an on-disk tier shared between processes.
+
+Every entry also records its scope: the table, instruments and ``ts_event``
+range its query reads. The cache follows the storage write log
+(``write_log.WriteLog``) and drops exactly the entries whose scope overlaps a
+committed write. A result is only stored if no overlapping write was logged
+while its query ran, so a repeat query is answered from memory without ever
+serving data older than the last load.
+"""
+
+import hashlib
+import os
+import pickle
+import tempfile
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import timedelta
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, Hashable, Iterable, List, Optional, Tuple, Union
+
+import pandas as pd
+import structlog
+
+from .write_log import LogPosition, WriteLog, WriteRecord
+
+logger = structlog.get_logger(__name__)
+
+DEFAULT_MAX_ENTRIES = 256
+DEFAULT_MAX_DISK_BYTES = 1024 ** 3
+
+_MIN_NS = -(2 ** 63)
+_MAX_NS = 2 ** 63 - 1
+
+
+def _bound_ns(value: Any, default: int, widen: timedelta) -> int:
+    """Nanosecond bound of a query date; naive values are widened to cover any session time zone."""
+    if value is None:
+        return default
+    timestamp = pd.Timestamp(value)
+    if timestamp.tzinfo is None:
+        timestamp = (timestamp + widen).tz_localize("UTC")
+    return timestamp.value
+
+
+@dataclass(frozen=True)
+class CacheScope:
+    """Data a cached query reads: table, instruments (None = any) and inclusive ns range."""
+
+    table: str
+    instrument_ids: Optional[FrozenSet[int]]
+    start_ns: int
+    end_ns: int
+
+    @classmethod
+    def for_query(
+        cls,
+        table: str,
+        instrument_ids: Optional[Iterable[int]],
+        start_date: Any = None,
+        end_date: Any = None
+    ) -> "CacheScope":
+        """
+        Build the scope of a query.
+
+        Args:
+            table: Table name
+            instrument_ids: Instruments filtered on (None if the query is not restricted by them)
+            start_date: Inclusive start filter (date, datetime or None)
+            end_date: Inclusive end filter (date, datetime or None)
+
+        Returns:
+            CacheScope of the query
+        """
+        return cls(
+            table,
+            frozenset(instrument_ids) if instrument_ids is not None else None,
+            _bound_ns(start_date, _MIN_NS, -timedelta(days=1)),
+            _bound_ns(end_date, _MAX_NS, timedelta(days=1)),
+        )
+
+    def affected_by(self, records: Iterable[WriteRecord]) -> bool:
+        """Whether any of the writes overlaps this scope."""
+        return any(record.overlaps(self.table, self.instrument_ids, self.start_ns, self.end_ns) for record in records)
+
+
+def query_cache_key(query) -> Tuple[str, Tuple[Tuple[str, str], ...]]:
+    """
+    Normalized cache key of a SQLAlchemy select.
+
+    Args:
+        query: Select built by the QueryBuilder (instrument IDs already sorted)
+
+    Returns:
+        Tuple of the compiled SQL and its sorted parameters
+    """
+    compiled = query.compile(compile_kwargs={"render_postcompile": True})
+    return str(compiled), tuple(sorted((name, repr(value)) for name, value in compiled.params.items()))
+
+
+class QueryResultCache:
+    """In-memory LRU of query results with an optional on-disk tier."""
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        disk_dir: Optional[Union[str, Path]] = None,
+        max_disk_bytes: int = DEFAULT_MAX_DISK_BYTES,
+        write_log: Optional[WriteLog] = None
+    ):
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_entries: Results kept in memory
+            disk_dir: Directory of the on-disk tier (None disables it); may be
+                shared by several processes
+            max_disk_bytes: Size of the on-disk tier before least recently used entries are evicted
+            write_log: Log of the loaders' writes (default: the shared storage write log)
+        """
+        self.max_entries = max_entries
+        self.disk_dir = Path(disk_dir) if disk_dir is not None else None
+        self.max_disk_bytes = max_disk_bytes
+        self.write_log = write_log or WriteLog()
+
+        self._lock = threading.Lock()
+        self._memory: "OrderedDict[Hashable, Tuple[CacheScope, List[Dict[str, Any]]]]" = OrderedDict()
+        self._position = self.write_log.position()
+        self._stats = {"hits": 0, "disk_hits": 0, "misses": 0, "stores": 0, "invalidations": 0, "evictions": 0}
+
+        if self.disk_dir is not None:
+            self.disk_dir.mkdir(parents=True, exist_ok=True)
+
+    def _sync(self) -> None:
+        """Apply the writes logged since the last sync to the memory tier (lock held)."""
+        records, self._position = self.write_log.read_since(self._position)
+        if records is None:
+            self._stats["invalidations"] += len(self._memory)
+            self._memory.clear()
+            return
+        if not records or not self._memory:
+            return
+        stale = [key for key, (scope, _) in self._memory.items() if scope.affected_by(records)]
+        for key in stale:
+            del self._memory[key]
+        self._stats["invalidations"] += len(stale)
+
+    def begin(self) -> LogPosition:
+        """
+        Mark the start of a query whose result will be stored with ``put``.
+
+        Returns:
+            Write log position to pass to ``put``
+        """
+        with self._lock:
+            self._sync()
+            return self._position
+
+    def get(self, key: Hashable) -> Optional[List[Dict[str, Any]]]:
+        """
+        Look up the results of a query.
+
+        Args:
+            key: Key from ``query_cache_key``
+
+        Returns:
+            Copy of the cached rows, or None on a miss
+        """
+        with self._lock:
+            self._sync()
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+                self._stats["hits"] += 1
+                return [dict(row) for row in entry[1]]
+
+            entry = self._load_from_disk(key)
+            if entry is not None:
+                self._remember(key, entry)
+                self._stats["disk_hits"] += 1
+                return [dict(row) for row in entry[1]]
+
+            self._stats["misses"] += 1
+            return None
+
+    def put(self, key: Hashable, scope: CacheScope, rows: List[Dict[str, Any]], position: LogPosition) -> bool:
+        """
+        Store the results of a query unless a write overlapped it while it ran.
+
+        Args:
+            key: Key from ``query_cache_key``
+            scope: Data the query reads
+            rows: Query results
+            position: Position returned by ``begin`` before the query ran
+
+        Returns:
+            True if the results were stored
+        """
+        with self._lock:
+            self._sync()
+            records, checked_position = self.write_log.read_since(position)
+            if records is None or scope.affected_by(records):
+                logger.debug("Query overlapped a write, result not cached", table=scope.table)
+                return False
+
+            entry = (scope, [dict(row) for row in rows])
+            self._remember(key, entry)
+            self._stats["stores"] += 1
+            if self.disk_dir is not None:
+                self._store_on_disk(key, entry, checked_position)
+            return True
+
+    def _remember(self, key: Hashable, entry: Tuple[CacheScope, List[Dict[str, Any]]]) -> None:
+        """Insert into the memory tier, evicting the least recently used entries (lock held)."""
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+            self._stats["evictions"] += 1
+
+    def _disk_path(self, key: Hashable) -> Path:
+        """File of a key in the on-disk tier."""
+        return self.disk_dir / (hashlib.sha256(repr(key).encode("utf-8")).hexdigest() + ".pkl")
+
+    def _load_from_disk(self, key: Hashable) -> Optional[Tuple[CacheScope, List[Dict[str, Any]]]]:
+        """Load an entry from the on-disk tier if no write overlapped it since it was stored."""
+        if self.disk_dir is None:
+            return None
+        path = self._disk_path(key)
+        try:
+            with open(path, "rb") as entry_file:
+                stored_key, scope, rows, position = pickle.load(entry_file)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning("Unreadable query cache entry removed", path=str(path), error=str(e))
+            path.unlink(missing_ok=True)
+            return None
+
+        records, _ = self.write_log.read_since(position)
+        if stored_key != key or records is None or scope.affected_by(records):
+            path.unlink(missing_ok=True)
+            self._stats["invalidations"] += 1
+            return None
+
+        os.utime(path)  # Recency for LRU eviction
+        return scope, rows
+
+    def _store_on_disk(self, key: Hashable, entry: Tuple[CacheScope, List[Dict[str, Any]]], position: LogPosition) -> None:
+        """Atomically write an entry to the on-disk tier and enforce its size limit."""
+        path = self._disk_path(key)
+        try:
+            with tempfile.NamedTemporaryFile(dir=self.disk_dir, suffix=".tmp", delete=False) as tmp_file:
+                pickle.dump((key, entry[0], entry[1], position), tmp_file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_file.name, path)
+        except OSError as e:
+            logger.warning("Failed to write query cache entry", path=str(path), error=str(e))
+            return
+        self._evict_disk()
+
+    def _evict_disk(self) -> None:
+        """Remove least recently used disk entries beyond ``max_disk_bytes``."""
+        files = []
+        for path in self.disk_dir.glob("*.pkl"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in files)
+        for _, size, path in sorted(files):
+            if total <= self.max_disk_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            self._stats["evictions"] += 1
+
+    def clear(self) -> None:
+        """Drop every entry, in memory and on disk."""
+        with self._lock:
+            self._memory.clear()
+            if self.disk_dir is not None:
+                for path in self.disk_dir.glob("*.pkl"):
+                    path.unlink(missing_ok=True)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Snapshot of the cache statistics.
+
+        Returns:
+            Dictionary with hits, disk_hits, misses, stores, invalidations, evictions and entries
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats["entries"] = len(self._memory)
+        return stats
@@ -0,0 +1,191 @@
+"""
+In-process cache of symbol to instrument_id mappings for the QueryBuilder.
+
+Resolving symbols against ``definitions_data`` used to cost a table-existence
+check and a DISTINCT over the hypertable on every query, plus another round trip
+to name the result rows. ``SymbolCache`` is instead warmed in bulk with all
+(instrument_id, raw_symbol) pairs at once and then answers lookups from memory
+until its TTL expires or it is invalidated. Symbols unknown to the warm set are
+looked up individually once and remembered, found or not, until the next warm.
+
+Caches are shared per database within a process (``shared_symbol_cache``), so
+every QueryBuilder pointed at the same database benefits from one warm-up. The
+definitions loader invalidates them after every committed load; caches in other
+processes pick up new definitions when their TTL expires.
+"""
+
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+DEFAULT_SYMBOL_CACHE_TTL = 300.0
+
+
+class SymbolCache:
+    """TTL-bounded, thread-safe mapping between symbols and instrument_ids."""
+
+    def __init__(self, ttl_seconds: float = DEFAULT_SYMBOL_CACHE_TTL):
+        """
+        Initialize an empty (cold) cache.
+
+        Args:
+            ttl_seconds: Seconds after a warm-up before the cache must be warmed again
+        """
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._symbol_to_ids: Dict[str, List[int]] = {}
+        self._id_to_symbol: Dict[int, str] = {}
+        self._warmed_at: Optional[float] = None
+        # False once the definitions table is known to be missing
+        self._definitions_available = True
+        self._stats = {"hits": 0, "misses": 0, "warmups": 0, "invalidations": 0}
+
+    def is_fresh(self) -> bool:
+        """Whether the cache was warmed less than ``ttl_seconds`` ago."""
+        with self._lock:
+            return self._warmed_at is not None and time.monotonic() - self._warmed_at < self.ttl_seconds
+
+    @property
+    def definitions_available(self) -> bool:
+        """Whether the last warm-up found the definitions table."""
+        return self._definitions_available
+
+    def warm(self, pairs: Iterable[Tuple[int, str]], definitions_available: bool = True) -> None:
+        """
+        Replace the cache contents with a bulk load of mappings.
+
+        Args:
+            pairs: (instrument_id, raw_symbol) pairs from definitions_data
+            definitions_available: False if the definitions table does not exist
+        """
+        symbol_to_ids: Dict[str, List[int]] = {}
+        id_to_symbol: Dict[int, str] = {}
+        for instrument_id, raw_symbol in pairs:
+            ids = symbol_to_ids.setdefault(raw_symbol, [])
+            if instrument_id not in ids:
+                ids.append(instrument_id)
+            id_to_symbol[instrument_id] = raw_symbol
+
+        with self._lock:
+            self._symbol_to_ids = symbol_to_ids
+            self._id_to_symbol = id_to_symbol
+            self._definitions_available = definitions_available
+            self._warmed_at = time.monotonic()
+            self._stats["warmups"] += 1
+
+        logger.info("Symbol cache warmed", symbols=len(symbol_to_ids), instruments=len(id_to_symbol))
+
+    def add(self, symbols: Iterable[str], pairs: Iterable[Tuple[int, str]]) -> None:
+        """
+        Record the result of an individual lookup, including symbols not found.
+
+        Args:
+            symbols: Symbols that were looked up
+            pairs: (instrument_id, raw_symbol) pairs found for them
+        """
+        with self._lock:
+            for symbol in symbols:
+                self._symbol_to_ids.setdefault(symbol, [])
+            for instrument_id, raw_symbol in pairs:
+                ids = self._symbol_to_ids.setdefault(raw_symbol, [])
+                if instrument_id not in ids:
+                    ids.append(instrument_id)
+                self._id_to_symbol[instrument_id] = raw_symbol
+
+    def lookup(self, symbols: List[str]) -> Tuple[Dict[str, List[int]], List[str]]:
+        """
+        Resolve symbols from memory.
+
+        Args:
+            symbols: Symbols to resolve
+
+        Returns:
+            Tuple of (symbol -> instrument_ids for known symbols, symbols not in the cache);
+            a known symbol with no instruments maps to an empty list
+        """
+        known: Dict[str, List[int]] = {}
+        unknown: List[str] = []
+        with self._lock:
+            for symbol in symbols:
+                if symbol in self._symbol_to_ids:
+                    known[symbol] = list(self._symbol_to_ids[symbol])
+                else:
+                    unknown.append(symbol)
+            self._stats["hits"] += len(known)
+            self._stats["misses"] += len(unknown)
+        return known, unknown
+
+    def symbols_for(self, instrument_ids: Iterable[int]) -> Dict[int, str]:
+        """
+        Map instrument_ids to their symbols.
+
+        Args:
+            instrument_ids: Instrument IDs to name
+
+        Returns:
+            Mapping for the instrument_ids the cache knows
+        """
+        with self._lock:
+            return {
+                instrument_id: self._id_to_symbol[instrument_id]
+                for instrument_id in instrument_ids
+                if instrument_id in self._id_to_symbol
+            }
+
+    def invalidate(self) -> None:
+        """Drop all mappings; the next lookup warms the cache again."""
+        with self._lock:
+            self._symbol_to_ids = {}
+            self._id_to_symbol = {}
+            self._warmed_at = None
+            self._definitions_available = True
+            self._stats["invalidations"] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Snapshot of the cache statistics.
+
+        Returns:
+            Dictionary with hits, misses, warmups, invalidations, symbols and fresh
+        """
+        fresh = self.is_fresh()
+        with self._lock:
+            stats = dict(self._stats)
+            stats["symbols"] = len(self._symbol_to_ids)
+        stats["fresh"] = fresh
+        return stats
+
+
+_shared_caches: Dict[Tuple[Any, ...], SymbolCache] = {}
+_shared_lock = threading.Lock()
+
+
+def shared_symbol_cache(connection_params: Dict[str, Any], ttl_seconds: float = DEFAULT_SYMBOL_CACHE_TTL) -> SymbolCache:
+    """
+    Get the process-wide symbol cache of a database.
+
+    Args:
+        connection_params: QueryBuilder connection parameters (host, port, database)
+        ttl_seconds: TTL used if the cache is created by this call
+
+    Returns:
+        SymbolCache shared by every caller using the same database
+    """
+    key = (connection_params.get('host'), connection_params.get('port'), connection_params.get('database'))
+    with _shared_lock:
+        cache = _shared_caches.get(key)
+        if cache is None:
+            cache = _shared_caches[key] = SymbolCache(ttl_seconds)
+        return cache
+
+
+def invalidate_shared_symbol_caches() -> None:
+    """Invalidate every shared symbol cache (e.g. after loading new definitions)."""
+    with _shared_lock:
+        caches = list(_shared_caches.values())
+    for cache in caches:
+        cache.invalidate()
@@ -204,6 +204,23 @@ definitions_data = Table(
     Index('idx_definitions_asset_exchange', 'asset', 'exchange'),
 )
 
+# Ingestion coverage catalog (maintained by the storage loaders)
+ingestion_coverage = Table(
+    'ingestion_coverage', metadata,
+    Column('schema', String, nullable=False, primary_key=True),
+    Column('symbol', String, nullable=False, primary_key=True),
+    Column('instrument_id', Integer, nullable=False, primary_key=True),
+    Column('day', DATE, nullable=False, primary_key=True),
+    Column('row_count', BIGINT, nullable=False),
+    Column('min_ts_event', TIMESTAMPTZ(timezone=True), nullable=False),
+    Column('max_ts_event', TIMESTAMPTZ(timezone=True), nullable=False),
+    Column('content_hash', String, nullable=False),
+    Column('updated_at', TIMESTAMPTZ(timezone=True), nullable=False),
+
+    # Indexes
+    Index('idx_ingestion_coverage_symbol_day', 'symbol', 'schema', 'day'),
+)
+
 # Schema mapping for easy access
 SCHEMA_TABLES = {
     'daily_ohlcv': daily_ohlcv_data,
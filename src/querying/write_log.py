@@ -0,0 +1,163 @@
+"""
+Append-only log of the time ranges the storage loaders write.
+
+Every committed load appends one JSON line naming the table, the instruments
+and the ``ts_event`` range it touched. Query result caches in any process
+sharing the log follow it (a ``stat`` per lookup, reading only new bytes) and
+drop exactly the entries overlapping a write, so cached results never outlive
+the data they were computed from.
+
+The log lives at ``cache/write_log.jsonl`` in the repository unless the
+``STORAGE_WRITE_LOG`` environment variable names another file. When it grows
+past ``MAX_WRITE_LOG_BYTES`` it is rotated; followers treat a rotation (or a
+line they cannot parse) as "everything may have changed".
+"""
+
+import json
+import os
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import FrozenSet, Iterable, List, Optional, Tuple, Union
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+WRITE_LOG_ENV = "STORAGE_WRITE_LOG"
+DEFAULT_WRITE_LOG_PATH = Path(__file__).resolve().parents[2] / "cache" / "write_log.jsonl"
+MAX_WRITE_LOG_BYTES = 8 * 1024 * 1024
+
+# (inode, byte offset) of a log; inode 0 while the log does not exist
+LogPosition = Tuple[int, int]
+
+_APPEND_LOCK = threading.Lock()
+
+
+def write_log_path() -> Path:
+    """Path of the write log shared by the loaders and the query caches."""
+    return Path(os.getenv(WRITE_LOG_ENV) or DEFAULT_WRITE_LOG_PATH)
+
+
+@dataclass(frozen=True)
+class WriteRecord:
+    """One committed write: a table, its instruments (empty = any) and a ts_event range in ns."""
+
+    table: str
+    instrument_ids: FrozenSet[int]
+    start_ns: int
+    end_ns: int
+
+    def overlaps(self, table: str, instrument_ids: Optional[FrozenSet[int]], start_ns: int, end_ns: int) -> bool:
+        """
+        Whether this write may have changed the results of a query.
+
+        Args:
+            table: Table the query reads
+            instrument_ids: Instruments the query reads (None = any)
+            start_ns: Inclusive query range start
+            end_ns: Inclusive query range end
+
+        Returns:
+            True if table, instruments and time range all overlap
+        """
+        if table != self.table or self.start_ns > end_ns or self.end_ns < start_ns:
+            return False
+        if not self.instrument_ids or instrument_ids is None:
+            return True
+        return not self.instrument_ids.isdisjoint(instrument_ids)
+
+
+class WriteLog:
+    """Appends to and follows a write log file."""
+
+    def __init__(self, path: Optional[Union[str, Path]] = None, max_bytes: int = MAX_WRITE_LOG_BYTES):
+        """
+        Initialize the log.
+
+        Args:
+            path: Log file (default: ``write_log_path()``)
+            max_bytes: Size after which the log is rotated on the next append
+        """
+        self.path = Path(path) if path is not None else write_log_path()
+        self.max_bytes = max_bytes
+
+    def append(self, table: str, instrument_ids: Iterable[int], start_ns: int, end_ns: int) -> None:
+        """
+        Record a committed write.
+
+        Args:
+            table: Table written
+            instrument_ids: Instruments written
+            start_ns: First ts_event written (ns since the epoch)
+            end_ns: Last ts_event written (ns since the epoch)
+        """
+        line = json.dumps({
+            "table": table,
+            "instrument_ids": sorted(int(instrument_id) for instrument_id in instrument_ids),
+            "start_ns": int(start_ns),
+            "end_ns": int(end_ns),
+        }) + "\n"
+
+        with _APPEND_LOCK:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                if self.path.stat().st_size >= self.max_bytes:
+                    os.replace(self.path, self.path.with_name(self.path.name + ".1"))
+                    logger.info("Write log rotated", path=str(self.path))
+            except FileNotFoundError:
+                pass
+            # One write() of a short line on an O_APPEND file: concurrent writers don't interleave
+            with open(self.path, "a", encoding="utf-8") as log_file:
+                log_file.write(line)
+
+    def position(self) -> LogPosition:
+        """Current end of the log."""
+        try:
+            stat = self.path.stat()
+        except FileNotFoundError:
+            return (0, 0)
+        return (stat.st_ino, stat.st_size)
+
+    def read_since(self, position: LogPosition) -> Tuple[Optional[List[WriteRecord]], LogPosition]:
+        """
+        Read the writes recorded after a position.
+
+        Args:
+            position: Position from ``position()`` or a previous call
+
+        Returns:
+            Tuple of (new records, or None if the log was rotated since ``position``
+            or cannot be parsed, position to continue from)
+        """
+        inode, offset = position
+        current = self.position()
+        if current == position:
+            return [], position
+        if current[0] != inode and inode != 0:
+            return None, current
+        if current[0] != inode:
+            offset = 0
+        elif current[1] < offset:
+            return None, current
+
+        try:
+            with open(self.path, "rb") as log_file:
+                log_file.seek(offset)
+                data = log_file.read(current[1] - offset)
+        except FileNotFoundError:
+            return None, (0, 0)
+
+        # A line still being appended is picked up by the next call
+        complete = data[:data.rfind(b"\n") + 1]
+        records = []
+        for line in complete.splitlines():
+            try:
+                entry = json.loads(line)
+                records.append(WriteRecord(
+                    entry["table"], frozenset(entry["instrument_ids"]), entry["start_ns"], entry["end_ns"]
+                ))
+            except (ValueError, KeyError, TypeError) as e:
+                logger.warning("Malformed write log line, treating everything as changed", error=str(e))
+                return None, (current[0], offset + len(complete))
+        return records, (current[0], offset + len(complete))
@@ -0,0 +1,427 @@
+"""
+COPY-based bulk load support for the TimescaleDB loaders.
+
+Rows are streamed into a session-local staging table with ``COPY ... FROM STDIN``
+and merged into the target hypertable with a single ``INSERT ... SELECT``. Each
+batch therefore costs a handful of round trips instead of one per row, while the
+loaders' ``ON CONFLICT`` clauses keep the exact same upsert semantics.
+
+Decoded DataFrames (see ``ingestion.api_adapters.dbn_frame``) can be loaded the
+same way without materializing row tuples: fixed-point prices and nanosecond
+timestamps are rendered column-wise and the frame is written as CSV.
+"""
+
+import io
+import time
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, List, Sequence
+
+import numpy as np
+import pandas as pd
+
+LOAD_METHOD_INSERT = "insert"
+LOAD_METHOD_COPY = "copy"
+LOAD_METHODS = (LOAD_METHOD_INSERT, LOAD_METHOD_COPY)
+
+# Column added to staging tables to remember COPY order for duplicate keys
+_SEQUENCE_COLUMN = "_copy_seq"
+
+# Fixed-point scale used by decoded Databento frames when attrs carry none
+DEFAULT_PRICE_SCALE = 1_000_000_000
+
+
+def validate_load_method(load_method: str) -> str:
+    """
+    Validate and normalize a loader load method name.
+
+    Args:
+        load_method: Either 'insert' (executemany) or 'copy' (COPY + merge)
+
+    Returns:
+        Normalized load method name
+
+    Raises:
+        ValueError: If the load method is not recognized
+    """
+    normalized = (load_method or LOAD_METHOD_INSERT).lower()
+    if normalized not in LOAD_METHODS:
+        raise ValueError(f"Unknown load method '{load_method}'. Use one of: {list(LOAD_METHODS)}")
+    return normalized
+
+
+def format_copy_value(value: Any) -> str:
+    """Render a Python value in PostgreSQL COPY text format."""
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    text = str(value)
+    return (
+        text.replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+        .replace("\x00", "")
+    )
+
+
+def rows_to_copy_buffer(rows: Iterable[Sequence[Any]]) -> io.StringIO:
+    """Serialize row tuples into an in-memory COPY text-format buffer."""
+    buffer = io.StringIO()
+    for row in rows:
+        buffer.write("\t".join(format_copy_value(value) for value in row))
+        buffer.write("\n")
+    buffer.seek(0)
+    return buffer
+
+
+def copy_upsert(
+    cursor,
+    table: str,
+    columns: List[str],
+    rows: List[Sequence[Any]],
+    conflict_columns: Sequence[str] = (),
+    conflict_clause: str = ""
+) -> int:
+    """
+    Bulk load rows through a staging table and merge them into ``table``.
+
+    When ``conflict_columns`` is given, only the last row per key (in COPY order)
+    is merged, matching what sequential per-row upserts would have left behind.
+
+    Args:
+        cursor: Open psycopg2 cursor (inside the caller's transaction)
+        table: Target table name
+        columns: Target column names, in the same order as each row tuple
+        rows: Row tuples to load
+        conflict_columns: Columns of the target's ON CONFLICT key, if any
+        conflict_clause: ``ON CONFLICT ...`` clause appended to the merge
+
+    Returns:
+        Number of rows loaded into the staging table
+    """
+    if not rows:
+        return 0
+
+    _stage_and_merge(
+        cursor, table, columns, rows_to_copy_buffer(rows), "",
+        conflict_columns, conflict_clause
+    )
+    return len(rows)
+
+
+# Statements one staging-table batch sends: CREATE, ALTER, TRUNCATE, COPY, INSERT
+COPY_BATCH_STATEMENTS = 5
+
+
+def _stage_and_merge(
+    cursor,
+    table: str,
+    columns: List[str],
+    buffer: io.StringIO,
+    copy_options: str,
+    conflict_columns: Sequence[str],
+    conflict_clause: str
+) -> None:
+    """COPY ``buffer`` into the session staging table and merge it into ``table``."""
+    staging_table = f"_stage_{table}"
+    column_list = ", ".join(columns)
+
+    cursor.execute(
+        f"CREATE TEMP TABLE IF NOT EXISTS {staging_table} ON COMMIT DROP AS "
+        f"SELECT {column_list} FROM {table} WITH NO DATA"
+    )
+    cursor.execute(f"ALTER TABLE {staging_table} ADD COLUMN IF NOT EXISTS {_SEQUENCE_COLUMN} BIGSERIAL")
+    cursor.execute(f"TRUNCATE {staging_table}")
+    cursor.copy_expert(f"COPY {staging_table} ({column_list}) FROM STDIN{copy_options}", buffer)
+
+    if conflict_columns:
+        key_list = ", ".join(conflict_columns)
+        select_sql = (
+            f"SELECT DISTINCT ON ({key_list}) {column_list} FROM {staging_table} "
+            f"ORDER BY {key_list}, {_SEQUENCE_COLUMN} DESC"
+        )
+    else:
+        select_sql = f"SELECT {column_list} FROM {staging_table} ORDER BY {_SEQUENCE_COLUMN}"
+
+    cursor.execute(f"INSERT INTO {table} ({column_list}) {select_sql} {conflict_clause}")
+
+
+def fixed_to_decimal_text(values: pd.Series, scale: int = DEFAULT_PRICE_SCALE) -> pd.Series:
+    """
+    Render fixed-point integer prices as exact decimal strings in bulk.
+
+    Integer and fractional parts are split with integer arithmetic, so no value
+    passes through a float. Missing values stay missing.
+
+    Args:
+        values: Fixed-point prices (int64 or nullable Int64)
+        scale: Fixed-point scale (1e9 for Databento prices)
+
+    Returns:
+        Object Series of decimal strings (e.g. '4500.250000000') or None
+    """
+    decimals = len(str(scale)) - 1
+    missing = values.isna().to_numpy()
+    raw = values.fillna(0).to_numpy(dtype=np.int64)
+    magnitude = np.abs(raw)
+    whole = (magnitude // scale).astype(str)
+    fraction = np.char.zfill((magnitude % scale).astype(str), decimals)
+    text = np.char.add(np.char.add(np.where(raw < 0, "-", ""), whole), np.char.add(".", fraction))
+    result = pd.Series(text, index=values.index, dtype=object)
+    result[missing] = None
+    return result
+
+
+def ns_to_timestamp_text(values: pd.Series) -> pd.Series:
+    """Render int64 epoch-nanosecond timestamps as UTC timestamptz literals in bulk."""
+    text = pd.to_datetime(values, unit="ns", utc=True).dt.strftime("%Y-%m-%d %H:%M:%S.%f+00")
+    return text.where(values.notna(), None)
+
+
+def frame_to_copy_buffer(frame: pd.DataFrame, columns: List[str]) -> io.StringIO:
+    """
+    Serialize a decoded frame into a CSV COPY buffer in ``columns`` order.
+
+    Price and timestamp columns named in ``frame.attrs`` are rendered in bulk;
+    columns absent from the frame are written as NULL.
+
+    Args:
+        frame: Decoded frame following the dbn_frame contract
+        columns: Target column order
+
+    Returns:
+        In-memory CSV buffer positioned at the start
+    """
+    price_columns = set(frame.attrs.get("price_columns", []))
+    timestamp_columns = set(frame.attrs.get("timestamp_columns", []))
+    scale = frame.attrs.get("price_scale", DEFAULT_PRICE_SCALE)
+
+    output = pd.DataFrame(index=frame.index)
+    for column in columns:
+        if column not in frame.columns:
+            output[column] = None
+        elif column in price_columns:
+            output[column] = fixed_to_decimal_text(frame[column], scale)
+        elif column in timestamp_columns:
+            output[column] = ns_to_timestamp_text(frame[column])
+        else:
+            output[column] = frame[column]
+
+    buffer = io.StringIO()
+    output.to_csv(buffer, header=False, index=False, na_rep="")
+    buffer.seek(0)
+    return buffer
+
+
+def copy_frame_upsert(
+    cursor,
+    table: str,
+    columns: List[str],
+    frame: pd.DataFrame,
+    conflict_columns: Sequence[str] = (),
+    conflict_clause: str = ""
+) -> int:
+    """
+    Bulk load a decoded frame through the staging table, like ``copy_upsert``.
+
+    Args:
+        cursor: Open psycopg2 cursor (inside the caller's transaction)
+        table: Target table name
+        columns: Target column names; frame columns are selected in this order
+        frame: Decoded frame following the dbn_frame contract
+        conflict_columns: Columns of the target's ON CONFLICT key, if any
+        conflict_clause: ``ON CONFLICT ...`` clause appended to the merge
+
+    Returns:
+        Number of rows loaded into the staging table
+    """
+    if frame.empty:
+        return 0
+
+    _stage_and_merge(
+        cursor, table, columns, frame_to_copy_buffer(frame, columns), " WITH (FORMAT csv)",
+        conflict_columns, conflict_clause
+    )
+    return len(frame)
+
+
+def finalize_load_stats(stats: Dict[str, Any], started_at: float, load_method: str) -> Dict[str, Any]:
+    """Add load method, duration and rows/s throughput to a loader stats dict."""
+    duration = time.perf_counter() - started_at
+    stats['load_method'] = load_method
+    stats['duration_seconds'] = round(duration, 6)
+    stats['rows_per_second'] = round(stats.get('inserted', 0) / duration, 2) if duration > 0 else 0.0
+    return stats
+
+
+class CopyLoadMixin:
+    """
+    Adds a selectable COPY load path to a Timescale loader.
+
+    Loaders using this mixin define ``TABLE_NAME``, ``_get_insert_columns()``,
+    ``_get_conflict_columns()`` and ``_build_conflict_clause()`` so the same
+    column order and upsert clause drive both the INSERT and COPY paths.
+    """
+
+    TABLE_NAME: str = ""
+    load_method: str = LOAD_METHOD_INSERT
+    # Columns the per-record path writes as float rather than Decimal
+    FLOAT_COLUMNS: List[str] = []
+
+    def _get_conflict_columns(self) -> List[str]:
+        """Columns of the target table's ON CONFLICT key (none by default)."""
+        return []
+
+    def _build_conflict_clause(self) -> str:
+        """ON CONFLICT clause shared by the INSERT and COPY paths (none by default)."""
+        return ""
+
+    def _on_rows_written(self, rows: Sequence[tuple]) -> None:
+        """Hook called with every batch of row tuples written (no-op by default)."""
+
+    def _on_frame_written(self, frame: pd.DataFrame) -> None:
+        """Hook called with every decoded frame batch written (no-op by default)."""
+
+    def _on_load_committed(self) -> None:
+        """Hook called after the batches written so far were committed (no-op by default)."""
+
+    def _resolve_load_method(self, load_method=None) -> str:
+        """Resolve a per-call override against the loader's configured method."""
+        return validate_load_method(load_method or self.load_method)
+
+    def _prepare_frame(self, frame: pd.DataFrame, data_source: str, **column_values: Any) -> pd.DataFrame:
+        """Add loader-level constant columns (data_source, granularity, ...) to a frame."""
+        return frame.assign(data_source=data_source, **column_values)
+
+    def insert_frame(
+        self,
+        frame: pd.DataFrame,
+        batch_size: int = 100_000,
+        data_source: str = 'databento',
+        **column_values: Any
+    ) -> Dict[str, Any]:
+        """
+        Load a decoded DataFrame directly with COPY, without per-row models.
+
+        Args:
+            frame: Decoded frame following the dbn_frame contract
+            batch_size: Rows per COPY batch
+            data_source: Source of the data (default: 'databento')
+            **column_values: Extra constant columns (e.g. granularity='1m')
+
+        Returns:
+            Dictionary with insertion statistics, including rows_per_second
+        """
+        started_at = time.perf_counter()
+        stats: Dict[str, Any] = {'inserted': 0, 'errors': 0, 'round_trips': 0}
+        if frame is None or frame.empty:
+            return finalize_load_stats(stats, started_at, LOAD_METHOD_COPY)
+
+        prepared = self._prepare_frame(frame, data_source, **column_values)
+        prepared.attrs = {**frame.attrs, **prepared.attrs}
+        columns = self._get_insert_columns()
+
+        with self.get_connection() as conn:
+            with conn.cursor() as cursor:
+                for start in range(0, len(prepared), batch_size):
+                    batch = prepared.iloc[start:start + batch_size]
+                    stats['inserted'] += copy_frame_upsert(
+                        cursor,
+                        self.TABLE_NAME,
+                        columns,
+                        batch,
+                        conflict_columns=self._get_conflict_columns(),
+                        conflict_clause=self._build_conflict_clause()
+                    )
+                    stats['round_trips'] += COPY_BATCH_STATEMENTS
+                    self._on_frame_written(batch)
+            conn.commit()
+            stats['round_trips'] += 1
+        self._on_load_committed()
+
+        return finalize_load_stats(stats, started_at, LOAD_METHOD_COPY)
+
+    def frame_to_rows(self, frame: pd.DataFrame, data_source: str = 'databento', **column_values: Any) -> List[tuple]:
+        """
+        Convert a frame of transformed records into row tuples in insert-column order.
+
+        Runs the same column preparation as ``insert_frame`` as whole-column
+        operations; columns the table expects but the frame lacks become NULL.
+
+        Args:
+            frame: Frame of transformed records (object columns keep Python values)
+            data_source: Source of the data (default: 'databento')
+            **column_values: Extra constant columns (e.g. granularity='1m')
+
+        Returns:
+            Row tuples ready for ``insert_rows``
+        """
+        prepared = self._prepare_frame(frame, data_source, **column_values)
+        selected = prepared.reindex(columns=self._get_insert_columns())
+        for column in self.FLOAT_COLUMNS:
+            if column in prepared.columns:
+                selected[column] = pd.to_numeric(selected[column], errors='coerce')
+        selected = selected.astype(object).where(selected.notna(), None)
+        return list(selected.itertuples(index=False, name=None))
+
+    def insert_rows(
+        self,
+        rows: List[tuple],
+        batch_size: int = 1000,
+        load_method=None
+    ) -> Dict[str, Any]:
+        """
+        Insert plain row tuples (in ``_get_insert_columns()`` order) without per-row models.
+
+        Args:
+            rows: Row tuples, e.g. from ``frame_to_rows``
+            batch_size: Number of rows to write per batch
+            load_method: Optional per-call override of the loader's load method
+
+        Returns:
+            Dictionary with insertion statistics, including rows_per_second
+        """
+        method = self._resolve_load_method(load_method)
+        started_at = time.perf_counter()
+        stats: Dict[str, Any] = {'inserted': 0, 'errors': 0, 'round_trips': 0}
+        if not rows:
+            return finalize_load_stats(stats, started_at, method)
+
+        insert_sql = self._build_insert_sql()
+        with self.get_connection() as conn:
+            with conn.cursor() as cursor:
+                for start in range(0, len(rows), batch_size):
+                    batch = rows[start:start + batch_size]
+                    stats['round_trips'] += self._write_batch(cursor, insert_sql, batch, method)
+                    stats['inserted'] += len(batch)
+            conn.commit()
+            stats['round_trips'] += 1
+        self._on_load_committed()
+
+        return finalize_load_stats(stats, started_at, method)
+
+    def _write_batch(self, cursor, insert_sql: str, batch_data: List[tuple], load_method: str) -> int:
+        """
+        Write one batch of row tuples with the selected load method.
+
+        Returns:
+            Number of statements sent to the server (executemany sends one per row)
+        """
+        if load_method == LOAD_METHOD_COPY:
+            copy_upsert(
+                cursor,
+                self.TABLE_NAME,
+                self._get_insert_columns(),
+                batch_data,
+                conflict_columns=self._get_conflict_columns(),
+                conflict_clause=self._build_conflict_clause()
+            )
+            statements = COPY_BATCH_STATEMENTS
+        else:
+            cursor.executemany(insert_sql, batch_data)
+            statements = len(batch_data)
+        self._on_rows_written(batch_data)
+        return statements
@@ -0,0 +1,317 @@
+"""
+Shared, persistent psycopg2 connection pool for the TimescaleDB loaders.
+
+Without a provider every loader call opens (and closes) its own
+``psycopg2.connect``; over hundreds of 1,000-row chunks the connection setup
+and TLS handshakes dominate. ``PooledConnectionProvider`` wraps a
+``ThreadedConnectionPool`` that all loaders (and ``QueryBuilder``) can share:
+
+- checkouts block up to ``checkout_timeout`` when ``max_size`` connections are
+  in use instead of failing immediately,
+- idle connections are pinged before reuse once they have been idle longer
+  than ``health_check_interval`` and replaced if the ping fails,
+- connections older than ``max_connection_age`` are recycled on checkout,
+- per-pool stats (checkouts, wait time, connection age, ...) are kept for
+  reporting.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+import psycopg2
+import psycopg2.extensions
+from psycopg2.pool import PoolError, ThreadedConnectionPool
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+
+class PooledConnectionProvider:
+    """
+    Thread-safe provider of pooled psycopg2 connections.
+
+    Use ``connection()`` as a context manager; the connection is returned to the
+    pool (rolled back if a transaction is still open) when the block exits.
+    Callers commit explicitly, exactly as with a fresh ``psycopg2.connect``.
+    """
+
+    def __init__(
+        self,
+        connection_params: Dict[str, Any],
+        min_size: int = 1,
+        max_size: int = 10,
+        checkout_timeout: float = 30.0,
+        health_check_interval: Optional[float] = 30.0,
+        max_connection_age: Optional[float] = None
+    ):
+        """
+        Initialize the provider. No connection is opened until ``warm_up`` or the first checkout.
+
+        Args:
+            connection_params: psycopg2.connect keyword arguments
+            min_size: Connections opened by ``warm_up``
+            max_size: Maximum number of open connections
+            checkout_timeout: Seconds to wait for a free connection before raising PoolError
+            health_check_interval: Ping connections idle longer than this many seconds
+                before reuse (None disables health checks, 0 pings on every checkout)
+            max_connection_age: Recycle connections older than this many seconds (None = never)
+
+        Raises:
+            ValueError: If the pool sizes are inconsistent
+        """
+        if max_size < 1 or not 0 <= min_size <= max_size:
+            raise ValueError(f"Invalid pool sizes: min_size={min_size}, max_size={max_size}")
+
+        self.connection_params = connection_params
+        self.min_size = min_size
+        self.max_size = max_size
+        self.checkout_timeout = checkout_timeout
+        self.health_check_interval = health_check_interval
+        self.max_connection_age = max_connection_age
+
+        self._pool = ThreadedConnectionPool(0, max_size, **connection_params)
+        # psycopg2 closes returned connections beyond minconn; keep every one idle instead
+        self._pool.minconn = max_size
+        self._slots = threading.BoundedSemaphore(max_size)
+        self._lock = threading.Lock()
+        # id(conn) -> (created_at, last_released_at) for open connections
+        self._connections: Dict[int, Tuple[float, float]] = {}
+        self._stats = {
+            'checkouts': 0,
+            'wait_seconds_total': 0.0,
+            'max_wait_seconds': 0.0,
+            'timeouts': 0,
+            'connections_created': 0,
+            'connections_recycled': 0,
+            'health_check_failures': 0,
+            'in_use': 0,
+        }
+
+    def warm_up(self, count: Optional[int] = None) -> int:
+        """
+        Open connections ahead of the first checkout.
+
+        Args:
+            count: Connections to have open afterwards (default: min_size, capped at max_size)
+
+        Returns:
+            Number of connections opened by this call
+        """
+        target = min(self.max_size, self.min_size if count is None else count)
+        with self._lock:
+            # Holding `target` connections at once forces any missing ones to be opened
+            to_hold = max(0, target - self._stats['in_use'])
+            created_before = self._stats['connections_created']
+
+        checked_out = []
+        try:
+            for _ in range(to_hold):
+                checked_out.append(self.checkout())
+        finally:
+            for conn in checked_out:
+                self.release(conn)
+
+        opened = self._stats['connections_created'] - created_before
+        logger.info("Connection pool warmed up", opened=opened, max_size=self.max_size)
+        return opened
+
+    @contextmanager
+    def connection(self) -> Iterator[psycopg2.extensions.connection]:
+        """
+        Check out a connection for the duration of the block.
+
+        Yields:
+            An open psycopg2 connection with no transaction in progress
+
+        Raises:
+            PoolError: If no connection became free within ``checkout_timeout``
+        """
+        conn = self.checkout()
+        try:
+            yield conn
+        except Exception as e:
+            logger.error("Database connection error", error=str(e))
+            if not conn.closed:
+                try:
+                    conn.rollback()
+                except psycopg2.Error:
+                    pass
+            raise
+        finally:
+            self.release(conn)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Snapshot of the pool's statistics.
+
+        Returns:
+            Dictionary with checkout counts, wait times and connection ages
+        """
+        now = time.monotonic()
+        with self._lock:
+            stats = dict(self._stats)
+            ages = [now - created_at for created_at, _ in self._connections.values()]
+
+        stats['open_connections'] = len(ages)
+        stats['idle'] = len(ages) - stats['in_use']
+        stats['max_size'] = self.max_size
+        stats['mean_wait_seconds'] = stats['wait_seconds_total'] / stats['checkouts'] if stats['checkouts'] else 0.0
+        stats['oldest_connection_age_seconds'] = max(ages) if ages else 0.0
+        stats['mean_connection_age_seconds'] = sum(ages) / len(ages) if ages else 0.0
+        return stats
+
+    def close(self) -> None:
+        """Close every connection; checked-out connections are closed when returned."""
+        with self._lock:
+            if self._pool.closed:
+                return
+            self._pool.closeall()
+            self._connections.clear()
+        logger.info("Connection pool closed", **{k: v for k, v in self._stats.items() if k != 'in_use'})
+
+    @property
+    def closed(self) -> bool:
+        """True once ``close`` has been called."""
+        return self._pool.closed
+
+    def checkout(self) -> psycopg2.extensions.connection:
+        """
+        Check out a connection; prefer ``connection()``, which always releases it.
+
+        Returns:
+            A healthy psycopg2 connection, which must be handed back with ``release``
+
+        Raises:
+            PoolError: If no connection became free within ``checkout_timeout``
+        """
+        started_at = time.perf_counter()
+        if not self._slots.acquire(timeout=self.checkout_timeout):
+            with self._lock:
+                self._stats['timeouts'] += 1
+            raise PoolError(f"Timed out after {self.checkout_timeout}s waiting for a pooled connection")
+        waited = time.perf_counter() - started_at
+
+        try:
+            conn = self._healthy_connection()
+        except Exception:
+            self._slots.release()
+            raise
+
+        with self._lock:
+            self._stats['checkouts'] += 1
+            self._stats['in_use'] += 1
+            self._stats['wait_seconds_total'] += waited
+            self._stats['max_wait_seconds'] = max(self._stats['max_wait_seconds'], waited)
+        return conn
+
+    def release(self, conn: psycopg2.extensions.connection) -> None:
+        """Return a checked-out connection to the pool in a clean state."""
+        try:
+            if self._pool.closed:
+                conn.close()
+                return
+
+            status = psycopg2.extensions.TRANSACTION_STATUS_UNKNOWN if conn.closed else conn.info.transaction_status
+            if status == psycopg2.extensions.TRANSACTION_STATUS_UNKNOWN:
+                self._discard(conn)
+                return
+            if status != psycopg2.extensions.TRANSACTION_STATUS_IDLE:
+                conn.rollback()
+            if conn.autocommit:
+                conn.autocommit = False
+
+            with self._lock:
+                created_at, _ = self._connections.get(id(conn), (time.monotonic(), None))
+                self._connections[id(conn)] = (created_at, time.monotonic())
+            self._pool.putconn(conn)
+        except psycopg2.Error as e:
+            logger.warning("Discarding pooled connection that could not be reset", error=str(e))
+            self._discard(conn)
+        finally:
+            with self._lock:
+                self._stats['in_use'] -= 1
+            self._slots.release()
+
+    def _healthy_connection(self) -> psycopg2.extensions.connection:
+        """Get a connection from the pool, replacing closed, stale or unhealthy ones."""
+        while True:
+            conn = self._pool.getconn()
+            now = time.monotonic()
+            with self._lock:
+                created_at, released_at = self._connections.get(id(conn), (None, None))
+                if created_at is None:
+                    self._connections[id(conn)] = (now, now)
+                    self._stats['connections_created'] += 1
+                    return conn
+
+            if conn.closed:
+                self._discard(conn)
+                continue
+            if self.max_connection_age is not None and now - created_at > self.max_connection_age:
+                with self._lock:
+                    self._stats['connections_recycled'] += 1
+                self._discard(conn)
+                continue
+            if self.health_check_interval is not None and now - released_at >= self.health_check_interval:
+                if not self._ping(conn):
+                    with self._lock:
+                        self._stats['health_check_failures'] += 1
+                    self._discard(conn)
+                    continue
+            return conn
+
+    @staticmethod
+    def _ping(conn: psycopg2.extensions.connection) -> bool:
+        """Run a trivial query to check that the server side of the connection is alive."""
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            conn.rollback()
+            return True
+        except psycopg2.Error as e:
+            logger.warning("Pooled connection failed health check", error=str(e))
+            return False
+
+    def _discard(self, conn: psycopg2.extensions.connection) -> None:
+        """Close a checked-out connection and forget it."""
+        with self._lock:
+            self._connections.pop(id(conn), None)
+        self._pool.putconn(conn, close=True)
+
+
+_shared_providers: Dict[Tuple, PooledConnectionProvider] = {}
+_shared_providers_lock = threading.Lock()
+
+
+def get_shared_connection_provider(connection_params: Dict[str, Any], **pool_options: Any) -> PooledConnectionProvider:
+    """
+    Return the process-wide provider for ``connection_params``, creating it on first use.
+
+    Loaders and query builders built from the same connection parameters share a
+    single pool this way; ``pool_options`` only apply when the pool is created.
+
+    Args:
+        connection_params: psycopg2.connect keyword arguments
+        **pool_options: PooledConnectionProvider options (min_size, max_size, ...)
+
+    Returns:
+        The shared PooledConnectionProvider
+    """
+    key = tuple(sorted((name, str(value)) for name, value in connection_params.items()))
+    with _shared_providers_lock:
+        provider = _shared_providers.get(key)
+        if provider is None or provider.closed:
+            provider = PooledConnectionProvider(connection_params, **pool_options)
+            _shared_providers[key] = provider
+        return provider
+
+
+def close_shared_connection_providers() -> None:
+    """Close and forget every shared provider (e.g. at shutdown or between pipeline runs)."""
+    with _shared_providers_lock:
+        providers = list(_shared_providers.values())
+        _shared_providers.clear()
+    for provider in providers:
+        provider.close()
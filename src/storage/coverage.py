@@ -0,0 +1,205 @@
+"""
+Per-day ingestion coverage catalog maintained by the loaders.
+
+Loaders mixing in ``CoverageMixin`` remember which instruments and which time
+window every written batch touched. ``refresh_coverage`` then recomputes just
+those (schema, symbol, instrument_id, day) entries of ``ingestion_coverage``
+from the hypertable with one aggregate upsert: row count, first/last
+``ts_event`` and an order-independent content hash of the day's rows.
+
+Because entries are recomputed from what is actually stored, re-loading a day
+(upserts) leaves its row count right and only changes its hash when the stored
+content changed.
+
+Each commit also appends the instruments and ``ts_event`` range it wrote to the
+storage write log, which the QueryBuilder result caches follow to invalidate
+exactly the affected results.
+"""
+
+import threading
+from datetime import timedelta
+from pathlib import Path
+from typing import Any, List, Optional, Sequence, Set
+
+import pandas as pd
+import structlog
+
+from src.querying.write_log import WriteLog
+
+logger = structlog.get_logger(__name__)
+
+COVERAGE_TABLE = "ingestion_coverage"
+
+_SCHEMA_SQL_PATH = Path(__file__).parent / "schema_definitions" / "ingestion_coverage_table.sql"
+
+# Guards the lazy creation of each loader's tracking state
+_STATE_LOCK = threading.Lock()
+
+
+class CoverageMixin:
+    """
+    Keeps ``ingestion_coverage`` up to date for a Timescale loader.
+
+    Must precede ``CopyLoadMixin`` in the loader's bases so its write hooks
+    take effect. Loaders set ``COVERAGE_SCHEMA`` to a SQL expression naming the
+    Databento schema of a row and, if needed, ``COVERAGE_SYMBOL_COLUMN``.
+    """
+
+    TABLE_NAME: str = ""
+    COVERAGE_SCHEMA: str = "''"
+    COVERAGE_SYMBOL_COLUMN: str = "symbol"
+    # Columns left out of the content hash because upserts touch them without changing data
+    COVERAGE_VOLATILE_COLUMNS = frozenset({"created_at", "updated_at"})
+
+    _coverage_lock: Optional[threading.Lock] = None
+    _coverage_table_ready: bool = False
+    # Log the committed write ranges are published to (None: the shared storage write log)
+    write_log: Optional[WriteLog] = None
+
+    def _coverage_state(self) -> threading.Lock:
+        """Lazily create the per-loader tracking state (loaders keep their own __init__)."""
+        with _STATE_LOCK:
+            if self._coverage_lock is None:
+                self._coverage_instruments: Set[int] = set()
+                self._coverage_min_ts: Optional[pd.Timestamp] = None
+                self._coverage_max_ts: Optional[pd.Timestamp] = None
+                # Written but not yet published to the write log
+                self._pending_instruments: Set[int] = set()
+                self._pending_min_ts: Optional[pd.Timestamp] = None
+                self._pending_max_ts: Optional[pd.Timestamp] = None
+                self._coverage_lock = threading.Lock()
+        return self._coverage_lock
+
+    def _on_rows_written(self, rows: Sequence[tuple]) -> None:
+        """Track instruments and event times of a written batch of row tuples."""
+        if not rows:
+            return
+        columns = self._get_insert_columns()
+        instrument_index = columns.index("instrument_id")
+        ts_index = columns.index("ts_event")
+        timestamps = pd.to_datetime(pd.Series([row[ts_index] for row in rows]), utc=True, errors="coerce")
+        self._track_coverage({row[instrument_index] for row in rows}, timestamps)
+
+    def _on_frame_written(self, frame: pd.DataFrame) -> None:
+        """Track instruments and event times of a written decoded frame."""
+        if frame.empty or "instrument_id" not in frame.columns or "ts_event" not in frame.columns:
+            return
+        ts_event = frame["ts_event"]
+        if "ts_event" in frame.attrs.get("timestamp_columns", []):
+            timestamps = pd.to_datetime(ts_event, unit="ns", utc=True)
+        else:
+            timestamps = pd.to_datetime(ts_event, utc=True, errors="coerce")
+        self._track_coverage(set(frame["instrument_id"].dropna().unique()), timestamps)
+
+    def _track_coverage(self, instrument_ids: Set[Any], timestamps: pd.Series) -> None:
+        """Merge a batch into the pending coverage window."""
+        batch_min, batch_max = timestamps.min(), timestamps.max()
+        if pd.isna(batch_min):
+            return
+        ids = {int(instrument_id) for instrument_id in instrument_ids if instrument_id is not None}
+        with self._coverage_state():
+            self._coverage_instruments.update(ids)
+            if self._coverage_min_ts is None or batch_min < self._coverage_min_ts:
+                self._coverage_min_ts = batch_min
+            if self._coverage_max_ts is None or batch_max > self._coverage_max_ts:
+                self._coverage_max_ts = batch_max
+
+            self._pending_instruments.update(ids)
+            if self._pending_min_ts is None or batch_min < self._pending_min_ts:
+                self._pending_min_ts = batch_min
+            if self._pending_max_ts is None or batch_max > self._pending_max_ts:
+                self._pending_max_ts = batch_max
+
+    def _on_load_committed(self) -> None:
+        """Publish the instruments and time range committed since the last call to the write log."""
+        with self._coverage_state():
+            instrument_ids = sorted(self._pending_instruments)
+            min_ts, max_ts = self._pending_min_ts, self._pending_max_ts
+            self._pending_instruments = set()
+            self._pending_min_ts = self._pending_max_ts = None
+
+        if min_ts is None:
+            return
+        try:
+            (self.write_log or WriteLog()).append(self.TABLE_NAME, instrument_ids, min_ts.value, max_ts.value)
+        except OSError as e:
+            # Query result caches cannot see this write; they must be cleared by hand
+            logger.error("Failed to publish write to the write log", table=self.TABLE_NAME, error=str(e))
+
+    def create_coverage_table_if_not_exists(self) -> None:
+        """Create the ``ingestion_coverage`` table and its index if missing."""
+        with self.get_connection() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute(_SCHEMA_SQL_PATH.read_text(encoding="utf-8"))
+            conn.commit()
+        self._coverage_table_ready = True
+
+    def _build_coverage_sql(self) -> str:
+        """Aggregate upsert recomputing coverage entries of the tracked window."""
+        hashed_columns = ", ".join(
+            column for column in self._get_insert_columns() if column not in self.COVERAGE_VOLATILE_COLUMNS
+        )
+        return f"""
+            INSERT INTO {COVERAGE_TABLE} (
+                schema, symbol, instrument_id, day, row_count,
+                min_ts_event, max_ts_event, content_hash, updated_at
+            )
+            SELECT schema, symbol, instrument_id, day, COUNT(*),
+                   MIN(ts_event), MAX(ts_event),
+                   md5(string_agg(row_hash, '' ORDER BY row_hash)), NOW()
+            FROM (
+                SELECT {self.COVERAGE_SCHEMA} AS schema,
+                       COALESCE({self.COVERAGE_SYMBOL_COLUMN}, '') AS symbol,
+                       instrument_id,
+                       (ts_event AT TIME ZONE 'UTC')::date AS day,
+                       ts_event,
+                       md5(ROW({hashed_columns})::text) AS row_hash
+                FROM {self.TABLE_NAME}
+                WHERE instrument_id = ANY(%s) AND ts_event >= %s AND ts_event < %s
+            ) hashed
+            GROUP BY schema, symbol, instrument_id, day
+            ON CONFLICT (schema, symbol, instrument_id, day) DO UPDATE SET
+                row_count = EXCLUDED.row_count,
+                min_ts_event = EXCLUDED.min_ts_event,
+                max_ts_event = EXCLUDED.max_ts_event,
+                content_hash = EXCLUDED.content_hash,
+                updated_at = EXCLUDED.updated_at
+        """
+
+    def refresh_coverage(self) -> int:
+        """
+        Recompute the coverage entries of every day touched since the last refresh.
+
+        Returns:
+            Number of coverage entries written (0 if nothing was loaded)
+        """
+        with self._coverage_state():
+            instrument_ids: List[int] = sorted(self._coverage_instruments)
+            min_ts, max_ts = self._coverage_min_ts, self._coverage_max_ts
+            self._coverage_instruments = set()
+            self._coverage_min_ts = self._coverage_max_ts = None
+
+        if not instrument_ids or min_ts is None:
+            return 0
+
+        if not self._coverage_table_ready:
+            self.create_coverage_table_if_not_exists()
+
+        # Whole UTC days, so a day's entry always covers all of its rows
+        start = min_ts.normalize().to_pydatetime()
+        end = (max_ts.normalize() + timedelta(days=1)).to_pydatetime()
+        with self.get_connection() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute(self._build_coverage_sql(), (instrument_ids, start, end))
+                entries = cursor.rowcount
+            conn.commit()
+
+        logger.info(
+            "Ingestion coverage refreshed",
+            table=self.TABLE_NAME,
+            instruments=len(instrument_ids),
+            start=start.date().isoformat(),
+            end=end.date().isoformat(),
+            entries=entries
+        )
+        return entries
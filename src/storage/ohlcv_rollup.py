@@ -0,0 +1,311 @@
+"""
+Local rollup of stored OHLCV bars into coarser granularities.
+
+Databento only serves 1s, 1m, 1h and 1d bars, and each granularity fetched is
+another API bill. Coarser bars are fully determined by finer ones, so the OHLCV
+loader can build them itself with one aggregate upsert per window:
+
+- open/close are the first/last fine open/close by ``ts_event``,
+- high/low are the max/min, volume and trade count the sums,
+- vwap is the volume-weighted vwap of the fine bars (NULL if any is missing).
+
+Rollup rows keep the ``data_source`` of the bars they were built from, so they
+land on the same upsert key as bars of that granularity fetched from the API.
+
+Loaders configured with ``rollups`` (e.g. ``{"1m": ["5m"], "5m": ["15m"]}``)
+remember the window of every committed source batch and re-aggregate just the
+affected target buckets after the commit, so derived bars follow new fine bars
+incrementally. Timescale continuous aggregates are not used because they cannot
+write back into ``daily_ohlcv_data`` itself.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set
+
+import pandas as pd
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+# Bar widths the rollup can produce or consume, in seconds
+GRANULARITY_SECONDS: Dict[str, int] = {
+    '1s': 1,
+    '1m': 60,
+    '5m': 300,
+    '15m': 900,
+    '1h': 3600,
+    '1d': 86400,
+}
+
+
+def validate_rollup(source: str, target: str) -> None:
+    """
+    Check that ``target`` bars can be built from ``source`` bars.
+
+    Args:
+        source: Granularity of the stored bars (e.g. '1m')
+        target: Granularity to derive (e.g. '15m')
+
+    Raises:
+        ValueError: If a granularity is unknown or target is not a coarser multiple of source
+    """
+    for granularity in (source, target):
+        if granularity not in GRANULARITY_SECONDS:
+            raise ValueError(
+                f"Unsupported OHLCV granularity '{granularity}'; expected one of {sorted(GRANULARITY_SECONDS)}"
+            )
+    source_seconds, target_seconds = GRANULARITY_SECONDS[source], GRANULARITY_SECONDS[target]
+    if target_seconds <= source_seconds or target_seconds % source_seconds:
+        raise ValueError(f"Cannot derive {target} bars from {source} bars")
+
+
+def validate_rollups(rollups: Optional[Dict[str, Iterable[str]]]) -> Dict[str, List[str]]:
+    """
+    Validate a rollup configuration.
+
+    Args:
+        rollups: Mapping of source granularity to the granularities derived from it
+
+    Returns:
+        Normalized mapping of source granularity to a list of targets
+
+    Raises:
+        ValueError: If any source/target pair is invalid
+    """
+    normalized: Dict[str, List[str]] = {}
+    for source, targets in (rollups or {}).items():
+        targets = [targets] if isinstance(targets, str) else list(targets)
+        for target in targets:
+            validate_rollup(source, target)
+        normalized[source] = targets
+    return normalized
+
+
+def _utc(value: Any) -> pd.Timestamp:
+    """Timestamp of a date, datetime or ISO string; naive values are UTC."""
+    timestamp = pd.Timestamp(value)
+    return timestamp.tz_localize("UTC") if timestamp.tzinfo is None else timestamp.tz_convert("UTC")
+
+
+class RollupMixin:
+    """
+    Derives coarser OHLCV bars from finer ones stored by the OHLCV loader.
+
+    Must precede ``CoverageMixin`` in the loader's bases: it extends the write
+    hooks to remember committed source bars, and relies on the coverage
+    tracking to catalogue and publish the bars it writes.
+    """
+
+    TABLE_NAME: str = ""
+
+    # Source granularity -> granularities refreshed after each committed load
+    rollups: Dict[str, List[str]] = {}
+
+    _rollup_pending: Optional[Dict[str, Dict[str, Any]]] = None
+
+    def _build_rollup_sql(self, instrument_filter: bool, symbol_filter: bool) -> str:
+        """Aggregate upsert of one target granularity from one source granularity."""
+        filters = ""
+        if instrument_filter:
+            filters += " AND instrument_id = ANY(%(instrument_ids)s)"
+        if symbol_filter:
+            filters += " AND symbol = ANY(%(symbols)s)"
+        return f"""
+            WITH written AS (
+                INSERT INTO {self.TABLE_NAME} (
+                    ts_event, ts_recv, instrument_id, symbol,
+                    open_price, high_price, low_price, close_price, volume,
+                    trade_count, vwap, granularity, data_source,
+                    rtype, publisher_id
+                )
+                SELECT time_bucket(%(bucket)s::interval, ts_event) AS bucket,
+                       MAX(ts_recv),
+                       instrument_id,
+                       last(symbol, ts_event),
+                       first(open_price, ts_event),
+                       MAX(high_price),
+                       MIN(low_price),
+                       last(close_price, ts_event),
+                       SUM(volume),
+                       CASE WHEN COUNT(trade_count) = COUNT(*) THEN SUM(trade_count) END,
+                       CASE WHEN COUNT(vwap) = COUNT(*) AND SUM(volume) > 0 THEN
+                           LEAST(GREATEST(SUM(vwap * volume) / SUM(volume), MIN(low_price)), MAX(high_price))
+                       END,
+                       %(target)s,
+                       data_source,
+                       NULL,
+                       last(publisher_id, ts_event)
+                FROM {self.TABLE_NAME}
+                WHERE granularity = %(source)s AND ts_event >= %(start)s AND ts_event < %(end)s{filters}
+                GROUP BY bucket, instrument_id, data_source
+                {self._build_conflict_clause()}
+                RETURNING instrument_id, ts_event
+            )
+            SELECT instrument_id, MIN(ts_event), MAX(ts_event), COUNT(*)
+            FROM written
+            GROUP BY instrument_id
+        """
+
+    def rollup(
+        self,
+        source: str,
+        target: str,
+        start: Any,
+        end: Any,
+        instrument_ids: Optional[Iterable[int]] = None,
+        symbols: Optional[Iterable[str]] = None
+    ) -> int:
+        """
+        Build ``target`` bars from the stored ``source`` bars of a time window.
+
+        The window is widened to whole target buckets, so every bucket it
+        touches is recomputed from all of its stored source bars.
+
+        Args:
+            source: Granularity of the stored bars (e.g. '1m')
+            target: Granularity to derive (e.g. '1h')
+            start: Inclusive window start (date, datetime or ISO string; naive = UTC)
+            end: Exclusive window end (date, datetime or ISO string; naive = UTC)
+            instrument_ids: Only roll up these instruments
+            symbols: Only roll up these symbols
+
+        Returns:
+            Number of target bars written
+
+        Raises:
+            ValueError: If target bars cannot be derived from source bars
+        """
+        validate_rollup(source, target)
+        bucket_seconds = GRANULARITY_SECONDS[target]
+        frequency = f"{bucket_seconds}s"
+        window_start = _utc(start).floor(frequency)
+        window_end = _utc(end).ceil(frequency)
+        if window_start >= window_end:
+            return 0
+
+        params: Dict[str, Any] = {
+            'bucket': f"{bucket_seconds} seconds",
+            'target': target,
+            'source': source,
+            'start': window_start.to_pydatetime(),
+            'end': window_end.to_pydatetime(),
+        }
+        if instrument_ids is not None:
+            params['instrument_ids'] = sorted(int(instrument_id) for instrument_id in instrument_ids)
+        if symbols is not None:
+            params['symbols'] = list(symbols)
+
+        sql = self._build_rollup_sql(instrument_ids is not None, symbols is not None)
+        with self.get_connection() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute(sql, params)
+                written = cursor.fetchall()
+            conn.commit()
+
+        bars = sum(count for _, _, _, count in written)
+        if written:
+            ids = {instrument_id for instrument_id, _, _, _ in written}
+            timestamps = pd.to_datetime(
+                pd.Series([ts for _, first, last, _ in written for ts in (first, last)]), utc=True
+            )
+            self._track_coverage(ids, timestamps)
+            if target in self.rollups:
+                self._track_rollup_source(target, ids, timestamps)
+            # Publish the derived bars without triggering another refresh
+            super()._on_load_committed()
+
+        logger.info(
+            "OHLCV bars rolled up",
+            source=source,
+            target=target,
+            start=window_start.isoformat(),
+            end=window_end.isoformat(),
+            instruments=len(written),
+            bars=bars
+        )
+        return bars
+
+    def _track_rollup_source(self, granularity: str, instrument_ids: Set[Any], timestamps: pd.Series) -> None:
+        """Merge a batch of ``granularity`` bars into the window awaiting rollup."""
+        batch_min, batch_max = timestamps.min(), timestamps.max()
+        if pd.isna(batch_min):
+            return
+        ids = {int(instrument_id) for instrument_id in instrument_ids if instrument_id is not None}
+        with self._coverage_state():
+            if self._rollup_pending is None:
+                self._rollup_pending = {}
+            pending = self._rollup_pending.setdefault(
+                granularity, {'instrument_ids': set(), 'min_ts': batch_min, 'max_ts': batch_max}
+            )
+            pending['instrument_ids'].update(ids)
+            pending['min_ts'] = min(pending['min_ts'], batch_min)
+            pending['max_ts'] = max(pending['max_ts'], batch_max)
+
+    def _on_rows_written(self, rows: Sequence[tuple]) -> None:
+        """Also remember written rows of rollup source granularities."""
+        super()._on_rows_written(rows)
+        if not rows or not self.rollups:
+            return
+        columns = self._get_insert_columns()
+        granularity_index = columns.index('granularity')
+        instrument_index = columns.index('instrument_id')
+        ts_index = columns.index('ts_event')
+        for granularity in {row[granularity_index] for row in rows} & set(self.rollups):
+            source_rows = [row for row in rows if row[granularity_index] == granularity]
+            timestamps = pd.to_datetime(
+                pd.Series([row[ts_index] for row in source_rows]), utc=True, errors="coerce"
+            )
+            self._track_rollup_source(granularity, {row[instrument_index] for row in source_rows}, timestamps)
+
+    def _on_frame_written(self, frame: pd.DataFrame) -> None:
+        """Also remember written frame rows of rollup source granularities."""
+        super()._on_frame_written(frame)
+        if frame.empty or not self.rollups or 'granularity' not in frame.columns:
+            return
+        for granularity, source_frame in frame.groupby('granularity'):
+            if granularity not in self.rollups:
+                continue
+            ts_event = source_frame['ts_event']
+            if 'ts_event' in frame.attrs.get('timestamp_columns', []):
+                timestamps = pd.to_datetime(ts_event, unit='ns', utc=True)
+            else:
+                timestamps = pd.to_datetime(ts_event, utc=True, errors='coerce')
+            self._track_rollup_source(
+                granularity, set(source_frame['instrument_id'].dropna().unique()), timestamps
+            )
+
+    def _on_load_committed(self) -> None:
+        """Publish the committed write, then refresh the bars derived from it."""
+        super()._on_load_committed()
+        if not self.rollups:
+            return
+        try:
+            self.refresh_rollups()
+        except Exception as e:
+            # The source bars are stored; the derived ones can be rebuilt with rollup() or a derive_from job
+            logger.warning("Failed to refresh OHLCV rollups", table=self.TABLE_NAME, error=str(e))
+
+    def refresh_rollups(self) -> int:
+        """
+        Re-aggregate every derived bucket touched by source bars committed since the last refresh.
+
+        Sources are processed finest first, so chained rollups (1m -> 5m -> 15m)
+        see the bars derived in the same refresh.
+
+        Returns:
+            Number of derived bars written
+        """
+        bars = 0
+        while True:
+            with self._coverage_state():
+                pending = self._rollup_pending or {}
+                if not pending:
+                    return bars
+                source = min(pending, key=GRANULARITY_SECONDS.__getitem__)
+                window = pending.pop(source)
+
+            # The last source bar covers [max_ts, max_ts + its width)
+            end = window['max_ts'] + pd.Timedelta(seconds=GRANULARITY_SECONDS[source])
+            for target in self.rollups.get(source, []):
+                bars += self.rollup(
+                    source, target, window['min_ts'], end, instrument_ids=window['instrument_ids']
+                )
@@ -0,0 +1,29 @@
+-- ================================================================================================
+-- Ingestion Coverage Catalog
+-- ================================================================================================
+-- One row per (schema, symbol, instrument_id, UTC day) stored in the market data hypertables,
+-- maintained by the storage loaders after every load. Coverage, gap and row-count questions
+-- are answered from this small table instead of scanning the hypertables.
+--
+-- Component: Storage catalog for coverage reporting (QueryBuilder, `status --coverage`)
+-- ================================================================================================
+
+CREATE TABLE IF NOT EXISTS ingestion_coverage (
+    schema TEXT NOT NULL,                    -- Databento schema (e.g. 'ohlcv-1d', 'trades')
+    symbol TEXT NOT NULL,                    -- Stored symbol ('' when the rows carry none)
+    instrument_id INTEGER NOT NULL,          -- Databento numeric instrument ID
+    day DATE NOT NULL,                       -- UTC day of ts_event
+    row_count BIGINT NOT NULL,               -- Rows stored for the day
+    min_ts_event TIMESTAMPTZ NOT NULL,       -- First event of the day
+    max_ts_event TIMESTAMPTZ NOT NULL,       -- Last event of the day
+    content_hash TEXT NOT NULL,              -- Order-independent hash of the day's stored rows
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+
+    CONSTRAINT pk_ingestion_coverage PRIMARY KEY (schema, symbol, instrument_id, day)
+);
+
+-- Per-symbol coverage lookups
+CREATE INDEX IF NOT EXISTS idx_ingestion_coverage_symbol_day ON ingestion_coverage (symbol, schema, day);
+
+COMMENT ON TABLE ingestion_coverage IS 'Per-day coverage catalog of the market data hypertables, maintained by the loaders';
+COMMENT ON COLUMN ingestion_coverage.content_hash IS 'md5 over the sorted md5 row hashes of the day; changes whenever stored content changes';
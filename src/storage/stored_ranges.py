@@ -0,0 +1,57 @@
+"""
+Lookup of the days already stored per symbol, for incremental ingestion.
+
+Loaders mixing in ``StoredRangeMixin`` can report, for a set of symbols and a
+time window, which UTC days already hold rows. The orchestrator turns this
+into the date ranges still missing so that only those are fetched again.
+"""
+
+from datetime import date
+from typing import Any, Dict, Iterable, Set
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+
+class StoredRangeMixin:
+    """Adds ``get_stored_days`` to a Timescale loader with ``symbol`` and ``ts_event`` columns."""
+
+    TABLE_NAME: str = ""
+
+    def get_stored_days(self, symbols: Iterable[str], start: Any, end: Any, **filters: Any) -> Dict[str, Set[date]]:
+        """
+        Find the UTC days with stored rows for each symbol.
+
+        Args:
+            symbols: Symbols as stored in the table's ``symbol`` column
+            start: Inclusive window start (date, datetime or ISO string)
+            end: Exclusive window end (date, datetime or ISO string)
+            **filters: Extra equality filters on trusted column names (e.g. granularity='1d')
+
+        Returns:
+            Mapping of symbol to the set of days holding at least one row;
+            symbols without rows are absent
+        """
+        conditions = "".join(f" AND {column} = %s" for column in filters)
+        sql = (
+            f"SELECT symbol, (ts_event AT TIME ZONE 'UTC')::date AS day FROM {self.TABLE_NAME} "
+            f"WHERE symbol = ANY(%s) AND ts_event >= %s AND ts_event < %s{conditions} "
+            f"GROUP BY symbol, day"
+        )
+        params = [list(symbols), start, end, *filters.values()]
+
+        stored: Dict[str, Set[date]] = {}
+        with self.get_connection() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute(sql, params)
+                for symbol, day in cursor.fetchall():
+                    stored.setdefault(symbol, set()).add(day)
+
+        logger.debug(
+            "Stored days looked up",
+            table=self.TABLE_NAME,
+            symbols=len(params[0]),
+            days=sum(len(days) for days in stored.values())
+        )
+        return stored
@@ -6,6 +6,7 @@ into TimescaleDB with proper schema management and error handling.
 """
 
 import structlog
+import time
 from contextlib import contextmanager
 from typing import Dict, Any, List, Optional
 from datetime import datetime
@@ -14,12 +15,15 @@ from psycopg2.extras import RealDictCursor
 from psycopg2 import sql
 import os
 
+from src.storage.coverage import CoverageMixin
+from src.storage.bulk_copy import CopyLoadMixin, LOAD_METHOD_INSERT, finalize_load_stats, validate_load_method
 from src.storage.models import DatabentoDefinitionRecord
+from src.querying.symbol_cache import invalidate_shared_symbol_caches
 
 logger = structlog.get_logger(__name__)
 
 
-class TimescaleDefinitionLoader:
+class TimescaleDefinitionLoader(CoverageMixin, CopyLoadMixin):
     """
     Loader for Databento definition records into TimescaleDB.
 
@@ -27,14 +31,28 @@ class TimescaleDefinitionLoader:
     with proper type conversion and error handling.
     """
 
-    def __init__(self, connection_params: Optional[Dict[str, Any]] = None):
+    TABLE_NAME = 'definitions_data'
+    COVERAGE_SCHEMA = "'definition'"
+    COVERAGE_SYMBOL_COLUMN = 'raw_symbol'
+
+    def __init__(
+        self,
+        connection_params: Optional[Dict[str, Any]] = None,
+        load_method: str = LOAD_METHOD_INSERT,
+        connection_provider=None
+    ):
         """
         Initialize the TimescaleDB loader.
 
         Args:
             connection_params: Database connection parameters, if None uses environment
+            load_method: 'insert' for per-row executemany or 'copy' for COPY FROM STDIN + merge
+            connection_provider: Optional shared PooledConnectionProvider; when set,
+                connections are checked out from its pool instead of opened per call
         """
         self.connection_params = connection_params or self._get_connection_params()
+        self.load_method = validate_load_method(load_method)
+        self.connection_provider = connection_provider
 
     def _get_connection_params(self) -> Dict[str, Any]:
         """Get database connection parameters from environment variables."""
@@ -48,7 +66,12 @@ class TimescaleDefinitionLoader:
 
     @contextmanager
     def get_connection(self):
-        """Get a database connection with proper cleanup."""
+        """Get a database connection with proper cleanup (pooled when a connection provider is set)."""
+        if self.connection_provider is not None:
+            with self.connection_provider.connection() as conn:
+                yield conn
+            return
+
         connection = None
         try:
             connection = psycopg2.connect(**self.connection_params)
@@ -110,23 +133,28 @@ class TimescaleDefinitionLoader:
     def insert_definition_records(
         self,
         records: List[DatabentoDefinitionRecord],
-        batch_size: int = 1000
-    ) -> Dict[str, int]:
+        batch_size: int = 1000,
+        load_method: Optional[str] = None
+    ) -> Dict[str, Any]:
         """
         Insert definition records into the definitions_data table.
 
         Args:
             records: List of validated DatabentoDefinitionRecord instances
             batch_size: Number of records to insert in each batch
+            load_method: Optional per-call override of the loader's load method
 
         Returns:
-            Dict with statistics: {'inserted': int, 'errors': int}
+            Dict with statistics: {'inserted': int, 'errors': int, 'rows_per_second': float, ...}
         """
+        method = self._resolve_load_method(load_method)
+        started_at = time.perf_counter()
+
         if not records:
-            return {'inserted': 0, 'errors': 0}
+            return finalize_load_stats({'inserted': 0, 'errors': 0}, started_at, method)
 
         insert_sql = self._build_insert_sql()
-        stats = {'inserted': 0, 'errors': 0}
+        stats = {'inserted': 0, 'errors': 0, 'round_trips': 0}
 
         try:
             with self.get_connection() as conn:
@@ -146,22 +174,24 @@ class TimescaleDefinitionLoader:
                                 continue
 
                         if batch_data:
-                            cursor.executemany(insert_sql, batch_data)
+                            stats['round_trips'] += self._write_batch(cursor, insert_sql, batch_data, method)
                             stats['inserted'] += len(batch_data)
-                            logger.info(f"Inserted batch of {len(batch_data)} records")
+                            logger.info(f"Inserted batch of {len(batch_data)} records", load_method=method)
 
                 conn.commit()
+                stats['round_trips'] += 1
+                self._on_load_committed()
                 logger.info(f"Successfully inserted {stats['inserted']} definition records")
 
         except Exception as e:
             logger.error(f"Failed to insert definition records: {e}")
             stats['errors'] += len(records) - stats['inserted']
 
-        return stats
+        return finalize_load_stats(stats, started_at, method)
 
-    def _build_insert_sql(self) -> str:
-        """Build the INSERT SQL statement for definition records."""
-        columns = [
+    def _get_insert_columns(self) -> List[str]:
+        """Column order shared by the INSERT statement and _record_to_tuple."""
+        return [
             'ts_event', 'ts_recv', 'rtype', 'publisher_id', 'instrument_id',
             'raw_symbol', 'security_update_action', 'instrument_class',
             'min_price_increment', 'display_factor', 'expiration', 'activation',
@@ -187,12 +217,26 @@ class TimescaleDefinitionLoader:
             'leg_underlying_id'
         ]
 
+    def _get_conflict_columns(self) -> List[str]:
+        """Columns of the definitions_data upsert key."""
+        return ['instrument_id', 'ts_event']
+
+    def _build_insert_sql(self) -> str:
+        """Build the INSERT SQL statement for definition records."""
+        columns = self._get_insert_columns()
+
         placeholders = ', '.join(['%s'] * len(columns))
         column_list = ', '.join(columns)
 
         return f"""
             INSERT INTO definitions_data ({column_list})
             VALUES ({placeholders})
+            {self._build_conflict_clause()}
+        """
+
+    def _build_conflict_clause(self) -> str:
+        """Build the ON CONFLICT clause shared by the INSERT and COPY paths."""
+        return """
             ON CONFLICT (instrument_id, ts_event)
             DO UPDATE SET
                 updated_at = NOW(),
@@ -339,6 +383,11 @@ class TimescaleDefinitionLoader:
             record.leg_underlying_id
         )
 
+    def _on_load_committed(self) -> None:
+        """Publish the committed write, then drop the symbol caches so queries resolve the new definitions."""
+        super()._on_load_committed()
+        invalidate_shared_symbol_caches()
+
     def get_definition_records(
         self,
         asset: Optional[str] = None,
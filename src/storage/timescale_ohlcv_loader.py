@@ -7,6 +7,7 @@ of OHLCV data.
 """
 
 import os
+import time
 from contextlib import contextmanager
 from typing import Dict, Any, List, Optional
 
@@ -15,13 +16,17 @@ import psycopg2.errors
 from psycopg2.extras import RealDictCursor
 import structlog
 
-from storage.models import DatabentoOHLCVRecord
+from src.storage.bulk_copy import CopyLoadMixin, LOAD_METHOD_INSERT, finalize_load_stats, validate_load_method
+from src.storage.stored_ranges import StoredRangeMixin
+from src.storage.coverage import CoverageMixin
+from src.storage.ohlcv_rollup import RollupMixin, validate_rollups
+from src.storage.models import DatabentoOHLCVRecord
 from utils.custom_logger import get_logger
 
 logger = get_logger(__name__)
 
 
-class TimescaleOHLCVLoader:
+class TimescaleOHLCVLoader(RollupMixin, CoverageMixin, CopyLoadMixin, StoredRangeMixin):
     """
     Loader for OHLCV data into TimescaleDB.
 
@@ -29,14 +34,34 @@ class TimescaleOHLCVLoader:
     including hypertable creation and batch insertion operations.
     """
 
-    def __init__(self, connection_params: Optional[Dict[str, Any]] = None):
+    TABLE_NAME = 'daily_ohlcv_data'
+    COVERAGE_SCHEMA = "'ohlcv-' || granularity"
+
+    def __init__(
+        self,
+        connection_params: Optional[Dict[str, Any]] = None,
+        load_method: str = LOAD_METHOD_INSERT,
+        connection_provider=None,
+        rollups: Optional[Dict[str, List[str]]] = None
+    ):
         """
         Initialize the TimescaleOHLCVLoader.
 
         Args:
             connection_params: Database connection parameters. If None, will load from environment.
+            load_method: 'insert' for per-row executemany or 'copy' for COPY FROM STDIN + merge
+            connection_provider: Optional shared PooledConnectionProvider; when set,
+                connections are checked out from its pool instead of opened per call
+            rollups: Optional mapping of source granularity to the coarser granularities
+                derived from it after every committed load (e.g. {'1m': ['5m', '1h']})
+
+        Raises:
+            ValueError: If a rollup cannot be derived from its source granularity
         """
         self.connection_params = connection_params or self._get_connection_params()
+        self.load_method = validate_load_method(load_method)
+        self.connection_provider = connection_provider
+        self.rollups = validate_rollups(rollups)
 
     def _get_connection_params(self) -> Dict[str, Any]:
         """Get database connection parameters from environment variables."""
@@ -50,7 +75,12 @@ class TimescaleOHLCVLoader:
 
     @contextmanager
     def get_connection(self):
-        """Context manager for database connections."""
+        """Context manager for database connections (pooled when a connection provider is set)."""
+        if self.connection_provider is not None:
+            with self.connection_provider.connection() as conn:
+                yield conn
+            return
+
         conn = None
         try:
             conn = psycopg2.connect(**self.connection_params)
@@ -222,7 +252,8 @@ class TimescaleOHLCVLoader:
                              records: List[DatabentoOHLCVRecord],
                              batch_size: int = 1000,
                              granularity: str = '1d',
-                             data_source: str = 'databento') -> Dict[str, int]:
+                             data_source: str = 'databento',
+                             load_method: Optional[str] = None) -> Dict[str, Any]:
         """
         Insert OHLCV records into the database.
 
@@ -231,16 +262,20 @@ class TimescaleOHLCVLoader:
             batch_size: Number of records to insert per batch
             granularity: Time granularity of the data (e.g., '1d', '1h', '5m')
             data_source: Source of the data (default: 'databento')
+            load_method: Optional per-call override of the loader's load method
 
         Returns:
-            Dictionary with insertion statistics
+            Dictionary with insertion statistics, including rows_per_second
         """
+        method = self._resolve_load_method(load_method)
+        started_at = time.perf_counter()
+
         if not records:
             logger.info("No OHLCV records to insert")
-            return {'inserted': 0, 'errors': 0}
+            return finalize_load_stats({'inserted': 0, 'errors': 0}, started_at, method)
 
         insert_sql = self._build_insert_sql()
-        stats = {'inserted': 0, 'errors': 0}
+        stats = {'inserted': 0, 'errors': 0, 'round_trips': 0}
 
         try:
             with self.get_connection() as conn:
@@ -260,34 +295,50 @@ class TimescaleOHLCVLoader:
                                 continue
 
                         if batch_data:
-                            cursor.executemany(insert_sql, batch_data)
+                            stats['round_trips'] += self._write_batch(cursor, insert_sql, batch_data, method)
                             stats['inserted'] += len(batch_data)
-                            logger.info(f"Inserted batch of {len(batch_data)} OHLCV records")
+                            logger.info(f"Inserted batch of {len(batch_data)} OHLCV records", load_method=method)
 
                 conn.commit()
+                stats['round_trips'] += 1
+                self._on_load_committed()
                 logger.info(f"Successfully inserted {stats['inserted']} OHLCV records")
 
         except Exception as e:
             logger.error(f"Failed to insert OHLCV records: {e}")
             stats['errors'] += len(records) - stats['inserted']
 
-        return stats
+        return finalize_load_stats(stats, started_at, method)
 
-    def _build_insert_sql(self) -> str:
-        """Build the INSERT SQL statement for OHLCV records."""
-        columns = [
+    def _get_insert_columns(self) -> List[str]:
+        """Column order shared by the INSERT statement and _record_to_tuple."""
+        return [
             'ts_event', 'ts_recv', 'instrument_id', 'symbol',
             'open_price', 'high_price', 'low_price', 'close_price', 'volume',
             'trade_count', 'vwap', 'granularity', 'data_source',
             'rtype', 'publisher_id'
         ]
 
+    def _get_conflict_columns(self) -> List[str]:
+        """Columns of the daily_ohlcv_data upsert key."""
+        return ['ts_event', 'instrument_id', 'granularity', 'data_source']
+
+    def _build_insert_sql(self) -> str:
+        """Build the INSERT SQL statement for OHLCV records."""
+        columns = self._get_insert_columns()
+
         placeholders = ', '.join(['%s'] * len(columns))
         column_list = ', '.join(columns)
 
         return f"""
             INSERT INTO daily_ohlcv_data ({column_list})
             VALUES ({placeholders})
+            {self._build_conflict_clause()}
+        """
+
+    def _build_conflict_clause(self) -> str:
+        """Build the ON CONFLICT clause shared by the INSERT and COPY paths."""
+        return """
             ON CONFLICT (ts_event, instrument_id, granularity, data_source)
             DO UPDATE SET
                 updated_at = NOW(),
@@ -7,6 +7,7 @@ insertion of statistics data including settlement prices, open interest, and pri
 """
 
 import os
+import time
 from contextlib import contextmanager
 from typing import Dict, Any, List, Optional
 from datetime import datetime
@@ -16,13 +17,16 @@ import psycopg2
 import psycopg2.errors
 from psycopg2.extras import RealDictCursor
 
-from storage.models import DatabentoStatisticsRecord
+from src.storage.bulk_copy import CopyLoadMixin, LOAD_METHOD_INSERT, finalize_load_stats, validate_load_method
+from src.storage.stored_ranges import StoredRangeMixin
+from src.storage.coverage import CoverageMixin
+from src.storage.models import DatabentoStatisticsRecord
 from utils.custom_logger import get_logger
 
 logger = get_logger(__name__)
 
 
-class TimescaleStatisticsLoader:
+class TimescaleStatisticsLoader(CoverageMixin, CopyLoadMixin, StoredRangeMixin):
     """
     Loader for statistics data into TimescaleDB.
 
@@ -30,14 +34,28 @@ class TimescaleStatisticsLoader:
     including hypertable creation and batch insertion operations.
     """
 
-    def __init__(self, connection_params: Optional[Dict[str, Any]] = None):
+    TABLE_NAME = 'statistics_data'
+    COVERAGE_SCHEMA = "'statistics'"
+    FLOAT_COLUMNS = ['stat_value', 'settlement_price', 'high_limit', 'low_limit']
+
+    def __init__(
+        self,
+        connection_params: Optional[Dict[str, Any]] = None,
+        load_method: str = LOAD_METHOD_INSERT,
+        connection_provider=None
+    ):
         """
         Initialize the TimescaleStatisticsLoader.
 
         Args:
             connection_params: Database connection parameters. If None, will load from environment.
+            load_method: 'insert' for per-row executemany or 'copy' for COPY FROM STDIN + merge
+            connection_provider: Optional shared PooledConnectionProvider; when set,
+                connections are checked out from its pool instead of opened per call
         """
         self.connection_params = connection_params or self._get_connection_params()
+        self.load_method = validate_load_method(load_method)
+        self.connection_provider = connection_provider
 
     def _get_connection_params(self) -> Dict[str, Any]:
         """Get database connection parameters from environment variables."""
@@ -51,7 +69,12 @@ class TimescaleStatisticsLoader:
 
     @contextmanager
     def get_connection(self):
-        """Context manager for database connections."""
+        """Context manager for database connections (pooled when a connection provider is set)."""
+        if self.connection_provider is not None:
+            with self.connection_provider.connection() as conn:
+                yield conn
+            return
+
         conn = None
         try:
             conn = psycopg2.connect(**self.connection_params)
@@ -172,7 +195,8 @@ class TimescaleStatisticsLoader:
     def insert_statistics_records(self,
                                 records: List[DatabentoStatisticsRecord],
                                 batch_size: int = 1000,
-                                data_source: str = 'databento') -> Dict[str, int]:
+                                data_source: str = 'databento',
+                                load_method: Optional[str] = None) -> Dict[str, Any]:
         """
         Insert statistics records into the database.
 
@@ -180,16 +204,20 @@ class TimescaleStatisticsLoader:
             records: List of DatabentoStatisticsRecord instances to insert
             batch_size: Number of records to insert per batch
             data_source: Source of the data (default: 'databento')
+            load_method: Optional per-call override of the loader's load method
 
         Returns:
-            Dictionary with insertion statistics
+            Dictionary with insertion statistics, including rows_per_second
         """
+        method = self._resolve_load_method(load_method)
+        started_at = time.perf_counter()
+
         if not records:
             logger.info("No statistics records to insert")
-            return {'inserted': 0, 'errors': 0}
+            return finalize_load_stats({'inserted': 0, 'errors': 0}, started_at, method)
 
         insert_sql = self._build_insert_sql()
-        stats = {'inserted': 0, 'errors': 0}
+        stats = {'inserted': 0, 'errors': 0, 'round_trips': 0}
 
         try:
             with self.get_connection() as conn:
@@ -211,9 +239,9 @@ class TimescaleStatisticsLoader:
 
                         if batch_data:
                             try:
-                                cursor.executemany(insert_sql, batch_data)
+                                stats['round_trips'] += self._write_batch(cursor, insert_sql, batch_data, method)
                                 stats['inserted'] += len(batch_data)
-                                logger.debug(f"Inserted batch of {len(batch_data)} statistics records")
+                                logger.debug(f"Inserted batch of {len(batch_data)} statistics records", load_method=method)
                             except Exception as e:
                                 logger.error(f"Failed to insert batch: {e}")
                                 stats['errors'] += len(batch_data)
@@ -221,24 +249,48 @@ class TimescaleStatisticsLoader:
                                 continue
 
                     conn.commit()
+                    stats['round_trips'] += 1
+                    self._on_load_committed()
                     logger.info(f"Successfully inserted {stats['inserted']} statistics records")
 
         except Exception as e:
             logger.error(f"Database error during statistics insertion: {e}")
             raise
 
-        return stats
+        return finalize_load_stats(stats, started_at, method)
 
-    def _build_insert_sql(self) -> str:
-        """Build the INSERT SQL statement for statistics."""
+    # RuleEngine mapping names -> statistics_data column names
+    _FRAME_COLUMN_ALIASES = {'price': 'stat_value', 'stat_flags': 'flags'}
+
+    def _prepare_frame(self, frame, data_source: str, **column_values: Any):
+        """Add constant columns and map RuleEngine output names back to table columns."""
+        frame = super()._prepare_frame(frame, data_source, **column_values)
+        renames = {
+            source: target for source, target in self._FRAME_COLUMN_ALIASES.items()
+            if source in frame.columns and target not in frame.columns
+        }
+        if renames:
+            frame = frame.rename(columns=renames)
+            frame.attrs['price_columns'] = [
+                renames.get(column, column) for column in frame.attrs.get('price_columns', [])
+            ]
+        return frame
+
+    def _get_insert_columns(self) -> List[str]:
+        """Column order shared by the INSERT statement and _record_to_tuple."""
+        return [
+            'ts_event', 'instrument_id', 'stat_type', 'stat_value',
+            'open_interest', 'settlement_price', 'high_limit', 'low_limit',
+            'sequence', 'flags', 'ts_recv', 'symbol', 'data_source'
+        ]
+
+    def _get_conflict_columns(self) -> List[str]:
+        """Columns of the statistics_data upsert key."""
+        return ['instrument_id', 'stat_type', 'ts_event']
+
+    def _build_conflict_clause(self) -> str:
+        """Build the ON CONFLICT clause shared by the INSERT and COPY paths."""
         return """
-            INSERT INTO statistics_data (
-                ts_event, instrument_id, stat_type, stat_value,
-                open_interest, settlement_price, high_limit, low_limit,
-                sequence, flags, ts_recv, symbol, data_source
-            ) VALUES (
-                %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
-            )
             ON CONFLICT (instrument_id, stat_type, ts_event) DO UPDATE SET
                 stat_value = EXCLUDED.stat_value,
                 open_interest = EXCLUDED.open_interest,
@@ -249,6 +301,18 @@ class TimescaleStatisticsLoader:
                 flags = EXCLUDED.flags
         """
 
+    def _build_insert_sql(self) -> str:
+        """Build the INSERT SQL statement for statistics."""
+        return """
+            INSERT INTO statistics_data (
+                ts_event, instrument_id, stat_type, stat_value,
+                open_interest, settlement_price, high_limit, low_limit,
+                sequence, flags, ts_recv, symbol, data_source
+            ) VALUES (
+                %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
+            )
+        """ + self._build_conflict_clause()
+
     def _record_to_tuple(self, record: DatabentoStatisticsRecord, data_source: str) -> tuple:
         """Convert a DatabentoStatisticsRecord to a tuple for insertion."""
         return (
@@ -7,22 +7,27 @@ batch insertion of TBBO data.
 """
 
 import os
+import time
 from contextlib import contextmanager
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 from decimal import Decimal
 
+import pandas as pd
 import psycopg2
 import psycopg2.errors
 from psycopg2.extras import RealDictCursor
 
-from storage.models import DatabentoTBBORecord
+from src.storage.bulk_copy import CopyLoadMixin, LOAD_METHOD_INSERT, finalize_load_stats, validate_load_method
+from src.storage.stored_ranges import StoredRangeMixin
+from src.storage.coverage import CoverageMixin
+from src.storage.models import DatabentoTBBORecord
 from utils.custom_logger import get_logger
 
 logger = get_logger(__name__)
 
 
-class TimescaleTBBOLoader:
+class TimescaleTBBOLoader(CoverageMixin, CopyLoadMixin, StoredRangeMixin):
     """
     Loader for TBBO (Top of Book) data into TimescaleDB.
 
@@ -30,14 +35,28 @@ class TimescaleTBBOLoader:
     including hypertable creation and batch insertion operations.
     """
 
-    def __init__(self, connection_params: Optional[Dict[str, Any]] = None):
+    TABLE_NAME = 'tbbo_data'
+    COVERAGE_SCHEMA = "'tbbo'"
+    FLOAT_COLUMNS = ['bid_px', 'ask_px']
+
+    def __init__(
+        self,
+        connection_params: Optional[Dict[str, Any]] = None,
+        load_method: str = LOAD_METHOD_INSERT,
+        connection_provider=None
+    ):
         """
         Initialize the TimescaleTBBOLoader.
 
         Args:
             connection_params: Database connection parameters. If None, will load from environment.
+            load_method: 'insert' for per-row executemany or 'copy' for COPY FROM STDIN + merge
+            connection_provider: Optional shared PooledConnectionProvider; when set,
+                connections are checked out from its pool instead of opened per call
         """
         self.connection_params = connection_params or self._get_connection_params()
+        self.load_method = validate_load_method(load_method)
+        self.connection_provider = connection_provider
 
     def _get_connection_params(self) -> Dict[str, Any]:
         """Get database connection parameters from environment variables."""
@@ -51,7 +70,12 @@ class TimescaleTBBOLoader:
 
     @contextmanager
     def get_connection(self):
-        """Context manager for database connections."""
+        """Context manager for database connections (pooled when a connection provider is set)."""
+        if self.connection_provider is not None:
+            with self.connection_provider.connection() as conn:
+                yield conn
+            return
+
         conn = None
         try:
             conn = psycopg2.connect(**self.connection_params)
@@ -172,7 +196,8 @@ class TimescaleTBBOLoader:
     def insert_tbbo_records(self,
                           records: List[DatabentoTBBORecord],
                           batch_size: int = 1000,
-                          data_source: str = 'databento') -> Dict[str, int]:
+                          data_source: str = 'databento',
+                          load_method: Optional[str] = None) -> Dict[str, Any]:
         """
         Insert TBBO records into the database.
 
@@ -180,16 +205,20 @@ class TimescaleTBBOLoader:
             records: List of DatabentoTBBORecord instances to insert
             batch_size: Number of records to insert per batch
             data_source: Source of the data (default: 'databento')
+            load_method: Optional per-call override of the loader's load method
 
         Returns:
-            Dictionary with insertion statistics
+            Dictionary with insertion statistics, including rows_per_second
         """
+        method = self._resolve_load_method(load_method)
+        started_at = time.perf_counter()
+
         if not records:
             logger.info("No TBBO records to insert")
-            return {'inserted': 0, 'errors': 0}
+            return finalize_load_stats({'inserted': 0, 'errors': 0}, started_at, method)
 
         insert_sql = self._build_insert_sql()
-        stats = {'inserted': 0, 'errors': 0}
+        stats = {'inserted': 0, 'errors': 0, 'round_trips': 0}
 
         try:
             with self.get_connection() as conn:
@@ -211,9 +240,9 @@ class TimescaleTBBOLoader:
 
                         if batch_data:
                             try:
-                                cursor.executemany(insert_sql, batch_data)
+                                stats['round_trips'] += self._write_batch(cursor, insert_sql, batch_data, method)
                                 stats['inserted'] += len(batch_data)
-                                logger.debug(f"Inserted batch of {len(batch_data)} TBBO records")
+                                logger.debug(f"Inserted batch of {len(batch_data)} TBBO records", load_method=method)
                             except Exception as e:
                                 logger.error(f"Failed to insert batch: {e}")
                                 stats['errors'] += len(batch_data)
@@ -221,13 +250,22 @@ class TimescaleTBBOLoader:
                                 continue
 
                     conn.commit()
+                    stats['round_trips'] += 1
+                    self._on_load_committed()
                     logger.info(f"Successfully inserted {stats['inserted']} TBBO records")
 
         except Exception as e:
             logger.error(f"Database error during TBBO insertion: {e}")
             raise
 
-        return stats
+        return finalize_load_stats(stats, started_at, method)
+
+    def _get_insert_columns(self) -> List[str]:
+        """Column order shared by the INSERT statement and _record_to_tuple."""
+        return [
+            'ts_event', 'instrument_id', 'bid_px', 'ask_px', 'bid_sz', 'ask_sz',
+            'bid_ct', 'ask_ct', 'sequence', 'ts_recv', 'symbol', 'data_source', 'is_crossed'
+        ]
 
     def _build_insert_sql(self) -> str:
         """Build the INSERT SQL statement for TBBO."""
@@ -240,6 +278,17 @@ class TimescaleTBBOLoader:
             )
         """
 
+    def _prepare_frame(self, frame, data_source: str, **column_values: Any):
+        """Add constant columns and the vectorized crossed-market flag to a decoded frame."""
+        frame = super()._prepare_frame(frame, data_source, **column_values)
+        if 'bid_px' in frame.columns and 'ask_px' in frame.columns:
+            bid_px = pd.to_numeric(frame['bid_px'], errors='coerce')
+            ask_px = pd.to_numeric(frame['ask_px'], errors='coerce')
+            frame['is_crossed'] = (bid_px > ask_px).fillna(False).astype(bool)
+        else:
+            frame['is_crossed'] = False
+        return frame
+
     def _record_to_tuple(self, record: DatabentoTBBORecord, data_source: str) -> tuple:
         """Convert a DatabentoTBBORecord to a tuple for insertion."""
         # Calculate if this is a crossed market
@@ -7,6 +7,7 @@ of trade data.
 """
 
 import os
+import time
 from contextlib import contextmanager
 from typing import Dict, Any, List, Optional
 from datetime import datetime
@@ -16,13 +17,16 @@ import psycopg2
 import psycopg2.errors
 from psycopg2.extras import RealDictCursor
 
-from storage.models import DatabentoTradeRecord
+from src.storage.bulk_copy import CopyLoadMixin, LOAD_METHOD_INSERT, finalize_load_stats, validate_load_method
+from src.storage.stored_ranges import StoredRangeMixin
+from src.storage.coverage import CoverageMixin
+from src.storage.models import DatabentoTradeRecord
 from utils.custom_logger import get_logger
 
 logger = get_logger(__name__)
 
 
-class TimescaleTradesLoader:
+class TimescaleTradesLoader(CoverageMixin, CopyLoadMixin, StoredRangeMixin):
     """
     Loader for trade data into TimescaleDB.
 
@@ -30,14 +34,28 @@ class TimescaleTradesLoader:
     including hypertable creation and batch insertion operations.
     """
 
-    def __init__(self, connection_params: Optional[Dict[str, Any]] = None):
+    TABLE_NAME = 'trades_data'
+    COVERAGE_SCHEMA = "'trades'"
+    FLOAT_COLUMNS = ['price']
+
+    def __init__(
+        self,
+        connection_params: Optional[Dict[str, Any]] = None,
+        load_method: str = LOAD_METHOD_INSERT,
+        connection_provider=None
+    ):
         """
         Initialize the TimescaleTradesLoader.
 
         Args:
             connection_params: Database connection parameters. If None, will load from environment.
+            load_method: 'insert' for per-row executemany or 'copy' for COPY FROM STDIN + merge
+            connection_provider: Optional shared PooledConnectionProvider; when set,
+                connections are checked out from its pool instead of opened per call
         """
         self.connection_params = connection_params or self._get_connection_params()
+        self.load_method = validate_load_method(load_method)
+        self.connection_provider = connection_provider
 
     def _get_connection_params(self) -> Dict[str, Any]:
         """Get database connection parameters from environment variables."""
@@ -51,7 +69,12 @@ class TimescaleTradesLoader:
 
     @contextmanager
     def get_connection(self):
-        """Context manager for database connections."""
+        """Context manager for database connections (pooled when a connection provider is set)."""
+        if self.connection_provider is not None:
+            with self.connection_provider.connection() as conn:
+                yield conn
+            return
+
         conn = None
         try:
             conn = psycopg2.connect(**self.connection_params)
@@ -172,7 +195,8 @@ class TimescaleTradesLoader:
     def insert_trades_records(self,
                             records: List[DatabentoTradeRecord],
                             batch_size: int = 1000,
-                            data_source: str = 'databento') -> Dict[str, int]:
+                            data_source: str = 'databento',
+                            load_method: Optional[str] = None) -> Dict[str, Any]:
         """
         Insert trade records into the database.
 
@@ -180,16 +204,20 @@ class TimescaleTradesLoader:
             records: List of DatabentoTradeRecord instances to insert
             batch_size: Number of records to insert per batch
             data_source: Source of the data (default: 'databento')
+            load_method: Optional per-call override of the loader's load method
 
         Returns:
-            Dictionary with insertion statistics
+            Dictionary with insertion statistics, including rows_per_second
         """
+        method = self._resolve_load_method(load_method)
+        started_at = time.perf_counter()
+
         if not records:
             logger.info("No trade records to insert")
-            return {'inserted': 0, 'errors': 0}
+            return finalize_load_stats({'inserted': 0, 'errors': 0}, started_at, method)
 
         insert_sql = self._build_insert_sql()
-        stats = {'inserted': 0, 'errors': 0}
+        stats = {'inserted': 0, 'errors': 0, 'round_trips': 0}
 
         try:
             with self.get_connection() as conn:
@@ -211,9 +239,9 @@ class TimescaleTradesLoader:
 
                         if batch_data:
                             try:
-                                cursor.executemany(insert_sql, batch_data)
+                                stats['round_trips'] += self._write_batch(cursor, insert_sql, batch_data, method)
                                 stats['inserted'] += len(batch_data)
-                                logger.debug(f"Inserted batch of {len(batch_data)} trades")
+                                logger.debug(f"Inserted batch of {len(batch_data)} trades", load_method=method)
                             except Exception as e:
                                 logger.error(f"Failed to insert batch: {e}")
                                 stats['errors'] += len(batch_data)
@@ -221,13 +249,22 @@ class TimescaleTradesLoader:
                                 continue
 
                     conn.commit()
+                    stats['round_trips'] += 1
+                    self._on_load_committed()
                     logger.info(f"Successfully inserted {stats['inserted']} trade records")
 
         except Exception as e:
             logger.error(f"Database error during trades insertion: {e}")
             raise
 
-        return stats
+        return finalize_load_stats(stats, started_at, method)
+
+    def _get_insert_columns(self) -> List[str]:
+        """Column order shared by the INSERT statement and _record_to_tuple."""
+        return [
+            'ts_event', 'instrument_id', 'price', 'size',
+            'ts_recv', 'symbol', 'side', 'data_source', 'sequence'
+        ]
 
     def _build_insert_sql(self) -> str:
         """Build the INSERT SQL statement for trades."""
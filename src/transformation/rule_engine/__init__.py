@@ -12,9 +12,12 @@ from .engine import (
     ValidationRuleError,
     create_rule_engine
 )
+from .frame_transform import BatchTransformResult, FrameTransformResult
 
 __all__ = [
     'RuleEngine',
+    'BatchTransformResult',
+    'FrameTransformResult',
     'TransformationError',
     'ValidationRuleError',
     'create_rule_engine'
@@ -17,7 +17,18 @@ from pydantic import BaseModel, ValidationError
 import pandas as pd
 import pandera.pandas as pa
 
+from core.pipeline_metrics import stage_timer
 from transformation.validators.databento_validators import get_validation_schema
+from .frame_transform import (
+    BatchTransformResult,
+    CompiledFrameMapping,
+    FrameTransformResult,
+    apply_frame_mapping,
+    compile_frame_mapping,
+    failure_mask_from_cases,
+    failure_messages_by_row,
+    validation_view
+)
 
 # Import Databento models
 from storage.models import (
@@ -65,6 +76,9 @@ class RuleEngine:
         self.schema_mappings = self.config.get('schema_mappings', {})
         self.conditional_mappings = self.config.get('conditional_mappings', {})
         self.global_settings = self.config.get('global_settings', {})
+        self._compiled_frame_mappings: Dict[str, CompiledFrameMapping] = {}
+        # Optional PipelineStats receiving transform and validate stage timings (set by the orchestrator)
+        self.pipeline_stats = None
 
         logger.info(f"RuleEngine initialized with config: {mapping_config_path}")
 
@@ -384,50 +398,223 @@ class RuleEngine:
 
         Returns:
             List of dictionaries containing the transformed data
+
+        Raises:
+            ValidationRuleError: If any row of the batch fails Pandera validation
         """
         # Bind schema context for all batch operations
         batch_logger = logger.bind(schema_name=schema_name, operation="batch_transform", batch_size=len(records))
 
-        transformed_batch = []
-
-        for record in records:
-            try:
-                transformed_record = self.transform_record(
-                    record, schema_name, validate=False  # Validation will be done on the batch
-                )
-                transformed_batch.append(transformed_record)
-            except TransformationError as e:
-                batch_logger.error("Failed to transform record in batch", error=str(e))
-                # Decide on error handling: skip record, add to error list, etc.
-                continue
+        with stage_timer(self.pipeline_stats, "transform", rows=len(records)):
+            transformed_batch, _, _ = self._transform_records(records, schema_name, batch_logger)
 
         if validate and transformed_batch:
-            # Convert list of dicts to DataFrame for batch validation
-            df = pd.DataFrame(transformed_batch)
-            
-            # Fix nullable integer columns that pandas infers as float64
-            # This prevents Pandera coercion errors when validating nullable int columns
-            if 'trade_count' in df.columns:
-                df['trade_count'] = df['trade_count'].astype('Int64')
-
             validation_schema = get_validation_schema(schema_name)
             if validation_schema:
                 try:
-                    validation_schema.validate(df, lazy=True)
+                    with stage_timer(self.pipeline_stats, "validate", rows=len(transformed_batch)):
+                        validation_schema.validate(self._batch_validation_frame(transformed_batch), lazy=True)
                 except pa.errors.SchemaErrors as err:
                     batch_logger.error(
                         "Pandera batch validation failed",
                         num_failures=len(err.failure_cases),
                         failure_details=err.failure_cases.to_dict(orient="records")
                     )
-                    # For now, we raise an error. In a real pipeline, you might
-                    # filter out the bad records and quarantine them.
+                    # Use transform_batch_isolated to keep passing rows instead
                     raise ValidationRuleError(f"Batch validation failed for {len(err.failure_cases)} records.")
             else:
                 batch_logger.warning("No Pandera validation schema found, skipping batch validation.")
 
         return transformed_batch
 
+    def transform_batch_isolated(self,
+                                 records: List[BaseModel],
+                                 schema_name: str) -> BatchTransformResult:
+        """
+        Transform and validate a batch, isolating failing rows instead of rejecting the batch.
+
+        The batch is validated once with Pandera; the row indices in
+        ``failure_cases`` split it into passing records, which continue to storage,
+        and failing records, which the caller can quarantine in bulk. Records that
+        fail transformation itself are reported as failures too.
+
+        Args:
+            records: List of Databento Pydantic model instances to transform
+            schema_name: Target schema name for transformation
+
+        Returns:
+            BatchTransformResult with passing records, failed records (the original
+            record as a dict plus its transformed form, if any) and error messages
+        """
+        batch_logger = logger.bind(schema_name=schema_name, operation="batch_transform_isolated", batch_size=len(records))
+
+        with stage_timer(self.pipeline_stats, "transform", rows=len(records)):
+            transformed_batch, source_records, transform_failures = self._transform_records(
+                records, schema_name, batch_logger
+            )
+        failed = [(self._record_as_dict(record), None, message) for record, message in transform_failures]
+        if not transformed_batch:
+            return BatchTransformResult.from_failures([], failed)
+
+        validation_schema = get_validation_schema(schema_name)
+        try:
+            with stage_timer(self.pipeline_stats, "validate", rows=len(transformed_batch)):
+                validation_schema.validate(self._batch_validation_frame(transformed_batch), lazy=True)
+            return BatchTransformResult.from_failures(transformed_batch, failed)
+        except pa.errors.SchemaErrors as err:
+            failure_cases = err.failure_cases
+
+        row_index = pd.RangeIndex(len(transformed_batch))
+        failure_mask = failure_mask_from_cases(row_index, failure_cases)
+        messages = failure_messages_by_row(failure_cases)
+
+        passing = []
+        for position, transformed in enumerate(transformed_batch):
+            if failure_mask.iloc[position]:
+                failed.append((
+                    self._record_as_dict(source_records[position]),
+                    transformed,
+                    messages.get(position, "Schema-level validation failure")
+                ))
+            else:
+                passing.append(transformed)
+
+        batch_logger.warning(
+            "Pandera batch validation isolated failing rows",
+            rows_passed=len(passing),
+            rows_failed=len(failed),
+            num_failures=len(failure_cases)
+        )
+        return BatchTransformResult.from_failures(passing, failed, failure_cases)
+
+    def _transform_records(self,
+                           records: List[BaseModel],
+                           schema_name: str,
+                           batch_logger: Any) -> tuple:
+        """
+        Transform records one by one without validation.
+
+        Returns:
+            Tuple of (transformed dicts, the source record of each transformed dict,
+            list of (record, error message) for records that failed to transform)
+        """
+        transformed_batch = []
+        source_records = []
+        failures = []
+
+        for record in records:
+            try:
+                transformed_record = self.transform_record(
+                    record, schema_name, validate=False  # Validation will be done on the batch
+                )
+                transformed_batch.append(transformed_record)
+                source_records.append(record)
+            except TransformationError as e:
+                batch_logger.error("Failed to transform record in batch", error=str(e))
+                failures.append((record, str(e)))
+
+        return transformed_batch, source_records, failures
+
+    @staticmethod
+    def _batch_validation_frame(transformed_batch: List[Dict[str, Any]]) -> pd.DataFrame:
+        """Build the DataFrame Pandera validates a transformed batch against."""
+        df = pd.DataFrame(transformed_batch)
+
+        # Fix nullable integer columns that pandas infers as float64
+        # This prevents Pandera coercion errors when validating nullable int columns
+        if 'trade_count' in df.columns:
+            df['trade_count'] = df['trade_count'].astype('Int64')
+        return df
+
+    @staticmethod
+    def _record_as_dict(record: Any) -> Dict[str, Any]:
+        """Return a quarantine-friendly dict for a source record."""
+        if isinstance(record, BaseModel):
+            return record.model_dump()
+        return dict(record) if isinstance(record, dict) else {"record": repr(record)}
+
+    def get_compiled_frame_mapping(self, schema_name: str) -> CompiledFrameMapping:
+        """
+        Get the columnar (compiled) form of a schema mapping, compiling it once.
+
+        Args:
+            schema_name: Name or alias of the schema
+
+        Returns:
+            CompiledFrameMapping for use with DataFrames
+
+        Raises:
+            KeyError: If the schema is not found in the configuration
+        """
+        normalized_schema = self._normalize_schema_name(schema_name)
+        compiled = self._compiled_frame_mappings.get(normalized_schema)
+        if compiled is None:
+            compiled = compile_frame_mapping(
+                normalized_schema,
+                self.get_schema_mapping(normalized_schema),
+                self.conditional_mappings.get(normalized_schema),
+                self.global_settings
+            )
+            self._compiled_frame_mappings[normalized_schema] = compiled
+        return compiled
+
+    def transform_frame(self,
+                        frame: pd.DataFrame,
+                        schema_name: str,
+                        validate: bool = True) -> FrameTransformResult:
+        """
+        Transform a whole chunk DataFrame in one vectorized pass.
+
+        Columnar counterpart of ``transform_batch``: the same field mappings,
+        conditional mappings, defaults and global settings are applied as column
+        operations, and Pandera validation runs once over the frame. Instead of
+        raising on validation failure, a per-row failure mask is returned so the
+        caller can store passing rows and quarantine the rest.
+
+        Args:
+            frame: Decoded chunk frame (see ``ingestion.api_adapters.dbn_frame``)
+            schema_name: Target schema name for transformation
+            validate: Whether to run Pandera validation
+
+        Returns:
+            FrameTransformResult with the transformed frame, failure mask and
+            the Pandera failure cases (None when validation passed or was skipped)
+
+        Raises:
+            TransformationError: If the mapping cannot be applied or validation
+                errors out for reasons other than failing rows
+        """
+        frame_logger = logger.bind(schema_name=schema_name, operation="frame_transform", frame_rows=len(frame))
+
+        try:
+            with stage_timer(self.pipeline_stats, "transform", rows=len(frame)):
+                transformed = apply_frame_mapping(frame, self.get_compiled_frame_mapping(schema_name))
+        except Exception as e:
+            frame_logger.error("Frame transformation failed", error=str(e))
+            raise TransformationError(f"Failed to transform frame: {str(e)}") from e
+
+        failure_mask = pd.Series(False, index=transformed.index)
+        if not validate or transformed.empty:
+            return FrameTransformResult(transformed, failure_mask)
+
+        validation_schema = get_validation_schema(schema_name)
+        try:
+            with stage_timer(self.pipeline_stats, "validate", rows=len(transformed)):
+                validation_schema.validate(validation_view(transformed), lazy=True)
+        except pa.errors.SchemaErrors as err:
+            failure_mask = failure_mask_from_cases(transformed.index, err.failure_cases)
+            frame_logger.warning(
+                "Pandera frame validation failed",
+                num_failures=len(err.failure_cases),
+                rows_failed=int(failure_mask.sum())
+            )
+            return FrameTransformResult(transformed, failure_mask, err.failure_cases)
+        except Exception as e:
+            frame_logger.error("An unexpected error occurred during frame validation", error=str(e))
+            raise TransformationError(f"Unexpected validation error: {e}") from e
+
+        return FrameTransformResult(transformed, failure_mask)
+
     def get_supported_schemas(self) -> List[str]:
         """Get list of supported schema names."""
         return list(self.schema_mappings.keys())
@@ -470,6 +657,8 @@ def create_rule_engine(mapping_config_path: Optional[str] = None) -> RuleEngine:
 # Export main classes and functions
 __all__ = [
     'RuleEngine',
+    'BatchTransformResult',
+    'FrameTransformResult',
     'TransformationError',
     'ValidationRuleError',
     'create_rule_engine'
@@ -0,0 +1,292 @@
+"""
+Columnar (DataFrame) transformation for the RuleEngine.
+
+A schema's ``field_mappings``, ``defaults``, conditional ``stat_type_mappings``
+and the ``global_settings`` from the mapping YAML are compiled once into a
+``CompiledFrameMapping``: a set of column renames plus vectorized fill, rounding
+and timezone operations that run over a whole chunk frame in one pass.
+
+Frames follow the contract of ``ingestion.api_adapters.dbn_frame``: prices may
+be fixed-point integers (``frame.attrs['price_scale']``) and timestamps may be
+int64 epoch nanoseconds. Both are handled without leaving vectorized code.
+"""
+
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+class CompiledFrameMapping(NamedTuple):
+    """Pre-compiled, vectorizable form of one schema mapping."""
+
+    schema_name: str
+    renames: List[Tuple[str, str]]
+    defaults: Dict[str, Any]
+    conditional_rules: List[Tuple[Any, str, str]]
+    default_conditional_rule: Optional[Tuple[str, str]]
+    price_precision: Optional[int]
+    normalize_utc: bool
+
+
+class FrameTransformResult(NamedTuple):
+    """Outcome of ``RuleEngine.transform_frame``."""
+
+    frame: pd.DataFrame
+    failure_mask: pd.Series
+    failure_cases: Optional[pd.DataFrame] = None
+
+    @property
+    def valid_frame(self) -> pd.DataFrame:
+        """Rows that passed validation."""
+        return self.frame[~self.failure_mask]
+
+    @property
+    def failed_frame(self) -> pd.DataFrame:
+        """Rows that failed validation, for quarantine."""
+        return self.frame[self.failure_mask]
+
+
+class BatchTransformResult(NamedTuple):
+    """Outcome of ``RuleEngine.transform_batch_isolated``."""
+
+    records: List[Dict[str, Any]]
+    failed_records: List[Dict[str, Any]]
+    failed_transformed: List[Optional[Dict[str, Any]]]
+    failure_messages: List[str]
+    failure_cases: Optional[pd.DataFrame] = None
+
+    @classmethod
+    def from_failures(
+        cls,
+        records: List[Dict[str, Any]],
+        failures: List[Tuple[Dict[str, Any], Optional[Dict[str, Any]], str]],
+        failure_cases: Optional[pd.DataFrame] = None
+    ) -> "BatchTransformResult":
+        """Build a result from (original, transformed, message) failure triples."""
+        return cls(
+            records=records,
+            failed_records=[original for original, _, _ in failures],
+            failed_transformed=[transformed for _, transformed, _ in failures],
+            failure_messages=[message for _, _, message in failures],
+            failure_cases=failure_cases
+        )
+
+
+def compile_frame_mapping(
+    schema_name: str,
+    mapping_config: Dict[str, Any],
+    conditional_config: Optional[Dict[str, Any]] = None,
+    global_settings: Optional[Dict[str, Any]] = None
+) -> CompiledFrameMapping:
+    """
+    Compile a schema mapping from the YAML configuration into column operations.
+
+    Args:
+        schema_name: Canonical schema name
+        mapping_config: The schema's entry under ``schema_mappings``
+        conditional_config: The schema's entry under ``conditional_mappings``
+        global_settings: The ``global_settings`` section
+
+    Returns:
+        CompiledFrameMapping ready for ``apply_frame_mapping``
+    """
+    conditional_config = conditional_config or {}
+    global_settings = global_settings or {}
+
+    conditional_rules = []
+    default_rule = None
+    for stat_type, rule in conditional_config.get('stat_type_mappings', {}).items():
+        primary_field = rule.get('primary_field')
+        target_field = rule.get('target_field')
+        if not (primary_field and target_field):
+            continue
+        if stat_type == 'default':
+            default_rule = (primary_field, target_field)
+        else:
+            conditional_rules.append((stat_type, primary_field, target_field))
+
+    return CompiledFrameMapping(
+        schema_name=schema_name,
+        renames=list(mapping_config.get('field_mappings', {}).items()),
+        defaults=dict(mapping_config.get('defaults', {})),
+        conditional_rules=conditional_rules,
+        default_conditional_rule=default_rule,
+        price_precision=global_settings.get('price_precision'),
+        normalize_utc=global_settings.get('timezone_normalization') == 'UTC'
+    )
+
+
+def round_fixed_point(values: pd.Series, scale: int, precision: int) -> pd.Series:
+    """
+    Round fixed-point integer prices to ``precision`` decimals (half-even).
+
+    Matches ``round(Decimal, precision)`` on the scaled value while staying in
+    integer arithmetic.
+
+    Args:
+        values: Fixed-point prices (int64 or nullable Int64)
+        scale: Fixed-point scale (e.g. 1_000_000_000)
+        precision: Number of decimal places to keep
+
+    Returns:
+        Rounded fixed-point prices with the same dtype and missing values
+    """
+    scale_digits = len(str(scale)) - 1
+    if precision >= scale_digits:
+        return values
+
+    step = 10 ** (scale_digits - precision)
+    missing = values.isna().to_numpy()
+    raw = values.fillna(0).to_numpy(dtype=np.int64)
+    quotient, remainder = np.divmod(np.abs(raw), step)
+    half = step // 2
+    round_up = (remainder > half) | ((remainder == half) & (quotient % 2 == 1))
+    rounded = np.sign(raw) * (quotient + round_up) * step
+    return pd.Series(pd.arrays.IntegerArray(rounded.astype(np.int64), missing), index=values.index)
+
+
+def _normalize_timestamp_column(values: pd.Series) -> pd.Series:
+    """Make a datetime column tz-aware UTC; int64 ns columns are already UTC."""
+    if pd.api.types.is_datetime64_any_dtype(values):
+        if values.dt.tz is None:
+            return values.dt.tz_localize('UTC')
+        return values.dt.tz_convert('UTC')
+    return values
+
+
+def apply_frame_mapping(frame: pd.DataFrame, compiled: CompiledFrameMapping) -> pd.DataFrame:
+    """
+    Apply a compiled mapping to a whole frame in one pass.
+
+    Mapped columns are renamed, conditional stat_type rules are applied with
+    boolean masks, defaults fill missing columns and nulls, prices are rounded
+    to ``price_precision`` and datetime columns are normalized to UTC. Columns
+    not named in the mapping are passed through unchanged.
+
+    Args:
+        frame: Input chunk frame
+        compiled: Output of ``compile_frame_mapping``
+
+    Returns:
+        New transformed frame (the input is not modified)
+    """
+    out = frame.copy()
+    price_columns = set(frame.attrs.get('price_columns', []))
+
+    # Field mappings: source -> target columns; renamed-away sources are dropped
+    target_fields = {target for _, target in compiled.renames}
+    renamed_away = []
+    renamed_price_columns = set()
+    for source_field, target_field in compiled.renames:
+        if source_field not in frame.columns:
+            if target_field not in out.columns:
+                out[target_field] = pd.Series(None, index=frame.index, dtype=object)
+            continue
+        out[target_field] = frame[source_field]
+        if source_field in price_columns:
+            renamed_price_columns.add(target_field)
+        if source_field != target_field and source_field not in target_fields:
+            renamed_away.append(source_field)
+    out = out.drop(columns=renamed_away)
+    price_columns = (price_columns - set(renamed_away)) | renamed_price_columns
+
+    # Conditional mappings (e.g. statistics stat_type) read from the input frame
+    if compiled.conditional_rules or compiled.default_conditional_rule:
+        stat_types = frame['stat_type'] if 'stat_type' in frame.columns else None
+        if stat_types is not None:
+            matched = pd.Series(False, index=frame.index)
+            for stat_type, primary_field, target_field in compiled.conditional_rules:
+                mask = stat_types == stat_type
+                matched |= mask
+                if primary_field in frame.columns:
+                    mask &= frame[primary_field].notna()
+                    out[target_field] = out[target_field].where(~mask, frame[primary_field]) \
+                        if target_field in out.columns else frame[primary_field].where(mask)
+                    if primary_field in price_columns:
+                        price_columns.add(target_field)
+            if compiled.default_conditional_rule:
+                primary_field, target_field = compiled.default_conditional_rule
+                if primary_field in frame.columns:
+                    mask = ~matched & frame[primary_field].notna()
+                    out[target_field] = out[target_field].where(~mask, frame[primary_field]) \
+                        if target_field in out.columns else frame[primary_field].where(mask)
+
+    # Defaults for missing columns and null values
+    for field, default_value in compiled.defaults.items():
+        if default_value is None:
+            if field not in out.columns:
+                out[field] = pd.Series(None, index=out.index, dtype=object)
+        elif field not in out.columns:
+            out[field] = default_value
+        else:
+            out[field] = out[field].where(out[field].notna(), default_value)
+
+    # Global settings: price precision and timezone normalization
+    if compiled.price_precision is not None:
+        scale = frame.attrs.get('price_scale')
+        for column in price_columns:
+            if scale:
+                out[column] = round_fixed_point(out[column], scale, compiled.price_precision)
+            elif pd.api.types.is_float_dtype(out[column]):
+                out[column] = out[column].round(compiled.price_precision)
+
+    if compiled.normalize_utc:
+        for column in out.columns:
+            out[column] = _normalize_timestamp_column(out[column])
+
+    out.attrs = dict(frame.attrs)
+    out.attrs['price_columns'] = sorted(price_columns)
+    out.attrs['timestamp_columns'] = [c for c in frame.attrs.get('timestamp_columns', []) if c in out.columns]
+    return out
+
+
+def validation_view(frame: pd.DataFrame) -> pd.DataFrame:
+    """
+    Build the float/datetime view of a frame that the Pandera schemas expect.
+
+    Fixed-point price columns are scaled to float and int64 ns timestamps are
+    converted to tz-aware datetimes, both in bulk. The index is preserved so
+    failure cases map back to rows of the original frame.
+    """
+    view = frame.copy()
+    scale = frame.attrs.get('price_scale')
+    if scale:
+        for column in frame.attrs.get('price_columns', []):
+            if column in view.columns:
+                view[column] = view[column].astype('Float64') / scale
+    for column in frame.attrs.get('timestamp_columns', []):
+        if column in view.columns and pd.api.types.is_integer_dtype(view[column]):
+            view[column] = pd.to_datetime(view[column], unit='ns', utc=True)
+    return view
+
+
+def failure_mask_from_cases(index: pd.Index, failure_cases: pd.DataFrame) -> pd.Series:
+    """
+    Turn Pandera ``failure_cases`` into a per-row boolean mask.
+
+    Row-level failures mark their index; schema-level failures (no index, e.g. a
+    missing required column) cannot be attributed to a row and fail every row.
+    """
+    mask = pd.Series(False, index=index)
+    if failure_cases is None or failure_cases.empty or 'index' not in failure_cases.columns:
+        return mask
+    if failure_cases['index'].isna().any():
+        mask[:] = True
+        return mask
+    mask[index.isin(failure_cases['index'].unique())] = True
+    return mask
+
+
+def failure_messages_by_row(failure_cases: pd.DataFrame) -> Dict[Any, str]:
+    """
+    Summarize Pandera ``failure_cases`` as one message per failing row index.
+
+    Returns:
+        Mapping of row index -> "column: check; ..." for row-level failures
+    """
+    if failure_cases is None or failure_cases.empty or 'index' not in failure_cases.columns:
+        return {}
+    row_cases = failure_cases[failure_cases['index'].notna()]
+    labels = row_cases['column'].fillna(row_cases['schema_context']).astype(str) + ": " + row_cases['check'].astype(str)
+    return labels.groupby(row_cases['index']).agg('; '.join).to_dict()
@@ -7,8 +7,10 @@ import os
 from datetime import datetime, date, UTC
 from decimal import Decimal
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
+import numpy as np
+import pandas as pd
 import structlog
 
 logger = structlog.get_logger(__name__)
@@ -69,12 +71,54 @@ class QuarantineManager:
             return
 
         now = datetime.now(UTC)
-        session_dir = self.base_dir / now.strftime("%Y-%m-%d_%H-%M-%S")
-        session_dir.mkdir(exist_ok=True)
+        quarantine_entry = self._build_entry(
+            now, schema_type, validation_rule, error_message, original_record, transformed_record
+        )
+        self._write_entries(now, schema_type, [quarantine_entry])
 
-        file_path = session_dir / f"{schema_type}_failures.jsonl"
+    def quarantine_records(
+        self,
+        schema_type: str,
+        validation_rule: str,
+        records: List[Dict[str, Any]],
+        error_messages: List[str],
+        transformed_records: Optional[List[Dict[str, Any]]] = None
+    ) -> int:
+        """
+        Writes a batch of failed records to a quarantine file with a single open.
+
+        Args:
+            schema_type: The schema of the failed records (e.g., 'ohlcv').
+            validation_rule: The name of the validation rule that failed.
+            records: The raw record data that failed, one dict per record.
+            error_messages: One error message per record.
+            transformed_records: The transformed records, if available (same order).
+
+        Returns:
+            Number of records written to quarantine.
+        """
+        if not self.enabled or not records:
+            return 0
 
-        quarantine_entry = {
+        now = datetime.now(UTC)
+        transformed_records = transformed_records or [None] * len(records)
+        entries = [
+            self._build_entry(now, schema_type, validation_rule, message, record, transformed)
+            for record, message, transformed in zip(records, error_messages, transformed_records)
+        ]
+        return len(entries) if self._write_entries(now, schema_type, entries) else 0
+
+    def _build_entry(
+        self,
+        now: datetime,
+        schema_type: str,
+        validation_rule: str,
+        error_message: str,
+        original_record: Dict[str, Any],
+        transformed_record: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Build one JSON-compatible quarantine entry."""
+        return {
             "timestamp": now.isoformat(),
             "schema_type": schema_type,
             "validation_rule": validation_rule,
@@ -83,27 +127,41 @@ class QuarantineManager:
             "transformed_record": self._serialize_record(transformed_record) if transformed_record else None
         }
 
+    def _write_entries(self, now: datetime, schema_type: str, entries: List[Dict[str, Any]]) -> bool:
+        """Append quarantine entries to the session file for ``now``."""
+        session_dir = self.base_dir / now.strftime("%Y-%m-%d_%H-%M-%S")
+        session_dir.mkdir(exist_ok=True)
+
+        file_path = session_dir / f"{schema_type}_failures.jsonl"
+
         try:
             with file_path.open("a", encoding="utf-8") as f:
-                f.write(json.dumps(quarantine_entry) + "\n")
+                f.write("".join(json.dumps(entry) + "\n" for entry in entries))
+            return True
         except IOError as e:
             logger.error(
                 "Failed to write to quarantine file",
                 path=str(file_path),
                 error=str(e)
             )
+            return False
 
     def _serialize_record(self, record: Dict[str, Any]) -> Dict[str, Any]:
         """
         Serialize a record's values to be JSON-compatible.
-        Converts datetime, date, and Decimal objects to strings.
+        Converts datetime, date, and Decimal objects to strings, NumPy scalars
+        to Python values and pandas missing values to None.
         """
         serialized = {}
         for key, value in record.items():
-            if isinstance(value, (datetime, date)):
+            if value is pd.NA or value is pd.NaT:
+                serialized[key] = None
+            elif isinstance(value, (datetime, date)):
                 serialized[key] = value.isoformat()
             elif isinstance(value, Decimal):
                 serialized[key] = str(value)
+            elif isinstance(value, np.generic):
+                serialized[key] = value.item()
             else:
                 serialized[key] = value
         return serialized
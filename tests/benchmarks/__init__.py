@@ -0,0 +1,7 @@
+"""
+Ingestion Benchmark Suite
+
+Synthetic per-schema workloads and a per-stage throughput/memory benchmark of
+the ingestion hot path, with JSON baselines and regression checks. See
+README.md in this directory.
+"""
@@ -0,0 +1,432 @@
+"""
+Ingestion hot-path benchmark.
+
+Times every stage a record goes through on the per-record ingestion path, one
+stage at a time, on synthetic workloads (see ``synthetic.py``):
+
+1. ``record_to_dict``: ``DatabentoAdapter._record_to_dict``
+2. ``model_validate``: Pydantic ``model_validate`` (strict, as in the adapter)
+3. ``transform_batch``: ``RuleEngine.transform_batch`` without validation
+4. ``pandera_validate``: Pandera validation of the transformed batch
+5. ``record_to_tuple``: the loader's ``_record_to_tuple``
+6. ``db_insert``: the loader's batch write against a local Postgres (optional)
+
+Each stage runs ``repeat`` times on the output of the previous stage; the best
+run gives the throughput and a separate run under ``tracemalloc`` gives the
+peak Python memory. Results are saved as JSON baselines that ``compare``
+checks for throughput and memory regressions.
+
+The insert stage writes inside a transaction that is rolled back, so it can be
+pointed at the test database of ``docker-compose.test.yml`` (via the usual
+``TIMESCALEDB_*`` variables) without leaving rows behind.
+
+Usage:
+    python -m tests.benchmarks.ingestion_benchmark run --records 50000 --output baseline.json
+    python -m tests.benchmarks.ingestion_benchmark run --workloads trades tbbo --db --load-method copy
+    python -m tests.benchmarks.ingestion_benchmark compare baseline.json current.json
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime, UTC
+from pathlib import Path
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence
+
+import pandas as pd
+import pandera as pa
+from pydantic import ValidationError
+
+from src.ingestion.api_adapters.databento_adapter import DatabentoAdapter
+from src.storage.bulk_copy import LOAD_METHOD_INSERT, LOAD_METHODS
+from src.storage.models import DATABENTO_SCHEMA_MODEL_MAPPING
+from src.storage.timescale_loader import TimescaleDefinitionLoader
+from src.storage.timescale_ohlcv_loader import TimescaleOHLCVLoader
+from src.storage.timescale_statistics_loader import TimescaleStatisticsLoader
+from src.storage.timescale_tbbo_loader import TimescaleTBBOLoader
+from src.storage.timescale_trades_loader import TimescaleTradesLoader
+from src.transformation.rule_engine import RuleEngine, create_rule_engine
+from src.transformation.rule_engine.frame_transform import failure_mask_from_cases
+from src.transformation.validators.databento_validators import get_validation_schema
+
+from tests.benchmarks.synthetic import DEFAULT_SYMBOL, WORKLOAD_SCHEMAS, generate_records
+
+BASELINE_FORMAT_VERSION = 1
+
+STAGES = (
+    "record_to_dict",
+    "model_validate",
+    "transform_batch",
+    "pandera_validate",
+    "record_to_tuple",
+    "db_insert",
+)
+
+_LOADER_CLASSES = {
+    "ohlcv": TimescaleOHLCVLoader,
+    "trades": TimescaleTradesLoader,
+    "tbbo": TimescaleTBBOLoader,
+    "statistics": TimescaleStatisticsLoader,
+    "definition": TimescaleDefinitionLoader,
+}
+
+
+class StageResult(NamedTuple):
+    """Measurements of one stage of one workload."""
+
+    records: int
+    seconds: float
+    records_per_second: float
+    peak_memory_bytes: int
+    # Rows the stage rejected (Pydantic or Pandera failures); 0 for the other stages
+    errors: int = 0
+
+
+class Regression(NamedTuple):
+    """A stage whose current result is worse than the baseline beyond the allowed margin."""
+
+    workload: str
+    stage: str
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def change(self) -> float:
+        """Relative change from baseline to current (e.g. -0.25 for a 25% drop)."""
+        return (self.current - self.baseline) / self.baseline if self.baseline else 0.0
+
+
+def _measure(func: Callable[[], Any], records: int, repeat: int) -> tuple:
+    """
+    Time ``func`` ``repeat`` times and measure its peak allocation once.
+
+    Returns:
+        Tuple of (StageResult without errors, value returned by the last call)
+    """
+    best = float("inf")
+    output = None
+    for _ in range(repeat):
+        started_at = time.perf_counter()
+        output = func()
+        best = min(best, time.perf_counter() - started_at)
+
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    rate = records / best if best > 0 else 0.0
+    return StageResult(records, round(best, 6), round(rate, 2), peak), output
+
+
+class IngestionBenchmark:
+    """Runs the per-stage benchmark for one or more synthetic workloads."""
+
+    def __init__(
+        self,
+        records: int = 10_000,
+        repeat: int = 3,
+        seed: int = 42,
+        rule_engine: Optional[RuleEngine] = None,
+        include_db: bool = False,
+        load_method: str = LOAD_METHOD_INSERT,
+        batch_size: int = 1000,
+        connection_params: Optional[Dict[str, Any]] = None
+    ):
+        """
+        Initialize the benchmark.
+
+        Args:
+            records: Synthetic records generated per workload
+            repeat: Timed runs per stage; the fastest one is reported
+            seed: Seed of the synthetic record generators
+            rule_engine: RuleEngine to benchmark (default: the Databento mappings)
+            include_db: Whether to run the insert stage against a database
+            load_method: Loader load method used by the insert stage ('insert' or 'copy')
+            batch_size: Rows per insert batch, as in the loaders' insert methods
+            connection_params: Database connection parameters (default: TIMESCALEDB_* environment)
+
+        Raises:
+            ValueError: If records or repeat is below 1
+        """
+        if records < 1 or repeat < 1:
+            raise ValueError(f"Invalid benchmark volume: records={records}, repeat={repeat}")
+
+        self.records = records
+        self.repeat = repeat
+        self.seed = seed
+        self.rule_engine = rule_engine or create_rule_engine()
+        self.include_db = include_db
+        self.load_method = load_method
+        self.batch_size = batch_size
+        self.connection_params = connection_params
+        self.adapter = DatabentoAdapter({"validation": {"quarantine_enabled": False}})
+
+    def run(self, workloads: Sequence[str] = tuple(WORKLOAD_SCHEMAS)) -> Dict[str, Any]:
+        """
+        Benchmark each workload and return a baseline document.
+
+        Args:
+            workloads: Workload names (keys of ``WORKLOAD_SCHEMAS``)
+
+        Returns:
+            JSON-serializable dict with run metadata and per-stage results
+        """
+        results = {}
+        for workload in workloads:
+            stages = self.run_workload(workload)
+            results[workload] = {stage: result._asdict() for stage, result in stages.items()}
+
+        return {
+            "format_version": BASELINE_FORMAT_VERSION,
+            "created_at": datetime.now(UTC).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "records": self.records,
+            "repeat": self.repeat,
+            "seed": self.seed,
+            "load_method": self.load_method if self.include_db else None,
+            "results": results,
+        }
+
+    def run_workload(self, workload: str) -> Dict[str, StageResult]:
+        """
+        Benchmark every stage of one workload.
+
+        Args:
+            workload: Workload name (key of ``WORKLOAD_SCHEMAS``)
+
+        Returns:
+            Stage name -> StageResult, in pipeline order
+        """
+        schema = WORKLOAD_SCHEMAS[workload]
+        raw_records = generate_records(workload, self.records, seed=self.seed)
+        symbols = None if workload == "definition" else [DEFAULT_SYMBOL]
+        count = len(raw_records)
+        results: Dict[str, StageResult] = {}
+
+        results["record_to_dict"], record_dicts = _measure(
+            lambda: [self.adapter._record_to_dict(record, symbols) for record in raw_records],
+            count, self.repeat
+        )
+
+        model_cls = DATABENTO_SCHEMA_MODEL_MAPPING[schema]
+        strict = self.adapter.strict_mode
+
+        def validate_models():
+            models, failed = [], 0
+            for record_dict in record_dicts:
+                try:
+                    models.append(model_cls.model_validate(record_dict, strict=strict))
+                except ValidationError:
+                    failed += 1
+            return models, failed
+
+        stage, (models, failed) = _measure(validate_models, count, self.repeat)
+        results["model_validate"] = stage._replace(errors=failed)
+
+        results["transform_batch"], transformed = _measure(
+            lambda: self.rule_engine.transform_batch(models, schema, validate=False),
+            len(models), self.repeat
+        )
+
+        validation_schema = get_validation_schema(schema)
+
+        def validate_frame():
+            try:
+                validation_schema.validate(RuleEngine._batch_validation_frame(transformed), lazy=True)
+                return 0
+            except pa.errors.SchemaErrors as err:
+                return int(failure_mask_from_cases(pd.RangeIndex(len(transformed)), err.failure_cases).sum())
+
+        stage, failed = _measure(validate_frame, len(transformed), self.repeat)
+        results["pandera_validate"] = stage._replace(errors=failed)
+
+        loader = self._create_loader(workload)
+        to_tuple = self._tuple_converter(workload, loader, schema)
+        results["record_to_tuple"], rows = _measure(
+            lambda: [to_tuple(model) for model in models],
+            len(models), self.repeat
+        )
+
+        if self.include_db:
+            loader.create_schema_if_not_exists()
+            results["db_insert"], _ = _measure(
+                lambda: self._insert_and_rollback(loader, rows),
+                len(rows), self.repeat
+            )
+
+        return results
+
+    def _create_loader(self, workload: str):
+        """Create the loader of a workload with the benchmark's load method."""
+        return _LOADER_CLASSES[workload](
+            connection_params=self.connection_params,
+            load_method=self.load_method
+        )
+
+    @staticmethod
+    def _tuple_converter(workload: str, loader: Any, schema: str) -> Callable[[Any], tuple]:
+        """Bind the loader's ``_record_to_tuple`` to the arguments its insert method passes."""
+        if workload == "definition":
+            return loader._record_to_tuple
+        if workload == "ohlcv":
+            granularity = schema.split("-")[-1]
+            return lambda record: loader._record_to_tuple(record, granularity, "databento")
+        return lambda record: loader._record_to_tuple(record, "databento")
+
+    def _insert_and_rollback(self, loader: Any, rows: List[tuple]) -> None:
+        """Write ``rows`` in loader-sized batches and roll the transaction back."""
+        insert_sql = loader._build_insert_sql()
+        with loader.get_connection() as conn:
+            try:
+                with conn.cursor() as cursor:
+                    for start in range(0, len(rows), self.batch_size):
+                        loader._write_batch(
+                            cursor, insert_sql, rows[start:start + self.batch_size], loader.load_method
+                        )
+            finally:
+                conn.rollback()
+
+
+def save_baseline(document: Dict[str, Any], path: str) -> Path:
+    """Write a benchmark document as JSON, creating parent directories."""
+    output = Path(path)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(document, indent=2))
+    return output
+
+
+def load_baseline(path: str) -> Dict[str, Any]:
+    """
+    Read a benchmark document.
+
+    Raises:
+        ValueError: If the file was written by an incompatible benchmark version
+    """
+    document = json.loads(Path(path).read_text())
+    version = document.get("format_version")
+    if version != BASELINE_FORMAT_VERSION:
+        raise ValueError(f"Unsupported benchmark format version {version} in {path}")
+    return document
+
+
+def compare_results(
+    baseline: Dict[str, Any],
+    current: Dict[str, Any],
+    max_slowdown: float = 0.10,
+    max_memory_growth: float = 0.25
+) -> List[Regression]:
+    """
+    Compare two benchmark documents stage by stage.
+
+    Only stages present in both documents are compared, so a baseline recorded
+    without ``--db`` can still be checked against a run with it.
+
+    Args:
+        baseline: Reference document
+        current: Document to check
+        max_slowdown: Allowed relative drop of records/s (0.10 = 10%)
+        max_memory_growth: Allowed relative growth of peak memory (0.25 = 25%)
+
+    Returns:
+        Regressions found, in workload and stage order
+    """
+    regressions = []
+    for workload, baseline_stages in baseline["results"].items():
+        current_stages = current["results"].get(workload, {})
+        for stage in STAGES:
+            if stage not in baseline_stages or stage not in current_stages:
+                continue
+            before, after = baseline_stages[stage], current_stages[stage]
+
+            if after["records_per_second"] < before["records_per_second"] * (1 - max_slowdown):
+                regressions.append(Regression(
+                    workload, stage, "records_per_second",
+                    before["records_per_second"], after["records_per_second"]
+                ))
+            if after["peak_memory_bytes"] > before["peak_memory_bytes"] * (1 + max_memory_growth):
+                regressions.append(Regression(
+                    workload, stage, "peak_memory_bytes",
+                    before["peak_memory_bytes"], after["peak_memory_bytes"]
+                ))
+    return regressions
+
+
+def format_results(document: Dict[str, Any]) -> str:
+    """Render a benchmark document as a plain-text table."""
+    lines = [f"{'workload':<12} {'stage':<18} {'records/s':>14} {'seconds':>10} {'peak MiB':>10} {'errors':>7}"]
+    for workload, stages in document["results"].items():
+        for stage in STAGES:
+            if stage not in stages:
+                continue
+            result = stages[stage]
+            lines.append(
+                f"{workload:<12} {stage:<18} {result['records_per_second']:>14,.0f} "
+                f"{result['seconds']:>10.4f} {result['peak_memory_bytes'] / 2 ** 20:>10.2f} "
+                f"{result['errors']:>7}"
+            )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Command-line entry point; returns the process exit code."""
+    parser = argparse.ArgumentParser(description="Ingestion hot-path benchmark")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="Benchmark synthetic workloads and save the results")
+    run_parser.add_argument("--workloads", nargs="+", choices=list(WORKLOAD_SCHEMAS), default=list(WORKLOAD_SCHEMAS))
+    run_parser.add_argument("--records", type=int, default=10_000, help="Synthetic records per workload")
+    run_parser.add_argument("--repeat", type=int, default=3, help="Timed runs per stage")
+    run_parser.add_argument("--seed", type=int, default=42)
+    run_parser.add_argument("--db", action="store_true", help="Also benchmark inserts (TIMESCALEDB_* connection)")
+    run_parser.add_argument("--load-method", choices=list(LOAD_METHODS), default=LOAD_METHOD_INSERT)
+    run_parser.add_argument("--output", default="benchmark_results/ingestion_benchmark.json")
+    run_parser.add_argument("--compare-to", help="Baseline to check the new results against")
+
+    compare_parser = commands.add_parser("compare", help="Flag regressions between two result files")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+
+    for command_parser in (run_parser, compare_parser):
+        command_parser.add_argument("--max-slowdown", type=float, default=0.10)
+        command_parser.add_argument("--max-memory-growth", type=float, default=0.25)
+
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        benchmark = IngestionBenchmark(
+            records=args.records,
+            repeat=args.repeat,
+            seed=args.seed,
+            include_db=args.db,
+            load_method=args.load_method
+        )
+        current = benchmark.run(args.workloads)
+        print(format_results(current))
+        print(f"\nResults saved to {save_baseline(current, args.output)}")
+        if not args.compare_to:
+            return 0
+        baseline = load_baseline(args.compare_to)
+    else:
+        baseline, current = load_baseline(args.baseline), load_baseline(args.current)
+
+    regressions = compare_results(baseline, current, args.max_slowdown, args.max_memory_growth)
+    for regression in regressions:
+        print(
+            f"REGRESSION {regression.workload}/{regression.stage} {regression.metric}: "
+            f"{regression.baseline:,.0f} -> {regression.current:,.0f} ({regression.change:+.1%})"
+        )
+    if not regressions:
+        print("No regressions")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
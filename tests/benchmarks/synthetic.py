@@ -0,0 +1,276 @@
+"""
+Synthetic Databento records for the ingestion benchmarks.
+
+The generators build plain objects carrying the same attributes as the DBN
+messages the Databento client yields (fixed-point integer prices, nanosecond
+timestamps, character codes as integers), so ``DatabentoAdapter._record_to_dict``
+and every later stage run exactly as they do on API data. Output is
+deterministic for a given seed.
+"""
+
+import random
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List
+
+# Fixed-point scale of DBN prices
+PRICE_SCALE = 1_000_000_000
+NANOS_PER_SECOND = 1_000_000_000
+
+# 2024-01-02 00:00:00 UTC
+BASE_TS_NS = 1_704_153_600 * NANOS_PER_SECOND
+
+# Synthetic instrument IDs start far above the IDs Databento assigns to CME futures
+BASE_INSTRUMENT_ID = 900_000_000
+DEFAULT_INSTRUMENTS = 10
+DEFAULT_SYMBOL = "ES.c.0"
+
+# Benchmark workload -> canonical pipeline schema
+WORKLOAD_SCHEMAS: Dict[str, str] = {
+    "ohlcv": "ohlcv-1d",
+    "trades": "trades",
+    "tbbo": "tbbo",
+    "statistics": "statistics",
+    "definition": "definition",
+}
+
+# Spacing between consecutive events of one instrument
+_EVENT_SPACING_NS = {
+    "ohlcv": 86_400 * NANOS_PER_SECOND,
+    "trades": 250_000,
+    "tbbo": 250_000,
+    "statistics": 60 * NANOS_PER_SECOND,
+    "definition": 3_600 * NANOS_PER_SECOND,
+}
+
+# Statistics types with a price value (opening, settlement, session high/low)
+_PRICE_STAT_TYPES = (1, 3, 4, 5)
+
+_MONTH_CODES = "HMUZ"
+
+
+def _fixed(price: float) -> int:
+    """Convert a price to DBN fixed-point."""
+    return int(round(price * PRICE_SCALE))
+
+
+class _PriceWalk:
+    """Per-instrument random walk on a 0.25 tick grid."""
+
+    def __init__(self, rng: random.Random, start: float = 4500.0, tick: float = 0.25):
+        self.rng = rng
+        self.tick = tick
+        self.prices: Dict[int, float] = {}
+        self.start = start
+
+    def next(self, instrument_id: int) -> float:
+        price = self.prices.get(instrument_id, self.start)
+        price = max(self.tick, price + self.rng.randint(-4, 4) * self.tick)
+        self.prices[instrument_id] = price
+        return price
+
+
+def _header(index: int, workload: str, instruments: int, rtype: int) -> Dict[str, Any]:
+    """Header fields shared by every message: unique (ts_event, instrument_id) per index."""
+    ts_event = BASE_TS_NS + (index // instruments) * _EVENT_SPACING_NS[workload]
+    return {
+        "rtype": rtype,
+        "publisher_id": 1,
+        "instrument_id": BASE_INSTRUMENT_ID + index % instruments,
+        "ts_event": ts_event,
+    }
+
+
+def _ohlcv(index: int, rng: random.Random, walk: _PriceWalk, instruments: int) -> SimpleNamespace:
+    fields = _header(index, "ohlcv", instruments, rtype=35)
+    open_price = walk.next(fields["instrument_id"])
+    close_price = walk.next(fields["instrument_id"])
+    high_price = max(open_price, close_price) + rng.randint(0, 8) * walk.tick
+    low_price = max(walk.tick, min(open_price, close_price) - rng.randint(0, 8) * walk.tick)
+    return SimpleNamespace(
+        **fields,
+        open=_fixed(open_price),
+        high=_fixed(high_price),
+        low=_fixed(low_price),
+        close=_fixed(close_price),
+        volume=rng.randint(1_000, 2_000_000),
+    )
+
+
+def _trade(index: int, rng: random.Random, walk: _PriceWalk, instruments: int) -> SimpleNamespace:
+    fields = _header(index, "trades", instruments, rtype=0)
+    return SimpleNamespace(
+        **fields,
+        ts_recv=fields["ts_event"] + rng.randint(1_000, 50_000),
+        price=_fixed(walk.next(fields["instrument_id"])),
+        size=rng.randint(1, 50),
+        action=ord("T"),
+        side=ord(rng.choice("ABN")),
+        flags=0,
+        depth=0,
+        ts_in_delta=rng.randint(1_000, 20_000),
+        sequence=index,
+    )
+
+
+def _tbbo(index: int, rng: random.Random, walk: _PriceWalk, instruments: int) -> SimpleNamespace:
+    fields = _header(index, "tbbo", instruments, rtype=1)
+    price = walk.next(fields["instrument_id"])
+    level = SimpleNamespace(
+        bid_px=_fixed(price - walk.tick),
+        ask_px=_fixed(price),
+        bid_sz=rng.randint(1, 200),
+        ask_sz=rng.randint(1, 200),
+        bid_ct=rng.randint(1, 40),
+        ask_ct=rng.randint(1, 40),
+    )
+    return SimpleNamespace(
+        **fields,
+        ts_recv=fields["ts_event"] + rng.randint(1_000, 50_000),
+        price=_fixed(price),
+        size=rng.randint(1, 50),
+        action=ord("T"),
+        side=ord(rng.choice("AB")),
+        flags=0,
+        depth=0,
+        ts_in_delta=rng.randint(1_000, 20_000),
+        sequence=index,
+        levels=[level],
+    )
+
+
+def _statistics(index: int, rng: random.Random, walk: _PriceWalk, instruments: int) -> SimpleNamespace:
+    fields = _header(index, "statistics", instruments, rtype=24)
+    return SimpleNamespace(
+        **fields,
+        ts_recv=fields["ts_event"] + rng.randint(1_000, 50_000),
+        ts_ref=fields["ts_event"],
+        price=_fixed(walk.next(fields["instrument_id"])),
+        quantity=rng.randint(0, 500_000),
+        sequence=index,
+        ts_in_delta=rng.randint(1_000, 20_000),
+        stat_type=_PRICE_STAT_TYPES[index % len(_PRICE_STAT_TYPES)],
+        channel_id=1,
+        update_action=1,
+        stat_flags=0,
+    )
+
+
+def _definition(index: int, rng: random.Random, walk: _PriceWalk, instruments: int) -> SimpleNamespace:
+    fields = _header(index, "definition", instruments, rtype=19)
+    year = 24 + (index // len(_MONTH_CODES)) % 10
+    raw_symbol = f"ES{_MONTH_CODES[index % len(_MONTH_CODES)]}{year % 10}"
+    price = walk.next(fields["instrument_id"])
+    activation = fields["ts_event"] - 90 * 86_400 * NANOS_PER_SECOND
+    return SimpleNamespace(
+        **fields,
+        ts_recv=fields["ts_event"] + rng.randint(1_000, 50_000),
+        raw_symbol=raw_symbol,
+        update_action=ord("A"),
+        instrument_class=ord("F"),
+        min_price_increment=_fixed(0.25),
+        display_factor=_fixed(1.0),
+        expiration=fields["ts_event"] + 180 * 86_400 * NANOS_PER_SECOND,
+        activation=activation,
+        high_limit_price=_fixed(price * 1.07),
+        low_limit_price=_fixed(price * 0.93),
+        max_price_variation=_fixed(60.0),
+        unit_of_measure_qty=_fixed(50.0),
+        min_price_increment_amount=_fixed(12.5),
+        price_ratio=0,
+        inst_attrib_value=1,
+        underlying_instrument_id=0,
+        raw_instrument_id=fields["instrument_id"],
+        market_depth_implied=2,
+        market_depth=10,
+        market_segment_id=64,
+        max_trade_volume=3_000,
+        min_lot_size=1,
+        min_block_size=0,
+        min_round_lot_size=1,
+        min_trade_volume=1,
+        contract_multiplier=0,
+        decay_quantity=0,
+        original_contract_size=0,
+        application_id=0,
+        maturity_year=2000 + year,
+        decay_start_date=0,
+        channel_id=310,
+        currency="USD",
+        settlement_currency="USD",
+        security_subtype="",
+        security_group="ES",
+        exchange="XCME",
+        underlying_asset="ES",
+        cfi_code="FFIXSX",
+        security_type="FUT",
+        unit_of_measure="IPNT",
+        underlying_symbol="",
+        strike_currency="",
+        strike_price=0,
+        matching_algorithm=ord("F"),
+        main_fraction=0,
+        price_display_format=0,
+        sub_fraction=0,
+        underlying_product_code=0,
+        maturity_month=3 * (index % len(_MONTH_CODES) + 1),
+        maturity_day=0,
+        maturity_week=0,
+        is_user_defined=ord("N"),
+        contract_multiplier_unit=0,
+        flow_schedule_type=0,
+        tick_rule=0,
+        leg_count=0,
+        leg_index=65535,
+        leg_instrument_id=0,
+        leg_raw_symbol="",
+        leg_instrument_class=127,
+        leg_side=127,
+        leg_price=0,
+        leg_delta=0,
+        leg_ratio_price_numerator=0,
+        leg_ratio_price_denominator=0,
+        leg_ratio_qty_numerator=0,
+        leg_ratio_qty_denominator=0,
+        leg_underlying_id=0,
+    )
+
+
+_GENERATORS: Dict[str, Callable[..., SimpleNamespace]] = {
+    "ohlcv": _ohlcv,
+    "trades": _trade,
+    "tbbo": _tbbo,
+    "statistics": _statistics,
+    "definition": _definition,
+}
+
+
+def generate_records(
+    workload: str,
+    count: int,
+    seed: int = 42,
+    instruments: int = DEFAULT_INSTRUMENTS
+) -> List[SimpleNamespace]:
+    """
+    Generate DBN-like records for one benchmark workload.
+
+    Args:
+        workload: One of ``WORKLOAD_SCHEMAS`` ('ohlcv', 'trades', 'tbbo', 'statistics', 'definition')
+        count: Number of records to generate
+        seed: Random seed; the same seed always yields the same records
+        instruments: Number of distinct instrument IDs the records rotate through
+
+    Returns:
+        Records in event-time order
+
+    Raises:
+        ValueError: If the workload is unknown or count/instruments is not positive
+    """
+    if workload not in _GENERATORS:
+        raise ValueError(f"Unknown workload '{workload}'. Use one of: {list(_GENERATORS)}")
+    if count < 1 or instruments < 1:
+        raise ValueError(f"Invalid synthetic volume: count={count}, instruments={instruments}")
+
+    rng = random.Random(seed)
+    walk = _PriceWalk(rng)
+    generator = _GENERATORS[workload]
+    return [generator(index, rng, walk, instruments) for index in range(count)]
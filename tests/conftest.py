@@ -0,0 +1,21 @@
+"""
+Shared pytest configuration.
+"""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def isolated_write_log(tmp_path, monkeypatch):
+    """Keep loaders under test from publishing writes to the repository's storage write log."""
+    path = tmp_path / "write_log.jsonl"
+    monkeypatch.setenv("STORAGE_WRITE_LOG", str(path))
+    return path
+
+
+@pytest.fixture(autouse=True)
+def isolated_trading_day_bitmaps(tmp_path, monkeypatch):
+    """Keep market calendars under test from reading or writing the repository's trading-day bitmaps."""
+    path = tmp_path / "calendars"
+    monkeypatch.setenv("TRADING_DAY_BITMAP_DIR", str(path))
+    return path
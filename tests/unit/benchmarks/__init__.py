@@ -0,0 +1 @@
+# Unit tests for the benchmark suite 
\ No newline at end of file
@@ -0,0 +1,134 @@
+"""
+Unit tests for the ingestion benchmark suite.
+
+Checks that the synthetic records survive the real conversion and validation
+stages, and that baseline comparison flags throughput and memory regressions.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.ingestion.api_adapters.databento_adapter import DatabentoAdapter
+from src.storage.models import DATABENTO_SCHEMA_MODEL_MAPPING
+from tests.benchmarks.ingestion_benchmark import (
+    BASELINE_FORMAT_VERSION,
+    IngestionBenchmark,
+    compare_results,
+    load_baseline,
+    save_baseline,
+)
+from tests.benchmarks.synthetic import DEFAULT_SYMBOL, WORKLOAD_SCHEMAS, generate_records
+
+
+def _document(**stages):
+    return {
+        "format_version": BASELINE_FORMAT_VERSION,
+        "results": {
+            "trades": {
+                stage: {"records": 100, "seconds": 1.0, "records_per_second": rate,
+                        "peak_memory_bytes": memory, "errors": 0}
+                for stage, (rate, memory) in stages.items()
+            }
+        },
+    }
+
+
+class TestSyntheticRecords:
+    """Test cases for the synthetic record generators."""
+
+    def test_generation_is_deterministic(self):
+        first = generate_records("trades", 50, seed=7)
+        second = generate_records("trades", 50, seed=7)
+        assert [vars(record) for record in first] == [vars(record) for record in second]
+
+    def test_event_keys_are_unique(self):
+        records = generate_records("ohlcv", 200, instruments=4)
+        keys = {(record.ts_event, record.instrument_id) for record in records}
+        assert len(keys) == 200
+
+    @pytest.mark.parametrize("workload", list(WORKLOAD_SCHEMAS))
+    def test_records_validate_as_pydantic_models(self, workload):
+        adapter = DatabentoAdapter({"validation": {"quarantine_enabled": False}})
+        model_cls = DATABENTO_SCHEMA_MODEL_MAPPING[WORKLOAD_SCHEMAS[workload]]
+        symbols = None if workload == "definition" else [DEFAULT_SYMBOL]
+
+        for record in generate_records(workload, 20):
+            model_cls.model_validate(adapter._record_to_dict(record, symbols), strict=True)
+
+    def test_invalid_volume_is_rejected(self):
+        with pytest.raises(ValueError):
+            generate_records("trades", 0)
+        with pytest.raises(ValueError):
+            generate_records("mbo", 10)
+
+
+class TestIngestionBenchmark:
+    """Test cases for running the benchmark stages."""
+
+    def test_workload_reports_every_cpu_stage(self):
+        benchmark = IngestionBenchmark(records=50, repeat=1)
+
+        results = benchmark.run_workload("ohlcv")
+
+        assert list(results) == [
+            "record_to_dict", "model_validate", "transform_batch", "pandera_validate", "record_to_tuple"
+        ]
+        assert results["record_to_dict"].records == 50
+        assert results["model_validate"].errors == 0
+        assert all(result.records_per_second > 0 for result in results.values())
+
+    def test_insert_stage_rolls_back(self):
+        benchmark = IngestionBenchmark(records=30, repeat=1, include_db=True, batch_size=10)
+        loader = MagicMock()
+        loader.load_method = "insert"
+        benchmark._create_loader = MagicMock(return_value=loader)
+        benchmark._tuple_converter = MagicMock(return_value=lambda record: (record.instrument_id,))
+        conn = loader.get_connection.return_value.__enter__.return_value
+
+        results = benchmark.run_workload("trades")
+
+        assert results["db_insert"].records == 30
+        # 3 batches for the timed run plus 3 for the memory run
+        assert loader._write_batch.call_count == 6
+        conn.rollback.assert_called()
+        conn.commit.assert_not_called()
+
+
+class TestCompareResults:
+    """Test cases for baseline comparison."""
+
+    def test_slowdown_beyond_margin_is_flagged(self):
+        baseline = _document(record_to_dict=(1000.0, 100), model_validate=(500.0, 100))
+        current = _document(record_to_dict=(850.0, 100), model_validate=(480.0, 100))
+
+        regressions = compare_results(baseline, current, max_slowdown=0.10)
+
+        assert [(r.stage, r.metric) for r in regressions] == [("record_to_dict", "records_per_second")]
+        assert regressions[0].change == pytest.approx(-0.15)
+
+    def test_memory_growth_beyond_margin_is_flagged(self):
+        baseline = _document(pandera_validate=(1000.0, 1000))
+        current = _document(pandera_validate=(1000.0, 1300))
+
+        regressions = compare_results(baseline, current, max_memory_growth=0.25)
+
+        assert [(r.stage, r.metric) for r in regressions] == [("pandera_validate", "peak_memory_bytes")]
+
+    def test_stages_missing_from_either_side_are_skipped(self):
+        baseline = _document(record_to_dict=(1000.0, 100))
+        current = _document(record_to_dict=(1000.0, 100), db_insert=(1.0, 100))
+
+        assert compare_results(baseline, current) == []
+
+    def test_baseline_round_trip(self, tmp_path):
+        document = _document(record_to_dict=(1000.0, 100))
+        path = save_baseline(document, str(tmp_path / "nested" / "baseline.json"))
+
+        assert load_baseline(str(path)) == document
+
+    def test_incompatible_baseline_is_rejected(self, tmp_path):
+        path = save_baseline({"format_version": 0, "results": {}}, str(tmp_path / "old.json"))
+
+        with pytest.raises(ValueError):
+            load_baseline(str(path))
@@ -259,6 +259,23 @@ class TestIngestCommand:
         assert "DRY RUN MODE" in result.stdout
         assert "Configuration validation passed" in result.stdout
     
+    def test_ingest_command_resume_dry_run(self):
+        """Test that --resume is accepted and reported in the summary."""
+        result = self.runner.invoke(ingestion_app, [
+            "ingest",
+            "--api", "databento",
+            "--dataset", "GLBX.MDP3",
+            "--schema", "ohlcv-1d",
+            "--symbols", "ES.FUT",
+            "--start-date", "2024-01-01",
+            "--end-date", "2024-01-02",
+            "--resume",
+            "--dry-run"
+        ])
+        
+        assert result.exit_code == 0
+        assert "Mode: resume" in result.stdout
+    
     @patch('src.cli.commands.ingestion.GuidedMode')
     @patch('src.cli.commands.ingestion.PipelineOrchestrator')
     def test_ingest_command_guided_mode(self, mock_orchestrator, mock_guided_mode):
@@ -652,5 +669,69 @@ class TestIngestionCommandsErrorHandling:
         assert "Unexpected error occurred" in result.stdout
 
 
+class TestMainEntryPoint:
+    """Test that the top-level commands in main.app forward every option."""
+
+    def setup_method(self):
+        """Set up the runner and the top-level app."""
+        from src.cli.main import app as main_app
+        self.runner = CliRunner()
+        self.app = main_app
+
+    def test_backfill_forwards_options_by_keyword(self):
+        """Test that backfill options reach the ingestion command under their own names."""
+        with patch('cli.commands.ingestion.backfill') as mock_backfill:
+            result = self.runner.invoke(self.app, [
+                "backfill", "DOW30",
+                "--batch-size", "8",
+                "--max-api-calls", "4",
+                "--max-db-writers", "2"
+            ])
+
+        assert result.exit_code == 0, result.stdout
+        kwargs = mock_backfill.call_args.kwargs
+        assert kwargs["symbol_group"] == "DOW30"
+        assert (kwargs["batch_size"], kwargs["max_api_calls"], kwargs["max_db_writers"]) == (8, 4, 2)
+        assert kwargs["retry_failed"] is True
+        assert kwargs["dry_run"] is False
+        assert kwargs["force"] is False
+        assert kwargs["resume"] is False
+
+    def test_resume_reaches_ingest_and_backfill(self):
+        """Test that --resume is accepted by the top-level ingest and backfill commands."""
+        with patch('cli.commands.ingestion.ingest') as mock_ingest, \
+                patch('cli.commands.ingestion.backfill') as mock_backfill:
+            ingest_result = self.runner.invoke(self.app, [
+                "ingest", "--api", "databento", "--job", "ohlcv_1d", "--resume", "--dry-run"
+            ])
+            backfill_result = self.runner.invoke(self.app, ["backfill", "SP500_SAMPLE", "--resume"])
+
+        assert ingest_result.exit_code == 0, ingest_result.stdout
+        assert backfill_result.exit_code == 0, backfill_result.stdout
+        ingest_kwargs = mock_ingest.call_args.kwargs
+        assert ingest_kwargs["resume"] is True
+        assert ingest_kwargs["dry_run"] is True
+        assert ingest_kwargs["job"] == "ohlcv_1d"
+        assert mock_backfill.call_args.kwargs["resume"] is True
+
+    def test_reprocess_reaches_ingest(self):
+        """Test that --reprocess is accepted by the top-level ingest command."""
+        with patch('cli.commands.ingestion.ingest') as mock_ingest:
+            result = self.runner.invoke(self.app, ["ingest", "--api", "databento", "--job", "trades", "--reprocess"])
+
+        assert result.exit_code == 0, result.stdout
+        assert mock_ingest.call_args.kwargs["reprocess"] is True
+        assert mock_ingest.call_args.kwargs["resume"] is False
+
+    def test_incremental_reaches_ingest(self):
+        """Test that --incremental is accepted by the top-level ingest command."""
+        with patch('cli.commands.ingestion.ingest') as mock_ingest:
+            result = self.runner.invoke(self.app, ["ingest", "--api", "databento", "--job", "ohlcv_1d", "--incremental"])
+
+        assert result.exit_code == 0, result.stdout
+        assert mock_ingest.call_args.kwargs["incremental"] is True
+        assert mock_ingest.call_args.kwargs["reprocess"] is False
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
\ No newline at end of file
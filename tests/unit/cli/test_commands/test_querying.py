@@ -5,6 +5,7 @@ Tests all querying-related commands including the main query command
 with comprehensive parameter validation and output formatting.
 """
 
+import json
 from unittest.mock import Mock, patch, MagicMock
 from io import StringIO
 from datetime import datetime, date
@@ -23,7 +24,10 @@ from src.cli.commands.querying import (
     format_table_output,
     format_csv_output,
     format_json_output,
-    write_output_file
+    write_output_file,
+    write_csv_stream,
+    write_json_stream,
+    write_ndjson_stream
 )
 
 
@@ -455,6 +459,157 @@ class TestQueryCommand:
         assert '"symbol": "ES.c.0"' in result.stdout
 
 
+    def test_write_csv_stream(self):
+        """Test CSV rows are written incrementally with a header from the first row."""
+        rows = iter([
+            {"symbol": "ES.c.0", "ts_event": datetime(2024, 1, 2, 14, 30), "price": Decimal("4800.50")},
+            {"symbol": "ES.c.0", "ts_event": datetime(2024, 1, 2, 14, 31), "price": None},
+        ])
+        output = StringIO()
+
+        assert write_csv_stream(rows, output) == 2
+        lines = output.getvalue().splitlines()
+        assert lines[0] == "symbol,ts_event,price"
+        assert lines[1] == "ES.c.0,2024-01-02 14:30:00,4800.50"
+        assert lines[2] == "ES.c.0,2024-01-02 14:31:00,"
+
+    def test_write_csv_stream_empty(self):
+        """Test an empty result still produces a readable file."""
+        output = StringIO()
+
+        assert write_csv_stream(iter([]), output) == 0
+        assert output.getvalue().startswith("# No data found")
+
+    def test_write_ndjson_stream(self):
+        """Test NDJSON writes one JSON object per line."""
+        output = StringIO()
+        rows = iter([{"symbol": "ES.c.0", "price": Decimal("4800.5")}, {"symbol": "NQ.c.0", "price": Decimal("17000")}])
+
+        assert write_ndjson_stream(rows, output) == 2
+        assert [json.loads(line) for line in output.getvalue().splitlines()] == [
+            {"symbol": "ES.c.0", "price": 4800.5},
+            {"symbol": "NQ.c.0", "price": 17000.0},
+        ]
+
+    def test_write_json_stream_matches_document_format(self):
+        """Test the streamed JSON document has the same content as format_json_output."""
+        rows = [{"symbol": "ES.c.0", "date": date(2024, 1, 1), "price": Decimal("4800.50")}]
+        output = StringIO()
+
+        assert write_json_stream(iter(rows), output) == 1
+        assert json.loads(output.getvalue()) == json.loads(format_json_output(rows))
+
+        empty = StringIO()
+        write_json_stream(iter([]), empty)
+        assert json.loads(empty.getvalue()) == {"results": [], "count": 0}
+
+    @patch('src.cli.commands.querying.QueryBuilder')
+    def test_query_command_streams_file_output(self, mock_query_builder, tmp_path):
+        """Test file exports use the streaming iter_* methods instead of query_*."""
+        mock_qb = Mock()
+        mock_query_builder.return_value = mock_qb
+        mock_qb.iter_trades.return_value = iter([
+            {"symbol": "ES.c.0", "price": Decimal("4800.25"), "size": 1}
+            for _ in range(3)
+        ])
+        output_file = tmp_path / "trades.ndjson"
+
+        result = self.runner.invoke(querying_app, [
+            "--symbols", "ES.c.0",
+            "--schema", "trades",
+            "--start-date", "2024-01-01",
+            "--end-date", "2024-01-02",
+            "--output-format", "ndjson",
+            "--output-file", str(output_file),
+            "--fetch-size", "500"
+        ], input="y\n")
+
+        assert result.exit_code == 0
+        assert "Records written: 3" in result.stdout
+        mock_qb.query_trades.assert_not_called()
+        assert mock_qb.iter_trades.call_args.kwargs["fetch_size"] == 500
+        assert len(output_file.read_text().splitlines()) == 3
+
+    @patch('src.cli.commands.querying.QueryBuilder')
+    def test_query_command_writes_parquet(self, mock_query_builder, tmp_path):
+        """Test parquet exports request columnar record batches and write them as row groups."""
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        schema = pa.schema([("symbol", pa.string()), ("price", pa.float64())])
+        batch = pa.record_batch([pa.array(["ES.c.0"] * 2), pa.array([4800.25, 4800.5])], schema=schema)
+        mock_qb = Mock()
+        mock_query_builder.return_value = mock_qb
+        mock_qb.iter_trades.return_value = pa.RecordBatchReader.from_batches(schema, [batch, batch])
+        output_file = tmp_path / "trades.parquet"
+
+        result = self.runner.invoke(querying_app, [
+            "--symbols", "ES.c.0",
+            "--schema", "trades",
+            "--start-date", "2024-01-01",
+            "--end-date", "2024-01-02",
+            "--output-format", "parquet",
+            "--output-file", str(output_file)
+        ], input="y\n")
+
+        assert result.exit_code == 0
+        assert "Records written: 4" in result.stdout
+        assert mock_qb.iter_trades.call_args.kwargs["columnar"] is True
+        assert pq.ParquetFile(output_file).num_row_groups == 2
+
+    @patch('src.cli.commands.querying.QueryBuilder')
+    def test_query_command_bucket_aggregates_on_server(self, mock_query_builder, tmp_path):
+        """Test --bucket routes OHLCV queries to the server-side aggregation API."""
+        mock_qb = Mock()
+        mock_query_builder.return_value = mock_qb
+        mock_qb.query_ohlcv_buckets.return_value = [
+            {"symbol": "ES.c.0", "open_price": Decimal("4800.25"), "bar_count": 30}
+        ]
+        output_file = tmp_path / "bars.ndjson"
+
+        result = self.runner.invoke(querying_app, [
+            "--symbols", "ES.c.0",
+            "--schema", "ohlcv-1m",
+            "--start-date", "2024-01-02",
+            "--end-date", "2024-01-03",
+            "--bucket", "30m",
+            "--output-format", "ndjson",
+            "--output-file", str(output_file)
+        ], input="y\n")
+
+        assert result.exit_code == 0
+        kwargs = mock_qb.query_ohlcv_buckets.call_args.kwargs
+        assert (kwargs["bucket"], kwargs["granularity"]) == ("30m", "1m")
+        mock_qb.iter_daily_ohlcv.assert_not_called()
+        assert len(output_file.read_text().splitlines()) == 1
+
+    def test_query_command_bucket_validation(self):
+        """Test --bucket rejects malformed widths and unsupported schemas."""
+        result = self.runner.invoke(querying_app, [
+            "--symbols", "ES.c.0",
+            "--schema", "tbbo",
+            "--start-date", "2024-01-01",
+            "--end-date", "2024-01-02",
+            "--bucket", "30x"
+        ])
+
+        assert result.exit_code == 1
+        assert "--bucket is only supported for OHLCV schemas and trades" in result.stdout
+        assert "Invalid bucket '30x'" in result.stdout
+
+    def test_query_command_ndjson_requires_output_file(self):
+        """Test ndjson output is only available for file exports."""
+        result = self.runner.invoke(querying_app, [
+            "--symbols", "ES.c.0",
+            "--start-date", "2024-01-01",
+            "--end-date", "2024-01-02",
+            "--output-format", "ndjson"
+        ])
+
+        assert result.exit_code == 1
+        assert "ndjson output requires --output-file" in result.stdout
+
+
 class TestQueryCommandErrorHandling:
     """Test error handling for query commands."""
     
@@ -98,6 +98,35 @@ class TestSystemCommands:
         assert result.exit_code == 1
         assert "Database environment variables not set" in result.stdout
     
+    @patch('src.cli.commands.system.QueryBuilder')
+    @patch('psycopg2.connect')
+    @patch.dict(os.environ, {
+        'TIMESCALEDB_USER': 'test_user',
+        'TIMESCALEDB_PASSWORD': 'test_pass',
+        'TIMESCALEDB_DBNAME': 'test_db'
+    }, clear=True)
+    def test_status_command_coverage(self, mock_connect, mock_query_builder_class):
+        """Test status --coverage prints the coverage catalog summary."""
+        mock_query_builder_class.return_value.get_coverage_summary.return_value = [{
+            'symbol': 'ES.c.0',
+            'schema': 'ohlcv-1d',
+            'first_day': datetime(2024, 1, 2).date(),
+            'last_day': datetime(2024, 1, 31).date(),
+            'days': 21,
+            'total_rows': 21,
+            'last_updated': datetime(2024, 2, 1, 8, 30)
+        }]
+
+        result = self.runner.invoke(system_app, ["status", "--coverage", "--symbols", "ES.c.0, NQ.c.0", "--schema", "ohlcv-1d"])
+
+        assert result.exit_code == 0
+        assert "Data Coverage" in result.stdout
+        assert "ES.c.0" in result.stdout
+        assert "2024-01-31" in result.stdout
+        mock_query_builder_class.return_value.get_coverage_summary.assert_called_once_with(
+            symbols=['ES.c.0', 'NQ.c.0'], schema='ohlcv-1d'
+        )
+
     @patch('src.cli.commands.system.PipelineOrchestrator')
     def test_list_jobs_success(self, mock_orchestrator_class):
         """Test list_jobs command with successful job loading."""
@@ -0,0 +1,84 @@
+"""
+Unit tests for the precomputed trading-day bitmap.
+"""
+
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+
+from src.cli.trading_day_bitmap import TradingDayBitmap
+
+FIRST = date(2023, 12, 1)
+LAST = date(2024, 2, 29)
+HOLIDAYS = {date(2023, 12, 25), date(2024, 1, 1), date(2024, 1, 15), date(2024, 2, 19)}
+
+
+def _weekdays(first=FIRST, last=LAST):
+    days = []
+    day = first
+    while day <= last:
+        if day.weekday() < 5 and day not in HOLIDAYS:
+            days.append(day)
+        day += timedelta(days=1)
+    return days
+
+
+@pytest.fixture
+def bitmap(tmp_path):
+    path = tmp_path / "NYSE.tdbm"
+    TradingDayBitmap.from_trading_days(FIRST, LAST, _weekdays(), "test calendar").save(path)
+    return TradingDayBitmap.load(path)
+
+
+class TestTradingDayBitmap:
+    """Test cases for TradingDayBitmap."""
+
+    def test_round_trip_keeps_range_and_source(self, bitmap):
+        assert (bitmap.first_day, bitmap.last_day) == (FIRST, LAST)
+        assert bitmap.source == "test calendar"
+        assert bitmap.covers(FIRST) and bitmap.covers(LAST)
+        assert not bitmap.covers(LAST + timedelta(days=1))
+
+    def test_is_trading_day_matches_calendar(self, bitmap):
+        expected = set(_weekdays())
+        day = FIRST
+        while day <= LAST:
+            assert bitmap.is_trading_day(day) == (day in expected), day
+            day += timedelta(days=1)
+
+        with pytest.raises(ValueError):
+            bitmap.is_trading_day(date(2024, 3, 1))
+
+    def test_count_uses_inclusive_bounds(self, bitmap):
+        assert bitmap.count(date(2024, 1, 1), date(2024, 1, 31)) == 21
+        assert bitmap.count(date(2024, 1, 8), date(2024, 1, 8)) == 1
+        assert bitmap.count(date(2024, 1, 6), date(2024, 1, 7)) == 0
+        assert bitmap.count(date(2024, 1, 10), date(2024, 1, 5)) == 0
+        assert bitmap.trading_days(date(2024, 1, 12), date(2024, 1, 17)).tolist() == [
+            date(2024, 1, 12), date(2024, 1, 16), date(2024, 1, 17),
+        ]
+
+    def test_vectorized_next_and_previous(self, bitmap):
+        days = [date(2023, 12, 22), date(2024, 1, 12), date(2024, 2, 29), date(2030, 1, 1)]
+
+        following = bitmap.next_trading_days(days)
+        preceding = bitmap.previous_trading_days(days)
+
+        assert following[:2].tolist() == [date(2023, 12, 26), date(2024, 1, 16)]
+        assert np.isnat(following[2:]).all()
+        assert preceding[:3].tolist() == [date(2023, 12, 21), date(2024, 1, 11), date(2024, 2, 28)]
+        assert np.isnat(preceding[3])
+        assert np.isnat(bitmap.previous_trading_days([FIRST])[0])
+        assert bitmap.is_trading_days(days).tolist() == [True, True, True, False]
+
+    def test_invalid_files_are_rejected(self, tmp_path, bitmap):
+        path = tmp_path / "bad.tdbm"
+        path.write_bytes(b"not a bitmap" * 10)
+        with pytest.raises(ValueError):
+            TradingDayBitmap.load(path)
+
+        source = tmp_path / "NYSE.tdbm"
+        path.write_bytes(source.read_bytes()[:-4])
+        with pytest.raises(ValueError, match="expected"):
+            TradingDayBitmap.load(path)
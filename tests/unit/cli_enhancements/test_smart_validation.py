@@ -16,8 +16,9 @@ import pandas as pd
 
 from src.cli.smart_validation import (
     SmartValidator, SymbolCache, MarketCalendar, ValidationResult, ValidationLevel,
-    validate_cli_input, get_calendar_instance, PANDAS_MARKET_CALENDARS_AVAILABLE
+    validate_cli_input, get_calendar_instance, get_trading_day_bitmap, PANDAS_MARKET_CALENDARS_AVAILABLE
 )
+from src.cli.trading_day_bitmap import TradingDayBitmap
 from src.cli.interactive_workflows import (
     WorkflowBuilder, WorkflowType, WorkflowTemplate, Workflow, WorkflowStep, StepStatus
 )
@@ -925,6 +926,103 @@ class TestMarketCalendarEdgeCases:
         assert calendar.is_trading_day(prev_day)
 
 
+class TestMarketCalendarBitmap:
+    """Test MarketCalendar answering from a persisted trading-day bitmap."""
+
+    def _calendar(self, tmp_path, mock_mcal):
+        mock_mcal.__version__ = "test"
+        mock_calendar = MagicMock()
+        mock_mcal.get_calendar.return_value = mock_calendar
+        get_calendar_instance.cache_clear()
+
+        trading_days = [
+            d.date() for d in pd.bdate_range("2024-01-01", "2024-12-31")
+            if d.date() not in (date(2024, 1, 1), date(2024, 12, 25))
+        ]
+        TradingDayBitmap.from_trading_days(
+            date(2024, 1, 1), date(2024, 12, 31), trading_days, "pandas_market_calendars test"
+        ).save(tmp_path / "NYSE.tdbm")
+        return MarketCalendar("NYSE", bitmap_dir=str(tmp_path)), mock_calendar
+
+    @patch('src.cli.smart_validation.PANDAS_MARKET_CALENDARS_AVAILABLE', True)
+    @patch('src.cli.smart_validation.mcal')
+    def test_trading_days_answered_from_bitmap(self, mock_mcal, tmp_path):
+        calendar, mock_calendar = self._calendar(tmp_path, mock_mcal)
+
+        assert calendar.trading_day_bitmap is get_trading_day_bitmap("NYSE", str(tmp_path))
+        assert not calendar.is_trading_day(date(2024, 1, 1))
+        assert calendar.is_trading_day(date(2024, 1, 2))
+        assert calendar.get_trading_days_count(date(2024, 1, 1), date(2024, 1, 31)) == 22
+        assert calendar.get_trading_days_count(date(2024, 1, 10), date(2024, 1, 5)) == 0
+        assert calendar.get_trading_days(date(2024, 12, 24), date(2024, 12, 27)) == [
+            date(2024, 12, 24), date(2024, 12, 26), date(2024, 12, 27)
+        ]
+        mock_calendar.schedule.assert_not_called()
+        mock_calendar.valid_days.assert_not_called()
+
+    @patch('src.cli.smart_validation.PANDAS_MARKET_CALENDARS_AVAILABLE', True)
+    @patch('src.cli.smart_validation.mcal')
+    def test_next_and_previous_trading_days(self, mock_mcal, tmp_path):
+        calendar, _ = self._calendar(tmp_path, mock_mcal)
+
+        assert calendar.get_next_trading_day(date(2024, 12, 24)) == date(2024, 12, 26)
+        assert calendar.get_previous_trading_day(date(2024, 1, 8)) == date(2024, 1, 5)
+        assert calendar.get_next_trading_days([date(2024, 1, 5), date(2024, 12, 24)]) == [
+            date(2024, 1, 8), date(2024, 12, 26)
+        ]
+        assert calendar.get_previous_trading_days([date(2024, 3, 4), date(2024, 12, 26)]) == [
+            date(2024, 3, 1), date(2024, 12, 24)
+        ]
+
+    @patch('src.cli.smart_validation.PANDAS_MARKET_CALENDARS_AVAILABLE', True)
+    @patch('src.cli.smart_validation.mcal')
+    def test_existing_bitmap_needs_no_calendar(self, mock_mcal, tmp_path):
+        calendar, _ = self._calendar(tmp_path, mock_mcal)
+
+        assert calendar.is_trading_day(date(2024, 7, 5))
+        mock_mcal.get_calendar.assert_not_called()
+
+    @patch('src.cli.smart_validation.PANDAS_MARKET_CALENDARS_AVAILABLE', False)
+    def test_bitmap_used_without_pandas_market_calendars(self, tmp_path, isolated_trading_day_bitmaps):
+        trading_days = [d.date() for d in pd.bdate_range("2024-01-01", "2024-12-31") if d.date() != date(2024, 7, 4)]
+        TradingDayBitmap.from_trading_days(
+            date(2024, 1, 1), date(2024, 12, 31), trading_days, "pandas_market_calendars test"
+        ).save(isolated_trading_day_bitmaps / "NYSE.tdbm")
+
+        calendar = MarketCalendar("NYSE")
+
+        assert calendar.trading_day_bitmap is not None
+        assert calendar._calendar is None
+        assert not calendar.is_trading_day(date(2024, 7, 4))
+
+    @patch('src.cli.smart_validation.PANDAS_MARKET_CALENDARS_AVAILABLE', True)
+    @patch('src.cli.smart_validation.mcal')
+    def test_rebuild_replaces_bitmap_from_other_release(self, mock_mcal, tmp_path):
+        calendar, mock_calendar = self._calendar(tmp_path, mock_mcal)
+        mock_calendar.valid_days.return_value = pd.bdate_range("1990-01-01", "2050-12-31")
+
+        assert get_trading_day_bitmap("NYSE", tmp_path, rebuild=True) is calendar.trading_day_bitmap
+        mock_calendar.valid_days.assert_not_called()
+
+        mock_mcal.__version__ = "newer"
+        rebuilt = get_trading_day_bitmap("NYSE", tmp_path, rebuild=True)
+
+        assert rebuilt.source == "pandas_market_calendars newer"
+        assert rebuilt.first_day == date(1990, 1, 1)
+        assert TradingDayBitmap.load(tmp_path / "NYSE.tdbm").source == rebuilt.source
+
+    @patch('src.cli.smart_validation.PANDAS_MARKET_CALENDARS_AVAILABLE', True)
+    @patch('src.cli.smart_validation.mcal')
+    def test_dates_outside_bitmap_use_calendar(self, mock_mcal, tmp_path):
+        calendar, mock_calendar = self._calendar(tmp_path, mock_mcal)
+        mock_calendar.valid_days.return_value = pd.DatetimeIndex([
+            pd.Timestamp('2024-12-31'), pd.Timestamp('2025-01-02')
+        ])
+
+        assert calendar.get_trading_days_count(date(2024, 12, 31), date(2025, 1, 2)) == 2
+        mock_calendar.valid_days.assert_called_once()
+
+
 class TestSymbolCacheAdvanced:
     """Advanced tests for SymbolCache."""
     
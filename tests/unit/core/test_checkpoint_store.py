@@ -0,0 +1,89 @@
+"""
+Unit tests for the chunk-level CheckpointStore.
+"""
+
+from src.core.checkpoint_store import CheckpointStore
+
+JOB = {
+    "name": "es trades",
+    "dataset": "GLBX.MDP3",
+    "schema": "trades",
+    "symbols": ["ES.c.0", "NQ.c.0"],
+    "stype_in": "continuous",
+}
+
+
+class TestCheckpointStore:
+    """Test cases for CheckpointStore."""
+
+    def test_completed_chunks_round_trip(self, tmp_path):
+        store = CheckpointStore(str(tmp_path))
+        store.mark_completed(JOB, "2024-01-01", "2024-01-02", records=10)
+        store.mark_completed(JOB, "2024-01-02", "2024-01-03")
+
+        assert CheckpointStore(str(tmp_path)).completed_chunks(JOB) == {
+            ("2024-01-01", "2024-01-02"),
+            ("2024-01-02", "2024-01-03"),
+        }
+
+    def test_missing_manifest_has_no_chunks(self, tmp_path):
+        assert CheckpointStore(str(tmp_path)).completed_chunks(JOB) == set()
+
+    def test_torn_line_is_ignored(self, tmp_path):
+        store = CheckpointStore(str(tmp_path))
+        store.mark_completed(JOB, "2024-01-01", "2024-01-02")
+        with open(store.manifest_path(JOB), "a", encoding="utf-8") as manifest:
+            manifest.write('{"start": "2024-01-02", "en')
+
+        assert store.completed_chunks(JOB) == {("2024-01-01", "2024-01-02")}
+
+    def test_job_key_depends_on_data_identity(self):
+        reordered = dict(JOB, symbols=["NQ.c.0", "ES.c.0"])
+
+        assert CheckpointStore.job_key(JOB) == CheckpointStore.job_key(reordered)
+        assert CheckpointStore.job_key(JOB) != CheckpointStore.job_key(dict(JOB, schema="tbbo"))
+        assert CheckpointStore.job_key(JOB) != CheckpointStore.job_key(dict(JOB, symbols=["ES.c.0"]))
+        assert CheckpointStore.job_key(JOB).startswith("es_trades-")
+
+    def test_clear_forgets_job(self, tmp_path):
+        store = CheckpointStore(str(tmp_path))
+        other_job = dict(JOB, schema="tbbo")
+        store.mark_completed(JOB, "2024-01-01", "2024-01-02")
+        store.mark_completed(other_job, "2024-01-01", "2024-01-02")
+
+        store.clear(JOB)
+
+        assert store.completed_chunks(JOB) == set()
+        assert store.completed_chunks(other_job) == {("2024-01-01", "2024-01-02")}
+
+    def test_window_covered_by_finer_completed_windows(self):
+        completed = {
+            ("2024-01-01", "2024-01-01T12:00:00"),
+            ("2024-01-01T12:00:00", "2024-01-02T00:00:00+00:00"),
+            ("2024-01-02", "2024-01-03"),
+        }
+
+        assert CheckpointStore.is_covered(completed, "2024-01-02", "2024-01-03")
+        assert CheckpointStore.is_covered(completed, "2024-01-01T00:00:00+00:00", "2024-01-03T00:00:00+00:00")
+        assert not CheckpointStore.is_covered(completed, "2024-01-02", "2024-01-04")
+        assert not CheckpointStore.is_covered(set(), "2024-01-01", "2024-01-02")
+
+    def test_precomputed_spans_match_per_call_merge(self):
+        completed = {
+            ("2024-01-01", "2024-01-02"),
+            ("2024-01-02", "2024-01-03"),
+            ("2024-01-05", "2024-01-06"),
+            ("not-a-date", "2024-01-07"),
+        }
+        spans = CheckpointStore.covered_spans(completed)
+
+        assert len(spans) == 2
+        for start, end in [
+            ("2024-01-01", "2024-01-03"), ("2024-01-02T06:00:00", "2024-01-02T18:00:00"),
+            ("2024-01-02", "2024-01-04"), ("2024-01-03", "2024-01-05"), ("2024-01-05", "2024-01-06"),
+            ("2023-12-31", "2024-01-01T12:00:00"), ("2024-01-06", "2024-01-07"),
+        ]:
+            assert (CheckpointStore.is_covered(completed, start, end, spans)
+                    == CheckpointStore.is_covered(completed, start, end))
+        assert CheckpointStore.is_covered(completed, "2024-01-01T12:00:00", "2024-01-03", spans)
+        assert not CheckpointStore.is_covered(completed, "2024-01-03", "2024-01-05", spans)
@@ -0,0 +1,71 @@
+"""
+Unit tests for incremental ingestion's missing-range computation.
+"""
+
+from datetime import date, timedelta
+
+from src.core.incremental import find_missing_ranges
+
+START = date(2024, 1, 1)
+END = date(2024, 2, 1)
+
+
+def _weekdays(start, end):
+    day, days = start, set()
+    while day < end:
+        if day.weekday() < 5:
+            days.add(day)
+        day += timedelta(days=1)
+    return days
+
+
+class TestFindMissingRanges:
+    """Test cases for find_missing_ranges."""
+
+    def test_nothing_stored_needs_whole_window(self):
+        assert find_missing_ranges({}, ["ES.c.0"], START, END) == [(START, END)]
+
+    def test_top_up_fetches_from_last_stored_day(self):
+        stored = {"ES.c.0": _weekdays(START, date(2024, 1, 26))}
+
+        assert find_missing_ranges(stored, ["ES.c.0"], START, END) == [(date(2024, 1, 25), END)]
+
+    def test_weekends_are_not_gaps_but_long_holes_are(self):
+        stored = {"ES.c.0": _weekdays(START, date(2024, 1, 8)) | _weekdays(date(2024, 1, 22), END)}
+
+        assert find_missing_ranges(stored, ["ES.c.0"], START, END) == [
+            (date(2024, 1, 6), date(2024, 1, 22)),
+            (date(2024, 1, 31), END),
+        ]
+
+    def test_ranges_of_all_symbols_are_merged(self):
+        stored = {
+            "ES.c.0": _weekdays(START, END),
+            "NQ.c.0": _weekdays(date(2024, 1, 15), END),
+        }
+
+        assert find_missing_ranges(stored, ["ES.c.0", "NQ.c.0"], START, END) == [
+            (START, date(2024, 1, 15)),
+            (date(2024, 1, 31), END),
+        ]
+
+    def test_trusting_the_last_day_only_flags_long_trailing_holes(self):
+        stored = {"ES.c.0": _weekdays(START, END)}
+        assert find_missing_ranges(stored, ["ES.c.0"], START, END, refetch_last_day=False) == []
+
+        stored = {"ES.c.0": _weekdays(START, date(2024, 1, 20))}
+        assert find_missing_ranges(stored, ["ES.c.0"], START, END, refetch_last_day=False) == [
+            (date(2024, 1, 20), END),
+        ]
+
+    def test_leading_and_trailing_edges_ignore_the_gap_tolerance(self):
+        stored = {"ES.c.0": _weekdays(date(2024, 1, 4), date(2024, 1, 27))}
+
+        assert find_missing_ranges(stored, ["ES.c.0"], START, END) == [
+            (START, date(2024, 1, 4)),
+            (date(2024, 1, 26), END),
+        ]
+        assert find_missing_ranges(stored, ["ES.c.0"], START, END, refetch_last_day=False) == [
+            (START, date(2024, 1, 4)),
+            (date(2024, 1, 27), END),
+        ]
@@ -0,0 +1,137 @@
+"""
+Unit tests for the concurrent JobScheduler.
+"""
+
+import json
+import threading
+import time
+
+import pytest
+
+from src.core.job_scheduler import JobScheduler, estimate_job_records, plan_jobs
+
+
+def _job(name, schema="ohlcv-1d", days=1, symbols=1, **extra):
+    return {
+        "name": name,
+        "dataset": "GLBX.MDP3",
+        "schema": schema,
+        "symbols": [f"S{index}" for index in range(symbols)],
+        "start_date": "2024-01-01",
+        "end_date": f"2024-01-{days:02d}",
+        **extra,
+    }
+
+
+class FakeOrchestrator:
+    """Runs a job by sleeping; fails the jobs named in ``failures``."""
+
+    def __init__(self, tracker, failures):
+        self.tracker = tracker
+        self.failures = failures
+
+    def execute_pipeline(self, job_config):
+        name = job_config["name"]
+        with self.tracker["lock"]:
+            self.tracker["started"].append(name)
+            self.tracker["active"] += 1
+            self.tracker["max_active"] = max(self.tracker["max_active"], self.tracker["active"])
+        time.sleep(0.02)
+        with self.tracker["lock"]:
+            self.tracker["active"] -= 1
+            self.tracker["finished"].append(name)
+        if name in self.failures:
+            return {"status": "failed", "records_processed": 0, "error": "boom"}
+        stats = {"stages": {"store": {"wall_seconds": 0.5, "cpu_seconds": 0.1, "rows": 10}}}
+        return {"status": "success", "records_processed": 10, "stats": stats}
+
+
+def _scheduler(failures=(), **kwargs):
+    tracker = {"lock": threading.Lock(), "started": [], "finished": [], "active": 0, "max_active": 0}
+    kwargs.setdefault("retry_failed", False)
+    return JobScheduler(lambda limits: FakeOrchestrator(tracker, set(failures)), **kwargs), tracker
+
+
+class TestPlanJobs:
+    """Test cases for job ordering and dependency resolution."""
+
+    def test_orders_by_priority_then_size(self):
+        jobs = plan_jobs([
+            _job("small"),
+            _job("large", schema="ohlcv-1m", days=30),
+            _job("urgent", priority=5),
+        ])
+
+        assert [job.name for job in jobs] == ["urgent", "large", "small"]
+
+    def test_derived_jobs_wait_for_source_granularity(self):
+        jobs = {job.name: job for job in plan_jobs([
+            _job("minute", schema="ohlcv-1m"),
+            _job("hourly", schema="ohlcv-1h", derive_from="1m"),
+        ])}
+
+        assert jobs["hourly"].depends_on == ("minute",)
+        assert jobs["minute"].depends_on == ()
+
+    def test_invalid_job_lists_are_rejected(self):
+        with pytest.raises(ValueError):
+            plan_jobs([_job("a"), _job("a")])
+        with pytest.raises(ValueError):
+            plan_jobs([_job("a", depends_on=["missing"])])
+        with pytest.raises(ValueError, match="cycle"):
+            plan_jobs([_job("a", depends_on=["b"]), _job("b", depends_on=["a"])])
+
+    def test_estimate_scales_with_symbols_and_days(self):
+        assert estimate_job_records(_job("a", schema="ohlcv-1h", days=2, symbols=3)) == 2 * 3 * 23
+        assert estimate_job_records({"name": "b", "schema": "ohlcv-1d"}) == 1
+
+
+class TestJobScheduler:
+    """Test cases for running scheduled jobs."""
+
+    def test_jobs_run_concurrently_and_report(self, tmp_path):
+        scheduler, tracker = _scheduler(max_workers=3, report_dir=str(tmp_path))
+
+        summary = scheduler.run([_job(f"job{index}") for index in range(6)])
+
+        assert tracker["max_active"] > 1
+        assert len(summary["successful"]) == 6
+        assert summary["records_processed"] == 60
+        report = json.loads(open(summary["report_path"]).read())
+        assert report["status"] == "success"
+        assert report["stages"]["store"]["rows"] == 60
+        assert [job["name"] for job in report["jobs"]] == summary["order"]
+
+    def test_dependency_finishes_before_dependent_starts(self):
+        scheduler, tracker = _scheduler(max_workers=4)
+
+        scheduler.run([
+            _job("hourly", schema="ohlcv-1h", derive_from="1m", priority=9),
+            _job("minute", schema="ohlcv-1m"),
+        ])
+
+        assert tracker["finished"].index("minute") < tracker["started"].index("hourly")
+
+    def test_first_failure_stops_the_run(self):
+        scheduler, tracker = _scheduler(failures={"first"}, max_workers=1)
+
+        summary = scheduler.run([_job("first", priority=2), _job("second", priority=1), _job("third")])
+
+        assert tracker["started"] == ["first"]
+        assert summary["stopped_by"] == "first"
+        assert summary["failed"] == ["first: boom"]
+        assert [entry.split(":")[0] for entry in summary["skipped"]] == ["second", "third"]
+
+    def test_keep_going_skips_only_dependents(self):
+        scheduler, tracker = _scheduler(failures={"minute"}, max_workers=2, stop_on_failure=False)
+
+        summary = scheduler.run([
+            _job("minute", schema="ohlcv-1m"),
+            _job("hourly", schema="ohlcv-1h", derive_from="1m"),
+            _job("daily"),
+        ])
+
+        assert "hourly" not in tracker["started"]
+        assert summary["stopped_by"] is None
+        assert summary["successful"] == ["daily"]
+        assert summary["skipped"] == ["hourly: Dependency did not succeed: minute"]
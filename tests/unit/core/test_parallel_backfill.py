@@ -0,0 +1,115 @@
+"""
+Unit tests for the worker-pool ParallelBackfill.
+"""
+
+import threading
+import time
+
+import pytest
+
+from src.core.parallel_backfill import BackfillTask, ConcurrencyLimits, ParallelBackfill
+
+
+class FakeOrchestrator:
+    """Records calls and tracks how many pipelines run at once."""
+
+    def __init__(self, tracker, limits, outcomes):
+        self.tracker = tracker
+        self.limits = limits
+        self.outcomes = outcomes
+
+    def execute_pipeline(self, job_config):
+        with self.tracker["lock"]:
+            self.tracker["calls"].append(job_config)
+            self.tracker["active"] += 1
+            self.tracker["max_active"] = max(self.tracker["max_active"], self.tracker["active"])
+        try:
+            with self.limits.api_calls:
+                with self.tracker["lock"]:
+                    self.tracker["api_active"] += 1
+                    self.tracker["max_api_active"] = max(self.tracker["max_api_active"], self.tracker["api_active"])
+                time.sleep(0.05)
+                with self.tracker["lock"]:
+                    self.tracker["api_active"] -= 1
+            outcome = self.outcomes.get(job_config["symbols"][0], [])
+            outcome = outcome.pop(0) if outcome else "success"
+            if isinstance(outcome, Exception):
+                raise outcome
+            if outcome == "success":
+                return {"status": "success", "records_processed": 10, "warnings": []}
+            return {"status": "failed", "records_processed": 0, "error": outcome}
+        finally:
+            with self.tracker["lock"]:
+                self.tracker["active"] -= 1
+
+
+def _tasks(symbols, schema="ohlcv-1d"):
+    return [BackfillTask(symbol, schema, {"name": f"backfill_{symbol}", "symbols": [symbol]}) for symbol in symbols]
+
+
+def _runner(outcomes=None, **kwargs):
+    tracker = {"lock": threading.Lock(), "calls": [], "orchestrators": 0, "active": 0,
+               "max_active": 0, "api_active": 0, "max_api_active": 0}
+    outcomes = outcomes or {}
+
+    def factory(limits):
+        with tracker["lock"]:
+            tracker["orchestrators"] += 1
+        return FakeOrchestrator(tracker, limits, outcomes)
+
+    return ParallelBackfill(factory, **kwargs), tracker
+
+
+class TestParallelBackfill:
+    """Test cases for ParallelBackfill."""
+
+    def test_tasks_run_in_parallel_on_isolated_orchestrators(self):
+        runner, tracker = _runner(max_workers=4)
+
+        summary = runner.run(_tasks(["ES", "NQ", "CL", "NG", "GC", "SI"]))
+
+        assert tracker["max_active"] > 1
+        assert tracker["orchestrators"] == 6
+        assert summary["successful"] == ["ES (ohlcv-1d)", "NQ (ohlcv-1d)", "CL (ohlcv-1d)",
+                                         "NG (ohlcv-1d)", "GC (ohlcv-1d)", "SI (ohlcv-1d)"]
+        assert summary["records_processed"] == 60
+
+    def test_api_calls_capped_across_workers(self):
+        runner, tracker = _runner(max_workers=6, max_api_calls=2)
+
+        runner.run(_tasks(["ES", "NQ", "CL", "NG", "GC", "SI"]))
+
+        assert tracker["max_api_active"] <= 2
+
+    def test_failed_task_retried_with_resume(self):
+        runner, tracker = _runner({"NQ": ["api down"]}, max_workers=2)
+
+        summary = runner.run(_tasks(["ES", "NQ"]))
+
+        assert summary["successful"] == ["ES (ohlcv-1d)", "NQ (ohlcv-1d) - retry"]
+        assert summary["retried"] == ["NQ (ohlcv-1d)"]
+        retry_config = [call for call in tracker["calls"] if call["symbols"] == ["NQ"]][-1]
+        assert retry_config["resume"] is True
+
+    def test_failure_reported_without_retry(self):
+        runner, tracker = _runner({"NQ": [RuntimeError("boom")]}, max_workers=2, retry_failed=False)
+
+        summary = runner.run(_tasks(["ES", "NQ"]))
+
+        assert summary["failed"] == ["NQ (ohlcv-1d): boom"]
+        assert summary["results"][1].attempts == 1
+        assert len(tracker["calls"]) == 2
+
+    def test_task_failing_every_attempt(self):
+        runner, _ = _runner({"ES": ["first", "second"]}, max_workers=1)
+
+        summary = runner.run(_tasks(["ES"]))
+
+        assert summary["failed"] == ["ES (ohlcv-1d): second"]
+        assert summary["results"][0].attempts == 2
+
+    def test_invalid_limits_rejected(self):
+        with pytest.raises(ValueError):
+            ConcurrencyLimits(api_calls=0)
+        with pytest.raises(ValueError):
+            ParallelBackfill(lambda limits: None, max_workers=0)
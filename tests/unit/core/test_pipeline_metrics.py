@@ -0,0 +1,121 @@
+"""
+Unit tests for the per-stage pipeline metrics.
+
+Covers histogram quantile estimation, stage accounting, lazy iterator timing,
+Prometheus rendering and the end-of-job report files.
+"""
+
+import json
+
+import pytest
+
+from src.core.pipeline_metrics import (
+    LatencyHistogram,
+    StageTimings,
+    render_prometheus,
+    stage_timer,
+    timed_batches,
+    timed_stage_iter,
+    write_job_report,
+    write_prometheus_textfile,
+)
+
+
+class TestLatencyHistogram:
+    """Test cases for LatencyHistogram."""
+
+    def test_empty_histogram_has_no_quantiles(self):
+        histogram = LatencyHistogram()
+
+        assert histogram.quantile(0.5) is None
+        assert histogram.to_dict()["p99_seconds"] is None
+
+    def test_quantiles_interpolate_within_buckets(self):
+        histogram = LatencyHistogram(buckets=(1.0, 2.0, 4.0))
+        for seconds in (0.5, 0.5, 1.5, 3.0):
+            histogram.observe(seconds)
+
+        # Rank 2 of 4 is the last sample of the (0, 1] bucket
+        assert histogram.quantile(0.5) == pytest.approx(1.0)
+        # The top occupied bucket is capped at the largest sample
+        assert histogram.quantile(0.99) == pytest.approx(2.0 + (3.0 - 2.0) * 0.96)
+        assert histogram.cumulative_counts() == [2, 3, 4, 4]
+
+    def test_samples_above_last_bucket_report_max(self):
+        histogram = LatencyHistogram(buckets=(1.0,))
+        histogram.observe(0.5)
+        histogram.observe(7.0)
+
+        assert histogram.quantile(0.99) == 7.0
+
+
+class TestStageTimers:
+    """Test cases for stage timers and timed iterators."""
+
+    def test_timed_batches_counts_items_and_reports_once(self):
+        recorded = []
+
+        items = list(timed_batches(range(5), lambda wall, cpu, rows: recorded.append((wall, cpu, rows))))
+
+        assert items == [0, 1, 2, 3, 4]
+        assert len(recorded) == 1
+        assert recorded[0][2] == 5
+        assert recorded[0][0] >= 0.0
+
+    def test_timed_batches_reports_when_closed_early(self):
+        recorded = []
+        iterator = timed_batches(range(10), lambda wall, cpu, rows: recorded.append(rows))
+
+        next(iterator)
+        next(iterator)
+        iterator.close()
+
+        assert recorded == [2]
+
+    def test_helpers_are_no_ops_without_stats(self):
+        items = [1, 2]
+
+        assert timed_stage_iter(None, "decode", items) is items
+        with stage_timer(None, "fetch", rows=3) as timing:
+            timing.rows = 4
+
+
+class TestPrometheusRendering:
+    """Test cases for the text exposition output."""
+
+    def test_render_includes_counters_stages_and_histogram(self):
+        timings = StageTimings("store")
+        timings.observe(0.02, 0.01, 100)
+
+        text = render_prometheus({"records_stored": 100, "skipped": None}, {"store": timings}, {"pipeline_job": "a"})
+
+        assert 'hist_ingestor_job_records_stored{pipeline_job="a"} 100' in text
+        assert "skipped" not in text
+        assert 'hist_ingestor_stage_rows{pipeline_job="a",stage="store"} 100' in text
+        assert 'hist_ingestor_stage_batch_latency_seconds_bucket{le="0.025",pipeline_job="a",stage="store"} 1' in text
+        assert 'hist_ingestor_stage_batch_latency_seconds_bucket{le="+Inf",pipeline_job="a",stage="store"} 1' in text
+        assert 'hist_ingestor_stage_batch_latency_seconds_count{pipeline_job="a",stage="store"} 1' in text
+        assert text.endswith("\n")
+
+    def test_label_values_are_escaped(self):
+        text = render_prometheus({"records_stored": 1}, {}, {"pipeline_job": 'a"b\\c'})
+
+        assert 'pipeline_job="a\\"b\\\\c"' in text
+
+
+class TestMetricFiles:
+    """Test cases for the report and textfile writers."""
+
+    def test_job_report_is_json(self, tmp_path):
+        path = write_job_report(str(tmp_path / "reports"), "ohlcv 1d/ES", {"job_name": "ohlcv 1d/ES"})
+
+        assert path.name.startswith("ohlcv_1d_ES_")
+        assert json.loads(path.read_text()) == {"job_name": "ohlcv 1d/ES"}
+
+    def test_textfile_replaces_previous_contents(self, tmp_path):
+        target = tmp_path / "textfile" / "ingestor.prom"
+        write_prometheus_textfile(str(target), "old\n")
+        write_prometheus_textfile(str(target), "new\n")
+
+        assert target.read_text() == "new\n"
+        assert [p.name for p in target.parent.iterdir()] == ["ingestor.prom"]
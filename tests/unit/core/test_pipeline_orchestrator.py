@@ -19,6 +19,7 @@ from src.core.pipeline_orchestrator import (
     ComponentInitializationError,
     PipelineExecutionError
 )
+from src.core import checkpoint_store as checkpoint_store_module
 from src.core.config_manager import ConfigManager
 
 
@@ -130,6 +131,61 @@ class TestPipelineStats:
         assert "end_time" in result
         assert "duration_seconds" in result
 
+    def test_add_is_thread_safe(self):
+        """Test that concurrent increments from worker threads are not lost."""
+        import threading
+
+        stats = PipelineStats()
+
+        def increment():
+            for _ in range(1000):
+                stats.add(records_stored=1, chunks_processed=2)
+
+        threads = [threading.Thread(target=increment) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert stats.records_stored == 4000
+        assert stats.chunks_processed == 8000
+
+    def test_stage_timings_in_to_dict(self):
+        """Test that timed stages, bytes and round trips are reported."""
+        stats = PipelineStats()
+
+        with stats.stage("transform", rows=10):
+            pass
+        with pytest.raises(RuntimeError):
+            with stats.stage("store") as timing:
+                timing.rows = 4
+                raise RuntimeError("write failed")
+        assert list(stats.timed_iter("decode", range(3))) == [0, 1, 2]
+        stats.add(bytes_fetched=2048, db_round_trips=6)
+
+        result = stats.to_dict()
+
+        assert result["bytes_fetched"] == 2048
+        assert result["db_round_trips"] == 6
+        assert set(result["stages"]) == {"transform", "store", "decode"}
+        assert result["stages"]["transform"]["rows"] == 10
+        assert result["stages"]["store"]["rows"] == 4
+        assert result["stages"]["decode"]["batches"] == 1
+        assert result["stages"]["decode"]["batch_latency"]["count"] == 1
+
+    def test_prometheus_output(self):
+        """Test rendering stats in the Prometheus text format."""
+        stats = PipelineStats()
+        stats.records_stored = 7
+        with stats.stage("fetch"):
+            pass
+
+        text = stats.to_prometheus({"pipeline_job": "daily"})
+
+        assert 'hist_ingestor_job_records_stored{pipeline_job="daily"} 7' in text
+        assert 'hist_ingestor_stage_batches{pipeline_job="daily",stage="fetch"} 1' in text
+        assert "start_time" not in text
+
 
 class TestPipelineOrchestrator:
     """Test the PipelineOrchestrator class."""
@@ -342,6 +398,45 @@ class TestPipelineOrchestrator:
         # Verify components are reset
         assert orchestrator.adapter is None
         assert orchestrator.storage_loader is None
+
+    def test_cleanup_closes_connection_pool(self, orchestrator):
+        """Test that cleanup closes the shared connection pool."""
+        provider = Mock()
+        provider.stats.return_value = {"checkouts": 3}
+        orchestrator.connection_provider = provider
+
+        orchestrator.cleanup_components()
+
+        provider.close.assert_called_once()
+        assert orchestrator.connection_provider is None
+
+    def test_backfill_worker_keeps_shared_pool_open(self, orchestrator):
+        """Test that an orchestrator with shared concurrency limits leaves the pool to the backfill."""
+        from src.core.parallel_backfill import ConcurrencyLimits
+
+        provider = Mock()
+        provider.stats.return_value = {"checkouts": 3}
+        orchestrator.connection_provider = provider
+        orchestrator.concurrency_limits = ConcurrencyLimits()
+
+        orchestrator.cleanup_components()
+
+        provider.close.assert_not_called()
+        assert orchestrator.connection_provider is None
+
+    def test_storage_holds_db_writer_slot(self, orchestrator):
+        """Test that storage runs inside the shared database writer cap."""
+        from src.core.parallel_backfill import ConcurrencyLimits
+
+        orchestrator.concurrency_limits = ConcurrencyLimits(db_writers=1)
+        slot_free = []
+        orchestrator._store_data = Mock(side_effect=lambda *args: slot_free.append(
+            orchestrator.concurrency_limits.db_writers.acquire(blocking=False)
+        ) or True)
+
+        assert orchestrator._stage_data_storage([Mock()], "job", 0, {}) is True
+        assert slot_free == [False]
+        assert orchestrator.concurrency_limits.db_writers.acquire(blocking=False) is True
     
     def test_get_predefined_job_config_success(self, orchestrator):
         """Test getting predefined job config."""
@@ -411,6 +506,33 @@ class TestPipelineOrchestrator:
         assert result is True
         mock_validate_config.assert_called_once_with(job_config, "databento")
         mock_execute_stages.assert_called_once_with(job_config)
+
+    @patch.object(PipelineOrchestrator, 'validate_job_config', return_value=True)
+    @patch.object(PipelineOrchestrator, '_execute_pipeline_stages', return_value=False)
+    def test_execute_databento_pipeline_writes_metrics(
+        self,
+        mock_execute_stages,
+        mock_validate_config,
+        orchestrator,
+        tmp_path
+    ):
+        """Test that the end-of-job report and Prometheus textfile are written when configured."""
+        import json
+
+        orchestrator.adapter = Mock()
+        orchestrator.storage_loader = Mock()
+        orchestrator.pipeline_config = {"metrics": {"report_dir": str(tmp_path / "reports")}}
+        textfile = tmp_path / "ingestor.prom"
+        job_config = {"name": "test_job", "schema": "trades", "metrics": {"prometheus_textfile": str(textfile)}}
+
+        assert orchestrator.execute_databento_pipeline(job_config) is False
+
+        [report_path] = (tmp_path / "reports").iterdir()
+        report = json.loads(report_path.read_text())
+        assert report["job_name"] == "test_job"
+        assert report["status"] == "failed"
+        assert "stages" in report
+        assert 'pipeline_job="test_job"' in textfile.read_text()
     
     @patch.object(PipelineOrchestrator, 'validate_job_config')
     def test_execute_databento_pipeline_invalid_config(
@@ -437,6 +559,97 @@ class TestPipelineOrchestrator:
         assert result is False
 
 
+class TestStreamingPipeline:
+    """Test the bounded-memory streaming pipeline mode."""
+
+    @pytest.fixture
+    def orchestrator(self):
+        """PipelineOrchestrator with a mocked ConfigManager."""
+        mock_config_manager = Mock(spec=ConfigManager)
+        mock_config_manager.get.return_value = Mock()
+        return PipelineOrchestrator(config_manager=mock_config_manager)
+
+    def test_extraction_stream_yields_bounded_batches(self, orchestrator):
+        """Test that streaming extraction never holds more than one batch."""
+        max_in_flight = {"value": 0}
+        pulled = {"value": 0}
+
+        def record_generator():
+            for i in range(25):
+                pulled["value"] += 1
+                yield {"id": i}
+
+        orchestrator.adapter = Mock()
+        orchestrator.adapter.fetch_historical_data.return_value = record_generator()
+
+        batches = []
+        for batch in orchestrator._stage_data_extraction_stream(
+            {"name": "test_job", "processing_batch_size": 10}
+        ):
+            # Records are pulled lazily: at most one batch ahead of the consumer
+            max_in_flight["value"] = max(max_in_flight["value"], pulled["value"] - sum(len(b) for b in batches))
+            batches.append(batch)
+
+        assert [len(b) for b in batches] == [10, 10, 5]
+        assert max_in_flight["value"] <= 10
+        assert orchestrator.stats.records_fetched == 25
+
+    def test_streaming_flag_routes_to_streaming_stages(self, orchestrator):
+        """Test that streaming jobs do not use list-materializing extraction."""
+        orchestrator._stage_data_extraction = Mock()
+        orchestrator._stage_data_extraction_stream = Mock(return_value=iter([[{"id": 1}], [{"id": 2}]]))
+        orchestrator._stage_data_transformation = Mock(side_effect=lambda x, *args: x)
+        orchestrator._stage_data_validation = Mock(side_effect=lambda x, *args: (x, []))
+        orchestrator._stage_data_storage = Mock(return_value=True)
+
+        result = orchestrator._execute_pipeline_stages({"name": "test_job", "streaming": True})
+
+        assert result is True
+        orchestrator._stage_data_extraction.assert_not_called()
+        assert orchestrator._stage_data_storage.call_count == 2
+        assert orchestrator.stats.chunks_processed == 2
+
+    def test_streaming_progress_uses_running_counters(self):
+        """Test that streaming progress reports running totals."""
+        updates = []
+        mock_config_manager = Mock(spec=ConfigManager)
+        mock_config_manager.get.return_value = Mock()
+        orchestrator = PipelineOrchestrator(
+            config_manager=mock_config_manager,
+            progress_callback=lambda **kwargs: updates.append(kwargs)
+        )
+
+        def batches():
+            orchestrator.stats.records_fetched += 3
+            yield [{"id": i} for i in range(3)]
+            orchestrator.stats.records_fetched += 2
+            yield [{"id": i} for i in range(2)]
+
+        orchestrator._stage_data_extraction_stream = Mock(return_value=batches())
+        orchestrator._stage_data_transformation = Mock(side_effect=lambda x, *args: x)
+        orchestrator._stage_data_validation = Mock(side_effect=lambda x, *args: (x, []))
+        orchestrator._stage_data_storage = Mock(return_value=True)
+
+        assert orchestrator._execute_pipeline_stages({"name": "test_job", "streaming": True}) is True
+
+        completed = [u for u in updates if u.get("description", "").startswith("Completed chunk")]
+        assert [u["completed"] for u in completed] == [3, 5]
+        final = [u for u in updates if "final_stats" in u]
+        assert final[0]["completed"] == 5
+
+    def test_streaming_storage_failure_stops_pipeline(self, orchestrator):
+        """Test that a storage failure aborts the streaming run."""
+        orchestrator._stage_data_extraction_stream = Mock(return_value=iter([[{"id": 1}], [{"id": 2}]]))
+        orchestrator._stage_data_transformation = Mock(side_effect=lambda x, *args: x)
+        orchestrator._stage_data_validation = Mock(side_effect=lambda x, *args: (x, []))
+        orchestrator._stage_data_storage = Mock(return_value=False)
+
+        result = orchestrator._execute_pipeline_stages({"name": "test_job", "streaming": True})
+
+        assert result is False
+        assert orchestrator._stage_data_storage.call_count == 1
+
+
 class TestPipelineIntegration:
     """Integration tests for pipeline execution flow."""
     
@@ -477,6 +690,30 @@ class TestPipelineIntegration:
         mock_execute_databento.assert_called_once()
         mock_cleanup.assert_called_once()
     
+    @patch('src.core.pipeline_orchestrator.ConfigManager')
+    @patch.object(PipelineOrchestrator, 'load_api_config')
+    @patch.object(PipelineOrchestrator, 'initialize_components')
+    @patch.object(PipelineOrchestrator, 'execute_databento_pipeline')
+    @patch.object(PipelineOrchestrator, 'cleanup_components')
+    def test_execute_ingestion_reprocess_uses_cache_only(
+        self,
+        mock_cleanup,
+        mock_execute_databento,
+        mock_initialize,
+        mock_load_config,
+        mock_config_manager_class
+    ):
+        """Test that a reprocess job switches the adapter to cached responses only."""
+        mock_load_config.return_value = {"cache": {"enabled": True, "base_dir": "cache"}}
+        mock_execute_databento.return_value = True
+
+        orchestrator = PipelineOrchestrator()
+        orchestrator.execute_ingestion("databento", overrides={"schema": "trades", "reprocess": True})
+
+        api_config = mock_initialize.call_args[0][1]
+        assert api_config["cache"] == {"enabled": True, "base_dir": "cache", "reprocess": True}
+        assert "reprocess" not in mock_load_config.return_value["cache"]
+    
     @patch('src.core.pipeline_orchestrator.ConfigManager')
     @patch.object(PipelineOrchestrator, 'load_api_config')
     def test_execute_ingestion_unsupported_api(
@@ -501,4 +738,542 @@ class TestPipelineIntegration:
 
 
 if __name__ == "__main__":
-    pytest.main([__file__]) 
\ No newline at end of file
+    pytest.main([__file__]) 
+
+class TestColumnarPipeline:
+    """Test the DataFrame-per-chunk columnar pipeline mode."""
+
+    @pytest.fixture
+    def orchestrator(self):
+        """PipelineOrchestrator with a mocked ConfigManager and loaders."""
+        mock_config_manager = Mock(spec=ConfigManager)
+        mock_config_manager.get.return_value = Mock()
+        orchestrator = PipelineOrchestrator(config_manager=mock_config_manager)
+        orchestrator.ohlcv_loader = Mock()
+        orchestrator.trades_loader = Mock()
+        orchestrator.ohlcv_loader.insert_frame.return_value = {"inserted": 2, "errors": 0}
+        orchestrator.trades_loader.insert_frame.return_value = {"inserted": 2, "errors": 0}
+        return orchestrator
+
+    @staticmethod
+    def _frame(schema):
+        import pandas as pd
+
+        frame = pd.DataFrame({"ts_event": [1, 2], "price": [1, 2]})
+        frame.attrs["schema"] = schema
+        return frame
+
+    def test_columnar_flag_routes_frames_to_loaders(self, orchestrator):
+        """Test that columnar jobs skip per-record stages and load frames directly."""
+        orchestrator.adapter = Mock()
+        orchestrator.adapter.fetch_historical_frames.return_value = iter([self._frame("trades")] * 3)
+        orchestrator._stage_data_transformation = Mock()
+
+        result = orchestrator._execute_pipeline_stages({"name": "test_job", "schema": "trades", "columnar": True})
+
+        assert result is True
+        orchestrator.adapter.fetch_historical_data.assert_not_called()
+        orchestrator._stage_data_transformation.assert_not_called()
+        assert orchestrator.trades_loader.insert_frame.call_count == 3
+        assert orchestrator.stats.records_fetched == 6
+        assert orchestrator.stats.records_stored == 6
+
+    def test_ohlcv_frame_gets_granularity(self, orchestrator):
+        """Test that OHLCV frames are stored with the schema's granularity."""
+        assert orchestrator._stage_frame_storage(self._frame("ohlcv-1h"), {"api": "databento"}) is True
+        orchestrator.ohlcv_loader.insert_frame.assert_called_once()
+        assert orchestrator.ohlcv_loader.insert_frame.call_args.kwargs["granularity"] == "1h"
+
+    def test_frame_storage_failure_stops_pipeline(self, orchestrator):
+        """Test that a loader error fails the columnar run."""
+        orchestrator.adapter = Mock()
+        orchestrator.adapter.fetch_historical_frames.return_value = iter([self._frame("trades")])
+        orchestrator.trades_loader.insert_frame.side_effect = RuntimeError("db down")
+
+        assert orchestrator._execute_pipeline_stages({"name": "test_job", "columnar": True}) is False
+        assert orchestrator.stats.errors_encountered == 1
+
+    def test_frame_transformation_drops_failed_rows(self, orchestrator):
+        """Test that rows failing frame validation are counted and not stored."""
+        import pandas as pd
+        from src.transformation.rule_engine import FrameTransformResult
+
+        frame = self._frame("trades")
+        orchestrator.rule_engine = Mock()
+        orchestrator.rule_engine.transform_frame.return_value = FrameTransformResult(
+            frame, pd.Series([False, True], index=frame.index)
+        )
+
+        stored = orchestrator._stage_frame_transformation(frame, {"name": "test_job"}, 0)
+
+        assert len(stored) == 1
+        assert orchestrator.stats.records_transformed == 2
+        assert orchestrator.stats.records_validated == 1
+        assert orchestrator.stats.records_quarantined == 1
+
+    def test_frame_failures_quarantined_in_bulk(self, orchestrator):
+        """Test that failing frame rows are written to the quarantine in one call."""
+        import pandas as pd
+        from src.transformation.rule_engine import FrameTransformResult
+
+        frame = self._frame("trades")
+        cases = pd.DataFrame({"index": [1], "column": ["size"], "check": ["greater_than(0)"], "schema_context": ["Column"]})
+        orchestrator.rule_engine = Mock()
+        orchestrator.rule_engine.transform_frame.return_value = FrameTransformResult(
+            frame, pd.Series([False, True], index=frame.index), cases
+        )
+        orchestrator.quarantine_manager = Mock()
+
+        orchestrator._stage_frame_transformation(frame, {"name": "test_job"}, 0)
+
+        orchestrator.quarantine_manager.quarantine_records.assert_called_once()
+        args = orchestrator.quarantine_manager.quarantine_records.call_args[0]
+        assert args[2] == [{"ts_event": 2, "price": 2}]
+        assert args[3] == ["size: greater_than(0)"]
+
+
+class TestStagedPipelineExecution:
+    """Test the bounded-queue staged pipeline mode."""
+
+    @pytest.fixture
+    def orchestrator(self):
+        """PipelineOrchestrator with a mocked adapter and loaders."""
+        mock_config_manager = Mock(spec=ConfigManager)
+        mock_config_manager.get.return_value = Mock()
+        orchestrator = PipelineOrchestrator(config_manager=mock_config_manager)
+        orchestrator.pipeline_config = {"queue_depth": 2, "workers": {"fetch": 2, "store": 2}}
+        orchestrator.adapter = Mock()
+        orchestrator.adapter.plan_data_chunks.return_value = ["2024-01", "2024-02", "2024-03"]
+        orchestrator.adapter.fetch_data_chunk.side_effect = lambda request: f"store-{request}"
+        orchestrator.trades_loader = Mock()
+        orchestrator.trades_loader.insert_frame.return_value = {"inserted": 2, "errors": 0}
+        return orchestrator
+
+    def test_columnar_chunks_flow_through_stages(self, orchestrator):
+        """Test that every planned chunk is fetched, decoded and stored."""
+        orchestrator.adapter.decode_data_chunk_frame.side_effect = (
+            lambda request, data_chunk: TestColumnarPipeline._frame("trades")
+        )
+
+        result = orchestrator._execute_pipeline_stages(
+            {"name": "test_job", "schema": "trades", "columnar": True, "staged": True}
+        )
+
+        assert result is True
+        assert orchestrator.adapter.fetch_data_chunk.call_count == 3
+        assert orchestrator.trades_loader.insert_frame.call_count == 3
+        assert orchestrator.stats.records_fetched == 6
+        assert orchestrator.stats.records_stored == 6
+        assert orchestrator.stats.chunks_processed == 3
+        stages = orchestrator.stage_metrics["stages"]
+        assert [stage["stage"] for stage in stages] == ["fetch", "decode", "transform", "store"]
+        assert [stage["workers"] for stage in stages] == [2, 1, 1, 2]
+
+    def test_record_chunks_use_record_stages(self, orchestrator):
+        """Test that non-columnar staged jobs run the per-record transform and storage stages."""
+        orchestrator.pipeline_config["staged"] = True
+        orchestrator.adapter.decode_data_chunk_records.return_value = [Mock(), Mock()]
+        orchestrator._stage_data_storage = Mock(return_value=True)
+
+        assert orchestrator._execute_pipeline_stages({"name": "test_job", "schema": "trades"}) is True
+        assert orchestrator._stage_data_storage.call_count == 3
+        assert orchestrator.stats.records_validated == 6
+
+    def test_storage_failure_stops_pipeline(self, orchestrator):
+        """Test that a failed store aborts the run with errors counted once."""
+        orchestrator.adapter.decode_data_chunk_frame.side_effect = (
+            lambda request, data_chunk: TestColumnarPipeline._frame("trades")
+        )
+        orchestrator.trades_loader.insert_frame.side_effect = RuntimeError("db down")
+
+        result = orchestrator._execute_pipeline_stages(
+            {"name": "test_job", "columnar": True, "staged": True, "stage_workers": {"store": 1}}
+        )
+
+        assert result is False
+        assert orchestrator.stats.errors_encountered == 1
+        assert orchestrator.stage_metrics["stages"][3]["workers"] == 1
+
+    def test_fetch_failure_is_reported(self, orchestrator):
+        """Test that an adapter error fails the run and is counted."""
+        orchestrator.adapter.fetch_data_chunk.side_effect = RuntimeError("api down")
+
+        result = orchestrator._execute_pipeline_stages({"name": "test_job", "columnar": True, "staged": True})
+
+        assert result is False
+        assert orchestrator.stats.errors_encountered == 1
+
+
+class TestValidationFailureIsolation:
+    """Test row-level validation failure isolation in the record pipeline."""
+
+    @pytest.fixture
+    def orchestrator(self):
+        """PipelineOrchestrator with isolation enabled and a mocked RuleEngine."""
+        from src.transformation.rule_engine import BatchTransformResult
+
+        mock_config_manager = Mock(spec=ConfigManager)
+        mock_config_manager.get.return_value = Mock()
+        orchestrator = PipelineOrchestrator(config_manager=mock_config_manager)
+        orchestrator.isolate_validation_failures = True
+        orchestrator.quarantine_manager = Mock()
+        orchestrator.rule_engine = Mock()
+        orchestrator.rule_engine.transform_batch_isolated.return_value = BatchTransformResult(
+            records=[{"size": 1}, {"size": 3}],
+            failed_records=[{"size": 0}],
+            failed_transformed=[{"size": 0}],
+            failure_messages=["size: greater_than(0)"]
+        )
+        return orchestrator
+
+    def test_passing_rows_continue_failing_rows_quarantined(self, orchestrator):
+        """Test that only failing rows are quarantined and the rest are returned."""
+        result = orchestrator._stage_data_transformation(["r1", "r2", "r3"], {"name": "job", "schema": "trades"}, 0)
+
+        assert result == [{"size": 1}, {"size": 3}]
+        orchestrator.rule_engine.transform_batch.assert_not_called()
+        orchestrator.quarantine_manager.quarantine_records.assert_called_once_with(
+            "trades", "pandera_validation", [{"size": 0}], ["size: greater_than(0)"], [{"size": 0}]
+        )
+        assert orchestrator.stats.records_transformed == 3
+        assert orchestrator.stats.records_quarantined == 1
+
+
+class TestTransformedRecordStorage:
+    """Test storing transformed dicts without per-row Pydantic models."""
+
+    @pytest.fixture
+    def orchestrator(self):
+        """PipelineOrchestrator with mocked loaders."""
+        mock_config_manager = Mock(spec=ConfigManager)
+        mock_config_manager.get.return_value = Mock()
+        orchestrator = PipelineOrchestrator(config_manager=mock_config_manager)
+        orchestrator.trades_loader = Mock()
+        orchestrator.trades_loader.frame_to_rows.side_effect = lambda frame, **kwargs: list(frame.itertuples(index=False))
+        orchestrator.trades_loader.insert_rows.return_value = {"inserted": 2, "errors": 0}
+        return orchestrator
+
+    def test_trade_dicts_stored_as_rows(self, orchestrator):
+        """Test that trade dicts are repaired in bulk and inserted as row tuples."""
+        records = [
+            {"ts_event": 1, "instrument_id": 42, "price": 1, "size": 1, "symbol": None},
+            {"ts_event": 2, "instrument_id": 42, "price": 2, "size": 1, "symbol": "ES.c.0"},
+        ]
+
+        result = orchestrator._stage_data_storage(records, "job", 0, {"schema": "trades", "symbols": ["ES.c.0"]})
+
+        assert result is True
+        frame = orchestrator.trades_loader.frame_to_rows.call_args[0][0]
+        assert list(frame["symbol"]) == ["ES.c.0", "ES.c.0"]
+        orchestrator.trades_loader.insert_rows.assert_called_once()
+        orchestrator.trades_loader.insert_trades_records.assert_not_called()
+        assert orchestrator.stats.records_stored == 2
+
+    def test_unrepairable_rows_dropped(self, orchestrator):
+        """Test that rows missing a symbol with no job symbols are dropped."""
+        records = [
+            {"ts_event": 1, "instrument_id": 42, "price": 1, "size": 1, "symbol": None},
+            {"ts_event": 2, "instrument_id": 42, "price": 2, "size": 1, "symbol": "ES.c.0"},
+        ]
+
+        orchestrator._stage_data_storage(records, "job", 0, {"schema": "trades"})
+
+        frame = orchestrator.trades_loader.frame_to_rows.call_args[0][0]
+        assert list(frame["symbol"]) == ["ES.c.0"]
+        assert orchestrator.stats.errors_encountered == 1
+
+
+class TestCheckpointedPipeline:
+    """Test chunk checkpointing and resumed runs."""
+
+    @pytest.fixture
+    def orchestrator(self, tmp_path):
+        """PipelineOrchestrator with a checkpoint store and a mocked chunk-planning adapter."""
+        from src.core.checkpoint_store import CheckpointStore
+        from src.ingestion.api_adapters.databento_adapter import DataChunkRequest
+
+        mock_config_manager = Mock(spec=ConfigManager)
+        mock_config_manager.get.return_value = Mock()
+        orchestrator = PipelineOrchestrator(config_manager=mock_config_manager)
+        orchestrator.checkpoint_store = CheckpointStore(str(tmp_path))
+        orchestrator.adapter = Mock()
+        orchestrator.adapter.plan_data_chunks.return_value = [
+            DataChunkRequest("GLBX.MDP3", "trades", ["ES.c.0"], "continuous", f"2024-01-0{day}", f"2024-01-0{day + 1}")
+            for day in (1, 2, 3)
+        ]
+        orchestrator.adapter.fetch_data_chunks.side_effect = (
+            lambda requests, max_concurrent=None: ((request, f"store-{request.start}") for request in requests)
+        )
+        orchestrator.adapter.decode_data_chunk_frame.side_effect = (
+            lambda request, data_chunk: TestColumnarPipeline._frame("trades")
+        )
+        orchestrator.trades_loader = Mock()
+        orchestrator.trades_loader.insert_frame.return_value = {"inserted": 2, "errors": 0}
+        return orchestrator
+
+    @staticmethod
+    def _job(**overrides):
+        return dict({"name": "test_job", "schema": "trades", "symbols": ["ES.c.0"], "columnar": True}, **overrides)
+
+    def test_stored_chunks_are_checkpointed(self, orchestrator):
+        """Test that every stored chunk window is recorded in the manifest."""
+        job = self._job()
+
+        assert orchestrator._execute_pipeline_stages(job) is True
+        assert orchestrator.checkpoint_store.completed_chunks(job) == {
+            ("2024-01-01", "2024-01-02"), ("2024-01-02", "2024-01-03"), ("2024-01-03", "2024-01-04")
+        }
+
+    def test_resume_skips_completed_chunks(self, orchestrator):
+        """Test that a resumed run only fetches chunks missing from the manifest."""
+        job = self._job(resume=True)
+        orchestrator.checkpoint_store.mark_completed(job, "2024-01-01", "2024-01-02")
+        orchestrator.checkpoint_store.mark_completed(job, "2024-01-02", "2024-01-03")
+
+        assert orchestrator._execute_pipeline_stages(job) is True
+        fetched = orchestrator.adapter.fetch_data_chunks.call_args[0][0]
+        assert [request.start for request in fetched] == ["2024-01-03"]
+        assert orchestrator.stats.chunks_skipped == 2
+        assert orchestrator.stats.records_stored == 2
+        assert len(orchestrator.checkpoint_store.completed_chunks(job)) == 3
+
+    def test_resume_merges_checkpoints_once_per_plan(self, orchestrator):
+        """Test that resume planning merges the completed windows once, not per chunk."""
+        job = self._job(resume=True)
+        orchestrator.checkpoint_store.mark_completed(job, "2024-01-01", "2024-01-01T12:00:00")
+        orchestrator.checkpoint_store.mark_completed(job, "2024-01-01T12:00:00", "2024-01-02")
+
+        with patch("src.core.checkpoint_store._merged_spans", wraps=checkpoint_store_module._merged_spans) as merge:
+            pending = orchestrator._pending_chunk_requests(job, orchestrator.checkpoint_store)
+
+        assert [request.start for request in pending] == ["2024-01-02", "2024-01-03"]
+        assert merge.call_count == 1
+
+    def test_fresh_run_discards_old_checkpoints(self, orchestrator):
+        """Test that a run without resume starts a new manifest."""
+        job = self._job()
+        orchestrator.checkpoint_store.mark_completed(job, "2024-01-01", "2024-01-02")
+        orchestrator.trades_loader.insert_frame.side_effect = [{"inserted": 2, "errors": 0}, RuntimeError("db down")]
+
+        assert orchestrator._execute_pipeline_stages(job) is False
+        assert orchestrator.adapter.fetch_data_chunks.call_args[0][0][0].start == "2024-01-01"
+        assert orchestrator.checkpoint_store.completed_chunks(job) == {("2024-01-01", "2024-01-02")}
+
+    def test_checkpointed_columnar_job_uses_frame_stages(self, orchestrator):
+        """Test that checkpointing keeps a columnar job on the DataFrame stages."""
+        job = self._job()
+
+        with patch.object(orchestrator, "_process_data_chunk") as process_data_chunk, \
+                patch.object(orchestrator, "_stage_frame_transformation",
+                             side_effect=lambda frame, job_config, chunk_idx: frame) as transform:
+            assert orchestrator._execute_pipeline_stages(job) is True
+
+        assert transform.call_count == 3
+        assert orchestrator.trades_loader.insert_frame.call_count == 3
+        process_data_chunk.assert_not_called()
+        orchestrator.adapter.iter_data_chunk_records.assert_not_called()
+
+    def test_checkpointed_streaming_job_processes_bounded_batches(self, orchestrator):
+        """Test that checkpointing keeps a streaming job on bounded record batches."""
+        orchestrator.adapter.iter_data_chunk_records.side_effect = (
+            lambda request, data_chunk: iter([Mock() for _ in range(5)])
+        )
+        job = self._job(columnar=False, streaming=True, processing_batch_size=2)
+
+        with patch.object(orchestrator, "_process_data_chunk", return_value=True) as process_data_chunk:
+            assert orchestrator._execute_pipeline_stages(job) is True
+
+        batch_sizes = [len(call.args[0]) for call in process_data_chunk.call_args_list]
+        assert batch_sizes == [2, 2, 1] * 3
+        orchestrator.adapter.decode_data_chunk_frame.assert_not_called()
+        orchestrator.adapter.fetch_historical_data.assert_not_called()
+        assert len(orchestrator.checkpoint_store.completed_chunks(job)) == 3
+
+    def test_staged_run_checkpoints_chunks(self, orchestrator):
+        """Test that the staged pipeline checkpoints chunks and honors resume."""
+        orchestrator.adapter.fetch_data_chunk.side_effect = lambda request: f"store-{request.start}"
+        job = self._job(staged=True, resume=True, stage_workers={"store": 1})
+        orchestrator.checkpoint_store.mark_completed(job, "2024-01-02", "2024-01-03")
+
+        assert orchestrator._execute_pipeline_stages(job) is True
+        assert orchestrator.adapter.fetch_data_chunk.call_count == 2
+        assert orchestrator.stats.chunks_skipped == 1
+        assert len(orchestrator.checkpoint_store.completed_chunks(job)) == 3
+
+    def test_execute_pipeline_summarizes_run(self, orchestrator):
+        """Test the CLI entry point's result dictionary."""
+        with patch.object(orchestrator, "execute_ingestion", return_value=False) as execute_ingestion:
+            result = orchestrator.execute_pipeline({"api": "databento", "name": "test_job"})
+
+        execute_ingestion.assert_called_once_with("databento", overrides={"api": "databento", "name": "test_job"})
+        assert result["status"] == "failed"
+        assert result["records_processed"] == 0
+        assert "error" in result
+
+
+class TestIncrementalIngestion:
+    """Test restricting jobs to the date ranges missing from storage."""
+
+    @pytest.fixture
+    def orchestrator(self):
+        """PipelineOrchestrator with mocked loaders."""
+        mock_config_manager = Mock(spec=ConfigManager)
+        mock_config_manager.get.return_value = Mock()
+        orchestrator = PipelineOrchestrator(config_manager=mock_config_manager)
+        orchestrator.adapter = Mock()
+        orchestrator.storage_loader = Mock()
+        orchestrator.ohlcv_loader = Mock()
+        orchestrator.trades_loader = Mock()
+        return orchestrator
+
+    @staticmethod
+    def _job(**overrides):
+        return dict({
+            "name": "nightly", "dataset": "GLBX.MDP3", "schema": "ohlcv-1d", "symbols": ["ES.c.0"],
+            "stype_in": "continuous", "start_date": "2024-01-01", "end_date": "2024-01-10", "incremental": True
+        }, **overrides)
+
+    def test_missing_ranges_added_to_job(self, orchestrator):
+        """Test that stored days are looked up per schema and turned into date ranges."""
+        from datetime import date
+
+        orchestrator.ohlcv_loader.get_stored_days.return_value = {
+            "ES.c.0": {date(2024, 1, day) for day in (1, 2, 3, 4, 5, 8)}
+        }
+
+        job_config = orchestrator._restrict_to_missing_ranges(self._job())
+
+        orchestrator.ohlcv_loader.get_stored_days.assert_called_once_with(
+            ["ES.c.0"], date(2024, 1, 1), date(2024, 1, 10), granularity="1d"
+        )
+        assert job_config["date_ranges"] == [("2024-01-08", "2024-01-10")]
+
+    def test_multi_symbol_job_fetches_full_range(self, orchestrator):
+        """Test that multi-symbol jobs, stored under their first symbol, are not restricted."""
+        job = self._job(symbols=["ES.c.0", "NQ.c.0"])
+
+        assert orchestrator._restrict_to_missing_ranges(job) is job
+        orchestrator.ohlcv_loader.get_stored_days.assert_not_called()
+
+    def test_unsupported_schema_fetches_full_range(self, orchestrator):
+        """Test that schemas without a stored-day lookup are left unchanged."""
+        job = self._job(schema="definition")
+
+        assert orchestrator._restrict_to_missing_ranges(job) is job
+
+    def test_up_to_date_job_skips_pipeline(self, orchestrator):
+        """Test that nothing is fetched when no range is missing."""
+        orchestrator._restrict_to_missing_ranges = Mock(return_value=self._job(date_ranges=[]))
+        orchestrator._execute_pipeline_stages = Mock()
+
+        with patch.object(orchestrator, "validate_job_config", return_value=True):
+            assert orchestrator.execute_databento_pipeline(self._job()) is True
+
+        orchestrator._execute_pipeline_stages.assert_not_called()
+
+
+
+class TestDerivedOHLCVJobs:
+    """Test building coarser OHLCV jobs from finer stored bars."""
+
+    @pytest.fixture
+    def orchestrator(self):
+        """PipelineOrchestrator with mocked loaders."""
+        mock_config_manager = Mock(spec=ConfigManager)
+        mock_config_manager.get.return_value = Mock()
+        orchestrator = PipelineOrchestrator(config_manager=mock_config_manager)
+        orchestrator.adapter = Mock()
+        orchestrator.storage_loader = Mock()
+        orchestrator.ohlcv_loader = Mock()
+        orchestrator._execute_pipeline_stages = Mock(return_value=True)
+        return orchestrator
+
+    @staticmethod
+    def _job(**overrides):
+        return dict({
+            "name": "ohlcv_1h", "dataset": "GLBX.MDP3", "schema": "ohlcv-1h", "symbols": ["ES.c.0"],
+            "stype_in": "continuous", "start_date": "2024-01-01", "end_date": "2024-01-31",
+            "date_chunk_interval_days": 14, "derive_from": "1m"
+        }, **overrides)
+
+    def test_complete_source_is_rolled_up_without_fetching(self, orchestrator):
+        """Test that a job whose 1m bars are all stored never reaches the API."""
+        from datetime import date, timedelta
+
+        orchestrator.ohlcv_loader.get_stored_days.return_value = {
+            "ES.c.0": {date(2024, 1, 1) + timedelta(days=offset) for offset in range(30)}
+        }
+        orchestrator.ohlcv_loader.rollup.return_value = 100
+
+        with patch.object(orchestrator, "validate_job_config", return_value=True):
+            assert orchestrator.execute_databento_pipeline(self._job()) is True
+
+        orchestrator.ohlcv_loader.get_stored_days.assert_called_once_with(
+            ["ES.c.0"], date(2024, 1, 1), date(2024, 1, 31), granularity="1m"
+        )
+        assert [c.args[2:4] for c in orchestrator.ohlcv_loader.rollup.call_args_list] == [
+            (date(2024, 1, 1), date(2024, 1, 15)),
+            (date(2024, 1, 15), date(2024, 1, 29)),
+            (date(2024, 1, 29), date(2024, 1, 31)),
+        ]
+        orchestrator.ohlcv_loader.rollup.assert_called_with(
+            "1m", "1h", date(2024, 1, 29), date(2024, 1, 31), symbols=["ES.c.0"]
+        )
+        assert orchestrator.stats.records_stored == 300
+        orchestrator._execute_pipeline_stages.assert_not_called()
+
+    def test_incomplete_source_falls_back_to_fetching(self, orchestrator):
+        """Test that missing 1m days leave the job to the API path."""
+        from datetime import date
+
+        orchestrator.ohlcv_loader.get_stored_days.return_value = {"ES.c.0": {date(2024, 1, 2)}}
+
+        with patch.object(orchestrator, "validate_job_config", return_value=True):
+            assert orchestrator.execute_databento_pipeline(self._job()) is True
+
+        orchestrator.ohlcv_loader.rollup.assert_not_called()
+        orchestrator._execute_pipeline_stages.assert_called_once()
+
+    def test_finer_target_fails_job(self, orchestrator):
+        """Test that bars cannot be derived from coarser ones."""
+        with patch.object(orchestrator, "validate_job_config", return_value=True):
+            assert orchestrator.execute_databento_pipeline(self._job(schema="ohlcv-1s")) is False
+
+        orchestrator._execute_pipeline_stages.assert_not_called()
+
+
+class TestIngestionCoverage:
+    """Test refreshing the ingestion coverage catalog after a run."""
+
+    @pytest.fixture
+    def orchestrator(self):
+        """PipelineOrchestrator with mocked loaders."""
+        mock_config_manager = Mock(spec=ConfigManager)
+        mock_config_manager.get.return_value = Mock()
+        orchestrator = PipelineOrchestrator(config_manager=mock_config_manager)
+        orchestrator.adapter = Mock()
+        orchestrator.storage_loader = Mock()
+        orchestrator.ohlcv_loader = Mock()
+        orchestrator.trades_loader = Mock()
+        return orchestrator
+
+    def test_coverage_refreshed_after_failed_run(self, orchestrator):
+        """Test that chunks stored before a failure are still catalogued."""
+        orchestrator._execute_pipeline_stages = Mock(return_value=False)
+
+        with patch.object(orchestrator, "validate_job_config", return_value=True):
+            assert orchestrator.execute_databento_pipeline({"name": "job"}) is False
+
+        orchestrator.ohlcv_loader.refresh_coverage.assert_called_once()
+        orchestrator.trades_loader.refresh_coverage.assert_called_once()
+        orchestrator.storage_loader.refresh_coverage.assert_called_once()
+
+    def test_coverage_error_does_not_fail_job(self, orchestrator):
+        """Test that a catalog failure is only logged."""
+        orchestrator._execute_pipeline_stages = Mock(return_value=True)
+        orchestrator.ohlcv_loader.refresh_coverage.side_effect = Exception("permission denied")
+
+        with patch.object(orchestrator, "validate_job_config", return_value=True):
+            assert orchestrator.execute_databento_pipeline({"name": "job"}) is True
+
+        orchestrator.trades_loader.refresh_coverage.assert_called_once()
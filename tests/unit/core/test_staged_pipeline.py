@@ -0,0 +1,102 @@
+"""
+Unit tests for the bounded-queue StagedPipeline.
+"""
+
+import threading
+import time
+
+import pytest
+
+from src.core.staged_pipeline import PipelineStage, StagedPipeline
+
+
+class TestStagedPipeline:
+    """Test cases for StagedPipeline."""
+
+    def test_items_flow_through_all_stages(self):
+        stored = []
+        lock = threading.Lock()
+
+        def store(item):
+            with lock:
+                stored.append(item)
+            return item
+
+        pipeline = StagedPipeline("test", range(20), [
+            PipelineStage("double", lambda x: x * 2, workers=3),
+            PipelineStage("store", store, workers=2),
+        ], queue_depth=2)
+
+        result = pipeline.run()
+
+        assert result.success is True
+        assert result.error is None
+        assert sorted(stored) == [x * 2 for x in range(20)]
+        assert [stage["items_processed"] for stage in result.metrics["stages"]] == [20, 20]
+        assert all(queue["max_occupancy"] <= 2 for queue in result.metrics["queues"])
+
+    def test_none_results_are_dropped(self):
+        stored = []
+
+        pipeline = StagedPipeline("test", range(6), [
+            PipelineStage("filter", lambda x: x if x % 2 else None),
+            PipelineStage("store", stored.append),
+        ])
+
+        result = pipeline.run()
+
+        assert result.success is True
+        assert sorted(stored) == [1, 3, 5]
+        assert result.metrics["stages"][0]["items_dropped"] == 3
+
+    def test_stage_error_aborts_run(self):
+        def fail_on_three(item):
+            if item == 3:
+                raise RuntimeError("bad chunk")
+            return item
+
+        pipeline = StagedPipeline("test", range(1000), [
+            PipelineStage("transform", fail_on_three, workers=2),
+            PipelineStage("store", lambda x: x),
+        ], queue_depth=1)
+
+        result = pipeline.run()
+
+        assert result.success is False
+        assert str(result.error) == "bad chunk"
+        assert result.metrics["stages"][1]["items_processed"] < 1000
+
+    def test_source_error_aborts_run(self):
+        def source():
+            yield 1
+            raise ValueError("fetch failed")
+
+        result = StagedPipeline("test", source(), [PipelineStage("store", lambda x: x)]).run()
+
+        assert result.success is False
+        assert isinstance(result.error, ValueError)
+
+    def test_slow_stage_applies_backpressure_and_is_reported(self):
+        def slow_store(item):
+            time.sleep(0.01)
+            return item
+
+        pipeline = StagedPipeline("test", range(10), [
+            PipelineStage("decode", lambda x: x),
+            PipelineStage("store", slow_store),
+        ], queue_depth=1)
+
+        result = pipeline.run()
+
+        assert result.metrics["bottleneck_stage"] == "store"
+        store_queue = result.metrics["queues"][1]
+        assert store_queue["max_occupancy"] == 1
+        assert store_queue["producer_wait_seconds"] > 0
+
+    def test_invalid_configuration(self):
+        with pytest.raises(ValueError):
+            StagedPipeline("test", [], [])
+        with pytest.raises(ValueError):
+            StagedPipeline("test", [], [PipelineStage("store", lambda x: x, workers=0)])
+        with pytest.raises(ValueError):
+            StagedPipeline("test", [], [PipelineStage("store", lambda x: x)], queue_depth=0)
@@ -0,0 +1,97 @@
+"""
+Unit tests for learned chunk densities and adaptive chunk sizing.
+"""
+
+import pytest
+
+from src.ingestion.api_adapters.chunk_density import AdaptiveChunker, ChunkDensityStore, split_window, window_days
+
+KEY = ChunkDensityStore.key("GLBX.MDP3", "trades", ["ES.c.0", "NQ.c.0"], "continuous")
+
+
+class TestChunkDensityStore:
+    """Test cases for ChunkDensityStore."""
+
+    def test_key_ignores_symbol_order(self):
+        assert KEY == ChunkDensityStore.key("GLBX.MDP3", "trades", ["NQ.c.0", "ES.c.0"], "continuous")
+        assert KEY != ChunkDensityStore.key("GLBX.MDP3", "tbbo", ["ES.c.0", "NQ.c.0"], "continuous")
+
+    def test_denser_samples_apply_at_once_sparser_ones_decay(self, tmp_path):
+        store = ChunkDensityStore(str(tmp_path / "density.json"), smoothing=0.5)
+
+        store.observe(KEY, 2.0, records=200)
+        store.observe(KEY, 1.0, records=400)
+        assert store.get(KEY)["records_per_day"] == 400
+
+        store.observe(KEY, 1.0, records=0)
+        assert store.get(KEY)["records_per_day"] == 200
+        assert store.get(KEY)["samples"] == 3
+
+    def test_densities_persist_across_instances(self, tmp_path):
+        path = str(tmp_path / "density.json")
+        ChunkDensityStore(path).observe(KEY, 4.0, nbytes=4096)
+
+        density = ChunkDensityStore(path).get(KEY)
+
+        assert density["bytes_per_day"] == 1024
+        assert "records_per_day" not in density
+
+    def test_empty_windows_are_ignored(self, tmp_path):
+        store = ChunkDensityStore(str(tmp_path / "density.json"))
+        store.observe(KEY, 0.0, records=10)
+
+        assert store.get(KEY) is None
+
+
+class TestAdaptiveChunker:
+    """Test cases for AdaptiveChunker."""
+
+    def _chunker(self, tmp_path, **kwargs):
+        return AdaptiveChunker(ChunkDensityStore(str(tmp_path / "density.json")), **kwargs)
+
+    def test_unmeasured_key_uses_default(self, tmp_path):
+        chunker = self._chunker(tmp_path, target_records=1000)
+
+        assert chunker.chunk_days(KEY, default=7) == 7
+
+    def test_tightest_target_wins_and_rounds_down(self, tmp_path):
+        chunker = self._chunker(tmp_path, target_records=1000, target_bytes=10_000)
+        chunker.store.observe(KEY, 1.0, records=100, nbytes=2_000)
+
+        # 10 days by records, 5 by bytes
+        assert chunker.chunk_days(KEY) == 5
+
+        chunker.store.observe(KEY, 1.0, records=10_000)
+        assert chunker.chunk_days(KEY) == pytest.approx(2 / 24)
+
+    def test_length_is_clamped(self, tmp_path):
+        chunker = self._chunker(tmp_path, target_records=10, min_chunk_hours=6, max_chunk_days=30)
+        chunker.store.observe(KEY, 1.0, records=1_000_000)
+        assert chunker.chunk_days(KEY) == pytest.approx(0.25)
+
+        sparse_key = ChunkDensityStore.key("GLBX.MDP3", "trades", ["ZN.c.0"], "continuous")
+        chunker.store.observe(sparse_key, 10.0, records=0)
+        assert chunker.chunk_days(sparse_key) == 30
+
+    def test_shrink_splits_only_too_long_windows(self, tmp_path):
+        chunker = self._chunker(tmp_path, target_records=100)
+        chunker.store.observe(KEY, 1.0, records=50)
+
+        windows = chunker.shrink([("2024-01-01", "2024-01-03"), ("2024-01-03", "2024-01-09")], KEY)
+
+        assert windows == [
+            ("2024-01-01", "2024-01-03"),
+            ("2024-01-03", "2024-01-05T00:00:00"),
+            ("2024-01-05T00:00:00", "2024-01-07T00:00:00"),
+            ("2024-01-07T00:00:00", "2024-01-09"),
+        ]
+
+
+def test_split_window_covers_span():
+    parts = split_window("2024-01-01T00:00:00+00:00", "2024-01-02T00:00:00+00:00", 0.25)
+
+    assert len(parts) == 4
+    assert parts[0][0] == "2024-01-01T00:00:00+00:00"
+    assert parts[-1][1] == "2024-01-02T00:00:00+00:00"
+    assert all(previous[1] == current[0] for previous, current in zip(parts, parts[1:]))
+    assert sum(window_days(*part) for part in parts) == pytest.approx(1.0)
@@ -6,6 +6,7 @@ connection establishment, data fetching with retries, and error handling.
 """
 
 import os
+import threading
 from datetime import datetime
 from unittest.mock import Mock, patch, MagicMock
 import pytest
@@ -360,4 +361,343 @@ class TestDatabentoAdapter:
         with adapter:
             assert adapter.client == mock_client
         
-        assert adapter._client is None 
\ No newline at end of file
+        assert adapter._client is None 
+
+def _canned_ohlcv_dbn(ts_events, close_px=4005000000000):
+    """Build an in-memory DBN store with one OHLCV-1m record per timestamp."""
+    import databento_dbn
+
+    metadata = databento_dbn.Metadata(
+        dataset="GLBX.MDP3",
+        start=min(ts_events),
+        stype_in=databento_dbn.SType.RAW_SYMBOL,
+        stype_out=databento_dbn.SType.INSTRUMENT_ID,
+        schema=databento_dbn.Schema.OHLCV_1M,
+        symbols=["ESH3"],
+        end=max(ts_events) + 1,
+    )
+    payload = metadata.encode()
+    for ts_event in ts_events:
+        payload += bytes(databento_dbn.OHLCVMsg(
+            rtype=0x21, publisher_id=1, instrument_id=12345, ts_event=ts_event,
+            open=4000500000000, high=4010250000000, low=3995750000000,
+            close=close_px, volume=1000,
+        ))
+    return databento.DBNStore.from_bytes(payload)
+
+
+class FakeTimeseries:
+    """Local stand-in for client.timeseries serving canned DBN data per chunk."""
+
+    def __init__(self, delays=None, failures=None):
+        self.delays = delays or {}
+        self.failures = dict(failures or {})
+        self.calls = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def get_range(self, dataset, symbols, schema, start, end, stype_in, path=None):
+        import time as _time
+        with self._lock:
+            self.calls.append(start)
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            _time.sleep(self.delays.get(start, 0.0))
+            if self.failures.get(start, 0) > 0:
+                self.failures[start] -= 1
+                raise ConnectionError(f"transient failure for {start}")
+            ts_event = int(datetime.fromisoformat(start).timestamp() * 1_000_000_000)
+            store = _canned_ohlcv_dbn([ts_event, ts_event + 60_000_000_000])
+            if path is not None:
+                store.to_file(path)
+                return databento.DBNStore.from_file(path)
+            return store
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+class TestConcurrentChunkFetch:
+    """Test cases for concurrent date-chunk prefetching."""
+
+    def setup_method(self):
+        self.config = {
+            "api": {"key": "test_key"},
+            "retry_policy": {"max_retries": 3, "base_delay": 0, "max_delay": 0, "backoff_multiplier": 0},
+            "validation": {"strict_mode": False, "quarantine_enabled": False},
+        }
+        self.job_config = {
+            "dataset": "GLBX.MDP3",
+            "schema": "ohlcv-1m",
+            "symbols": ["ES.FUT"],
+            "stype_in": "continuous",
+            "start_date": "2023-01-01T00:00:00+00:00",
+            "end_date": "2023-01-06T00:00:00+00:00",
+            "date_chunk_interval_days": 1,
+        }
+
+    def _adapter(self, timeseries, max_concurrent):
+        adapter = DatabentoAdapter({**self.config, "fetch": {"max_concurrent_chunks": max_concurrent}})
+        adapter.client = Mock()
+        adapter.client.timeseries = timeseries
+        return adapter
+
+    def test_config_default_is_serial(self):
+        assert DatabentoAdapter(self.config).max_concurrent_chunks == 1
+
+    def test_records_yielded_in_chronological_order(self):
+        # Early chunks are the slowest, so completion order is reversed
+        timeseries = FakeTimeseries(delays={
+            "2023-01-01T00:00:00+00:00": 0.2,
+            "2023-01-02T00:00:00+00:00": 0.1,
+        })
+        adapter = self._adapter(timeseries, max_concurrent=3)
+
+        records = list(adapter.fetch_historical_data(self.job_config))
+
+        assert len(records) == 10
+        timestamps = [record.ts_event for record in records]
+        assert timestamps == sorted(timestamps)
+        assert records[0].close_price == Decimal("4005")
+        assert timeseries.max_active > 1
+
+    def test_prefetch_is_bounded(self):
+        timeseries = FakeTimeseries(delays={f"2023-01-0{day}T00:00:00+00:00": 0.05 for day in range(1, 6)})
+        adapter = self._adapter(timeseries, max_concurrent=2)
+
+        list(adapter.fetch_historical_data(self.job_config))
+
+        assert timeseries.max_active <= 2
+        assert len(timeseries.calls) == 5
+
+    def test_job_override_and_serial_path_match(self):
+        serial = list(self._adapter(FakeTimeseries(), 4).fetch_historical_data(
+            {**self.job_config, "max_concurrent_chunks": 1}
+        ))
+        concurrent = list(self._adapter(FakeTimeseries(), 4).fetch_historical_data(self.job_config))
+
+        assert [r.ts_event for r in serial] == [r.ts_event for r in concurrent]
+
+    def test_retry_applies_per_chunk(self):
+        timeseries = FakeTimeseries(failures={"2023-01-03T00:00:00+00:00": 2})
+        adapter = self._adapter(timeseries, max_concurrent=3)
+
+        records = list(adapter.fetch_historical_data(self.job_config))
+
+        assert len(records) == 10
+        assert timeseries.calls.count("2023-01-03T00:00:00+00:00") == 3
+
+    def test_exhausted_retries_propagate(self):
+        timeseries = FakeTimeseries(failures={"2023-01-02T00:00:00+00:00": 5})
+        adapter = self._adapter(timeseries, max_concurrent=3)
+
+        with pytest.raises(ConnectionError):
+            list(adapter.fetch_historical_data(self.job_config))
+
+    def test_planned_chunks_fetch_and_decode_separately(self):
+        adapter = self._adapter(FakeTimeseries(), max_concurrent=1)
+
+        requests = adapter.plan_data_chunks(self.job_config)
+        records = [
+            record
+            for request in requests
+            for record in adapter.decode_data_chunk_records(request, adapter.fetch_data_chunk(request))
+        ]
+        frame = adapter.decode_data_chunk_frame(requests[0], adapter.fetch_data_chunk(requests[0]))
+
+        assert len(requests) == 5
+        assert requests[0].schema == "ohlcv-1m"
+        assert [r.ts_event for r in records] == [r.ts_event for r in adapter.fetch_historical_data(self.job_config)]
+        assert len(frame) == 2
+
+    def test_planned_chunks_restricted_to_date_ranges(self):
+        adapter = self._adapter(FakeTimeseries(), max_concurrent=1)
+        job_config = {**self.job_config, "date_ranges": [("2023-01-02T12:00:00+00:00", "2023-01-04")]}
+
+        requests = adapter.plan_data_chunks(job_config)
+
+        assert [(r.start, r.end) for r in requests] == [
+            ("2023-01-02T12:00:00+00:00", "2023-01-03T00:00:00+00:00"),
+            ("2023-01-03T00:00:00+00:00", "2023-01-04T00:00:00+00:00"),
+        ]
+        assert adapter.plan_data_chunks({**self.job_config, "date_ranges": []}) == []
+
+    def test_fetch_data_chunks_keeps_request_order(self):
+        timeseries = FakeTimeseries(delays={"2023-01-02T00:00:00+00:00": 0.1})
+        adapter = self._adapter(timeseries, max_concurrent=3)
+        requests = adapter.plan_data_chunks(self.job_config)[1:]
+
+        fetched = list(adapter.fetch_data_chunks(requests))
+
+        assert [request for request, _ in fetched] == requests
+        assert len(timeseries.calls) == 4
+        assert len(list(adapter.iter_data_chunk_records(*fetched[0]))) == 2
+
+    def test_api_call_limiter_caps_concurrent_requests(self):
+        timeseries = FakeTimeseries(delays={f"2023-01-0{day}T00:00:00+00:00": 0.05 for day in range(1, 6)})
+        adapter = self._adapter(timeseries, max_concurrent=4)
+        adapter.api_call_limiter = threading.Semaphore(1)
+
+        records = list(adapter.fetch_historical_data(self.job_config))
+
+        assert len(records) == 10
+        assert timeseries.max_active == 1
+
+
+class TestRawResponseCache:
+    """Test cases for the adapter's raw response cache and reprocess mode."""
+
+    def setup_method(self):
+        self.job_config = {
+            "dataset": "GLBX.MDP3",
+            "schema": "ohlcv-1m",
+            "symbols": ["ES.FUT"],
+            "stype_in": "continuous",
+            "start_date": "2023-01-01T00:00:00+00:00",
+            "end_date": "2023-01-04T00:00:00+00:00",
+            "date_chunk_interval_days": 1,
+        }
+
+    def _adapter(self, tmp_path, timeseries=None, **cache_config):
+        adapter = DatabentoAdapter({
+            "api": {"key": "test_key"},
+            "retry_policy": {"max_retries": 3, "base_delay": 0, "max_delay": 0, "backoff_multiplier": 0},
+            "validation": {"strict_mode": False, "quarantine_enabled": False},
+            "cache": {"enabled": True, "base_dir": str(tmp_path), **cache_config},
+        })
+        if timeseries is not None:
+            adapter.client = Mock()
+            adapter.client.timeseries = timeseries
+        return adapter
+
+    def test_rerun_served_from_cache(self, tmp_path):
+        timeseries = FakeTimeseries()
+        first = list(self._adapter(tmp_path, timeseries).fetch_historical_data(self.job_config))
+
+        adapter = self._adapter(tmp_path, timeseries)
+        second = list(adapter.fetch_historical_data(self.job_config))
+
+        assert len(timeseries.calls) == 3
+        assert [r.ts_event for r in first] == [r.ts_event for r in second]
+        assert adapter.response_cache.stats()["hit_rate"] == 1.0
+
+    def test_reprocess_needs_no_client(self, tmp_path):
+        list(self._adapter(tmp_path, FakeTimeseries()).fetch_historical_data(self.job_config))
+
+        adapter = self._adapter(tmp_path, reprocess=True)
+        adapter.connect()
+
+        assert adapter.validate_config() is True
+        assert adapter.client is None
+        assert len(list(adapter.fetch_historical_data(self.job_config))) == 6
+
+    def test_reprocess_miss_raises(self, tmp_path):
+        adapter = self._adapter(tmp_path, reprocess=True)
+
+        with pytest.raises(RuntimeError, match="reprocess mode"):
+            list(adapter.fetch_historical_data(self.job_config))
+
+
+class DailyTimeseries(FakeTimeseries):
+    """FakeTimeseries variant serving two records per day of the requested window."""
+
+    def get_range(self, dataset, symbols, schema, start, end, stype_in, path=None):
+        with self._lock:
+            self.calls.append(start)
+        start_ns = int(datetime.fromisoformat(start).timestamp() * 1_000_000_000)
+        end_ns = int(datetime.fromisoformat(end).timestamp() * 1_000_000_000)
+        return _canned_ohlcv_dbn(list(range(start_ns, end_ns, 43_200_000_000_000)))
+
+
+class TestAdaptiveChunking:
+    """Test cases for date chunks sized from learned densities."""
+
+    def setup_method(self):
+        self.job_config = {
+            "dataset": "GLBX.MDP3",
+            "schema": "ohlcv-1m",
+            "symbols": ["ES.FUT"],
+            "stype_in": "continuous",
+            "start_date": "2023-01-01T00:00:00+00:00",
+            "end_date": "2023-01-09T00:00:00+00:00",
+            "date_chunk_interval_days": 4,
+        }
+
+    def _adapter(self, tmp_path, timeseries, max_concurrent=1):
+        adapter = DatabentoAdapter({
+            "api": {"key": "test_key"},
+            "retry_policy": {"max_retries": 3, "base_delay": 0, "max_delay": 0, "backoff_multiplier": 0},
+            "validation": {"strict_mode": False, "quarantine_enabled": False},
+            "fetch": {
+                "max_concurrent_chunks": max_concurrent,
+                "adaptive_chunking": {
+                    "enabled": True,
+                    "target_records": 4,
+                    "state_file": str(tmp_path / "density.json"),
+                },
+            },
+        })
+        adapter.client = Mock()
+        adapter.client.timeseries = timeseries
+        return adapter
+
+    def test_disabled_by_default(self):
+        adapter = DatabentoAdapter({"api": {"key": "test_key"}})
+
+        assert adapter.adaptive_chunker is None
+        assert len(adapter.plan_data_chunks(self.job_config)) == 2
+
+    def test_remaining_chunks_shrink_after_dense_chunk(self, tmp_path):
+        # 2 records per day: the first 4-day chunk is twice the 4-record target
+        timeseries = DailyTimeseries()
+        adapter = self._adapter(tmp_path, timeseries)
+
+        records = list(adapter.fetch_historical_data(self.job_config))
+
+        assert timeseries.calls == [
+            "2023-01-01T00:00:00+00:00",
+            "2023-01-05T00:00:00+00:00",
+            "2023-01-07T00:00:00+00:00",
+        ]
+        assert len(records) == 16
+        timestamps = [record.ts_event for record in records]
+        assert timestamps == sorted(timestamps)
+
+    def test_prefetched_chunks_keep_their_windows(self, tmp_path):
+        timeseries = DailyTimeseries()
+        adapter = self._adapter(tmp_path, timeseries, max_concurrent=2)
+
+        records = list(adapter.fetch_historical_data(self.job_config))
+
+        assert len(timeseries.calls) == 2
+        assert len(records) == 16
+
+    def test_next_run_plans_from_learned_density(self, tmp_path):
+        list(self._adapter(tmp_path, DailyTimeseries()).fetch_historical_data(self.job_config))
+
+        requests = self._adapter(tmp_path, DailyTimeseries()).plan_data_chunks(self.job_config)
+
+        assert [(r.start, r.end) for r in requests] == [
+            ("2023-01-01T00:00:00+00:00", "2023-01-03T00:00:00+00:00"),
+            ("2023-01-03T00:00:00+00:00", "2023-01-05T00:00:00+00:00"),
+            ("2023-01-05T00:00:00+00:00", "2023-01-07T00:00:00+00:00"),
+            ("2023-01-07T00:00:00+00:00", "2023-01-09T00:00:00+00:00"),
+        ]
+
+    def test_fetch_data_chunks_yields_shrunk_requests(self, tmp_path):
+        adapter = self._adapter(tmp_path, DailyTimeseries())
+        requests = adapter.plan_data_chunks(self.job_config)
+
+        fetched = []
+        for request, data_chunk in adapter.fetch_data_chunks(requests):
+            fetched.append(request)
+            list(adapter.iter_data_chunk_records(request, data_chunk))
+
+        assert fetched[0] == requests[0]
+        assert [(r.start, r.end) for r in fetched[1:]] == [
+            ("2023-01-05T00:00:00+00:00", "2023-01-07T00:00:00+00:00"),
+            ("2023-01-07T00:00:00+00:00", "2023-01-09T00:00:00+00:00"),
+        ]
+        assert fetched[-1].schema == requests[-1].schema
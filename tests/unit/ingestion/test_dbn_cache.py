@@ -0,0 +1,90 @@
+"""
+Unit tests for the raw DBN response cache.
+"""
+
+import os
+
+import pytest
+
+from src.ingestion.api_adapters.dbn_cache import DBNResponseCache
+
+
+def _writer(payload):
+    def write(path):
+        with open(path, "wb") as f:
+            f.write(payload)
+    return write
+
+
+def _key(start):
+    return DBNResponseCache.key("GLBX.MDP3", "trades", ["ES.c.0"], "continuous", start, start + "T23:59")
+
+
+class TestDBNResponseCache:
+    """Test cases for DBNResponseCache."""
+
+    def test_key_identifies_request(self):
+        key = DBNResponseCache.key("GLBX.MDP3", "trades", ["ES.c.0", "NQ.c.0"], "continuous", "2024-01-01", "2024-01-02")
+
+        assert key == DBNResponseCache.key("GLBX.MDP3", "trades", ["NQ.c.0", "ES.c.0"], "continuous", "2024-01-01", "2024-01-02")
+        assert key != DBNResponseCache.key("GLBX.MDP3", "tbbo", ["ES.c.0", "NQ.c.0"], "continuous", "2024-01-01", "2024-01-02")
+        assert key != DBNResponseCache.key("GLBX.MDP3", "trades", ["ES.c.0", "NQ.c.0"], "continuous", "2024-01-01", "2024-01-03")
+
+    def test_store_then_get_counts_hits_and_misses(self, tmp_path):
+        cache = DBNResponseCache(str(tmp_path))
+        key = _key("2024-01-01")
+
+        assert cache.get(key) is None
+        path = cache.store(key, _writer(b"dbn"))
+
+        assert cache.get(key) == path
+        assert path.read_bytes() == b"dbn"
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"], stats["writes"]) == (1, 1, 1)
+        assert stats["hit_rate"] == 0.5
+        assert stats["bytes"] == 3
+
+    def test_least_recently_used_evicted(self, tmp_path):
+        cache = DBNResponseCache(str(tmp_path), max_bytes=25)
+        first, second, third = _key("2024-01-01"), _key("2024-01-02"), _key("2024-01-03")
+        cache.store(first, _writer(b"x" * 10))
+        cache.store(second, _writer(b"x" * 10))
+        cache.get(first)
+
+        cache.store(third, _writer(b"x" * 10))
+
+        assert cache.get(second) is None
+        assert cache.get(first) is not None
+        assert cache.get(third) is not None
+        assert cache.stats()["evictions"] == 1
+        assert cache.stats()["bytes"] == 20
+
+    def test_index_reloaded_from_disk(self, tmp_path):
+        key = _key("2024-01-01")
+        DBNResponseCache(str(tmp_path)).store(key, _writer(b"dbn"))
+
+        reopened = DBNResponseCache(str(tmp_path))
+
+        assert reopened.get(key) is not None
+        assert reopened.stats()["entries"] == 1
+
+    def test_failed_write_leaves_no_entry(self, tmp_path):
+        cache = DBNResponseCache(str(tmp_path))
+        key = _key("2024-01-01")
+
+        def failing_write(path):
+            with open(path, "wb") as f:
+                f.write(b"partial")
+            raise ConnectionError("dropped")
+
+        with pytest.raises(ConnectionError):
+            cache.store(key, failing_write)
+
+        assert cache.get(key) is None
+        assert not any(name.endswith(".tmp") for _, _, files in os.walk(tmp_path) for name in files)
+
+    def test_recent_windows_not_cacheable(self, tmp_path):
+        cache = DBNResponseCache(str(tmp_path), min_age_hours=24)
+
+        assert cache.is_cacheable("2024-01-01") is True
+        assert cache.is_cacheable("2999-01-01T00:00:00+00:00") is False
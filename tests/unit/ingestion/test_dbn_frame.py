@@ -0,0 +1,149 @@
+"""
+Unit tests for columnar DBN decoding.
+
+Tests decoding of canned in-memory DBN stores into storage-shaped DataFrames
+and the adapter's frame-per-chunk fetch path.
+"""
+
+from unittest.mock import Mock
+
+import databento
+import databento_dbn
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.ingestion.api_adapters.databento_adapter import DatabentoAdapter
+from src.ingestion.api_adapters.dbn_frame import (
+    PRICE_SCALE,
+    decode_dbn_store,
+    fixed_to_float,
+    ns_to_datetime,
+    supports_columnar,
+)
+
+TS_EVENT = 1705329000000000123  # 2024-01-15T14:30:00.000000123Z
+
+
+def _store(schema, records):
+    metadata = databento_dbn.Metadata(
+        dataset="GLBX.MDP3",
+        start=TS_EVENT,
+        stype_in=databento_dbn.SType.RAW_SYMBOL,
+        stype_out=databento_dbn.SType.INSTRUMENT_ID,
+        schema=schema,
+        symbols=["ESH4"],
+        end=TS_EVENT + 1_000_000_000,
+    )
+    return databento.DBNStore.from_bytes(metadata.encode() + b"".join(bytes(r) for r in records))
+
+
+def _trade(price, side=databento_dbn.Side.BID, offset=0):
+    return databento_dbn.TradeMsg(
+        publisher_id=1, instrument_id=42, ts_event=TS_EVENT + offset, price=price, size=3,
+        action=databento_dbn.Action.TRADE, side=side, depth=0, ts_recv=TS_EVENT + offset + 10, sequence=7,
+    )
+
+
+class TestDecodeDbnStore:
+    """Test cases for decode_dbn_store."""
+
+    def test_ohlcv_columns_and_fixed_point_prices(self):
+        bar = databento_dbn.OHLCVMsg(
+            rtype=0x21, publisher_id=1, instrument_id=42, ts_event=TS_EVENT,
+            open=4500250000001, high=4510000000000, low=4490000000000, close=4505000000000, volume=10,
+        )
+        frame = decode_dbn_store(_store(databento_dbn.Schema.OHLCV_1M, [bar]), "ohlcv-1m", "ES.c.0")
+
+        assert list(frame[["open_price", "close_price"]].iloc[0]) == [4500250000001, 4505000000000]
+        assert frame["open_price"].dtype == "Int64"
+        assert frame["ts_event"].dtype == np.int64
+        assert frame["ts_event"].iloc[0] == TS_EVENT
+        assert frame["ts_recv"].iloc[0] == TS_EVENT
+        assert frame["symbol"].iloc[0] == "ES.c.0"
+        assert frame.attrs["schema"] == "ohlcv-1m"
+        assert frame.attrs["price_scale"] == PRICE_SCALE
+        assert frame.attrs["price_columns"] == ["open_price", "high_price", "low_price", "close_price"]
+
+    def test_trades_side_decoded_to_str(self):
+        records = [_trade(4500250000000), _trade(4500500000000, databento_dbn.Side.ASK, offset=1)]
+        frame = decode_dbn_store(_store(databento_dbn.Schema.TRADES, records), "trades", "ES.c.0")
+
+        assert len(frame) == 2
+        assert list(frame["side"]) == ["B", "A"]
+        assert list(frame["sequence"]) == [7, 7]
+        assert frame["ts_recv"].iloc[1] == TS_EVENT + 11
+
+    def test_tbbo_levels_flattened(self):
+        quote = databento_dbn.MBP1Msg(
+            publisher_id=1, instrument_id=42, ts_event=TS_EVENT, price=4500250000000, size=1,
+            action=databento_dbn.Action.TRADE, side=databento_dbn.Side.ASK, depth=0, ts_recv=TS_EVENT,
+            levels=databento_dbn.BidAskPair(
+                bid_px=4500000000000, ask_px=4500250000000, bid_sz=5, ask_sz=6, bid_ct=1, ask_ct=2
+            ),
+        )
+        frame = decode_dbn_store(_store(databento_dbn.Schema.TBBO, [quote]), "tbbo", "ES.c.0")
+
+        row = frame.iloc[0]
+        assert (row["bid_px"], row["ask_px"], row["bid_sz"], row["ask_ct"]) == (4500000000000, 4500250000000, 5, 2)
+
+    def test_statistics_undefined_price_is_missing(self):
+        stat = databento_dbn.StatMsg(
+            publisher_id=1, instrument_id=42, ts_event=TS_EVENT, ts_recv=TS_EVENT, ts_ref=0,
+            price=databento_dbn.UNDEF_PRICE, quantity=1500, stat_type=databento_dbn.StatType.OPEN_INTEREST,
+        )
+        frame = decode_dbn_store(_store(databento_dbn.Schema.STATISTICS, [stat]), "statistics", "ES.c.0")
+
+        assert pd.isna(frame["stat_value"].iloc[0])
+        assert frame["quantity"].iloc[0] == 1500
+        assert frame["stat_type"].iloc[0] == 9
+
+    def test_empty_store(self):
+        frame = decode_dbn_store(_store(databento_dbn.Schema.TRADES, []), "trades", "ES.c.0")
+        assert frame.empty
+        assert frame.attrs["schema"] == "trades"
+
+    def test_unsupported_schema(self):
+        assert not supports_columnar("definition")
+        with pytest.raises(ValueError):
+            decode_dbn_store(_store(databento_dbn.Schema.TRADES, []), "definition")
+
+    def test_bulk_helpers(self):
+        prices = pd.Series([4500250000000, None], dtype="Int64")
+        assert fixed_to_float(prices).iloc[0] == pytest.approx(4500.25)
+        assert ns_to_datetime(pd.Series([TS_EVENT])).iloc[0].isoformat().startswith("2024-01-15T14:30:00")
+
+
+class TestFetchHistoricalFrames:
+    """Test cases for DatabentoAdapter.fetch_historical_frames."""
+
+    def _adapter(self, stores):
+        adapter = DatabentoAdapter({"api": {"key": "test_key"}, "fetch": {"max_concurrent_chunks": 2}})
+        adapter.client = Mock()
+        adapter.client.timeseries.get_range.side_effect = stores
+        return adapter
+
+    def test_one_frame_per_chunk_in_order(self):
+        stores = [
+            _store(databento_dbn.Schema.TRADES, [_trade(4500250000000)]),
+            _store(databento_dbn.Schema.TRADES, []),
+            _store(databento_dbn.Schema.TRADES, [_trade(4501000000000, offset=5)]),
+        ]
+        adapter = self._adapter(stores)
+        job_config = {
+            "dataset": "GLBX.MDP3", "schema": "trades", "symbols": ["ES.c.0"], "stype_in": "continuous",
+            "start_date": "2024-01-15", "end_date": "2024-01-18", "date_chunk_interval_days": 1,
+        }
+
+        frames = list(adapter.fetch_historical_frames(job_config))
+
+        assert [len(frame) for frame in frames] == [1, 1]
+        assert list(pd.concat(frames)["price"]) == [4500250000000, 4501000000000]
+
+    def test_unsupported_schema_rejected(self):
+        adapter = self._adapter([])
+        with pytest.raises(ValueError):
+            list(adapter.fetch_historical_frames({
+                "dataset": "GLBX.MDP3", "schema": "definition", "symbols": "ES.FUT", "stype_in": "parent",
+                "start_date": "2024-01-15", "end_date": "2024-01-15",
+            }))
@@ -0,0 +1,109 @@
+"""
+Unit tests for server-side time-bucketed aggregation queries.
+"""
+
+from datetime import date, timedelta
+from decimal import Decimal
+from unittest.mock import Mock, patch
+
+import pytest
+from sqlalchemy.dialects.postgresql.psycopg2 import dialect
+
+from src.querying.aggregation import parse_bucket
+from src.querying.exceptions import SymbolResolutionError, ValidationError
+from src.querying.query_builder import QueryBuilder
+from src.querying.symbol_cache import SymbolCache
+
+
+def _sql(query) -> str:
+    return str(query.compile(dialect=dialect(), compile_kwargs={"literal_binds": True}))
+
+
+@pytest.fixture
+def query_builder():
+    with patch('src.querying.query_builder.create_engine'):
+        qb = QueryBuilder(
+            {'host': 'test_host', 'port': 5432, 'database': 'test_db', 'user': 'test_user', 'password': 'test_pass'},
+            symbol_cache=SymbolCache()
+        )
+    qb.symbol_cache.warm([(12345, 'ES.c.0')])
+    return qb
+
+
+class TestParseBucket:
+    """Test parsing of bucket widths."""
+
+    def test_units(self):
+        assert parse_bucket('30m') == timedelta(minutes=30)
+        assert parse_bucket('4H') == timedelta(hours=4)
+        assert parse_bucket('1w') == timedelta(days=7)
+        assert parse_bucket(timedelta(seconds=15)) == timedelta(seconds=15)
+
+    @pytest.mark.parametrize('bucket', ['', '30', 'm', '1.5h', '0m', '2y', timedelta(milliseconds=500)])
+    def test_invalid(self, bucket):
+        with pytest.raises(ValidationError):
+            parse_bucket(bucket)
+
+
+class TestBucketedQueries:
+    """Test the aggregation queries built and run by the QueryBuilder."""
+
+    def test_ohlcv_buckets_aggregate_on_the_server(self, query_builder):
+        row = Mock()
+        row._mapping = {'symbol': 'ES.c.0', 'open_price': Decimal('4800.25'), 'bar_count': 30}
+        connection = Mock()
+        connection.execute.return_value.fetchall.return_value = [row]
+
+        with patch.object(query_builder, 'get_connection') as mock_get_conn:
+            mock_get_conn.return_value.__enter__.return_value = connection
+            results = query_builder.query_ohlcv_buckets('ES.c.0', '30m', date(2024, 1, 2), date(2024, 1, 3))
+
+        assert results == [{'symbol': 'ES.c.0', 'open_price': Decimal('4800.25'), 'bar_count': 30}]
+        sql = _sql(connection.execute.call_args[0][0])
+        bucket = "time_bucket(INTERVAL '1800 seconds', daily_ohlcv_data.ts_event)"
+        assert sql.startswith(f"SELECT {bucket} AS ts_event")
+        assert "first(daily_ohlcv_data.open_price, daily_ohlcv_data.ts_event) AS open_price" in sql
+        assert "last(daily_ohlcv_data.close_price, daily_ohlcv_data.ts_event) AS close_price" in sql
+        assert "sum(daily_ohlcv_data.vwap * daily_ohlcv_data.volume)" in sql
+        assert "daily_ohlcv_data.instrument_id IN (12345)" in sql
+        assert f"GROUP BY {bucket}, daily_ohlcv_data.instrument_id" in sql
+        assert f"ORDER BY daily_ohlcv_data.instrument_id, {bucket} DESC" in sql
+
+    def test_bucket_must_be_multiple_of_granularity(self, query_builder):
+        with pytest.raises(ValidationError, match="not a multiple of the 1h granularity"):
+            query_builder.query_ohlcv_buckets('ES.c.0', '90m', granularity='1h')
+
+    def test_ohlcv_falls_back_to_stored_symbols(self, query_builder):
+        with patch.object(query_builder, '_resolve_symbols_to_instrument_ids',
+                          side_effect=SymbolResolutionError("no definitions")), \
+                patch.object(query_builder, '_execute_cached', return_value=[]) as execute:
+            assert query_builder.query_ohlcv_buckets(['ES.c.0'], '4h', granularity='1h') == []
+
+        sql = _sql(execute.call_args[0][0])
+        assert "daily_ohlcv_data.symbol IN ('ES.c.0')" in sql
+        assert "GROUP BY time_bucket(INTERVAL '14400 seconds', daily_ohlcv_data.ts_event), " \
+               "daily_ohlcv_data.instrument_id, daily_ohlcv_data.symbol" in sql
+
+    def test_trade_buckets(self, query_builder):
+        with patch.object(query_builder, '_execute_cached', return_value=[]) as execute:
+            query_builder.query_trade_buckets('ES.c.0', '5m', side='B', limit=10)
+
+        query, scope = execute.call_args[0]
+        sql = _sql(query)
+        assert "sum(trades_data.size) AS volume" in sql
+        assert "count(*) AS trade_count" in sql
+        assert "CAST(sum(trades_data.price * trades_data.size) / CAST(nullif(sum(trades_data.size)" in sql
+        assert "trades_data.side = 'B'" in sql
+        assert sql.endswith("LIMIT 10")
+        assert scope.instrument_ids == {12345}
+
+    def test_columnar_types(self, query_builder):
+        import pyarrow as pa
+
+        with patch.object(query_builder, '_resolve_symbols_to_instrument_ids', return_value=[]):
+            reader = query_builder.query_trade_buckets('NQ.c.0', '1h', columnar=True)
+
+        assert reader.read_all().num_rows == 0
+        assert reader.schema.field('ts_event').type == pa.timestamp('ns', tz='UTC')
+        assert reader.schema.field('vwap').type == pa.float64()
+        assert reader.schema.field('trade_count').type == pa.int64()
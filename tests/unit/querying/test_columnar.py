@@ -0,0 +1,131 @@
+"""
+Unit tests for the columnar (COPY to Arrow) query result path.
+"""
+
+from datetime import date
+from unittest.mock import MagicMock
+
+import psycopg2
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+from sqlalchemy import select
+
+from src.querying.columnar import (
+    columnar_select,
+    compile_copy_sql,
+    copy_record_batches,
+    write_arrow,
+    write_parquet,
+)
+from src.querying.table_definitions import daily_ohlcv_data, trades_data
+
+
+def _copy_connection(payload: bytes, error: Exception = None):
+    """Fake DBAPI connection whose COPY writes ``payload`` and then optionally fails."""
+    def copy_expert(sql, sink):
+        sink.write(payload)
+        if error is not None:
+            raise error
+
+    connection = MagicMock()
+    cursor = connection.cursor.return_value.__enter__.return_value
+    cursor.copy_expert.side_effect = copy_expert
+    return connection
+
+
+SCHEMA = pa.schema([
+    ("ts_event", pa.timestamp("ns", tz="UTC")),
+    ("price", pa.float64()),
+    ("side", pa.string()),
+])
+
+
+class TestColumnarSelect:
+    """Test the rewrite of QueryBuilder selects into columnar form."""
+
+    def test_schema_types(self):
+        _, schema = columnar_select(select(daily_ohlcv_data))
+
+        assert schema.field("ts_event").type == pa.timestamp("ns", tz="UTC")
+        assert schema.field("open_price").type == pa.float64()
+        assert schema.field("volume").type == pa.int64()
+        assert schema.field("instrument_id").type == pa.int32()
+        assert columnar_select(select(trades_data))[1].field("flags").type == pa.int16()
+        assert schema.field("symbol").type == pa.string()
+        assert schema.names == [column.name for column in daily_ohlcv_data.c]
+
+    def test_copy_sql_converts_on_the_server(self):
+        from sqlalchemy.dialects.postgresql.psycopg2 import dialect
+
+        query = select(trades_data).where(
+            trades_data.c.instrument_id.in_([1, 2]), trades_data.c.ts_event >= date(2024, 1, 1)
+        )
+        arrow_query, _ = columnar_select(query)
+        cursor = MagicMock()
+        cursor.mogrify.side_effect = lambda sql, params: (sql % {k: repr(v) for k, v in params.items()}).encode()
+
+        copy_sql = compile_copy_sql(arrow_query, dialect(), cursor)
+
+        assert copy_sql.startswith("COPY (SELECT CAST(round(EXTRACT(epoch FROM trades_data.ts_event)")
+        assert "CAST(trades_data.price AS DOUBLE PRECISION) AS price" in copy_sql
+        assert "trades_data.instrument_id IN (1, 2)" in copy_sql
+        assert copy_sql.endswith("TO STDOUT WITH (FORMAT csv, HEADER true)")
+
+
+class TestCopyRecordBatches:
+    """Test parsing streamed COPY output into record batches."""
+
+    def test_batches_follow_schema(self):
+        payload = b"ts_event,price,side\n" + b"1704067200000001000,4800.25,B\n" * 5000 + b'1704067200000001000,,""\n'
+
+        batches = list(copy_record_batches(_copy_connection(payload), "COPY", SCHEMA, block_size=1 << 14))
+        table = pa.Table.from_batches(batches, schema=SCHEMA)
+
+        assert len(batches) > 1
+        assert table.num_rows == 5001
+        assert table.column("ts_event").cast(pa.int64())[0].as_py() == 1704067200000001000
+        # NULL and the empty string stay distinct
+        assert table.slice(5000).to_pylist()[0]["price"] is None
+        assert table.slice(5000).to_pylist()[0]["side"] == ""
+
+    def test_database_error_is_raised(self):
+        connection = _copy_connection(b"ts_event,pri", psycopg2.OperationalError("server closed the connection"))
+
+        with pytest.raises(psycopg2.OperationalError, match="server closed"):
+            list(copy_record_batches(connection, "COPY", SCHEMA, block_size=1 << 14))
+
+    def test_early_close_stops_the_copy(self):
+        payload = b"ts_event,price,side\n" + b"1704067200000001000,4800.25,B\n" * 100_000
+
+        batches = copy_record_batches(_copy_connection(payload), "COPY", SCHEMA, block_size=1 << 14)
+        next(batches)
+        batches.close()
+
+
+class TestColumnarWriters:
+    """Test the Parquet and Arrow IPC writers."""
+
+    @pytest.fixture
+    def reader(self):
+        batch = pa.record_batch(
+            [pa.array([1, 2], pa.int64()).view(SCHEMA.field("ts_event").type), pa.array([1.5, 2.5]), pa.array(["B", "S"])],
+            schema=SCHEMA
+        )
+        return pa.RecordBatchReader.from_batches(SCHEMA, [batch, batch])
+
+    def test_write_parquet_one_row_group_per_batch(self, reader, tmp_path):
+        output = tmp_path / "out.parquet"
+
+        assert write_parquet(reader, output) == 4
+        parquet_file = pq.ParquetFile(output)
+        assert parquet_file.num_row_groups == 2
+        assert parquet_file.schema_arrow == SCHEMA
+
+    def test_write_arrow(self, reader, tmp_path):
+        output = tmp_path / "out.arrow"
+
+        assert write_arrow(reader, output) == 4
+        table = pa.ipc.open_file(output).read_all()
+        assert table.num_rows == 4
+        assert table.column("side").to_pylist() == ["B", "S", "B", "S"]
@@ -12,6 +12,7 @@ from decimal import Decimal
 
 from src.querying.query_builder import QueryBuilder
 from src.querying.exceptions import QueryExecutionError, SymbolResolutionError
+from src.querying.symbol_cache import SymbolCache
 
 
 class TestQueryBuilder:
@@ -32,7 +33,7 @@ class TestQueryBuilder:
     def query_builder(self, mock_connection_params):
         """Create QueryBuilder instance with mocked connection."""
         with patch('src.querying.query_builder.create_engine'):
-            return QueryBuilder(mock_connection_params)
+            return QueryBuilder(mock_connection_params, symbol_cache=SymbolCache())
     
     @pytest.fixture
     def mock_connection(self):
@@ -167,7 +168,8 @@ class TestQueryBuilder:
             
             mock_connection.execute.side_effect = [
                 mock_table_check,  # Table existence check
-                mock_result        # Empty symbol resolution query
+                mock_result,       # Cache warm-up (no definitions)
+                mock_result        # Lookup of the symbol unknown to the cache
             ]
             
             with pytest.raises(SymbolResolutionError):
@@ -190,9 +192,13 @@ class TestQueryBuilder:
             mock_table_check = Mock()
             mock_table_check.fetchone.return_value = [True]  # Return list with boolean
             
+            mock_empty_result = Mock()
+            mock_empty_result.fetchall.return_value = []
+
             mock_connection.execute.side_effect = [
                 mock_table_check,  # Table existence check
-                mock_result        # Partial symbol resolution query
+                mock_result,       # Cache warm-up
+                mock_empty_result  # Lookup of the symbol unknown to the cache
             ]
             
             # Should return found symbols and log warning for missing ones
@@ -226,11 +232,13 @@ class TestQueryBuilder:
             mock_table_check.fetchone.return_value = [True]  # Return list with boolean
             
             # Mock symbol resolution and data query
+            # The database annotates rows with the resolved symbol
+            mock_ohlcv_query_result.fetchall.return_value[0]._mapping['symbol'] = 'ES.c.0'
+
             mock_connection.execute.side_effect = [
                 mock_table_check,               # Table existence check
-                mock_symbol_resolution_result,  # Symbol resolution
-                mock_ohlcv_query_result,        # OHLCV data query
-                mock_symbol_resolution_result   # Symbol name lookup
+                mock_symbol_resolution_result,  # Symbol cache warm-up
+                mock_ohlcv_query_result         # OHLCV data query
             ]
             
             result = query_builder.query_daily_ohlcv(
@@ -243,6 +251,12 @@ class TestQueryBuilder:
             assert result[0]['instrument_id'] == 12345
             assert result[0]['open_price'] == Decimal('4500.00')
             assert result[0]['symbol'] == 'ES.c.0'
+            assert mock_connection.execute.call_count == 3
+
+            data_sql = str(mock_connection.execute.call_args_list[2][0][0].compile(
+                compile_kwargs={"literal_binds": True}
+            ))
+            assert "CASE daily_ohlcv_data.instrument_id WHEN 12345 THEN 'ES.c.0'" in data_sql
     
     def test_query_daily_ohlcv_success_with_fallback(self, query_builder, mock_connection):
         """Test successful daily OHLCV query using direct symbol fallback."""
@@ -454,6 +468,53 @@ class TestQueryBuilder:
             
             assert result == ['ES.c.0', 'CL.c.0', 'GC.c.0']
     
+    def test_get_ingestion_coverage_filters(self, query_builder, mock_connection):
+        """Test coverage entries are read from the catalog with the given filters."""
+        mock_row = Mock()
+        mock_row._mapping = {'schema': 'trades', 'symbol': 'ES.c.0', 'day': date(2024, 1, 2), 'row_count': 42}
+        mock_result = Mock()
+        mock_result.fetchall.return_value = [mock_row]
+
+        with patch.object(query_builder, 'get_connection') as mock_get_conn:
+            mock_get_conn.return_value.__enter__.return_value = mock_connection
+            mock_connection.execute.return_value = mock_result
+
+            result = query_builder.get_ingestion_coverage(
+                symbols='ES.c.0', schema='trades',
+                start_date=date(2024, 1, 1), end_date=datetime(2024, 1, 31, 12, 0)
+            )
+
+        assert result == [{'schema': 'trades', 'symbol': 'ES.c.0', 'day': date(2024, 1, 2), 'row_count': 42}]
+        query = mock_connection.execute.call_args[0][0]
+        compiled = query.compile(compile_kwargs={"literal_binds": True})
+        sql = str(compiled)
+        assert "FROM ingestion_coverage" in sql
+        assert "ingestion_coverage.symbol IN ('ES.c.0')" in sql
+        assert "ingestion_coverage.day <= '2024-01-31'" in sql
+
+    def test_get_coverage_summary_groups_by_symbol_and_schema(self, query_builder, mock_connection):
+        """Test the coverage summary aggregates the catalog per symbol and schema."""
+        mock_result = Mock()
+        mock_result.fetchall.return_value = []
+
+        with patch.object(query_builder, 'get_connection') as mock_get_conn:
+            mock_get_conn.return_value.__enter__.return_value = mock_connection
+            mock_connection.execute.return_value = mock_result
+
+            assert query_builder.get_coverage_summary() == []
+
+        sql = str(mock_connection.execute.call_args[0][0])
+        assert "sum(ingestion_coverage.row_count) AS total_rows" in sql
+        assert "GROUP BY ingestion_coverage.symbol, ingestion_coverage.schema" in sql
+
+    def test_coverage_query_error(self, query_builder):
+        """Test catalog query failures raise QueryExecutionError."""
+        with patch.object(query_builder, 'get_connection') as mock_get_conn:
+            mock_get_conn.side_effect = Exception("relation does not exist")
+
+            with pytest.raises(QueryExecutionError):
+                query_builder.get_coverage_summary()
+
     def test_connection_error_handling(self, query_builder):
         """Test handling of database connection errors."""
         with patch.object(query_builder, 'get_connection') as mock_get_conn:
@@ -487,30 +548,120 @@ class TestQueryBuilder:
         # Verify query object is created (detailed SQL testing would require more complex setup)
         assert query is not None
     
-    def test_add_symbol_names_to_results(self, query_builder, mock_connection):
-        """Test adding symbol names to query results."""
-        results = [
-            {'instrument_id': 12345, 'price': Decimal('4500.00')},
-            {'instrument_id': 67890, 'price': Decimal('75.50')}
-        ]
-        
-        mock_symbol_rows = [
-            Mock(instrument_id=12345, raw_symbol='ES.c.0'),
-            Mock(instrument_id=67890, raw_symbol='CL.c.0')
-        ]
-        
-        mock_symbols_result = Mock()
-        mock_symbols_result.fetchall.return_value = mock_symbol_rows
-        
+    def test_warm_symbol_cache_makes_queries_single_round_trip(self, query_builder, mock_connection,
+                                                            mock_symbol_resolution_result):
+        """Test that queries with a warm symbol cache need only the data statement."""
+        mock_trades_result = Mock()
+        mock_trades_result.fetchall.return_value = []
+        mock_table_check = Mock()
+        mock_table_check.fetchone.return_value = [True]
+
         with patch.object(query_builder, 'get_connection') as mock_get_conn:
             mock_get_conn.return_value.__enter__.return_value = mock_connection
-            mock_connection.execute.return_value = mock_symbols_result
-            
-            enriched_results = query_builder._add_symbol_names_to_results(results)
-            
-            assert enriched_results[0]['symbol'] == 'ES.c.0'
-            assert enriched_results[1]['symbol'] == 'CL.c.0'
-    
+            mock_connection.execute.side_effect = [
+                mock_table_check,               # Table existence check
+                mock_symbol_resolution_result,  # Symbol cache warm-up
+                mock_trades_result,             # First data query
+                mock_trades_result              # Second data query
+            ]
+
+            query_builder.query_trades('ES.c.0')
+            query_builder.query_trades('ES.c.0')
+
+        assert mock_connection.execute.call_count == 4
+        assert query_builder.symbol_cache.stats()['warmups'] == 1
+
+    def test_invalidated_symbol_cache_is_warmed_again(self, query_builder, mock_connection,
+                                                      mock_symbol_resolution_result):
+        """Test that invalidation forces a new bulk warm-up."""
+        mock_table_check = Mock()
+        mock_table_check.fetchone.return_value = [True]
+
+        with patch.object(query_builder, 'get_connection') as mock_get_conn:
+            mock_get_conn.return_value.__enter__.return_value = mock_connection
+            mock_connection.execute.side_effect = [
+                mock_table_check, mock_symbol_resolution_result,
+                mock_table_check, mock_symbol_resolution_result
+            ]
+
+            assert query_builder._resolve_symbols_to_instrument_ids('ES.c.0') == [12345]
+            query_builder.invalidate_symbol_cache()
+            assert query_builder._resolve_symbols_to_instrument_ids('ES.c.0') == [12345]
+
+        assert query_builder.symbol_cache.stats()['warmups'] == 2
+
+    def test_definitions_load_refreshes_shared_symbol_cache(self, mock_connection_params, mock_connection,
+                                                            mock_symbol_resolution_result):
+        """Test that committing new definitions makes the next lookup see the new mapping."""
+        from src.storage.bulk_copy import LOAD_METHOD_INSERT
+        from src.storage.timescale_loader import TimescaleDefinitionLoader
+
+        params = dict(mock_connection_params, database='definitions_refresh_db')
+        with patch('src.querying.query_builder.create_engine'):
+            query_builder = QueryBuilder(params)
+
+        rolled_row = Mock()
+        rolled_row.instrument_id = 67890
+        rolled_row.raw_symbol = 'ES.c.0'
+        rolled_result = Mock()
+        rolled_result.fetchall.return_value = [rolled_row]
+        mock_table_check = Mock()
+        mock_table_check.fetchone.return_value = [True]
+
+        loader = TimescaleDefinitionLoader(params)
+        columns = loader._get_insert_columns()
+        row = [None] * len(columns)
+        row[columns.index('instrument_id')] = 67890
+        row[columns.index('raw_symbol')] = 'ES.c.0'
+        row[columns.index('ts_event')] = datetime(2024, 3, 15)
+        loader_connection = MagicMock()
+
+        with patch.object(query_builder, 'get_connection') as mock_get_conn:
+            mock_get_conn.return_value.__enter__.return_value = mock_connection
+            mock_connection.execute.side_effect = [
+                mock_table_check, mock_symbol_resolution_result,
+                mock_table_check, rolled_result
+            ]
+
+            assert query_builder._resolve_symbols_to_instrument_ids('ES.c.0') == [12345]
+            with patch.object(loader, 'get_connection') as mock_loader_conn:
+                mock_loader_conn.return_value.__enter__.return_value = loader_connection
+                loader.insert_rows([tuple(row)], load_method=LOAD_METHOD_INSERT)
+            assert query_builder._resolve_symbols_to_instrument_ids('ES.c.0') == [67890]
+
+        assert query_builder.symbol_cache.stats()['warmups'] == 2
+
+    def test_result_cache_serves_repeat_queries_until_written(self, query_builder, mock_connection,
+                                                              isolated_write_log):
+        """Test that repeat queries are served from the result cache until a loader writes their range."""
+        from src.querying.result_cache import QueryResultCache
+        from src.querying.write_log import WriteLog
+
+        query_builder.result_cache = QueryResultCache(write_log=WriteLog(isolated_write_log))
+        query_builder.symbol_cache.warm([(12345, 'ES.c.0')])
+        row = Mock()
+        row._mapping = {'instrument_id': 12345, 'symbol': 'ES.c.0', 'close_price': Decimal('4800.25')}
+        mock_data_result = Mock()
+        mock_data_result.fetchall.return_value = [row]
+
+        with patch.object(query_builder, 'get_connection') as mock_get_conn:
+            mock_get_conn.return_value.__enter__.return_value = mock_connection
+            mock_connection.execute.return_value = mock_data_result
+
+            first = query_builder.query_daily_ohlcv('ES.c.0', date(2024, 1, 1), date(2024, 1, 31))
+            assert query_builder.query_daily_ohlcv('ES.c.0', date(2024, 1, 1), date(2024, 1, 31)) == first
+            assert mock_connection.execute.call_count == 1
+
+            # A different limit is a different query
+            query_builder.query_daily_ohlcv('ES.c.0', date(2024, 1, 1), date(2024, 1, 31), limit=5)
+            assert mock_connection.execute.call_count == 2
+
+            WriteLog(isolated_write_log).append(
+                'daily_ohlcv_data', [12345], 1705276800000000000, 1705276800000000000  # 2024-01-15
+            )
+            query_builder.query_daily_ohlcv('ES.c.0', date(2024, 1, 1), date(2024, 1, 31))
+            assert mock_connection.execute.call_count == 3
+
     def test_date_range_filtering(self, query_builder, mock_connection, mock_symbol_resolution_result):
         """Test date range filtering in queries."""
         mock_filtered_result = Mock()
@@ -568,4 +719,118 @@ class TestQueryBuilder:
             result = query_builder.query_daily_ohlcv(['ES.c.0', 'CL.c.0'])
             
             # Verify multiple symbols were processed
-            assert mock_connection.execute.call_count == 3 
\ No newline at end of file
+            assert mock_connection.execute.call_count == 3 
+
+class TestProviderPool:
+    """Test borrowing QueryBuilder connections from a shared connection provider."""
+
+    def test_connections_are_returned_to_provider(self):
+        import sqlite3
+        from sqlalchemy import create_engine, text
+        from src.querying.query_builder import _ProviderPool
+
+        raw = sqlite3.connect(":memory:", check_same_thread=False)
+        provider = Mock()
+        provider.checkout.return_value = raw
+
+        engine = create_engine("sqlite://", pool=_ProviderPool(provider))
+        for _ in range(2):
+            with engine.connect() as connection:
+                assert connection.execute(text("SELECT 1")).scalar() == 1
+
+        assert provider.checkout.call_count == 2
+        assert provider.release.call_count == 2
+        provider.release.assert_called_with(raw)
+        # The borrowed connection is handed back, not closed
+        assert raw.execute("SELECT 2").fetchone() == (2,)
+
+    def test_query_builder_uses_provider_pool(self):
+        from src.querying.query_builder import _ProviderPool
+
+        with patch('src.querying.query_builder.create_engine') as mock_create_engine:
+            QueryBuilder({'host': 'h', 'port': 5432, 'database': 'd', 'user': 'u', 'password': ''},
+                         connection_provider=Mock())
+
+        assert isinstance(mock_create_engine.call_args.kwargs['pool'], _ProviderPool)
+
+
+class TestStreamingQueries:
+    """Test the iterator-returning (iter_*) query methods."""
+
+    @pytest.fixture
+    def query_builder(self):
+        with patch('src.querying.query_builder.create_engine'):
+            return QueryBuilder({'host': 'h', 'port': 5432, 'database': 'd', 'user': 'u', 'password': ''},
+                                symbol_cache=SymbolCache(), fetch_size=2)
+
+    def test_stream_query_yields_rows_lazily(self, query_builder):
+        from sqlalchemy import create_engine, text
+
+        query_builder.engine = create_engine("sqlite://")
+        rows = query_builder._stream_query(
+            text("SELECT 1 AS n UNION ALL SELECT 2 UNION ALL SELECT 3 ORDER BY n")
+        )
+
+        assert next(rows) == {'n': 1}
+        assert list(rows) == [{'n': 2}, {'n': 3}]
+
+    def test_stream_query_uses_fetch_size(self, query_builder):
+        connection = MagicMock()
+        connection.execution_options.return_value.execute.return_value = iter([])
+
+        with patch.object(query_builder, 'get_connection') as mock_get_conn:
+            mock_get_conn.return_value.__enter__.return_value = connection
+            assert list(query_builder._stream_query(Mock(), fetch_size=500)) == []
+
+        connection.execution_options.assert_called_once_with(yield_per=500)
+
+    def test_iter_trades_resolves_symbols_eagerly(self, query_builder):
+        with patch.object(query_builder, '_resolve_symbols_to_instrument_ids',
+                          side_effect=SymbolResolutionError("unknown")):
+            with pytest.raises(SymbolResolutionError):
+                query_builder.iter_trades('BAD')
+
+    def test_iter_daily_ohlcv_falls_back_to_direct_query(self, query_builder):
+        with patch.object(query_builder, '_resolve_symbols_to_instrument_ids',
+                          side_effect=SymbolResolutionError("definitions_data table does not exist")), \
+             patch.object(query_builder, '_stream_query', return_value=iter([{'symbol': 'ES.c.0'}])) as mock_stream:
+            assert list(query_builder.iter_daily_ohlcv('ES.c.0', fetch_size=100)) == [{'symbol': 'ES.c.0'}]
+
+        query, fetch_size, columnar = mock_stream.call_args[0]
+        assert "daily_ohlcv_data.symbol IN" in str(query)
+        assert fetch_size == 100
+        assert columnar is False
+
+    def test_iter_columnar_without_instruments_is_empty(self, query_builder):
+        with patch.object(query_builder, '_resolve_symbols_to_instrument_ids', return_value=[]):
+            batches = query_builder.iter_trades('ES.c.0', columnar=True)
+
+        table = batches.read_all()
+        assert table.num_rows == 0
+        assert str(table.schema.field('ts_event').type) == 'timestamp[ns, tz=UTC]'
+        assert 'symbol' in table.schema.names
+
+    def test_iter_columnar_streams_copy_output(self, query_builder):
+        from sqlalchemy.dialects.postgresql.psycopg2 import dialect as psycopg2_dialect
+
+        connection = MagicMock()
+        connection.cursor.return_value.__enter__.return_value = connection.cursor.return_value
+        connection.cursor.return_value.mogrify.side_effect = lambda sql, params: sql.encode()
+        connection.cursor.return_value.copy_expert.side_effect = lambda sql, sink: sink.write(
+            b"ts_event,instrument_id,open_price,high_price,low_price,close_price,volume,trade_count,"
+            b"vwap,granularity,data_source,symbol,ts_recv,rtype,publisher_id,created_at,updated_at\n"
+            b"1704153600000000000,1,4800.25,4810,4790.5,4805,1000,,,1d,databento,ES.c.0,,35,1,,\n"
+        )
+        query_builder.engine.raw_connection.return_value = connection
+        query_builder.engine.dialect = psycopg2_dialect()
+        query_builder.symbol_cache.warm([(1, 'ES.c.0')])
+
+        table = query_builder.iter_daily_ohlcv('ES.c.0', columnar=True).read_all()
+
+        assert table.column('ts_event').cast('int64').to_pylist() == [1704153600000000000]
+        assert table.column('open_price').to_pylist() == [4800.25]
+        assert table.column('trade_count').to_pylist() == [None]
+        copy_sql = connection.cursor.return_value.copy_expert.call_args[0][0]
+        assert copy_sql.startswith("COPY (SELECT") and "TO STDOUT WITH (FORMAT csv, HEADER true)" in copy_sql
+        connection.invalidate.assert_not_called()
+        connection.close.assert_called_once()
@@ -0,0 +1,119 @@
+"""
+Unit tests for the write-aware query result cache and the storage write log.
+"""
+
+from datetime import date, datetime, timezone
+
+import pandas as pd
+import pytest
+
+from src.querying.result_cache import CacheScope, QueryResultCache
+from src.querying.write_log import WriteLog
+
+
+def _ns(value: str) -> int:
+    return pd.Timestamp(value, tz="UTC").value
+
+
+@pytest.fixture
+def write_log(tmp_path):
+    return WriteLog(tmp_path / "write_log.jsonl")
+
+
+JANUARY_ES = CacheScope.for_query("daily_ohlcv_data", [1], date(2024, 1, 1), date(2024, 1, 31))
+ROWS = [{"symbol": "ES.c.0", "close_price": 4800.25}]
+
+
+class TestWriteLog:
+    """Test appending to and following the write log."""
+
+    def test_follow_reads_only_new_records(self, write_log):
+        position = write_log.position()
+        write_log.append("trades_data", [2, 1], _ns("2024-01-02"), _ns("2024-01-03"))
+
+        records, position = write_log.read_since(position)
+        assert [(r.table, r.instrument_ids) for r in records] == [("trades_data", {1, 2})]
+        assert write_log.read_since(position) == ([], position)
+
+    def test_rotation_reports_unknown_changes(self, tmp_path):
+        log = WriteLog(tmp_path / "write_log.jsonl", max_bytes=1)
+        log.append("trades_data", [1], 0, 1)
+        position = log.position()
+        log.append("trades_data", [1], 0, 1)
+
+        records, _ = log.read_since(position)
+        assert records is None
+
+    def test_overlap(self, write_log):
+        write_log.append("daily_ohlcv_data", [1], _ns("2024-01-10"), _ns("2024-01-10"))
+        (record,), _ = write_log.read_since((0, 0))
+
+        assert record.overlaps("daily_ohlcv_data", frozenset({1, 3}), _ns("2024-01-01"), _ns("2024-01-31"))
+        assert record.overlaps("daily_ohlcv_data", None, _ns("2024-01-01"), _ns("2024-01-31"))
+        assert not record.overlaps("daily_ohlcv_data", frozenset({2}), _ns("2024-01-01"), _ns("2024-01-31"))
+        assert not record.overlaps("daily_ohlcv_data", frozenset({1}), _ns("2024-02-01"), _ns("2024-02-29"))
+        assert not record.overlaps("trades_data", frozenset({1}), _ns("2024-01-01"), _ns("2024-01-31"))
+
+
+class TestQueryResultCache:
+    """Test cache hits, LRU eviction and write-driven invalidation."""
+
+    def test_hit_returns_copy(self, write_log):
+        cache = QueryResultCache(write_log=write_log)
+        cache.put("q", JANUARY_ES, ROWS, cache.begin())
+
+        cached = cache.get("q")
+        cached[0]["close_price"] = 0
+        assert cache.get("q") == ROWS
+        assert cache.stats()["hits"] == 2
+
+    def test_overlapping_write_invalidates(self, write_log):
+        cache = QueryResultCache(write_log=write_log)
+        cache.put("q", JANUARY_ES, ROWS, cache.begin())
+
+        write_log.append("daily_ohlcv_data", [2], _ns("2024-01-10"), _ns("2024-01-10"))
+        write_log.append("daily_ohlcv_data", [1], _ns("2024-03-01"), _ns("2024-03-01"))
+        assert cache.get("q") == ROWS
+
+        write_log.append("daily_ohlcv_data", [1], _ns("2024-01-31 20:00"), _ns("2024-02-01"))
+        assert cache.get("q") is None
+
+    def test_write_during_query_is_not_cached(self, write_log):
+        cache = QueryResultCache(write_log=write_log)
+        position = cache.begin()
+        write_log.append("daily_ohlcv_data", [1], _ns("2024-01-10"), _ns("2024-01-10"))
+
+        assert cache.put("q", JANUARY_ES, ROWS, position) is False
+        assert cache.get("q") is None
+
+    def test_lru_eviction(self, write_log):
+        cache = QueryResultCache(max_entries=2, write_log=write_log)
+        for key in ("a", "b"):
+            cache.put(key, JANUARY_ES, ROWS, cache.begin())
+        cache.get("a")
+        cache.put("c", JANUARY_ES, ROWS, cache.begin())
+
+        assert cache.get("b") is None
+        assert cache.get("a") == ROWS and cache.get("c") == ROWS
+
+    def test_disk_tier_is_shared_and_invalidated(self, write_log, tmp_path):
+        disk_dir = tmp_path / "results"
+        writer = QueryResultCache(disk_dir=disk_dir, write_log=write_log)
+        writer.put("q", JANUARY_ES, ROWS, writer.begin())
+
+        reader = QueryResultCache(disk_dir=disk_dir, write_log=write_log)
+        assert reader.get("q") == ROWS
+        assert reader.stats()["disk_hits"] == 1
+
+        write_log.append("daily_ohlcv_data", [1], _ns("2024-01-10"), _ns("2024-01-10"))
+        assert QueryResultCache(disk_dir=disk_dir, write_log=write_log).get("q") is None
+        assert not list(disk_dir.glob("*.pkl"))
+
+    def test_scope_bounds(self):
+        aware = CacheScope.for_query("trades_data", None, datetime(2024, 1, 2, tzinfo=timezone.utc), None)
+        assert aware.start_ns == _ns("2024-01-02")
+        assert aware.instrument_ids is None
+
+        # Naive bounds are widened by a day for the database session time zone
+        assert JANUARY_ES.start_ns == _ns("2023-12-31")
+        assert JANUARY_ES.end_ns == _ns("2024-02-01")
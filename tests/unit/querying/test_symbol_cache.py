@@ -0,0 +1,66 @@
+"""
+Unit tests for the QueryBuilder symbol resolution cache.
+"""
+
+from unittest.mock import patch
+
+from src.querying.symbol_cache import SymbolCache, shared_symbol_cache
+
+
+class TestSymbolCache:
+    """Test cases for SymbolCache."""
+
+    def test_cold_cache_is_not_fresh(self):
+        assert not SymbolCache().is_fresh()
+
+    def test_warm_lookup_and_reverse_mapping(self):
+        cache = SymbolCache()
+        cache.warm([(1, "ES.c.0"), (2, "NQ.c.0"), (1, "ES.c.0")])
+
+        known, unknown = cache.lookup(["ES.c.0", "CL.c.0"])
+
+        assert known == {"ES.c.0": [1]}
+        assert unknown == ["CL.c.0"]
+        assert cache.symbols_for([1, 2, 3]) == {1: "ES.c.0", 2: "NQ.c.0"}
+        assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 1
+
+    def test_unfound_symbols_are_remembered(self):
+        cache = SymbolCache()
+        cache.warm([])
+        cache.add(["CL.c.0", "BAD"], [(7, "CL.c.0")])
+
+        known, unknown = cache.lookup(["CL.c.0", "BAD"])
+
+        assert known == {"CL.c.0": [7], "BAD": []}
+        assert unknown == []
+
+    def test_add_accepts_pairs_for_symbols_not_looked_up(self):
+        cache = SymbolCache()
+        cache.add(["ES.c.0"], [(1, "ES.c.0"), (5002, "ESH4")])
+
+        assert cache.lookup(["ESH4"]) == ({"ESH4": [5002]}, [])
+        assert cache.symbols_for([5002]) == {5002: "ESH4"}
+
+    def test_ttl_expiry(self):
+        cache = SymbolCache(ttl_seconds=60)
+        with patch("src.querying.symbol_cache.time.monotonic", return_value=1000.0):
+            cache.warm([(1, "ES.c.0")])
+        with patch("src.querying.symbol_cache.time.monotonic", return_value=1059.0):
+            assert cache.is_fresh()
+        with patch("src.querying.symbol_cache.time.monotonic", return_value=1061.0):
+            assert not cache.is_fresh()
+
+    def test_invalidate_clears_mappings(self):
+        cache = SymbolCache()
+        cache.warm([], definitions_available=False)
+        cache.invalidate()
+
+        assert not cache.is_fresh()
+        assert cache.definitions_available
+        assert cache.lookup(["ES.c.0"]) == ({}, ["ES.c.0"])
+
+    def test_shared_cache_per_database(self):
+        params = {"host": "db", "port": 5432, "database": "hist_data", "user": "a"}
+
+        assert shared_symbol_cache(params) is shared_symbol_cache(dict(params, user="b"))
+        assert shared_symbol_cache(params) is not shared_symbol_cache(dict(params, database="other"))
@@ -0,0 +1,292 @@
+"""
+Unit tests for the COPY-based bulk load path.
+
+Tests COPY text encoding, the staging-table merge SQL and the loaders'
+load-method selection using mocked database cursors.
+"""
+
+import pytest
+from datetime import datetime, timezone
+from decimal import Decimal
+from unittest.mock import MagicMock, patch
+
+from src.storage.bulk_copy import (
+    COPY_BATCH_STATEMENTS,
+    LOAD_METHOD_COPY,
+    LOAD_METHOD_INSERT,
+    copy_upsert,
+    format_copy_value,
+    rows_to_copy_buffer,
+    validate_load_method,
+)
+from src.storage.timescale_statistics_loader import TimescaleStatisticsLoader
+from src.storage.timescale_trades_loader import TimescaleTradesLoader
+
+
+class TestCopyEncoding:
+    """Test cases for COPY text-format encoding."""
+
+    def test_null_and_boolean_values(self):
+        assert format_copy_value(None) == "\\N"
+        assert format_copy_value(True) == "t"
+        assert format_copy_value(False) == "f"
+
+    def test_special_characters_are_escaped(self):
+        assert format_copy_value("a\tb\nc\\d\re") == "a\\tb\\nc\\\\d\\re"
+
+    def test_datetime_and_decimal(self):
+        ts = datetime(2024, 1, 15, 14, 30, tzinfo=timezone.utc)
+        assert format_copy_value(ts) == "2024-01-15T14:30:00+00:00"
+        assert format_copy_value(Decimal("4500.25")) == "4500.25"
+
+    def test_rows_to_copy_buffer(self):
+        buffer = rows_to_copy_buffer([(1, "ES", None), (2, "NQ", True)])
+        assert buffer.read() == "1\tES\t\\N\n2\tNQ\tt\n"
+
+    def test_validate_load_method(self):
+        assert validate_load_method("COPY") == LOAD_METHOD_COPY
+        assert validate_load_method(None) == LOAD_METHOD_INSERT
+        with pytest.raises(ValueError):
+            validate_load_method("bulk")
+
+
+class TestCopyUpsert:
+    """Test cases for the staging-table merge."""
+
+    def test_empty_rows_do_nothing(self):
+        cursor = MagicMock()
+        assert copy_upsert(cursor, "trades_data", ["a"], []) == 0
+        cursor.execute.assert_not_called()
+
+    def test_merge_with_conflict_keys_keeps_last_row(self):
+        cursor = MagicMock()
+        loaded = copy_upsert(
+            cursor,
+            "statistics_data",
+            ["ts_event", "instrument_id", "stat_value"],
+            [(1, 2, 3.0), (1, 2, 4.0)],
+            conflict_columns=["instrument_id", "ts_event"],
+            conflict_clause="ON CONFLICT (instrument_id, ts_event) DO NOTHING"
+        )
+
+        assert loaded == 2
+        cursor.copy_expert.assert_called_once()
+        copy_sql = cursor.copy_expert.call_args[0][0]
+        assert copy_sql.startswith("COPY _stage_statistics_data")
+
+        merge_sql = cursor.execute.call_args_list[-1][0][0]
+        assert "INSERT INTO statistics_data" in merge_sql
+        assert "DISTINCT ON (instrument_id, ts_event)" in merge_sql
+        assert "_copy_seq DESC" in merge_sql
+        assert merge_sql.rstrip().endswith("DO NOTHING")
+
+    def test_merge_without_conflict_keys_preserves_order(self):
+        cursor = MagicMock()
+        copy_upsert(cursor, "trades_data", ["ts_event", "price"], [(1, 2.0)])
+
+        merge_sql = cursor.execute.call_args_list[-1][0][0]
+        assert "DISTINCT ON" not in merge_sql
+        assert "ORDER BY _copy_seq" in merge_sql
+
+
+class TestLoaderLoadMethod:
+    """Test cases for load-method selection in the Timescale loaders."""
+
+    @pytest.fixture
+    def trade_record(self):
+        record = MagicMock()
+        record.ts_event = datetime(2024, 1, 15, tzinfo=timezone.utc)
+        record.ts_recv = record.ts_event
+        record.instrument_id = 123
+        record.price = Decimal("4500.25")
+        record.size = 2
+        record.symbol = "ES.c.0"
+        record.side = "B"
+        record.sequence = 1
+        return record
+
+    @staticmethod
+    def _mock_connection(loader):
+        cursor = MagicMock()
+        conn = MagicMock()
+        conn.cursor.return_value.__enter__.return_value = cursor
+        connection_cm = MagicMock()
+        connection_cm.__enter__.return_value = conn
+        return patch.object(loader, "get_connection", return_value=connection_cm), cursor
+
+    def test_invalid_load_method_rejected(self):
+        with pytest.raises(ValueError):
+            TimescaleTradesLoader({"host": "x"}, load_method="bulk")
+
+    def test_insert_method_uses_executemany(self, trade_record):
+        loader = TimescaleTradesLoader({"host": "x"})
+        patcher, cursor = self._mock_connection(loader)
+        with patcher:
+            stats = loader.insert_trades_records([trade_record, trade_record])
+
+        cursor.executemany.assert_called_once()
+        cursor.copy_expert.assert_not_called()
+        assert stats["inserted"] == 2
+        assert stats["load_method"] == LOAD_METHOD_INSERT
+        assert "rows_per_second" in stats
+        # executemany sends one statement per row, plus the commit
+        assert stats["round_trips"] == 3
+
+    def test_copy_method_uses_copy_expert(self, trade_record):
+        loader = TimescaleTradesLoader({"host": "x"}, load_method="copy")
+        patcher, cursor = self._mock_connection(loader)
+        with patcher:
+            stats = loader.insert_trades_records([trade_record] * 3, batch_size=2)
+
+        assert cursor.copy_expert.call_count == 2
+        cursor.executemany.assert_not_called()
+        assert stats["inserted"] == 3
+        assert stats["load_method"] == LOAD_METHOD_COPY
+        assert stats["round_trips"] == 2 * COPY_BATCH_STATEMENTS + 1
+
+    def test_per_call_override(self, trade_record):
+        loader = TimescaleTradesLoader({"host": "x"}, load_method="copy")
+        patcher, cursor = self._mock_connection(loader)
+        with patcher:
+            stats = loader.insert_trades_records([trade_record], load_method="insert")
+
+        cursor.executemany.assert_called_once()
+        assert stats["load_method"] == LOAD_METHOD_INSERT
+
+    def test_insert_and_copy_share_conflict_clause(self):
+        loader = TimescaleStatisticsLoader({"host": "x"})
+        insert_sql = loader._build_insert_sql()
+
+        assert loader._build_conflict_clause().strip() in insert_sql
+        assert loader._get_conflict_columns() == ["instrument_id", "stat_type", "ts_event"]
+        assert insert_sql.count("%s") == len(loader._get_insert_columns())
+
+
+class TestFrameCopy:
+    """Test cases for loading decoded DataFrames with COPY."""
+
+    @pytest.fixture
+    def trades_frame(self):
+        import pandas as pd
+
+        frame = pd.DataFrame({
+            "ts_event": [1705329000000000123, 1705329001000000000],
+            "ts_recv": [1705329000000000200, 1705329001000000000],
+            "instrument_id": [42, 42],
+            "price": pd.array([4500250000001, -1], dtype="Int64"),
+            "size": [3, 1],
+            "side": ["B", "A"],
+            "sequence": [7, 8],
+            "symbol": ["ES.c.0", "ES.c.0"],
+        })
+        frame.attrs.update(schema="trades", price_columns=["price"], timestamp_columns=["ts_event", "ts_recv"])
+        return frame
+
+    def test_fixed_to_decimal_text_is_exact(self):
+        import pandas as pd
+        from src.storage.bulk_copy import fixed_to_decimal_text
+
+        text = fixed_to_decimal_text(pd.Series([4500250000001, -1500000000, None], dtype="Int64"))
+        assert list(text) == ["4500.250000001", "-1.500000000", None]
+
+    def test_frame_to_copy_buffer_orders_columns(self, trades_frame):
+        from src.storage.bulk_copy import frame_to_copy_buffer
+
+        buffer = frame_to_copy_buffer(trades_frame, ["ts_event", "price", "side", "missing"])
+        lines = buffer.read().splitlines()
+
+        assert lines[0] == "2024-01-15 14:30:00.000000+00,4500.250000001,B,"
+        assert lines[1].split(",")[1] == "-0.000000001"
+
+    def test_loader_insert_frame_uses_csv_copy(self, trades_frame):
+        loader = TimescaleTradesLoader({"host": "x"})
+        patcher, cursor = TestLoaderLoadMethod._mock_connection(loader)
+        with patcher:
+            stats = loader.insert_frame(trades_frame, data_source="databento")
+
+        assert stats["inserted"] == 2
+        assert stats["load_method"] == LOAD_METHOD_COPY
+        copy_sql, buffer = cursor.copy_expert.call_args[0]
+        assert "WITH (FORMAT csv)" in copy_sql
+        first_row = buffer.getvalue().splitlines()[0].split(",")
+        assert first_row[loader._get_insert_columns().index("data_source")] == "databento"
+        cursor.executemany.assert_not_called()
+
+    def test_tbbo_frame_gets_crossed_flag(self):
+        import pandas as pd
+        from src.storage.timescale_tbbo_loader import TimescaleTBBOLoader
+
+        frame = pd.DataFrame({
+            "bid_px": pd.array([2, 1, None], dtype="Int64"),
+            "ask_px": pd.array([1, 2, 3], dtype="Int64"),
+        })
+        prepared = TimescaleTBBOLoader({"host": "x"})._prepare_frame(frame, "databento")
+        assert list(prepared["is_crossed"]) == [True, False, False]
+
+    def test_statistics_frame_maps_rule_engine_names(self):
+        import pandas as pd
+
+        frame = pd.DataFrame({"price": pd.array([4500000000000], dtype="Int64"), "stat_flags": [0]})
+        frame.attrs["price_columns"] = ["price"]
+        prepared = TimescaleStatisticsLoader({"host": "x"})._prepare_frame(frame, "databento")
+        assert {"stat_value", "flags"} <= set(prepared.columns)
+        assert prepared.attrs["price_columns"] == ["stat_value"]
+
+
+class TestRowPath:
+    """Test cases for storing transformed records as plain row tuples."""
+
+    @staticmethod
+    def _records_frame(records):
+        import pandas as pd
+
+        return pd.DataFrame(records, dtype=object)
+
+    def test_trades_frame_to_rows_matches_record_tuple(self):
+        ts = datetime(2024, 1, 15, 14, 30, tzinfo=timezone.utc)
+        frame = self._records_frame([
+            {"ts_event": ts, "instrument_id": 42, "price": Decimal("4500.25"), "size": 3,
+             "ts_recv": ts, "symbol": "ES.c.0", "side": "B", "sequence": None},
+        ])
+
+        rows = TimescaleTradesLoader({"host": "x"}).frame_to_rows(frame, data_source="databento")
+
+        assert rows == [(ts, 42, 4500.25, 3, ts, "ES.c.0", "B", "databento", None)]
+        assert type(rows[0][1]) is int
+
+    def test_statistics_rows_use_table_column_names(self):
+        ts = datetime(2024, 1, 15, tzinfo=timezone.utc)
+        frame = self._records_frame([
+            {"ts_event": ts, "instrument_id": 42, "stat_type": 3, "price": Decimal("4500.5"),
+             "stat_flags": 1, "symbol": "ES.c.0"},
+        ])
+        loader = TimescaleStatisticsLoader({"host": "x"})
+
+        row = dict(zip(loader._get_insert_columns(), loader.frame_to_rows(frame)[0]))
+
+        assert row["stat_value"] == 4500.5
+        assert row["flags"] == 1
+        assert row["open_interest"] is None
+
+    def test_tbbo_rows_flag_crossed_markets_with_missing_prices(self):
+        from src.storage.timescale_tbbo_loader import TimescaleTBBOLoader
+
+        frame = self._records_frame([
+            {"bid_px": Decimal("2"), "ask_px": Decimal("1")},
+            {"bid_px": None, "ask_px": Decimal("1")},
+        ])
+        loader = TimescaleTBBOLoader({"host": "x"})
+        crossed_index = loader._get_insert_columns().index("is_crossed")
+
+        assert [row[crossed_index] for row in loader.frame_to_rows(frame)] == [True, False]
+
+    def test_insert_rows_writes_batches_with_copy(self):
+        loader = TimescaleTradesLoader({"host": "x"}, load_method=LOAD_METHOD_COPY)
+        patcher, cursor = TestLoaderLoadMethod._mock_connection(loader)
+        rows = [(datetime(2024, 1, 15, tzinfo=timezone.utc), 42, 1.0, 1, None, "ES", "B", "databento", i) for i in range(3)]
+        with patcher:
+            stats = loader.insert_rows(rows, batch_size=2)
+
+        assert stats["inserted"] == 3
+        assert cursor.copy_expert.call_count == 2
+        cursor.executemany.assert_not_called()
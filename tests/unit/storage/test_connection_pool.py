@@ -0,0 +1,161 @@
+"""
+Unit tests for the shared psycopg2 connection pool.
+
+psycopg2.connect is patched with in-memory fake connections, so no database is needed.
+"""
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import psycopg2
+import psycopg2.extensions
+import pytest
+from psycopg2.pool import PoolError
+
+from src.storage.connection_pool import (
+    PooledConnectionProvider,
+    close_shared_connection_providers,
+    get_shared_connection_provider,
+)
+from src.storage.timescale_trades_loader import TimescaleTradesLoader
+
+PARAMS = {"host": "localhost", "database": "test"}
+
+
+class FakeConnection:
+    """Minimal stand-in for a psycopg2 connection."""
+
+    def __init__(self):
+        self.closed = 0
+        self.autocommit = False
+        self.healthy = True
+        self.info = MagicMock(transaction_status=psycopg2.extensions.TRANSACTION_STATUS_IDLE)
+        self.rollbacks = 0
+
+    def cursor(self):
+        cursor = MagicMock()
+        cursor.__enter__.return_value = cursor
+        if not self.healthy:
+            cursor.execute.side_effect = psycopg2.OperationalError("server closed the connection")
+        return cursor
+
+    def rollback(self):
+        self.rollbacks += 1
+        self.info.transaction_status = psycopg2.extensions.TRANSACTION_STATUS_IDLE
+
+    def close(self):
+        self.closed = 1
+
+
+@pytest.fixture
+def connect():
+    with patch("psycopg2.connect", side_effect=lambda *args, **kwargs: FakeConnection()) as mock_connect:
+        yield mock_connect
+
+
+class TestPooledConnectionProvider:
+    """Test cases for PooledConnectionProvider."""
+
+    def test_connections_are_reused(self, connect):
+        provider = PooledConnectionProvider(PARAMS, max_size=4)
+
+        seen = set()
+        for _ in range(5):
+            with provider.connection() as conn:
+                seen.add(id(conn))
+
+        assert len(seen) == 1
+
+        stats = provider.stats()
+        assert connect.call_count == 1
+        assert stats["checkouts"] == 5
+        assert stats["connections_created"] == 1
+        assert stats["in_use"] == 0
+        assert stats["idle"] == 1
+
+    def test_warm_up_opens_min_size(self, connect):
+        provider = PooledConnectionProvider(PARAMS, min_size=3, max_size=5)
+
+        assert provider.warm_up() == 3
+        assert provider.warm_up() == 0
+        assert provider.stats()["open_connections"] == 3
+
+    def test_checkout_waits_for_free_connection(self, connect):
+        provider = PooledConnectionProvider(PARAMS, max_size=1, checkout_timeout=2)
+        held = provider.checkout()
+        threading.Timer(0.05, provider.release, args=(held,)).start()
+
+        with provider.connection() as conn:
+            assert conn is held
+
+        assert provider.stats()["max_wait_seconds"] > 0
+
+    def test_checkout_times_out_when_exhausted(self, connect):
+        provider = PooledConnectionProvider(PARAMS, max_size=1, checkout_timeout=0.01)
+        provider.checkout()
+
+        with pytest.raises(PoolError):
+            provider.checkout()
+        assert provider.stats()["timeouts"] == 1
+
+    def test_failed_health_check_replaces_connection(self, connect):
+        provider = PooledConnectionProvider(PARAMS, health_check_interval=0)
+        with provider.connection() as conn:
+            conn.healthy = False
+
+        with provider.connection() as replacement:
+            assert replacement is not conn
+        assert conn.closed
+        assert provider.stats()["health_check_failures"] == 1
+
+    def test_old_connections_are_recycled(self, connect):
+        provider = PooledConnectionProvider(PARAMS, max_connection_age=0.01)
+        with provider.connection() as conn:
+            pass
+        time.sleep(0.02)
+
+        with provider.connection() as replacement:
+            assert replacement is not conn
+        assert provider.stats()["connections_recycled"] == 1
+
+    def test_open_transaction_rolled_back_on_release(self, connect):
+        provider = PooledConnectionProvider(PARAMS)
+
+        with pytest.raises(RuntimeError):
+            with provider.connection() as conn:
+                conn.info.transaction_status = psycopg2.extensions.TRANSACTION_STATUS_INTRANS
+                raise RuntimeError("insert failed")
+
+        assert conn.rollbacks >= 1
+        assert not conn.closed
+        assert provider.stats()["idle"] == 1
+
+    def test_invalid_sizes(self):
+        with pytest.raises(ValueError):
+            PooledConnectionProvider(PARAMS, min_size=3, max_size=2)
+
+
+class TestSharedProviders:
+    """Test cases for the process-wide provider registry."""
+
+    def teardown_method(self):
+        close_shared_connection_providers()
+
+    def test_same_params_share_a_provider(self, connect):
+        first = get_shared_connection_provider(PARAMS, max_size=2)
+
+        assert get_shared_connection_provider(dict(PARAMS)) is first
+        assert get_shared_connection_provider({**PARAMS, "database": "other"}) is not first
+
+    def test_loaders_check_out_from_provider(self, connect):
+        provider = get_shared_connection_provider(PARAMS)
+        loader = TimescaleTradesLoader(PARAMS, connection_provider=provider)
+
+        with loader.get_connection():
+            pass
+        with loader.get_connection():
+            pass
+
+        assert connect.call_count == 1
+        assert provider.stats()["checkouts"] == 2
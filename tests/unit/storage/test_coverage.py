@@ -0,0 +1,137 @@
+"""
+Unit tests for the ingestion coverage catalog maintained by the loaders.
+"""
+
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+
+from src.storage.bulk_copy import LOAD_METHOD_INSERT
+from src.storage.timescale_loader import TimescaleDefinitionLoader
+from src.storage.timescale_ohlcv_loader import TimescaleOHLCVLoader
+from src.storage.timescale_trades_loader import TimescaleTradesLoader
+
+
+def _mock_connection(loader, rowcount=0):
+    cursor = MagicMock()
+    cursor.rowcount = rowcount
+    conn = MagicMock()
+    conn.cursor.return_value.__enter__.return_value = cursor
+    connection_cm = MagicMock()
+    connection_cm.__enter__.return_value = conn
+    return patch.object(loader, "get_connection", return_value=connection_cm), cursor
+
+
+def _trade_row(instrument_id, ts_event):
+    return (ts_event, instrument_id, 4500.25, 1, ts_event, "ES.c.0", "B", "databento", 1)
+
+
+class TestCoverageTracking:
+    """Test cases for CoverageMixin write tracking and refresh."""
+
+    def test_refresh_without_writes_is_noop(self):
+        loader = TimescaleTradesLoader({})
+        patcher, cursor = _mock_connection(loader)
+
+        with patcher:
+            assert loader.refresh_coverage() == 0
+
+        cursor.execute.assert_not_called()
+
+    def test_written_rows_refresh_touched_days(self):
+        loader = TimescaleTradesLoader({})
+        rows = [
+            _trade_row(101, datetime(2024, 1, 2, 14, 30, tzinfo=timezone.utc)),
+            _trade_row(102, datetime(2024, 1, 4, 21, 0, tzinfo=timezone.utc)),
+        ]
+        loader._write_batch(MagicMock(), "INSERT ...", rows, LOAD_METHOD_INSERT)
+        loader._coverage_table_ready = True
+        patcher, cursor = _mock_connection(loader, rowcount=2)
+
+        with patcher:
+            assert loader.refresh_coverage() == 2
+
+        sql, params = cursor.execute.call_args[0]
+        assert "INSERT INTO ingestion_coverage" in sql
+        assert "FROM trades_data" in sql
+        assert "'trades' AS schema" in sql
+        assert params[0] == [101, 102]
+        # Whole UTC days from the first to the last touched day
+        assert params[1] == datetime(2024, 1, 2, tzinfo=timezone.utc)
+        assert params[2] == datetime(2024, 1, 5, tzinfo=timezone.utc)
+
+        # Tracking is reset once refreshed
+        with patcher:
+            assert loader.refresh_coverage() == 0
+
+    def test_written_frame_tracked_from_nanoseconds(self):
+        loader = TimescaleOHLCVLoader({})
+        frame = pd.DataFrame({
+            "ts_event": [pd.Timestamp("2024-03-01", tz="UTC").value, pd.Timestamp("2024-03-02", tz="UTC").value],
+            "instrument_id": [7, 7],
+        })
+        frame.attrs["timestamp_columns"] = ["ts_event"]
+        loader._on_frame_written(frame)
+        loader._coverage_table_ready = True
+        patcher, cursor = _mock_connection(loader)
+
+        with patcher:
+            loader.refresh_coverage()
+
+        sql, params = cursor.execute.call_args[0]
+        assert "'ohlcv-' || granularity AS schema" in sql
+        assert params[0] == [7]
+        assert params[2] == datetime(2024, 3, 3, tzinfo=timezone.utc)
+
+    def test_content_hash_skips_volatile_columns(self):
+        loader = TimescaleDefinitionLoader({})
+        sql = loader._build_coverage_sql()
+
+        assert "COALESCE(raw_symbol, '') AS symbol" in sql
+        hashed = sql.split("md5(ROW(")[1].split(")::text)")[0]
+        assert "instrument_id" in hashed
+        assert "updated_at" not in hashed
+
+    def test_table_created_on_first_refresh(self):
+        loader = TimescaleTradesLoader({})
+        loader._on_rows_written([_trade_row(101, datetime(2024, 1, 2, tzinfo=timezone.utc))])
+        patcher, cursor = _mock_connection(loader)
+
+        with patcher:
+            loader.refresh_coverage()
+
+        statements = [call.args[0] for call in cursor.execute.call_args_list]
+        assert "CREATE TABLE IF NOT EXISTS ingestion_coverage" in statements[0]
+        assert loader._coverage_table_ready
+
+
+class TestWritePublishing:
+    """Test that committed writes are published to the storage write log."""
+
+    def test_insert_rows_publishes_committed_range(self, isolated_write_log):
+        from src.querying.write_log import WriteLog
+
+        loader = TimescaleTradesLoader({})
+        rows = [
+            _trade_row(101, datetime(2024, 1, 2, 14, 30, tzinfo=timezone.utc)),
+            _trade_row(102, datetime(2024, 1, 4, 21, 0, tzinfo=timezone.utc)),
+        ]
+        patcher, _ = _mock_connection(loader)
+
+        with patcher:
+            loader.insert_rows(rows, load_method=LOAD_METHOD_INSERT)
+
+        records, _ = WriteLog(isolated_write_log).read_since((0, 0))
+        assert len(records) == 1
+        assert records[0].table == "trades_data"
+        assert records[0].instrument_ids == {101, 102}
+        assert records[0].start_ns == pd.Timestamp("2024-01-02 14:30", tz="UTC").value
+        assert records[0].end_ns == pd.Timestamp("2024-01-04 21:00", tz="UTC").value
+
+    def test_nothing_published_without_writes(self, isolated_write_log):
+        loader = TimescaleTradesLoader({})
+
+        loader._on_load_committed()
+
+        assert not isolated_write_log.exists()
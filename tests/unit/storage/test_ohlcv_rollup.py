@@ -0,0 +1,132 @@
+"""
+Unit tests for deriving coarser OHLCV bars from stored finer bars.
+"""
+
+from datetime import date, datetime, timezone
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+import pytest
+
+from src.querying.write_log import WriteLog
+from src.storage.ohlcv_rollup import validate_rollups
+from src.storage.timescale_ohlcv_loader import TimescaleOHLCVLoader
+
+
+def _mock_connection(loader, fetched=()):
+    cursor = MagicMock()
+    cursor.fetchall.side_effect = list(fetched)
+    conn = MagicMock()
+    conn.cursor.return_value.__enter__.return_value = cursor
+    connection_cm = MagicMock()
+    connection_cm.__enter__.return_value = conn
+    return patch.object(loader, "get_connection", return_value=connection_cm), cursor
+
+
+def _utc(*args):
+    return datetime(*args, tzinfo=timezone.utc)
+
+
+def _bar(instrument_id, ts_event, granularity="1m"):
+    return (
+        ts_event, ts_event, instrument_id, "ES.c.0", 4800.0, 4801.0, 4799.5, 4800.5, 10,
+        3, 4800.2, granularity, "databento", 33, 1
+    )
+
+
+class TestRollupConfiguration:
+    """Test validation of source/target granularities."""
+
+    def test_targets_must_be_coarser_multiples(self):
+        assert validate_rollups({"1m": "5m", "5m": ["15m", "1h"]}) == {"1m": ["5m"], "5m": ["15m", "1h"]}
+
+        with pytest.raises(ValueError, match="Cannot derive 1m bars from 5m"):
+            validate_rollups({"5m": ["1m"]})
+        with pytest.raises(ValueError, match="Unsupported OHLCV granularity"):
+            TimescaleOHLCVLoader({}, rollups={"1m": ["7m"]})
+
+
+class TestRollup:
+    """Test the aggregate upsert building derived bars."""
+
+    def test_window_widened_to_target_buckets(self, isolated_write_log):
+        loader = TimescaleOHLCVLoader({})
+        patcher, cursor = _mock_connection(loader, [[(7, _utc(2024, 1, 2, 14), _utc(2024, 1, 2, 15), 2)]])
+
+        with patcher:
+            assert loader.rollup("1m", "1h", "2024-01-02 14:10", "2024-01-02 15:20", symbols=["ES.c.0"]) == 2
+
+        sql, params = cursor.execute.call_args[0]
+        assert "time_bucket(%(bucket)s::interval, ts_event)" in sql
+        assert "first(open_price, ts_event)" in sql and "last(close_price, ts_event)" in sql
+        assert "GROUP BY bucket, instrument_id, data_source" in sql
+        assert "ON CONFLICT (ts_event, instrument_id, granularity, data_source)" in sql
+        assert "symbol = ANY(%(symbols)s)" in sql and "instrument_id = ANY" not in sql
+        assert params["bucket"] == "3600 seconds"
+        assert (params["source"], params["target"]) == ("1m", "1h")
+        assert params["start"] == _utc(2024, 1, 2, 14)
+        assert params["end"] == _utc(2024, 1, 2, 16)
+
+        # Derived bars are catalogued and published like any other load
+        assert loader._coverage_instruments == {7}
+        (record,), _ = WriteLog(isolated_write_log).read_since((0, 0))
+        assert record.table == "daily_ohlcv_data"
+        assert record.instrument_ids == {7}
+
+    def test_daily_window_from_dates(self):
+        loader = TimescaleOHLCVLoader({})
+        patcher, cursor = _mock_connection(loader, [[]])
+
+        with patcher:
+            assert loader.rollup("1h", "1d", date(2024, 1, 1), date(2024, 1, 15)) == 0
+
+        _, params = cursor.execute.call_args[0]
+        assert params["start"] == _utc(2024, 1, 1)
+        assert params["end"] == _utc(2024, 1, 15)
+
+
+class TestIncrementalRefresh:
+    """Test refreshing derived bars as source bars are committed."""
+
+    def test_committed_rows_refresh_chained_rollups(self):
+        loader = TimescaleOHLCVLoader({}, rollups={"1m": ["5m"], "5m": ["15m"]})
+        rows = [_bar(7, _utc(2024, 1, 2, 14, 3)), _bar(7, _utc(2024, 1, 2, 14, 11)), _bar(7, _utc(2024, 1, 2), "1d")]
+        patcher, cursor = _mock_connection(loader, [
+            [(7, _utc(2024, 1, 2, 14, 0), _utc(2024, 1, 2, 14, 10), 3)],
+            [(7, _utc(2024, 1, 2, 14, 0), _utc(2024, 1, 2, 14, 0), 1)],
+        ])
+
+        with patcher:
+            loader.insert_rows(rows)
+
+        rollups = [c.args[1] for c in cursor.execute.call_args_list if "time_bucket" in c.args[0]]
+        assert [(p["source"], p["target"], p["start"], p["end"]) for p in rollups] == [
+            ("1m", "5m", _utc(2024, 1, 2, 14, 0), _utc(2024, 1, 2, 14, 15)),
+            ("5m", "15m", _utc(2024, 1, 2, 14, 0), _utc(2024, 1, 2, 14, 15)),
+        ]
+        assert rollups[0]["instrument_ids"] == [7]
+        assert not loader._rollup_pending
+
+    def test_frames_tracked_by_granularity(self):
+        loader = TimescaleOHLCVLoader({}, rollups={"1m": ["1h"]})
+        frame = pd.DataFrame({
+            "ts_event": [pd.Timestamp("2024-03-01 10:59", tz="UTC").value] * 2,
+            "instrument_id": [7, 8],
+            "granularity": ["1m", "1s"],
+        })
+        frame.attrs["timestamp_columns"] = ["ts_event"]
+
+        loader._on_frame_written(frame)
+
+        assert set(loader._rollup_pending) == {"1m"}
+        assert loader._rollup_pending["1m"]["instrument_ids"] == {7}
+
+    def test_rollup_failure_does_not_fail_load(self):
+        loader = TimescaleOHLCVLoader({}, rollups={"1m": ["5m"]})
+        patcher, cursor = _mock_connection(loader)
+        cursor.execute.side_effect = Exception("function time_bucket does not exist")
+
+        with patcher:
+            stats = loader.insert_rows([_bar(7, _utc(2024, 1, 2, 14, 3))])
+
+        assert stats["inserted"] == 1
@@ -0,0 +1,47 @@
+"""
+Unit tests for the loaders' stored-day lookup used by incremental ingestion.
+"""
+
+from datetime import date
+from unittest.mock import MagicMock, patch
+
+from src.storage.timescale_ohlcv_loader import TimescaleOHLCVLoader
+from src.storage.timescale_trades_loader import TimescaleTradesLoader
+
+
+def _mock_connection(loader, rows):
+    cursor = MagicMock()
+    cursor.fetchall.return_value = rows
+    conn = MagicMock()
+    conn.cursor.return_value.__enter__.return_value = cursor
+    connection_cm = MagicMock()
+    connection_cm.__enter__.return_value = conn
+    return patch.object(loader, "get_connection", return_value=connection_cm), cursor
+
+
+class TestStoredDays:
+    """Test cases for StoredRangeMixin.get_stored_days."""
+
+    def test_days_grouped_by_symbol(self):
+        loader = TimescaleTradesLoader({})
+        rows = [("ES.c.0", date(2024, 1, 2)), ("ES.c.0", date(2024, 1, 3)), ("NQ.c.0", date(2024, 1, 2))]
+        patcher, cursor = _mock_connection(loader, rows)
+
+        with patcher:
+            stored = loader.get_stored_days(["ES.c.0", "NQ.c.0"], date(2024, 1, 1), date(2024, 2, 1))
+
+        assert stored == {"ES.c.0": {date(2024, 1, 2), date(2024, 1, 3)}, "NQ.c.0": {date(2024, 1, 2)}}
+        sql, params = cursor.execute.call_args[0]
+        assert "FROM trades_data" in sql
+        assert params == [["ES.c.0", "NQ.c.0"], date(2024, 1, 1), date(2024, 2, 1)]
+
+    def test_filters_added_as_parameters(self):
+        loader = TimescaleOHLCVLoader({})
+        patcher, cursor = _mock_connection(loader, [])
+
+        with patcher:
+            assert loader.get_stored_days(["ES.c.0"], date(2024, 1, 1), date(2024, 2, 1), granularity="1d") == {}
+
+        sql, params = cursor.execute.call_args[0]
+        assert "AND granularity = %s" in sql
+        assert params[-1] == "1d"
@@ -162,4 +162,35 @@ def test_null_fields_and_type_mismatch(rule_engine):
             volume=1000,
             vwap=Decimal('101.0'),
             count=10
-        ) 
\ No newline at end of file
+        ) 
+
+# Row-level failure isolation
+def _trade_record(size):
+    return DatabentoTradeRecord(
+        ts_event=datetime(2024, 6, 13, 12, 0, tzinfo=timezone.utc),
+        ts_recv=datetime(2024, 6, 13, 12, 0, tzinfo=timezone.utc),
+        instrument_id=1,
+        symbol='AAPL',
+        price=Decimal('100.0'),
+        size=size,
+        side='B'
+    )
+
+def test_transform_batch_rejects_whole_batch(rule_engine):
+    with pytest.raises(ValidationRuleError):
+        rule_engine.transform_batch([_trade_record(1), _trade_record(0)], 'trades')
+
+def test_transform_batch_isolated_splits_failing_rows(rule_engine):
+    result = rule_engine.transform_batch_isolated(
+        [_trade_record(1), _trade_record(0), _trade_record(3)], 'trades'
+    )
+    assert [record['size'] for record in result.records] == [1, 3]
+    assert [record['size'] for record in result.failed_records] == [0]
+    assert result.failed_transformed[0]['size'] == 0
+    assert result.failure_messages == ['size: greater_than(0)']
+
+def test_transform_batch_isolated_all_valid(rule_engine):
+    result = rule_engine.transform_batch_isolated([_trade_record(1), _trade_record(2)], 'trades')
+    assert len(result.records) == 2
+    assert result.failed_records == []
+    assert result.failure_cases is None
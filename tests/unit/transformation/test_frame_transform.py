@@ -0,0 +1,155 @@
+"""
+Unit tests for the columnar RuleEngine path (RuleEngine.transform_frame).
+
+Frames mirror the dbn_frame contract: fixed-point Int64 prices and int64
+nanosecond timestamps, with the schema recorded in ``frame.attrs``.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.transformation.rule_engine.engine import create_rule_engine
+from src.transformation.rule_engine.frame_transform import (
+    apply_frame_mapping,
+    compile_frame_mapping,
+    failure_mask_from_cases,
+    round_fixed_point,
+)
+
+PRICE_SCALE = 1_000_000_000
+TS_EVENT = 1705329000000000000  # 2024-01-15T14:30:00Z
+
+
+def _frame(schema, data, price_columns):
+    frame = pd.DataFrame(data)
+    for column in price_columns:
+        frame[column] = frame[column].astype("Int64")
+    frame.attrs["schema"] = schema
+    frame.attrs["price_scale"] = PRICE_SCALE
+    frame.attrs["price_columns"] = price_columns
+    frame.attrs["timestamp_columns"] = [c for c in ("ts_event", "ts_recv") if c in frame.columns]
+    return frame
+
+
+def _trades_frame(prices, sizes):
+    count = len(prices)
+    return _frame("trades", {
+        "ts_event": np.arange(count, dtype=np.int64) + TS_EVENT,
+        "ts_recv": np.arange(count, dtype=np.int64) + TS_EVENT + 10,
+        "instrument_id": [42] * count,
+        "price": prices,
+        "size": sizes,
+        "side": ["B"] * count,
+        "symbol": ["ES.c.0"] * count,
+    }, ["price"])
+
+
+@pytest.fixture(scope="module")
+def rule_engine():
+    return create_rule_engine()
+
+
+class TestTransformFrame:
+    """Test cases for RuleEngine.transform_frame."""
+
+    def test_trades_defaults_and_passthrough(self, rule_engine):
+        frame = _trades_frame([4500250000000, 4500500000000], [1, 2])
+
+        result = rule_engine.transform_frame(frame, "trades")
+
+        assert not result.failure_mask.any()
+        assert result.failure_cases is None
+        assert list(result.frame["action"]) == ["T", "T"]
+        assert list(result.frame["publisher_id"]) == [1, 1]
+        assert list(result.frame["price"]) == [4500250000000, 4500500000000]
+        assert result.frame["ts_event"].dtype == np.int64
+        assert result.frame.attrs["price_columns"] == ["price"]
+        assert "action" not in frame.columns  # input untouched
+
+    def test_failing_rows_are_masked_not_raised(self, rule_engine):
+        frame = _trades_frame([4500250000000, 4500500000000, 4500750000000], [1, 0, 3])
+
+        result = rule_engine.transform_frame(frame, "trades")
+
+        assert result.failure_mask.tolist() == [False, True, False]
+        assert len(result.valid_frame) == 2
+        assert list(result.failed_frame["size"]) == [0]
+        assert result.failure_cases is not None
+
+    def test_statistics_renames_follow_mapping(self, rule_engine):
+        frame = _frame("statistics", {
+            "ts_event": [TS_EVENT], "ts_recv": [TS_EVENT], "instrument_id": [42],
+            "stat_type": [3], "stat_value": [4500000000000], "flags": [0],
+            "update_action": [1], "symbol": ["ES.c.0"],
+        }, ["stat_value"])
+
+        result = rule_engine.transform_frame(frame, "statistics")
+
+        assert "stat_value" not in result.frame.columns
+        assert result.frame["price"].iloc[0] == 4500000000000
+        assert result.frame["stat_flags"].iloc[0] == 0
+        assert result.frame.attrs["price_columns"] == ["price"]
+        assert not result.failure_mask.any()
+
+    def test_ohlcv_missing_optional_columns_validate(self, rule_engine):
+        frame = _frame("ohlcv-1d", {
+            "ts_event": [TS_EVENT], "instrument_id": [42], "symbol": ["ES.c.0"],
+            "open_price": [4500000000000], "high_price": [4510000000000],
+            "low_price": [4490000000000], "close_price": [4505000000000], "volume": [10],
+        }, ["open_price", "high_price", "low_price", "close_price"])
+
+        result = rule_engine.transform_frame(frame, "ohlcv-1d")
+
+        assert not result.failure_mask.any()
+        assert result.frame["granularity"].iloc[0] == "1d"
+        assert result.frame["vwap"].isna().all()
+
+    def test_compiled_mapping_is_cached(self, rule_engine):
+        assert rule_engine.get_compiled_frame_mapping("trd") is rule_engine.get_compiled_frame_mapping("trades")
+
+
+class TestFrameMappingHelpers:
+    """Test cases for the compiled mapping primitives."""
+
+    def test_round_fixed_point_half_even(self):
+        values = pd.Series([15, 25, -15, 24, None], dtype="Int64")
+
+        rounded = round_fixed_point(values, PRICE_SCALE, 8)
+
+        assert rounded.iloc[:4].tolist() == [20, 20, -20, 20]
+        assert pd.isna(rounded.iloc[4])
+
+    def test_conditional_stat_type_mapping(self):
+        compiled = compile_frame_mapping(
+            "statistics",
+            {"field_mappings": {"stat_type": "stat_type"}},
+            {"stat_type_mappings": {
+                2: {"primary_field": "quantity", "target_field": "open_interest"},
+                "default": {"primary_field": "stat_value", "target_field": "price"},
+            }},
+        )
+        frame = pd.DataFrame({"stat_type": [2, 3], "quantity": [100, 5], "stat_value": [1.5, 2.5]})
+
+        result = apply_frame_mapping(frame, compiled)
+
+        assert result["open_interest"].iloc[0] == 100
+        assert pd.isna(result["open_interest"].iloc[1])
+        assert pd.isna(result["price"].iloc[0])
+        assert result["price"].iloc[1] == 2.5
+
+    def test_datetime_columns_normalized_to_utc(self):
+        compiled = compile_frame_mapping(
+            "trades", {"field_mappings": {}}, global_settings={"timezone_normalization": "UTC"}
+        )
+        frame = pd.DataFrame({"ts_event": pd.to_datetime(["2024-01-15 09:30"])})
+
+        result = apply_frame_mapping(frame, compiled)
+
+        assert str(result["ts_event"].dt.tz) == "UTC"
+
+    def test_schema_level_failure_fails_every_row(self):
+        index = pd.RangeIndex(3)
+        cases = pd.DataFrame({"index": [None], "check": ["column_in_dataframe"]})
+
+        assert failure_mask_from_cases(index, cases).tolist() == [True, True, True]
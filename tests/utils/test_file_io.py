@@ -0,0 +1,38 @@
+import json
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import numpy as np
+import pandas as pd
+
+from utils.file_io import QuarantineManager
+
+
+def _read_entries(base_dir):
+    files = list(base_dir.glob("*/trades_failures.jsonl"))
+    assert len(files) == 1
+    return [json.loads(line) for line in files[0].read_text().splitlines()]
+
+
+def test_quarantine_records_writes_batch(tmp_path):
+    manager = QuarantineManager(base_dir=str(tmp_path))
+    records = [
+        {"price": Decimal("1.5"), "size": np.int64(0), "ts_event": datetime(2024, 1, 1, tzinfo=timezone.utc)},
+        {"price": pd.NA, "size": 2, "ts_event": pd.NaT},
+    ]
+
+    written = manager.quarantine_records("trades", "pandera_validation", records, ["size: greater_than(0)", "price"])
+
+    entries = _read_entries(tmp_path)
+    assert written == 2
+    assert [entry["error_message"] for entry in entries] == ["size: greater_than(0)", "price"]
+    assert entries[0]["original_record"] == {"price": "1.5", "size": 0, "ts_event": "2024-01-01T00:00:00+00:00"}
+    assert entries[1]["original_record"]["price"] is None
+    assert entries[1]["original_record"]["ts_event"] is None
+    assert entries[0]["transformed_record"] is None
+
+
+def test_quarantine_records_disabled(tmp_path):
+    manager = QuarantineManager(enabled=False, base_dir=str(tmp_path / "dlq"))
+    assert manager.quarantine_records("trades", "rule", [{"a": 1}], ["msg"]) == 0
+    assert not (tmp_path / "dlq").exists()